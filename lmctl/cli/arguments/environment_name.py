@@ -3,8 +3,15 @@ from typing import Sequence
 
 __all__ = (
     'EnvironmentNameOption',
+    'EnvironmentNamesOption',
+    'AllEnvironmentsOption',
+    'ENVIRONMENT_NAMES_PARAM_NAME',
+    'ALL_ENVIRONMENTS_PARAM_NAME',
 )
 
+ENVIRONMENT_NAMES_PARAM_NAME = 'environment_names'
+ALL_ENVIRONMENTS_PARAM_NAME = 'all_environments'
+
 class EnvironmentNameOption(click.Option):
 
     def __init__(
@@ -19,4 +26,35 @@ class EnvironmentNameOption(click.Option):
             required=required,
             help=help,
             **kwargs
-        )
\ No newline at end of file
+        )
+
+class EnvironmentNamesOption(EnvironmentNameOption):
+
+    def __init__(
+            self, 
+            param_decls: Sequence[str] = ['-e', '--environment', ENVIRONMENT_NAMES_PARAM_NAME],
+            help: str = 'Name of an environment from the configuration file to be used, otherwise the active environment is used by default. May be repeated to run against several environments in parallel', 
+            **kwargs):
+        super().__init__(
+            param_decls=param_decls,
+            help=help,
+            multiple=True,
+            **kwargs
+        )
+
+class AllEnvironmentsOption(click.Option):
+
+    def __init__(
+            self, 
+            param_decls: Sequence[str] = ['--all-envs', ALL_ENVIRONMENTS_PARAM_NAME],
+            help: str = 'Run against all environments (with CP4NA orchestration configured) in the configuration file, in parallel', 
+            **kwargs):
+        param_decls = [p for p in param_decls]
+        super().__init__(
+            param_decls,
+            is_flag=True,
+            default=False,
+            show_default=True,
+            help=help,
+            **kwargs
+        )
@@ -0,0 +1,55 @@
+import click
+from typing import Sequence
+
+__all__ = (
+    'WaitOption',
+    'WaitTimeoutOption',
+    'wait_option',
+    'WAIT_PARAM_NAME',
+    'WAIT_TIMEOUT_PARAM_NAME',
+)
+
+WAIT_PARAM_NAME = 'wait'
+WAIT_TIMEOUT_PARAM_NAME = 'wait_timeout'
+
+default_param_decls = ['--wait', WAIT_PARAM_NAME]
+default_timeout_param_decls = ['--wait-timeout', WAIT_TIMEOUT_PARAM_NAME]
+
+class WaitOption(click.Option):
+
+    def __init__(self, 
+            param_decls: Sequence[str] = default_param_decls,
+            help: str = 'Wait for the process(es) started by the request to finish. Exits with an error if any process does not complete successfully', 
+            **kwargs
+        ):
+        param_decls = [p for p in param_decls]
+        super().__init__(
+            param_decls,
+            is_flag=True,
+            help=help,
+            **kwargs
+        )
+
+class WaitTimeoutOption(click.Option):
+
+    def __init__(self, 
+            param_decls: Sequence[str] = default_timeout_param_decls,
+            help: str = 'Maximum number of seconds to wait, when "--wait" is used (waits indefinitely by default)', 
+            **kwargs
+        ):
+        param_decls = [p for p in param_decls]
+        super().__init__(
+            param_decls,
+            type=click.FloatRange(min=0),
+            help=help,
+            **kwargs
+        )
+
+def wait_option():
+    """
+    Adds both the "--wait" and "--wait-timeout" options
+    """
+    def decorator(f):
+        f = click.option(*default_timeout_param_decls, cls=WaitTimeoutOption)(f)
+        return click.option(*default_param_decls, cls=WaitOption)(f)
+    return decorator
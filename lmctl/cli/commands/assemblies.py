@@ -70,7 +70,8 @@ The request can include the following parameters:
 @tnco_builder.make_create_command(
     result_prefix=accepted_process_prefix,
     additional_help=create_help_str,
-    allow_object_group=True
+    allow_object_group=True,
+    allow_wait=True
 )
 @set_param_option('--prop', 'prop_values', help='Directly set a property passed to the request')
 def create_assembly(tnco_client: TNCOClient, obj: Dict[str, Any], prop_values: Dict[str, Any] = None, object_group_id: str = None):
@@ -96,7 +97,8 @@ The request can include the following parameters:
     identifiers=[id_opt, name_arg],
     result_prefix=accepted_process_prefix,
     additional_help=update_help_str,
-    allow_patch=False
+    allow_patch=False,
+    allow_wait=True
 )
 @click.argument(name_arg.param_name, required=False)
 @click.option(*id_opt.param_opts, help='Reference the target Assembly by ID instead of name')
@@ -146,7 +148,8 @@ def missing_detector(e: Exception) -> Tuple[bool, str]:
 @tnco_builder.make_delete_command(
     identifiers=[name_arg, id_opt],
     missing_detector=missing_detector,
-    result_prefix=accepted_process_prefix
+    result_prefix=accepted_process_prefix,
+    allow_wait=True
 )
 @click.argument(name_arg.param_name, required=False)
 @click.option(*id_opt.param_opts, help='Reference the target Assembly by ID instead of name')
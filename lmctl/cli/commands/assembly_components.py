@@ -1,9 +1,10 @@
 import click
 from lmctl.client import TNCOClient
 from lmctl.cli.io import IOController
+from lmctl.cli.arguments import wait_option
 from typing import Dict, Any
 from .actions import heal
-from .utils import TNCOCommandBuilder, Identity, Identifier, pass_io
+from .utils import TNCOCommandBuilder, Identity, Identifier, pass_io, wait_for_processes
 from .assemblies import accepted_process_prefix
 
 __all__ = (
@@ -73,13 +74,16 @@ def build_heal(tnco_builder, a_or_an = 'a', help_prefix_extra = ''):
     @click.option(*metric_key_opt.param_opts, help=f'Reference the target {tnco_builder.display_name} by metric key instead of ID/name')
     @click.option(*assembly_name_opt.param_opts, help=f'Reference the owning Assembly by name')
     @click.option(*assembly_id_opt.param_opts, help=f'Reference the owning Assembly by ID')
+    @wait_option()
     @pass_io
     def do_heal(
             tnco_client: TNCOClient,
             obj: Dict[str, Any],
             io: IOController, 
             identity: Identity,
-            assembly_identity: Identity
+            assembly_identity: Identity,
+            wait: bool = False,
+            wait_timeout: float = None
         ):
         if identity.identifier.param_name == name_arg.param_name:
             obj[name_arg.obj_attribute] = identity.value
@@ -103,6 +107,8 @@ def build_heal(tnco_builder, a_or_an = 'a', help_prefix_extra = ''):
 
         process_id = tnco_client.assemblies.intent_heal(obj)
         io.print(f'{accepted_process_prefix}{process_id}')
+        if wait:
+            wait_for_processes(tnco_client, io, [process_id], timeout=wait_timeout)
 
     return do_heal
 
@@ -5,11 +5,12 @@ from .utils import pass_io, Identity, Identifier
 from lmctl.cli.controller import get_global_controller, CLIController
 from lmctl.cli.io import IOController
 from lmctl.cli.tags import SETTINGS_TAG
-from lmctl.cli.arguments import output_format_option, TNCOClientSecretOption, TNCOPwdOption, TNCOTokenOption
+from lmctl.cli.arguments import output_format_option, AllEnvironmentsOption, TNCOClientSecretOption, TNCOPwdOption, TNCOTokenOption
 from lmctl.cli.format import Column, OutputFormat, TableFormat, Table
-from lmctl.client import TNCOClient
+from lmctl.client import TNCOClient, TestResult
 from lmctl.environment import EnvironmentGroup
 from lmctl.config import ConfigError, get_config_with_path, write_config
+from typing import List, Sequence
 
 __all__ = (
     'get_env',
@@ -38,9 +39,18 @@ default_columns = [
 ping_table = Table(columns=[
         Column('name', header='Test Name'),
         Column('result', header='Result', accessor=lambda x: 'OK' if x.passed else 'Failed'),
+        Column('latency', header='Latency (s)', accessor=lambda x: f'{x.latency:.3f}' if x.latency is not None else None),
         Column('error', header='Error')
     ])
 
+multi_env_ping_table = Table(columns=[
+        Column('environment', header='Environment'),
+        Column('name', header='Test Name', accessor=lambda x: x['test'].name),
+        Column('result', header='Result', accessor=lambda x: 'OK' if x['test'].passed else 'Failed'),
+        Column('latency', header='Latency (s)', accessor=lambda x: f'{x["test"].latency:.3f}' if x['test'].latency is not None else None),
+        Column('error', header='Error', accessor=lambda x: x['test'].error)
+    ])
+
 @get.command(singular, aliases=[plural], tags=[SETTINGS_TAG], help=f'Get an {display_name} from active LMCTL config file')
 @click.argument(name_arg.param_name, required=False)
 @click.option(*active_opt.param_opts, is_flag=True, default=False, show_default=True, help='Display the active environment (if set) rather than retrieving one by name')
@@ -79,7 +89,8 @@ class PingEnvironmentCommand(click.Command):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.params.append(click.Argument([name_arg.param_name], required=False))
+        self.params.append(click.Argument([name_arg.param_name], required=False, nargs=-1))
+        self.params.append(AllEnvironmentsOption(help='Test connection with all environments in the configuration file, in parallel'))
         self.params.append(TNCOClientSecretOption())
         self.params.append(TNCOPwdOption())
         self.params.append(TNCOTokenOption())
@@ -89,26 +100,33 @@ class PingEnvironmentCommand(click.Command):
     
     def _callback(self, 
                     *args, 
-                    name: str = None,
+                    name: Sequence[str] = None,
+                    all_environments: bool = False,
                     **kwargs):
         ctl = get_global_controller()
-        environment = ctl.get_environment_group(name)
-        result = self.behaviour(*args, ctl=ctl, environment=environment, **kwargs)
+        environments = ctl.get_environment_groups(name, all_environments=all_environments)
+        result = self.behaviour(*args, ctl=ctl, environments=environments, **kwargs)
 
 @ping.command(singular, cls=PingEnvironmentCommand, aliases=[plural], tags=[SETTINGS_TAG], 
         short_help=f'Test connection with an {display_name} from active LMCTL config file',
         help=f'''\
             Test connection with an {display_name} from active LMCTL config file
-            \n\nConnection is tested by making requests to a few pre-selected APIs on the configured CP4NA orchestration'''
+            \n\nConnection is tested by making requests to a few pre-selected APIs on the configured CP4NA orchestration
+            \n\nProvide several names (or use "--all-envs") to test multiple environments in parallel'''
         )
 @click.option('--include-template-engine', '--include-kami', 'include_template_engine', 
                 is_flag=True, default=False, show_default=True, help='Include tests for connection to Kami, an optional demo component')
-def ping_env(ctl: CLIController, environment: EnvironmentGroup, pwd: str, client_secret: str, token: str, include_template_engine: bool):
+@click.option('--timeout', type=float, default=None, help='Seconds to wait for each test to complete before it is marked as failed')
+@click.option('--lightweight', is_flag=True, default=False, show_default=True, help='Test each API with a cheap request (HEAD or limit=1) rather than retrieving all items')
+def ping_env(ctl: CLIController, environments: List[EnvironmentGroup], pwd: str, client_secret: str, token: str, include_template_engine: bool, timeout: float, lightweight: bool):
+    if len(environments) > 1:
+        return _ping_environments(ctl, environments, pwd, client_secret, token, include_template_engine, timeout, lightweight)
+    environment = environments[0]
     happy_exit = True
     if environment.has_tnco:
         tnco_client = ctl.get_tnco_client(environment_group_name=environment.name, input_pwd=pwd, input_client_secret=client_secret, input_token=token)
         ctl.io.print(f'Pinging CP4NA orchestration: {environment.name} ({environment.tnco.address})')
-        tnco_ping_result = tnco_client.ping(include_template_engine=include_template_engine)
+        tnco_ping_result = tnco_client.ping(include_template_engine=include_template_engine, timeout=timeout, lightweight=lightweight)
         ctl.io.print(TableFormat(table=ping_table).convert_list(tnco_ping_result.tests))
         if tnco_ping_result.passed:
             ctl.io.print(f'CP4NA orchestration tests passed! ✅')
@@ -120,6 +138,35 @@ def ping_env(ctl: CLIController, environment: EnvironmentGroup, pwd: str, client
     if not happy_exit:
         exit(1)
 
+def _ping_environments(ctl: CLIController, environments: List[EnvironmentGroup], pwd: str, client_secret: str, token: str, include_template_engine: bool, timeout: float, lightweight: bool):
+    tnco_clients = {}
+    for environment in environments:
+        if environment.has_tnco:
+            tnco_clients[environment.name] = ctl.get_tnco_client(environment_group_name=environment.name, input_pwd=pwd, input_client_secret=client_secret, input_token=token)
+        else:
+            ctl.io.print(f'No CP4NA orchestration configured on {environment.name} (skipping)')
+    if len(tnco_clients) == 0:
+        return
+    ctl.io.print(f'Pinging CP4NA orchestration: ' + ', '.join([f'{e.name} ({e.tnco.address})' for e in environments if e.name in tnco_clients]))
+    results = ctl.run_in_environments(list(tnco_clients.keys()), 
+                                        lambda name: tnco_clients[name].ping(include_template_engine=include_template_engine, timeout=timeout, lightweight=lightweight))
+    rows = []
+    failed_environments = []
+    for r in results:
+        if r.failed:
+            tests = [TestResult(name='Ping', error=r.error)]
+        else:
+            tests = r.result.tests
+        if any(not t.passed for t in tests):
+            failed_environments.append(r.environment)
+        rows.extend([{'environment': r.environment, 'test': t} for t in tests])
+    ctl.io.print(TableFormat(table=multi_env_ping_table).convert_list(rows))
+    if len(failed_environments) == 0:
+        ctl.io.print(f'CP4NA orchestration tests passed! ✅')
+    else:
+        ctl.io.print_error(f'CP4NA orchestration tests failed on: ' + ', '.join(failed_environments) + ' ❌')
+        exit(1)
+
 @use.command(singular, aliases=[plural], tags=[SETTINGS_TAG], help=f'Change the active environment (default environment used by commands)')
 @click.argument(name_arg.param_name, required=True)
 def use_env(name: str):
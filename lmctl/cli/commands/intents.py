@@ -1,11 +1,11 @@
 import click
 from .assemblies import accepted_process_prefix
 from .actions import create
-from .utils import TNCOCommandBuilder, pass_io, shallow_merge_objs
+from .utils import TNCOCommandBuilder, pass_io, shallow_merge_objs, wait_for_processes
 from lmctl.client import TNCOClient
-from lmctl.cli.arguments import set_param_option
+from lmctl.cli.arguments import set_param_option, wait_option
 from lmctl.cli.io import IOController
-from typing import Dict, Any
+from typing import Dict, Any, List, Union, Optional
 
 __all__ = (
     'generate_intent',
@@ -48,16 +48,72 @@ def generate_intent(intent_type: str):
         \n\nThe properties of a request depend on the type of intent being performed.\
         \n\nKnown types: createAssembly, changeAssemblyState, upgradeAssembly, deleteAssembly, healAssembly, scaleOutAssembly, scaleInAssembly, adoptAssembly
         \n\nNote: your chosen type is not validated against this list so if a new type of intent has been added in CP4NA, this command is still usable
+        \n\nTo request many intents, include a list of them in "-f, file" (or an "items" list). Use "--parallel" to submit several at once\
+        (any "--set" values are applied to each intent)
     ''',
     pass_file_content=True,
     allow_object_group=True
 )
 @set_param_option()
+@click.option('--parallel', type=click.IntRange(min=1), default=1, show_default=True, help='Number of intents to submit at once, when "-f, --file" includes many intents')
+@wait_option()
 @pass_io
-def create_intent(tnco_client: TNCOClient, io: IOController, obj: Dict[str, Any], set_values: Dict[str, Any], object_group_id: str = None):
+def create_intent(tnco_client: TNCOClient, io: IOController, obj: Union[Dict[str, Any], List], set_values: Dict[str, Any], parallel: int, 
+                    object_group_id: str = None, wait: bool = False, wait_timeout: float = None):
+    many_intents = _get_many_intents(obj)
+    if many_intents is not None:
+        return _create_many_intents(tnco_client, io, many_intents, set_values, parallel, object_group_id=object_group_id, wait=wait, wait_timeout=wait_timeout)
     intent_request = shallow_merge_objs(obj, set_values)
     intent_name = intent_request.pop('intentType', None)
     if intent_name is None:
         raise click.UsageError(message='Must include "intentType" in contents of "-f, --file" or with "--set intentType=<type>"', ctx=click.get_current_context())
     process_id = tnco_client.assemblies.intent(intent_name, intent_request, object_group_id=object_group_id)
+    if process_id is None:
+        # Retry, rollback and cancel intents do not return a process ID
+        io.print(f'Accepted - {intent_name} request')
+        if wait:
+            io.print(f'Cannot wait on {intent_name} intent as it does not return a process ID')
+        return
     io.print(f'{accepted_process_prefix}{process_id}')
+    if wait:
+        wait_for_processes(tnco_client, io, [process_id], timeout=wait_timeout)
+
+def _get_many_intents(obj: Union[Dict[str, Any], List]) -> Optional[List]:
+    if isinstance(obj, list):
+        return obj
+    if isinstance(obj, dict) and isinstance(obj.get('items', None), list):
+        return obj['items']
+    return None
+
+def _create_many_intents(tnco_client: TNCOClient, io: IOController, many_intents: List, set_values: Dict[str, Any], parallel: int, object_group_id: str = None,
+                            wait: bool = False, wait_timeout: float = None):
+    intents = []
+    for index, intent_obj in enumerate(many_intents):
+        if not isinstance(intent_obj, dict):
+            raise click.UsageError(message=f'Intent {index} in contents of "-f, --file" is not an object', ctx=click.get_current_context())
+        intent_request = shallow_merge_objs(intent_obj, set_values)
+        intent_name = intent_request.pop('intentType', None)
+        if intent_name is None:
+            raise click.UsageError(message=f'Must include "intentType" in intent {index} of "-f, --file" or with "--set intentType=<type>"', ctx=click.get_current_context())
+        intents.append((intent_name, intent_request))
+    batch_results = tnco_client.assemblies.intents_batch(intents, max_workers=parallel, object_group_id=object_group_id)
+    for result in batch_results.results:
+        if result.accepted and result.process_id is None:
+            io.print(f'[{result.index}] {result.intent_name}: Accepted ({result.latency:.2f}s)')
+        elif result.accepted:
+            io.print(f'[{result.index}] {result.intent_name}: {accepted_process_prefix}{result.process_id} ({result.latency:.2f}s)')
+        else:
+            io.print_error(f'[{result.index}] {result.intent_name}: Failed - {result.error}')
+    failed = batch_results.failed
+    if len(failed) > 0:
+        io.print_error(f'{len(failed)} of {len(batch_results.results)} intents failed')
+    if wait:
+        # Wait for the processes of the accepted intents, even if others failed
+        accepted_process_ids = [result.process_id for result in batch_results.results if result.accepted and result.process_id is not None]
+        without_process_id = [result for result in batch_results.results if result.accepted and result.process_id is None]
+        if len(without_process_id) > 0:
+            io.print(f'Cannot wait on {len(without_process_id)} accepted intent(s) which do not return a process ID: ' + ', '.join(f'[{result.index}] {result.intent_name}' for result in without_process_id))
+        if len(accepted_process_ids) > 0:
+            wait_for_processes(tnco_client, io, accepted_process_ids, timeout=wait_timeout)
+    if len(failed) > 0:
+        exit(1)
@@ -1,11 +1,11 @@
 import click
 import logging
-import shutil
-import os
+import lmctl.files as files
 import lmctl.cli.lifecycle as lifecycle_cli
 import lmctl.project.package.core as pkgs
 from lmctl.cli.controller import get_global_controller
 from lmctl.cli.format import determine_format_class
+from lmctl.cli.arguments import EnvironmentNamesOption
 from .utils.object_groups import object_group_options
 
 logger = logging.getLogger(__name__)
@@ -19,48 +19,72 @@ def pkg():
 PUSH_HEADER = 'Push'
 
 
-@pkg.command(help='Push a previously built package to a CP4NA orchestration environment')
+@pkg.command(help='Push a previously built package to a CP4NA orchestration environment.\
+        \n\nUse "-e, --environment" more than once to push the package to several environments in parallel (it is extracted and validated only once)')
 @click.argument('package')
 @click.argument('environment', required=False, default=None)
+@click.option('-e', '--environment', 'environment_names', cls=EnvironmentNamesOption, help='name of an environment to push to. May be repeated to push to several environments in parallel')
 @click.option('--config', default=None, help='configuration file')
 @click.option('--armname', default='defaultrm', help='if using ansible-rm packaging the name of ARM to upload Resources to must be provided')
 @click.option('--pwd', '--api-key', default=None, help='password/api_key used for authenticating with CP4NA orchestration. Only required if the environment is secure and a username has been included in your configuration file with no password (api_key when using auth_mode=zen)')
 @click.option('--autocorrect', default=False, is_flag=True, help='allow validation warnings and errors to be autocorrected if supported')
+@click.option('--parallel', type=click.IntRange(min=1), default=1, show_default=True, help='maximum number of subprojects to push at once (a subproject is pushed after its own subprojects)')
+@click.option('--delta', default=False, is_flag=True, help='skip descriptors, descriptor templates and behaviour (configurations/scenarios) which are unchanged in the target environment')
 @object_group_options()
-def push(package, environment, config, armname, pwd, autocorrect, object_group_name = None, object_group_id = None):
+def push(package, environment, environment_names, config, armname, pwd, autocorrect, parallel, delta, object_group_name = None, object_group_id = None):
     """Pushes an existing Assembly/Resource package to a target CP4NA orchestration (and ARM) environment"""
     logger.debug('Pushing package at: {0}'.format(package))
-    pkg, pkg_content = lifecycle_cli.get_pkg_and_open(package)
-    try:
-        env_sessions = lifecycle_cli.build_sessions_for_pkg(pkg_content.meta, environment, pwd, armname, config)
-        ctl = get_global_controller(override_config_path=config)
-        tnco_client = ctl.get_tnco_client(environment_group_name=environment, input_pwd=pwd)
-        object_group_id = lifecycle_cli.resolve_object_group(tnco_client, object_group_id, object_group_name)
-        controller = lifecycle_cli.ExecutionController(PUSH_HEADER)
-        controller.start(package)
-        exec_push(controller, pkg, env_sessions, allow_autocorrect=autocorrect, object_group_id=object_group_id)
-    finally:
+    all_environment_names = list(dict.fromkeys(([environment] if environment is not None else []) + list(environment_names)))
+    if len(all_environment_names) > 1:
+        return push_to_environments(package, all_environment_names, config, armname, pwd, autocorrect, parallel, delta, object_group_name=object_group_name, object_group_id=object_group_id)
+    if len(all_environment_names) == 1:
+        environment = all_environment_names[0]
+    # Only the meta is needed to create the sessions, which is read without extracting the package
+    pkg, pkg_meta = lifecycle_cli.get_pkg_and_read_meta(package)
+    env_sessions = lifecycle_cli.build_sessions_for_pkg(pkg_meta, environment, pwd, armname, config)
+    ctl = get_global_controller(override_config_path=config)
+    tnco_client = ctl.get_tnco_client(environment_group_name=environment, input_pwd=pwd)
+    object_group_id = lifecycle_cli.resolve_object_group(tnco_client, object_group_id, object_group_name)
+    controller = lifecycle_cli.ExecutionController(PUSH_HEADER)
+    controller.start(package)
+    pkg_content = exec_push(controller, pkg, env_sessions, allow_autocorrect=autocorrect, object_group_id=object_group_id, parallel=parallel, delta=delta)
+    if pkg_content is not None:
         cleanup_pkg(pkg_content)
     controller.finalise()
 
 
+def push_to_environments(package, environment_names, config, armname, pwd, autocorrect, parallel, delta, object_group_name = None, object_group_id = None):
+    pkg, pkg_meta = lifecycle_cli.get_pkg_and_read_meta(package)
+    ctl = get_global_controller(override_config_path=config)
+    env_sessions_by_name = {}
+    object_group_id_by_name = {}
+    for environment_name in environment_names:
+        env_sessions_by_name[environment_name] = lifecycle_cli.build_sessions_for_pkg(pkg_meta, environment_name, pwd, armname, config)
+        if object_group_id is not None or object_group_name is not None:
+            tnco_client = ctl.get_tnco_client(environment_group_name=environment_name, input_pwd=pwd)
+            object_group_id_by_name[environment_name] = lifecycle_cli.resolve_object_group(tnco_client, object_group_id, object_group_name)
+    controller = lifecycle_cli.ExecutionController(PUSH_HEADER)
+    controller.start('{0} to {1}'.format(package, ', '.join(environment_names)))
+    # The package is extracted (only if needed) by the push, into a workspace removed once all environments are done
+    results = exec_push_to_environments(controller, pkg, env_sessions_by_name, allow_autocorrect=autocorrect, 
+                                            object_group_id_by_name=object_group_id_by_name, parallel=parallel, delta=delta)
+    controller.process_environment_results(results)
+    controller.finalise()
+
+
 @pkg.command(help='Inspect a package')
 @click.argument('package')
 @click.option('--config', default=None, help='configuration file')
 @click.option('-f', '--format', 'output_format', default='yaml', help='format of output [yaml, json]')
 def inspect(package, config, output_format):
     logger.debug('Inspecting package at: {0}'.format(package))
-    pkg_content = lifecycle_cli.open_pkg(package)
-    try:
-        inspection_report = pkg_content.inspect()
-        result = format_inspection_report(output_format, inspection_report)
-        click.echo(result)
-    finally:
-        cleanup_pkg(pkg_content)
+    # Reads the meta of the package directly from the archive, rather than extracting it
+    inspection_report = lifecycle_cli.inspect_pkg(package)
+    result = format_inspection_report(output_format, inspection_report)
+    click.echo(result)
     
 def cleanup_pkg(pkg):
-    if os.path.exists(pkg.tree.root_path):
-        shutil.rmtree(pkg.tree.root_path)
+    files.remove_directory(pkg.tree.root_path)
 
 def format_inspection_report(output_format, inspection_report):
     inspection_report_tpl = inspection_report.to_dict()
@@ -69,9 +93,15 @@ def format_inspection_report(output_format, inspection_report):
     result = formatter.convert_element(inspection_report_tpl)
     return result
 
-def exec_push(controller, pkg, env_sessions, allow_autocorrect=False, object_group_id=None):
-    push_options = pkgs.PushOptions()
+def exec_push(controller, pkg, env_sessions, allow_autocorrect=False, object_group_id=None, parallel=1, delta=False):
+    push_options = pkgs.PushOptions(parallel=parallel, delta=delta)
     push_options.object_group_id = object_group_id
     push_options.allow_autocorrect = allow_autocorrect
     push_options.journal_consumer = controller.consumer
     return controller.execute(pkg.push, env_sessions, push_options)
+
+def exec_push_to_environments(controller, pkg, env_sessions_by_name, allow_autocorrect=False, object_group_id_by_name=None, parallel=1, delta=False):
+    push_options = pkgs.PushOptions(parallel=parallel, delta=delta)
+    push_options.allow_autocorrect = allow_autocorrect
+    push_options.journal_consumer = controller.consumer
+    return controller.execute(pkg.push_to_environments, env_sessions_by_name, push_options, None, None, object_group_id_by_name)
@@ -67,7 +67,10 @@ def get_process(
         raise click.UsageError(message=f'Do not use "--deep" option when retrieving multiple processes', ctx=click.get_current_context())
     api = tnco_client.processes
     if identity is not None:
-        return api.get(identity.value, shallow=(deep is False))
+        if deep:
+            # Deep processes may be very large, parse as the response is read
+            return api.get(identity.value, shallow=False, stream=True)
+        return api.get(identity.value, shallow=True)
 
     query_params = {}
     if assembly_id is not None:
@@ -86,7 +89,8 @@ def get_process(
         query_params['intentTypes'] = ','.join(intent_types)
     if limit is not None:
         query_params['limit'] = limit
-    return api.query(object_group_id=object_group_id, **query_params)
+    # Processes are printed as they are read from the response
+    return api.iter_query(object_group_id=object_group_id, **query_params)
 
 accepted_process_prefix = 'Accepted -'
 
@@ -41,8 +41,8 @@ def exec_validate(controller, project, allow_autocorrect=False):
     return validation_result
 
 
-def exec_build(controller, project, allow_autocorrect=False):
-    build_options = project_sources.BuildOptions()
+def exec_build(controller, project, allow_autocorrect=False, jobs=1, incremental=False):
+    build_options = project_sources.BuildOptions(jobs=jobs, incremental=incremental)
     build_options.allow_autocorrect = allow_autocorrect
     build_options.journal_consumer = controller.consumer
     build_result = controller.execute(project.build, build_options)
@@ -50,15 +50,15 @@ def exec_build(controller, project, allow_autocorrect=False):
     return build_result
 
 
-def exec_push(controller, pkg, env_sessions, object_group_id = None):
-    push_options = pkgs.PushOptions()
+def exec_push(controller, pkg, env_sessions, object_group_id = None, parallel=1, delta=False):
+    push_options = pkgs.PushOptions(parallel=parallel, delta=delta)
     push_options.object_group_id = object_group_id
     push_options.journal_consumer = controller.consumer
     return controller.execute(pkg.push, env_sessions, push_options)
 
 
-def exec_test(controller, pkg_content, env_sessions, tests):
-    test_options = pkgs.TestOptions(tests)
+def exec_test(controller, pkg_content, env_sessions, tests, parallel=1, fail_fast=False, test_timeout=None):
+    test_options = pkgs.TestOptions(tests, parallel=parallel, fail_fast=fail_fast, test_timeout=test_timeout)
     test_options.journal_consumer = controller.consumer
     test_report = controller.execute(pkg_content.test, env_sessions, test_options)
     controller.process_test_report(test_report)
@@ -86,13 +86,15 @@ def validate(project_path, autocorrect):
 @project.command(help='Build distributable package for Project')
 @click.option('--project', 'project_path',  default='./', help='File location of project')
 @click.option('--autocorrect', default=False, is_flag=True, help='allow validation warnings and errors to be autocorrected if supported')
-def build(project_path, autocorrect):
+@click.option('--jobs', type=click.IntRange(min=1), default=1, show_default=True, help='maximum number of subprojects to stage and compile at once')
+@click.option('--incremental', default=False, is_flag=True, help='reuse the output of the last (incremental) build for any subprojects whose sources have not changed since')
+def build(project_path, autocorrect, jobs, incremental):
     """Builds an Assembly/Resource project"""
     logger.debug('Building project at: {0}'.format(project_path))
     project = lifecycle_cli.open_project(project_path)
     controller = lifecycle_cli.ExecutionController(BUILD_HEADER)
     controller.start('{0} at {1}'.format(project.config.name, project_path))
-    exec_build(controller, project, allow_autocorrect=autocorrect)
+    exec_build(controller, project, allow_autocorrect=autocorrect, jobs=jobs, incremental=incremental)
     controller.finalise()
 
 
@@ -103,8 +105,10 @@ def build(project_path, autocorrect):
 @click.option('--armname', default='defaultrm', help='if using ansible-rm packaging the name of ARM to upload Resources must be provided')
 @click.option('--pwd', '--api-key', default=None, help='password/api_key used for authenticating with CP4NA orchestration. Only required if the environment is secure and a username has been included in your configuration file with no password (api_key when using auth_mode=zen)')
 @click.option('--autocorrect', default=False, is_flag=True, help='allow validation warnings and errors to be autocorrected if supported')
+@click.option('--parallel', type=click.IntRange(min=1), default=1, show_default=True, help='maximum number of subprojects to push at once (a subproject is pushed after its own subprojects)')
+@click.option('--delta', default=False, is_flag=True, help='skip descriptors, descriptor templates and behaviour (configurations/scenarios) which are unchanged in the target environment')
 @object_group_options()
-def push(project_path, environment, config, armname, pwd, autocorrect, object_group_name = None, object_group_id = None):
+def push(project_path, environment, config, armname, pwd, autocorrect, parallel, delta, object_group_name = None, object_group_id = None):
     """Push an Assembly/Resource project"""
     logger.debug('Pushing project at: {0}'.format(project_path))
     project = lifecycle_cli.open_project(project_path)
@@ -116,7 +120,7 @@ def push(project_path, environment, config, armname, pwd, autocorrect, object_gr
     controller = lifecycle_cli.ExecutionController(PUSH_HEADER)
     controller.start('{0} at {1}'.format(project.config.name, project_path))
     build_result = exec_build(controller, project, allow_autocorrect=autocorrect)
-    exec_push(controller, build_result.pkg, env_sessions, object_group_id=object_group_id)
+    exec_push(controller, build_result.pkg, env_sessions, object_group_id=object_group_id, parallel=parallel, delta=delta)
     controller.finalise()
 
 def __parse_tests_option(tests):
@@ -132,10 +136,13 @@ def __parse_tests_option(tests):
 @click.option('--config', default=None, help='configuration file')
 @click.option('--armname', default='defaultrm', help='if using ansible-rm packaging the name of ARM to upload Resources to must be provided')
 @click.option('--tests', default=None, help='specify comma separated list of individual tests to execute')
+@click.option('--parallel', type=click.IntRange(min=1), default=1, show_default=True, help='maximum number of tests to execute at once')
+@click.option('--fail-fast', default=False, is_flag=True, help='skip any tests not yet started once a test has failed')
+@click.option('--test-timeout', type=click.FloatRange(min=0), default=None, help='seconds to wait for each test to finish before it is failed (and its execution cancelled)')
 @click.option('--pwd', '--api-key', default=None, help='password/api_key used for authenticating with CP4NA orchestration. Only required if the environment is secure and a username has been included in your configuration file with no password (api_key when using auth_mode=zen)')
 @click.option('--autocorrect', default=False, is_flag=True, help='allow validation warnings and errors to be autocorrected if supported')
 @object_group_options()
-def test(project_path, environment, config, armname, tests, pwd, autocorrect, object_group_name = None, object_group_id = None):
+def test(project_path, environment, config, armname, tests, parallel, fail_fast, test_timeout, pwd, autocorrect, object_group_name = None, object_group_id = None):
     """Builds, pushes and runs the tests of an Assembly/Resource project on a target CP4NA orchestration (and ARM) environment"""
     logger.debug('Testing project at: {0}'.format(project_path))
     project = lifecycle_cli.open_project(project_path)
@@ -148,7 +155,10 @@ def test(project_path, environment, config, armname, tests, pwd, autocorrect, ob
     controller.start('{0} at {1}'.format(project.config.name, project_path))
     build_result = exec_build(controller, project, allow_autocorrect=autocorrect)
     pkg_content = exec_push(controller, build_result.pkg, env_sessions, object_group_id=object_group_id)
-    exec_test(controller, pkg_content, env_sessions, __parse_tests_option(tests))
+    if pkg_content is None:
+        # ETSI packages are pushed without being extracted, the tests still need the content
+        pkg_content = lifecycle_cli.open_pkg(build_result.pkg.path)
+    exec_test(controller, pkg_content, env_sessions, __parse_tests_option(tests), parallel=parallel, fail_fast=fail_fast, test_timeout=test_timeout)
     controller.finalise()
 
 
@@ -1,10 +1,11 @@
 import click
 from .actions import scale
-from .utils import TNCOCommandBuilder, Identity, Identifier, pass_io
+from .utils import TNCOCommandBuilder, Identity, Identifier, pass_io, wait_for_processes
 from .assemblies import accepted_process_prefix
 from typing import Dict, Any
 from lmctl.client import TNCOClient
 from lmctl.cli.io import IOController
+from lmctl.cli.arguments import wait_option
 
 __all__ = (
     'scale_resource_cluster',
@@ -55,6 +56,7 @@ Request an intent to scale out/in a {tnco_builder.display_name} of an Assembly.
 @click.option(*assembly_name_opt.param_opts, help=f'Reference the owning Assembly by name')
 @click.option(*assembly_id_opt.param_opts, help=f'Reference the owning Assembly by ID')
 @click.option('--in/--out', 'scale_in', default=False, help=f'Scale the {tnco_builder.display_name} in or out')
+@wait_option()
 @pass_io
 def scale_resource_cluster(
         tnco_client: TNCOClient,
@@ -63,6 +65,8 @@ def scale_resource_cluster(
         identity: Identity,
         assembly_identity: Identity,
         scale_in: bool,
+        wait: bool = False,
+        wait_timeout: float = None
     ):
     obj['clusterName'] = identity.value
     if assembly_identity.identifier.param_name == assembly_name_opt.param_name:
@@ -77,3 +81,5 @@ def scale_resource_cluster(
     else:
         process_id = tnco_client.assemblies.intent_scale_out(obj)
     io.print(f'{accepted_process_prefix}{process_id}')
+    if wait:
+        wait_for_processes(tnco_client, io, [process_id], timeout=wait_timeout)
@@ -4,4 +4,5 @@ from .tnco_builders import *
 from .identifier import *
 from .ignore_missing import *
 from .pass_io import *
-from .obj_utils import *
\ No newline at end of file
+from .obj_utils import *
+from .wait_for_processes import *
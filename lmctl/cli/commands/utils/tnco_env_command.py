@@ -1,14 +1,19 @@
 import click
 from typing import Optional
-from lmctl.cli.arguments import EnvironmentNameOption, TNCOClientSecretOption, TNCOPwdOption, TNCOTokenOption
+from lmctl.cli.arguments import EnvironmentNameOption, EnvironmentNamesOption, AllEnvironmentsOption, TNCOClientSecretOption, TNCOPwdOption, TNCOTokenOption
 from lmctl.cli.controller import get_global_controller
 from lmctl.client import TNCOClient
 
 class TNCOEnvironmentCommand(click.Command):
     
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, allow_multiple_environments: bool = False, **kwargs):
         super().__init__(*args, **kwargs)
-        self.params.append(EnvironmentNameOption())
+        self.allow_multiple_environments = allow_multiple_environments
+        if self.allow_multiple_environments:
+            self.params.append(EnvironmentNamesOption())
+            self.params.append(AllEnvironmentsOption())
+        else:
+            self.params.append(EnvironmentNameOption())
         self.params.append(TNCOClientSecretOption())
         self.params.append(TNCOPwdOption())
         self.params.append(TNCOTokenOption())
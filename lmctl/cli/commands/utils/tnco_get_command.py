@@ -1,6 +1,6 @@
 import click
-from typing import Dict, Any, Sequence, Tuple
-from .identifier import Identifier, determine_identifier, strip_identifiers
+from typing import Dict, Any, Sequence, Tuple, List, Iterator
+from .identifier import Identifier, Identity, determine_identifier, strip_identifiers
 from .tnco_env_command import TNCOEnvironmentCommand
 from .constraints import mutually_exclusive, mutually_exclusive_group
 from lmctl.cli.controller import get_global_controller
@@ -8,12 +8,16 @@ from lmctl.cli.arguments import (
     FileInputOption, OutputFormatOption, ObjectGroupOption, ObjectGroupIDOption,
     OBJECT_GROUP_PARAM_NAME, OBJECT_GROUP_ID_PARAM_NAME, OBJECT_GROUP_PARAM_OPTS_STR, OBJECT_GROUP_ID_PARAM_OPTS_STR
 )
-from lmctl.cli.format import Column, OutputFormat
+from lmctl.cli.format import Column, OutputFormat, TableFormat, Table
+from lmctl.cli.controller import EnvironmentResult
+from lmctl.client import TNCOClient
 
 __all__ = (
     'TNCOGetCommand',
 )
 
+environment_column = Column('environment', header='Environment')
+
 class TNCOGetCommand(TNCOEnvironmentCommand):
     
     def __init__(self, 
@@ -39,6 +43,7 @@ class TNCOGetCommand(TNCOEnvironmentCommand):
             kwargs['help'] = self._build_help()
         if 'short_help' not in kwargs or kwargs['short_help'] is None:
             kwargs['short_help'] = f'Get a {self.type_display_name}'
+        kwargs.setdefault('allow_multiple_environments', True)
         super().__init__(*args, **kwargs)
         if self.allow_file_input:
             file_input_option = FileInputOption()
@@ -69,6 +74,8 @@ class TNCOGetCommand(TNCOEnvironmentCommand):
                     *args, 
                     output_format: OutputFormat,
                     environment_name: str = None,
+                    environment_names: Sequence[str] = None,
+                    all_environments: bool = False,
                     pwd: str = None,
                     client_secret: str = None,
                     token: str = None,
@@ -77,24 +84,85 @@ class TNCOGetCommand(TNCOEnvironmentCommand):
                     object_group_id: str = None,
                     **kwargs):
         identity = determine_identifier(self.identifiers, required=self.identifier_required, file_content=file_content, **kwargs)
-        tnco_client = self._get_tnco_client(environment_name, pwd, client_secret, token)
-
         stripped_kwargs = strip_identifiers(self.identifiers, **kwargs)
 
-        if self.allow_object_group:
-            if object_group_name is not None:
-                stripped_kwargs['object_group_id'] = tnco_client.object_groups.get_by_name(object_group_name)['id']
-            else:
-                stripped_kwargs['object_group_id'] = object_group_id
+        if environment_names is not None:
+            if all_environments or len(environment_names) > 1:
+                return self._get_from_environments(*args, output_format=output_format, environment_names=environment_names, all_environments=all_environments, 
+                                                    pwd=pwd, client_secret=client_secret, token=token, identity=identity, 
+                                                    object_group_name=object_group_name, object_group_id=object_group_id, **stripped_kwargs)
+            environment_name = environment_names[0] if len(environment_names) > 0 else None
 
-        result = self.get_behaviour(*args, tnco_client=tnco_client, identity=identity, **stripped_kwargs)
+        tnco_client = self._get_tnco_client(environment_name, pwd, client_secret, token)
+        result = self._get(*args, tnco_client=tnco_client, identity=identity, object_group_name=object_group_name, object_group_id=object_group_id, **stripped_kwargs)
 
         io = get_global_controller().io
         if isinstance(result, list):
             io.print(output_format.convert_list(result))
+        elif isinstance(result, Iterator):
+            # Print items as they are retrieved (e.g. page by page) rather than waiting for all of them
+            for chunk in output_format.convert_stream(result):
+                io.print(chunk)
         else:
             io.print(output_format.convert_element(result))
 
+    def _get(self, *args, tnco_client: TNCOClient, identity: Identity, object_group_name: str = None, object_group_id: str = None, **kwargs):
+        if self.allow_object_group:
+            if object_group_name is not None:
+                kwargs['object_group_id'] = tnco_client.object_groups.get_by_name(object_group_name)['id']
+            else:
+                kwargs['object_group_id'] = object_group_id
+        return self.get_behaviour(*args, tnco_client=tnco_client, identity=identity, **kwargs)
+
+    def _get_from_environments(self, 
+                    *args, 
+                    output_format: OutputFormat,
+                    environment_names: Sequence[str],
+                    all_environments: bool,
+                    pwd: str = None,
+                    client_secret: str = None,
+                    token: str = None,
+                    **kwargs):
+        ctl = get_global_controller()
+        environments = ctl.get_environment_groups(environment_names, all_environments=all_environments)
+        if all_environments:
+            environments = [e for e in environments if e.has_tnco]
+        # Clients are built up front, so any prompts for credentials happen before the parallel requests
+        tnco_clients = {e.name: self._get_tnco_client(e.name, pwd, client_secret, token) for e in environments}
+        def get_from_environment(name: str):
+            result = self._get(*args, tnco_client=tnco_clients[name], **kwargs)
+            # Retrieve all items on the worker, the merged results are printed together
+            return list(result) if isinstance(result, Iterator) else result
+        results = ctl.run_in_environments(list(tnco_clients.keys()), get_from_environment)
+
+        ctl.io.print(self._environment_output_format(output_format).convert_list(self._merge_environment_results(results)))
+        failed = [r for r in results if r.failed]
+        for r in failed:
+            # Errors caught by a safety net have already been printed
+            if not isinstance(r.error, SystemExit):
+                ctl.io.print_error(f'Error: Failed to get {self.type_display_name} from environment "{r.environment}": {r.error}')
+        if len(failed) > 0:
+            ctl.io.print_error(f'Error: Failed to get {self.type_display_name} from environments: ' + ', '.join([r.environment for r in failed]))
+            exit(1)
+
+    def _merge_environment_results(self, results: Sequence[EnvironmentResult]) -> List[Dict[str, Any]]:
+        merged = []
+        for r in results:
+            if r.failed:
+                continue
+            items = r.result if isinstance(r.result, list) else [r.result]
+            for item in items:
+                if isinstance(item, dict):
+                    merged.append({'environment': r.environment, **item})
+                else:
+                    merged.append({'environment': r.environment, 'value': item})
+        return merged
+
+    def _environment_output_format(self, output_format: OutputFormat) -> OutputFormat:
+        if isinstance(output_format, TableFormat) and output_format.table is not None:
+            return TableFormat(table=Table(columns=[environment_column] + list(output_format._get_columns())))
+        return output_format
+
     def _build_help(self) -> str:
         help_msg = f'Get a {self.type_display_name}'
         if not self.identifier_required:
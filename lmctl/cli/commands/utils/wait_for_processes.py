@@ -0,0 +1,30 @@
+from typing import Sequence
+from lmctl.client import TNCOClient, TNCOProcessWaitTimeoutError
+from lmctl.cli.io import IOController
+
+__all__ = (
+    'wait_for_processes',
+)
+
+# Status of a process which finished successfully
+COMPLETED_STATUS = 'Completed'
+
+def wait_for_processes(tnco_client: TNCOClient, io: IOController, process_ids: Sequence[str], timeout: float = None):
+    """
+    Wait for the processes to finish, printing the status of each as it finishes. Exits with an error if any does not complete (or the timeout is reached)
+    """
+    unsuccessful = []
+    try:
+        for process in tnco_client.processes.iter_wait_for(process_ids, timeout=timeout):
+            status = process.get('status')
+            if status == COMPLETED_STATUS:
+                io.print(f'Process {process.get("id")}: {status}')
+            else:
+                unsuccessful.append(process)
+                io.print_error(f'Process {process.get("id")}: {status}')
+    except TNCOProcessWaitTimeoutError as e:
+        io.print_error(f'Error: {e}')
+        exit(1)
+    if len(unsuccessful) > 0:
+        io.print_error(f'{len(unsuccessful)} of {len(process_ids)} processes did not complete')
+        exit(1)
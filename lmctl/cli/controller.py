@@ -1,5 +1,8 @@
 import click
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, List, Sequence
 from lmctl.cli.io import IOController
 from lmctl.config import get_config_with_path, Config, ConfigError
 from lmctl.environment import EnvironmentGroup
@@ -7,6 +10,19 @@ from .safety_net import safety_net, tnco_client_safety_net
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of environments a command is executed against at once
+DEFAULT_ENVIRONMENT_WORKERS = 10
+
+@dataclass
+class EnvironmentResult:
+    environment: str
+    result: Any = None
+    error: BaseException = None
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+
 class CLIController:
     
     def __init__(self, config: Config, config_path: str):
@@ -34,6 +50,40 @@ class CLIController:
             exit(1)
         return env_group
 
+    def get_environment_groups(self, environment_group_names: Sequence[str] = None, all_environments: bool = False) -> List[EnvironmentGroup]:
+        if all_environments:
+            if environment_group_names:
+                self.io.print_error(f'Error: Cannot provide environment names when requesting all environments')
+                exit(1)
+            env_groups = [e for e in self.config.environments.values()]
+            if len(env_groups) == 0:
+                self.io.print_error(f'Error: No environments found in config')
+                exit(1)
+            return env_groups
+        if not environment_group_names:
+            return [self.get_environment_group()]
+        # Preserve order but ignore duplicates
+        unique_names = list(dict.fromkeys(environment_group_names))
+        return [self.get_environment_group(name) for name in unique_names]
+
+    def run_in_environments(self, environment_group_names: Sequence[str], func: Callable[[str], Any], max_workers: int = DEFAULT_ENVIRONMENT_WORKERS) -> List[EnvironmentResult]:
+        """
+        Execute "func" for each environment on a pool of worker threads. The function is passed the name of the environment.
+
+        Errors (including exits requested by a safety net) are captured on the result for the environment, rather than raised, 
+        so one failing environment does not stop the others. Results are returned in the same order as the environment names.
+        """
+        def run(environment_group_name: str) -> EnvironmentResult:
+            try:
+                return EnvironmentResult(environment=environment_group_name, result=func(environment_group_name))
+            except (Exception, SystemExit) as e:
+                logger.debug(f'Execution against environment {environment_group_name} failed: {e}')
+                return EnvironmentResult(environment=environment_group_name, error=e)
+        if len(environment_group_names) == 0:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(environment_group_names)), thread_name_prefix='lmctl-env') as executor:
+            return list(executor.map(run, environment_group_names))
+
     def get_active_environment(self) -> EnvironmentGroup:
         if self.config.active_environment is not None:
             env_group = self.config.environments.get(self.config.active_environment, None)
@@ -1,7 +1,7 @@
 from .output_format import OutputFormat
 from .input_format import InputFormat
 from .exceptions import BadFormatError
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Iterable, Iterator
 from lmctl.utils.dcutils.dc_to_dict import asdict
 import dataclasses
 import json 
@@ -21,6 +21,25 @@ class JsonFormat(OutputFormat, InputFormat):
         except json.JSONDecodeError as e:
             raise BadFormatError(f'Failed to convert to JSON: {e}') from e
 
+    def convert_stream(self, elements: Iterable[Any]) -> Iterator[str]:
+        # Produces the same document as convert_list, one element at a time
+        iterator = iter(elements)
+        end = object()
+        previous = next(iterator, end)
+        if previous is end:
+            yield self.convert_list([])
+            return
+        yield '{\n  "items": ['
+        for element in iterator:
+            yield self._convert_list_item(previous) + ','
+            previous = element
+        yield self._convert_list_item(previous)
+        yield '  ]\n}'
+
+    def _convert_list_item(self, element: Any) -> str:
+        converted = self.convert_element(element)
+        return '\n'.join(f'    {line}' for line in converted.split('\n'))
+
     def convert_element(self, element: Any) -> str:
         if dataclasses.is_dataclass(type(element)):
             element = asdict(element)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Any
+from typing import List, Any, Iterable, Iterator
 
 class OutputFormat(ABC):
 
@@ -10,3 +10,10 @@ class OutputFormat(ABC):
     @abstractmethod
     def convert_element(self, element: Any) -> str:
         pass
+
+    def convert_stream(self, elements: Iterable[Any]) -> Iterator[str]:
+        """
+        Convert elements as they are produced, yielding chunks of output which can be printed (on separate lines) straight away.
+        By default, all of the elements are collected and converted with convert_list
+        """
+        yield self.convert_list(list(elements))
@@ -1,5 +1,5 @@
 from .output_format import OutputFormat
-from typing import Union, Callable, List, Any
+from typing import Union, Callable, List, Any, Iterable, Iterator
 from tabulate import tabulate
 from pydantic.dataclasses import dataclass, Field
 
@@ -14,6 +14,8 @@ class Table:
     columns: List[Column] = Field(default_factory=list)
 
 class TableFormat(OutputFormat):
+    # Number of rows converted together by convert_stream
+    stream_batch_size = 100
 
     def __init__(self, headers: List[str] = None, row_processor: Callable = None, table: Table = None):
         if table is not None:
@@ -47,22 +49,43 @@ class TableFormat(OutputFormat):
                     raise TypeError(f'Found an instance of "{type(c)}" in table "{self.table}" columns when they must be an instance of "{Column.__name__}"')
         return columns
 
+    def _get_headers(self, columns: List[Column]) -> List[str]:
+        if columns is None:
+            return self.headers
+        headers = []
+        for c in columns:
+            if c.header is not None:
+                headers.append(c.header)
+            else:
+                headers.append(c.name)
+        return headers
+
     def convert_list(self, element_list: List[Any]):
         columns = self._get_columns()
-        if columns is None:
-            headers = self.headers
-        else:
-            headers = []
-            for c in columns:
-                if c.header is not None:
-                    headers.append(c.header)
-                else:
-                    headers.append(c.name)
+        headers = self._get_headers(columns)
         rows = []
         for element in element_list:
             rows.append(self.__element_to_table_row(element, columns))
         return tabulate(rows, headers=headers, tablefmt='orgtbl')
 
+    def convert_stream(self, elements: Iterable[Any]) -> Iterator[str]:
+        # Rows are converted in batches, with the headers on the first batch only (columns are aligned within each batch)
+        columns = self._get_columns()
+        headers = self._get_headers(columns)
+        rows = []
+        first_batch = True
+        for element in elements:
+            rows.append(self.__element_to_table_row(element, columns))
+            if len(rows) >= self.stream_batch_size:
+                yield self.__tabulate_batch(rows, headers if first_batch else ())
+                first_batch = False
+                rows = []
+        if len(rows) > 0 or first_batch:
+            yield self.__tabulate_batch(rows, headers if first_batch else ())
+
+    def __tabulate_batch(self, rows: List[List[Any]], headers: List[str]) -> str:
+        return tabulate(rows, headers=headers, tablefmt='orgtbl')
+
     def convert_element(self, element: Any):
         return self.convert_list([element])
 
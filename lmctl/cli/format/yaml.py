@@ -1,7 +1,7 @@
 from .output_format import OutputFormat
 from .input_format import InputFormat
 from .exceptions import BadFormatError
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Iterable, Iterator
 from lmctl.utils.dcutils.dc_to_dict import asdict
 import dataclasses
 import yaml
@@ -21,6 +21,26 @@ class YamlFormat(OutputFormat):
         except yaml.YAMLError as e:
             raise BadFormatError(f'Failed to convert to YAML: {e}') from e
 
+    def convert_stream(self, elements: Iterable[Any]) -> Iterator[str]:
+        iterator = iter(elements)
+        end = object()
+        first = next(iterator, end)
+        if first is end:
+            yield self.convert_list([]).rstrip('\n')
+            return
+        yield 'items:'
+        yield self._convert_list_item(first)
+        for element in iterator:
+            yield self._convert_list_item(element)
+
+    def _convert_list_item(self, element: Any) -> str:
+        if dataclasses.is_dataclass(type(element)):
+            element = asdict(element)
+        try:
+            return yaml.dump([element], sort_keys=False).rstrip('\n')
+        except yaml.YAMLError as e:
+            raise BadFormatError(f'Failed to convert to YAML: {e}') from e
+
     def convert_element(self, element: Any) -> str:
         if dataclasses.is_dataclass(type(element)):
             element = asdict(element)
@@ -69,6 +69,23 @@ def get_pkg_and_open(pkg_path):
         logger.exception(str(e))
         exit(1)
 
+def get_pkg_and_read_meta(pkg_path):
+    try:
+        pkg = pkgs.Pkg(pkg_path)
+        return pkg, pkg.read_meta()
+    except pkgs.InvalidPackageError as e:
+        printer.print_text('Error: {0}'.format(str(e)))
+        logger.exception(str(e))
+        exit(1)
+
+def inspect_pkg(pkg_path):
+    try:
+        return pkgs.Pkg(pkg_path).inspect()
+    except pkgs.InvalidPackageError as e:
+        printer.print_text('Error: {0}'.format(str(e)))
+        logger.exception(str(e))
+        exit(1)
+
 def open_pkg(pkg_path):
     try:
         return pkgs.Pkg(pkg_path).open()
@@ -291,6 +308,18 @@ class ExecutionController:
             validation_report = ValidationReporter().error_report(validation_result)
             self.end_with_failure(validation_report)
 
+    def process_environment_results(self, environment_results):
+        printer.print_section('Environment Results')
+        failures = []
+        for environment_result in environment_results:
+            if environment_result.failed:
+                printer.print_text('{0}: {1} - {2}'.format(environment_result.environment, FAILED, str(environment_result.error)))
+                failures.append('{0}: {1}'.format(environment_result.environment, str(environment_result.error)))
+            else:
+                printer.print_text('{0}: {1}'.format(environment_result.environment, PASSED))
+        if len(failures) > 0:
+            self.include_failure(['Failed on {0} of {1} environments:'.format(len(failures), len(environment_results))] + failures)
+
     def process_test_report(self, test_report):
         printer.print_section('Test Results')
         printer.print_text('Passed: {0}, Failed: {1}, Skipped: {2}'.format(test_report.passed_count(), test_report.failed_count(), test_report.skipped_count()))
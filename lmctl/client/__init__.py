@@ -1,5 +1,6 @@
 from .client import TNCOClient
-from .exceptions import TNCOClientError, TNCOClientHttpError
+from .async_client import AsyncTNCOClient, AsyncTNCOAPI
+from .exceptions import TNCOClientError, TNCOClientHttpError, TNCOProcessWaitTimeoutError
 from .client_builder import TNCOClientBuilder
 from .auth_type import AuthType
 from .auth_tracker import AuthTracker
@@ -10,6 +11,11 @@ from .token_auth import JwtTokenAuth
 from .error_capture import TNCOErrorCapture, tnco_error_capture
 from .client_test_result import TestResult, TestResults
 from .client_request import TNCOClientRequest
+from .transport import TNCOClientTransport, ConnectionPoolStats
+from .token_cache import TokenCache, FileTokenCache
+from .retry_policy import RetryPolicy, RetryBudget
+from .rate_limiter import RateLimiter, RateLimitStats
+from .response_cache import ResponseCache, ResponseStore, FileResponseStore
 from .constants import *
 
 def builder():
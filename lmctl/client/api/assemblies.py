@@ -1,16 +1,25 @@
 import urllib
-from typing import List, Dict, Union
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Union, Iterator, Sequence, Tuple
 from lmctl.client.exceptions import TNCOClientError
 from lmctl.client.models import (CreateAssemblyIntent, UpgradeAssemblyIntent, ChangeAssemblyStateIntent, 
                                     DeleteAssemblyIntent, ScaleAssemblyIntent, HealAssemblyIntent,
                                     AdoptAssemblyIntent, CreateOrUpgradeAssemblyIntent,
-                                    RollbackAssemblyIntent, CancelAssemblyIntent, RetryAssemblyIntent, Intent)
+                                    RollbackAssemblyIntent, CancelAssemblyIntent, RetryAssemblyIntent, Intent,
+                                    IntentResult, IntentBatchResults)
 
 from lmctl.client.client_request import TNCOClientRequest
-from .tnco_api_base import TNCOAPI
+from .tnco_api_base import TNCOAPI, DEFAULT_PAGE_SIZE
 from lmctl.client.utils import build_relative_endpoint
+from lmctl.client.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
 
 INTENTS_WITHOUT_LOCATION_HEADER = ["retry", "rollback", "cancel"]
+# Number of intents submitted at once by "intents_batch"
+DEFAULT_BATCH_WORKERS = 10
 
 class AssembliesAPI(TNCOAPI):
     topology_endpoint = 'api/topology/assemblies'
@@ -23,6 +32,12 @@ class AssembliesAPI(TNCOAPI):
     def get_topN(self, object_group_id: str = None) -> List:
         return self._get_json(self.topology_endpoint, object_group_id=object_group_id)
 
+    def iter_all(self, object_group_id: str = None, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Dict]:
+        return self._iter_json(self.topology_endpoint, object_group_id=object_group_id, page_size=page_size)
+
+    def iter_query(self, object_group_id: str = None, page_size: int = DEFAULT_PAGE_SIZE, **query_params) -> Iterator[Dict]:
+        return self._iter_json(self.topology_endpoint, query_params=query_params, object_group_id=object_group_id, page_size=page_size)
+
     def get_by_name(self, name: str) -> Dict:
         result = self.all_with_name(name)
         if len(result) == 0:
@@ -47,8 +62,52 @@ class AssembliesAPI(TNCOAPI):
                                                         RetryAssemblyIntent,
                                                         CancelAssemblyIntent,
                                                         RollbackAssemblyIntent], 
-                     object_group_id: str = None) -> str:
-        return self._intent_request_impl(intent_name, intent_obj, object_group_id=object_group_id)
+                     object_group_id: str = None, retryable: bool = None) -> str:
+        """
+        Request an intent. Intents are not retried by the client's RetryPolicy (a repeated intent may start a second process), 
+        unless "retryable" is True (or the policy has "retry_intents" enabled)
+        """
+        return self._intent_request_impl(intent_name, intent_obj, object_group_id=object_group_id, retryable=retryable)
+
+    def intents_batch(self, intents: Sequence[Tuple], max_workers: int = DEFAULT_BATCH_WORKERS, intents_per_second: float = None, 
+                        object_group_id: str = None, retryable: bool = None) -> IntentBatchResults:
+        """
+        Submit many intents, "max_workers" at a time. A failure to submit one intent does not stop the others.
+
+        Args:
+            intents (Sequence[Tuple]): (intent_name, intent_obj) pairs, or (intent_name, intent_obj, object_group_id) to set an object group on individual intents
+            max_workers (int): maximum number of intents submitted at once
+            intents_per_second (float): maximum average rate of submission (in addition to any RateLimiter on the client)
+            object_group_id (str): object group of all intents (unless set on an individual intent)
+            retryable (bool): allow the client's RetryPolicy to retry intents which fail with a transient error
+        Returns:
+            IntentBatchResults: the result of each intent (process ID or error, and latency), in the order given. 
+                Accepted retry, rollback and cancel intents have no process ID
+        """
+        if max_workers is None or max_workers < 1:
+            raise ValueError(f'max_workers must be greater than 0 but was {max_workers}')
+        bucket = TokenBucket(intents_per_second) if intents_per_second is not None else None
+        def submit(index: int, intent: Tuple) -> IntentResult:
+            intent_name, intent_obj = intent[0], intent[1]
+            intent_object_group_id = intent[2] if len(intent) > 2 and intent[2] is not None else object_group_id
+            if bucket is not None:
+                bucket.acquire()
+            start = time.perf_counter()
+            try:
+                process_id = self._intent_request_impl(intent_name, intent_obj, object_group_id=intent_object_group_id, retryable=retryable)
+            except Exception as e:
+                logger.debug(f'Intent {index} ({intent_name}) in batch failed: {e}')
+                return IntentResult(index, intent_name, error=e, latency=time.perf_counter() - start)
+            if intent_name in INTENTS_WITHOUT_LOCATION_HEADER:
+                # Accepted, but the response does not identify a process
+                process_id = None
+            return IntentResult(index, intent_name, process_id=process_id, latency=time.perf_counter() - start)
+        intents = list(intents)
+        if len(intents) == 0:
+            return IntentBatchResults()
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(intents)), thread_name_prefix='lmctl-intents') as executor:
+            futures = [executor.submit(submit, index, intent) for index, intent in enumerate(intents)]
+            return IntentBatchResults([future.result() for future in futures])
 
     def intent_create(self, intent_obj: Union[Dict, CreateAssemblyIntent], object_group_id: str = None) -> str:
         return self._intent_request_impl('createAssembly', intent_obj, object_group_id=object_group_id)
@@ -97,7 +156,7 @@ class AssembliesAPI(TNCOAPI):
                                                                         HealAssemblyIntent, 
                                                                         ScaleAssemblyIntent,
                                                                         UpgradeAssemblyIntent],
-                                   object_group_id: str = None) -> str:
+                                   object_group_id: str = None, retryable: bool = None) -> str:
         endpoint = self.intent_endpoint(intent_name)
         if isinstance(intent_obj, Intent):
             intent_obj_data = intent_obj.to_dict()
@@ -106,6 +165,8 @@ class AssembliesAPI(TNCOAPI):
         request = TNCOClientRequest(method='POST', endpoint=endpoint).add_json_body(intent_obj_data)
         if object_group_id is not None:
             request.add_object_group_id_body(object_group_id)
+        if retryable is not None:
+            request.set_retryable(retryable)
             
         if intent_name in INTENTS_WITHOUT_LOCATION_HEADER:
             return self._exec_request(request)
@@ -1,6 +1,6 @@
-from typing import List, Dict
+from typing import List, Dict, Iterator
 from lmctl.client.client_request import TNCOClientRequest
-from .tnco_api_base import TNCOAPI
+from .tnco_api_base import TNCOAPI, DEFAULT_PAGE_SIZE
 
 class BehaviourScenarioExecutionsAPI(TNCOAPI):
     endpoint = 'api/behaviour/executions'
@@ -47,6 +47,18 @@ class BehaviourScenarioExecutionsAPI(TNCOAPI):
             query_params=query_params
         )
 
+    def iter_all_in_project(self, project_id: str, include_scenario: bool = None, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Dict]:
+        query_params = {'projectId': project_id}
+        if include_scenario is not None:
+            query_params['includeScenario'] = include_scenario
+        return self._iter_json(query_params=query_params, page_size=page_size)
+
+    def iter_all_of_scenario(self, scenario_id: str, include_scenario: bool = None, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Dict]:
+        query_params = {'scenarioId': scenario_id}
+        if include_scenario is not None:
+            query_params['includeScenario'] = include_scenario
+        return self._iter_json(query_params=query_params, page_size=page_size)
+
     def get_progress(self, execution_id: str) -> Dict:
         endpoint = self._execution_progress_endpoint(execution_id)
         return self._get_json(endpoint=endpoint)
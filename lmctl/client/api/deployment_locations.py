@@ -1,5 +1,5 @@
-from typing import List, Dict
-from .tnco_api_base import TNCOAPI
+from typing import List, Dict, Iterator
+from .tnco_api_base import TNCOAPI, DEFAULT_PAGE_SIZE
 
 class DeploymentLocationAPI(TNCOAPI):
     endpoint = 'api/deploymentLocations'
@@ -7,6 +7,9 @@ class DeploymentLocationAPI(TNCOAPI):
     def all(self, object_group_id: str = None) -> List:
         return self._all(object_group_id=object_group_id)
 
+    def iter_all(self, object_group_id: str = None, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Dict]:
+        return self._iter_json(object_group_id=object_group_id, page_size=page_size)
+
     def get(self, id: str) -> Dict:
         return self._get(id_value=id)
 
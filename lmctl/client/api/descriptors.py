@@ -1,7 +1,7 @@
 import yaml
-from typing import List, Dict
+from typing import List, Dict, Iterator, Any
 from lmctl.client.client_request import TNCOClientRequest
-from .tnco_api_base import TNCOAPI
+from .tnco_api_base import TNCOAPI, DEFAULT_PAGE_SIZE
 from lmctl.client.utils import build_relative_endpoint_from_data, build_relative_endpoint
 
 
@@ -41,10 +41,21 @@ class DescriptorsAPI(TNCOAPI):
         return self._exec_request_and_parse_yaml(request)
 
     def all(self, object_group_id: str = None) -> List:
+        return self._all_as_yaml(object_group_id=object_group_id)
+
+    def iter_all(self, object_group_id: str = None, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Dict]:
+        return self._iter_pages(
+            fetch_page=lambda page_params: self._all_as_yaml(object_group_id=object_group_id, query_params=page_params),
+            page_size=page_size
+        )
+
+    def _all_as_yaml(self, object_group_id: str = None, query_params: Dict[str, Any] = None) -> List:
         request = TNCOClientRequest(
                         method='GET',
                         endpoint=self.endpoint,
                     ).add_headers({'Accept': 'application/yaml,application/json'})
+        if query_params is not None:
+            request.query_params.update(query_params)
         if object_group_id is not None:
             request.add_object_group_id_param(object_group_id)
         request.override_address = getattr(self, 'override_address') if hasattr(self, 'override_address') else None
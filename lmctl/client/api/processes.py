@@ -1,15 +1,133 @@
-from typing import List, Dict
+import time
+import logging
+from typing import List, Dict, Iterator, Union, Sequence, Tuple
 from .tnco_api_base import TNCOAPI
 from lmctl.client.client_request import TNCOClientRequest
+from lmctl.client.exceptions import TNCOProcessWaitTimeoutError
+
+logger = logging.getLogger(__name__)
+
+# Statuses of a process which will not change again
+FINISHED_PROCESS_STATUSES = ('Completed', 'Failed', 'Cancelled')
+# Seconds between status checks while waiting for processes. The interval grows by POLL_BACKOFF_FACTOR each time no process changes status,
+# up to the maximum, and returns to the initial interval when one does
+DEFAULT_POLL_INTERVAL = 1
+DEFAULT_MAX_POLL_INTERVAL = 15
+POLL_BACKOFF_FACTOR = 1.5
 
 class ProcessesAPI(TNCOAPI):
     endpoint = 'api/processes'
 
-    def get(self, id: str, shallow: bool = None) -> Dict:
+    def get(self, id: str, shallow: bool = None, stream: bool = False) -> Dict:
+        """
+        Get a process by ID. Set "stream" to parse the response as it is read, which reduces peak memory for deep (shallow=False) processes
+        """
         query_params = {}
         if shallow is not None:
             query_params['shallow'] = shallow
+        if stream:
+            return self._get(id_value=id, query_params=query_params, stream=True)
         return self._get(id_value=id, query_params=query_params)
 
     def query(self, object_group_id: str = None, **query_params) -> List:
         return self._get_json(self.endpoint, query_params=query_params, object_group_id=object_group_id)
+
+    def iter_query(self, object_group_id: str = None, **query_params) -> Iterator[Dict]:
+        """
+        Same as "query" but yields each process as it is parsed from the response, so the full list is never held in memory. 
+        The processes API does not support paging (no "offset"), so all processes are returned in one response (a "limit" query parameter is sent to the server as with "query")
+        """
+        return self._iter_json_response(self.endpoint, query_params=query_params, object_group_id=object_group_id)
+
+    def wait_for(self, process_ids: Union[str, Sequence[str]], timeout: float = None, statuses: Sequence[str] = FINISHED_PROCESS_STATUSES,
+                    poll_interval: float = DEFAULT_POLL_INTERVAL, max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL) -> Union[Dict, List[Dict]]:
+        """
+        Wait for one or more processes to reach one of the given statuses (by default, any status in which a process has finished).
+
+        Returns the (shallow) process when a single ID is given, otherwise a list of processes in the order of "process_ids".
+        Raises TNCOProcessWaitTimeoutError if any process has not reached one of the statuses before "timeout" seconds (None waits indefinitely)
+        """
+        single = isinstance(process_ids, str) or process_ids is None
+        ids = [process_ids] if single else list(process_ids)
+        finished = {}
+        for process_id, process in self._wait(ids, timeout, statuses, poll_interval, max_poll_interval):
+            finished[process_id] = process
+        if single:
+            return finished[process_ids]
+        return [finished[process_id] for process_id in ids]
+
+    def iter_wait_for(self, process_ids: Sequence[str], timeout: float = None, statuses: Sequence[str] = FINISHED_PROCESS_STATUSES,
+                        poll_interval: float = DEFAULT_POLL_INTERVAL, max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL) -> Iterator[Dict]:
+        """
+        Same as "wait_for" but yields each (shallow) process as soon as it reaches one of the statuses.
+
+        Processes are checked together on each poll: after the first check, all pending processes are retrieved with one query
+        (filtered by their Assembly, when they share one, and earliest start time). The poll interval backs off, from "poll_interval" up to "max_poll_interval", while no process changes status.
+        Raises TNCOProcessWaitTimeoutError if any process has not reached one of the statuses before "timeout" seconds
+        """
+        for process_id, process in self._wait(process_ids, timeout, statuses, poll_interval, max_poll_interval):
+            yield process
+
+    def _wait(self, process_ids: Sequence[str], timeout: float, statuses: Sequence[str], poll_interval: float, max_poll_interval: float) -> Iterator[Tuple[str, Dict]]:
+        if isinstance(statuses, str):
+            statuses = [statuses]
+        for process_id in process_ids:
+            if not process_id:
+                raise ValueError(f'Cannot wait for a process without an ID, process IDs were: {list(process_ids)}')
+        wanted_statuses = {status.lower() for status in statuses}
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        pending = dict.fromkeys(process_ids)
+        finished = {}
+        interval = poll_interval
+        while True:
+            changed = False
+            for process_id, process in self._check_processes(pending).items():
+                last_seen = pending[process_id]
+                if last_seen is None or last_seen.get('status') != process.get('status'):
+                    changed = True
+                if str(process.get('status')).lower() in wanted_statuses:
+                    del pending[process_id]
+                    finished[process_id] = process
+                    yield process_id, process
+                else:
+                    pending[process_id] = process
+            if len(pending) == 0:
+                return
+            interval = poll_interval if changed else min(interval * POLL_BACKOFF_FACTOR, max_poll_interval)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TNCOProcessWaitTimeoutError(f'Timed out after {timeout} seconds waiting for processes: {", ".join(pending.keys())}', 
+                                                        pending_ids=list(pending.keys()), finished=finished)
+                interval = min(interval, remaining)
+            logger.debug(f'Waiting {interval:.2f} seconds before checking {len(pending)} process(es)')
+            time.sleep(interval)
+
+    def _check_processes(self, pending: Dict[str, Dict]) -> Dict[str, Dict]:
+        # Once more than one process is known (from a previous check), all of them are retrieved with one query, filtered by their Assembly 
+        # (when they share one) and earliest start time. Processes not yet seen, or missing from the query results, are retrieved individually
+        checked = {}
+        known = [last_seen for last_seen in pending.values() if last_seen is not None]
+        if len(known) > 1:
+            query_params = self._batch_query_params(known)
+            if query_params is not None:
+                for process in self.iter_query(**query_params):
+                    if process.get('id') in pending:
+                        checked[process['id']] = process
+        for process_id in pending.keys():
+            if process_id not in checked:
+                checked[process_id] = self.get(process_id, shallow=True)
+        return {process_id: checked[process_id] for process_id in pending.keys()}
+
+    def _batch_query_params(self, processes: List[Dict]) -> Dict:
+        query_params = {}
+        assembly_ids = {process.get('assemblyId') for process in processes}
+        if len(assembly_ids) == 1 and None not in assembly_ids:
+            query_params['assemblyId'] = assembly_ids.pop()
+        start_times = [process.get('startTime') for process in processes]
+        if all(start_time is not None for start_time in start_times):
+            query_params['startDateTime'] = min(start_times)
+        if len(query_params) == 0:
+            # Without a filter the query would return every process
+            return None
+        return query_params
@@ -1,31 +1,53 @@
-from typing import Dict, Callable, List
+import logging
+import functools
+from typing import Dict, Callable, List, Iterator, Any
 from lmctl.client.client_request import TNCOClientRequest
 from lmctl.client.utils import (build_relative_endpoint, build_relative_endpoint_from_data, 
                         read_response_location_header, read_response_body_as_json, read_response_body_as_yaml, 
-                        read_response_body_as_plaintext)
+                        read_response_body_as_plaintext, iter_response_body_as_json)
 
 
+logger = logging.getLogger(__name__)
+
+# Number of items requested in each page by the "iter_*" methods
+DEFAULT_PAGE_SIZE = 100
+# Keys of a paged response body which may hold the items of the page
+PAGE_CONTENT_KEYS = ('items', 'content', 'results')
+
 def default_create_response_handler_placeholder(response):
     pass
 
 class TNCOAPI:
     id_attr = 'id'
+    # Query parameters used to request a page of a collection
+    page_size_param = 'limit'
+    page_offset_param = 'offset'
 
     def __init__(self, base_client: 'TNCOClient'):
         self.base_client = base_client
 
-    def _get_json(self, endpoint: str, query_params: Dict[str,str] = None, object_group_id: str = None):
+    def _get_json(self, endpoint: str, query_params: Dict[str,str] = None, object_group_id: str = None, stream: bool = False):
         request = TNCOClientRequest.build_request_for_json(endpoint=endpoint, object_group_id=object_group_id)
         if query_params is not None:
             request.query_params.update(query_params)
-        return self._exec_request_and_parse_json(request)
+        return self._exec_request_and_parse_json(request, stream=stream)
 
-    def _exec_request(self, request: TNCOClientRequest, response_handler: Callable = None):
+    def _exec_request(self, request: TNCOClientRequest, response_handler: Callable = None, stream: bool = False):
+        if stream:
+            response = self.base_client.make_request(request, stream=True)
+            try:
+                if response_handler is not None:
+                    return response_handler(response=response)
+            finally:
+                response.close()
+            return None
         response = self.base_client.make_request(request)
         if response_handler is not None:
             return response_handler(response=response)
 
-    def _exec_request_and_parse_json(self, request: TNCOClientRequest) -> Dict:
+    def _exec_request_and_parse_json(self, request: TNCOClientRequest, stream: bool = False) -> Dict:
+        if stream:
+            return self._exec_request(request, response_handler=functools.partial(read_response_body_as_json, stream=True), stream=True)
         return self._exec_request(request, response_handler=read_response_body_as_json)
 
     def _exec_request_and_parse_yaml(self, request: TNCOClientRequest) -> Dict:
@@ -46,12 +68,86 @@ class TNCOAPI:
             object_group_id=object_group_id
         )
 
-    def _get(self, id_value: str, query_params: Dict[str,str] = None, endpoint: str = None) -> Dict:
+    def _iter_json(self, endpoint: str = None, query_params: Dict[str,str] = None, object_group_id: str = None, 
+                    page_size: int = DEFAULT_PAGE_SIZE, max_items: int = None) -> Iterator[Dict]:
+        if endpoint is None:
+            endpoint = self.endpoint
+        return self._iter_pages(
+            fetch_page=lambda page_params: self._get_json(endpoint=endpoint, query_params=page_params, object_group_id=object_group_id),
+            query_params=query_params,
+            page_size=page_size,
+            max_items=max_items
+        )
+
+    def _iter_json_response(self, endpoint: str = None, query_params: Dict[str,str] = None, object_group_id: str = None, items_key: str = None) -> Iterator[Dict]:
+        """
+        Request a collection in one response (for endpoints which do not support paging), yielding each item as it is parsed from the connection.
+        The request is sent when iteration begins
+        """
+        if endpoint is None:
+            endpoint = self.endpoint
+        request = TNCOClientRequest.build_request_for_json(endpoint=endpoint, object_group_id=object_group_id)
+        if query_params is not None:
+            request.query_params.update(query_params)
+        response = self.base_client.make_request(request, stream=True)
+        yield from iter_response_body_as_json(response, items_key=items_key)
+
+    def _iter_pages(self, fetch_page: Callable[[Dict[str,Any]], Any], query_params: Dict[str,Any] = None, 
+                        page_size: int = DEFAULT_PAGE_SIZE, max_items: int = None) -> Iterator[Dict]:
+        """
+        Request a collection one page at a time (using the "page_size_param" and "page_offset_param" query parameters), yielding each item as its page arrives.
+
+        Paging stops when a page has fewer items than requested, the response marks itself as the last page or "max_items" have been yielded. 
+        If the server does not support paging (returns everything in one response, or the same page again) then the items it returned are yielded once only
+        """
+        if page_size is None or page_size < 1:
+            raise ValueError(f'page_size must be greater than 0 but was {page_size}')
+        offset = 0
+        yielded = 0
+        previous_page_ids = None
+        while True:
+            request_size = page_size if max_items is None else min(page_size, max_items - yielded)
+            if request_size <= 0:
+                return
+            page_params = dict(query_params) if query_params is not None else {}
+            page_params[self.page_size_param] = request_size
+            page_params[self.page_offset_param] = offset
+            body = fetch_page(page_params)
+            items, is_last_page = self._read_page(body)
+            page_ids = [item.get(self.id_attr) if isinstance(item, dict) else item for item in items]
+            if previous_page_ids is not None and len(page_ids) > 0 and page_ids == previous_page_ids:
+                logger.warning(f'Server returned the same page for offset {offset} of {self.__class__.__name__}, it may not support the "{self.page_offset_param}" parameter. Stopping iteration')
+                return
+            for item in items:
+                yield item
+                yielded += 1
+                if max_items is not None and yielded >= max_items:
+                    return
+            if is_last_page or len(items) != request_size:
+                # A short page is the last, a larger page means the server ignored the size and returned everything
+                return
+            previous_page_ids = page_ids
+            offset += len(items)
+
+    def _read_page(self, body: Any):
+        if body is None:
+            return [], True
+        if isinstance(body, list):
+            return body, False
+        if isinstance(body, dict):
+            for key in PAGE_CONTENT_KEYS:
+                if isinstance(body.get(key, None), list):
+                    return body[key], body.get('last', False) is True
+        # Not a collection
+        return [body], True
+
+    def _get(self, id_value: str, query_params: Dict[str,str] = None, endpoint: str = None, stream: bool = False) -> Dict:
         if endpoint is None:
             endpoint = self.endpoint
         return self._get_json(
             endpoint=build_relative_endpoint(base_endpoint=endpoint, id_value=id_value),
-            query_params=query_params
+            query_params=query_params,
+            stream=stream
         )
 
     def _create(self, obj: Dict, endpoint: str = None, response_handler: Callable = default_create_response_handler_placeholder, object_group_id: str = None):
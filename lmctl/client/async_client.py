@@ -0,0 +1,243 @@
+import asyncio
+import functools
+import logging
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Callable, Any, AsyncIterator
+from lmctl.utils.trace_ctx import trace_ctx
+from .api.tnco_api_base import TNCOAPI
+from .auth_type import AuthType
+from .client import TNCOClient
+from .client_request import TNCOClientRequest
+from .client_test_result import TestResults
+from .transport import TNCOClientTransport
+from .token_cache import TokenCache
+from .retry_policy import RetryPolicy
+from .rate_limiter import RateLimiter
+from .response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+# Methods on the API groups which do not make a request, so are not converted to coroutines
+NON_REQUEST_METHODS = ('intent_endpoint',)
+# Prefix of methods on the API groups returning an iterator, which are converted to async generators
+ITERATOR_METHOD_PREFIX = 'iter_'
+# Marks the end of an iterator run on the worker pool (StopIteration cannot be raised through a Future)
+_END_OF_ITERATION = object()
+
+class AsyncTNCOAPI:
+    """
+    Exposes the methods of a TNCOAPI group as coroutines.
+
+    For example, `await async_client.assemblies.get(id)` is the async equivalent of `client.assemblies.get(id)`.
+    Iterator methods become async generators, e.g. `async for process in async_client.processes.iter_query()`
+    """
+
+    def __init__(self, api: TNCOAPI, async_client: 'AsyncTNCOClient'):
+        self._api = api
+        self._async_client = async_client
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._api, name)
+        if name.startswith('_') or name in NON_REQUEST_METHODS or not callable(attr):
+            return attr
+
+        if name.startswith(ITERATOR_METHOD_PREFIX):
+            @functools.wraps(attr)
+            def iterate_async(*args, **kwargs):
+                return self._async_client.iterate(attr, *args, **kwargs)
+            return iterate_async
+
+        @functools.wraps(attr)
+        async def run_async(*args, **kwargs):
+            return await self._async_client.run(attr, *args, **kwargs)
+        return run_async
+
+
+class AsyncTNCOClient:
+    """
+    Asyncio client for TNCO, with the same API groups as TNCOClient (e.g. `await client.assemblies.get(id)`)
+
+    Requests are executed by a TNCOClient (sharing its TNCOClientRequest handling, auth types and pooled transport) on a bounded pool of worker threads,
+    so many requests may be in-flight from one event loop. Requests beyond "max_workers" wait for a free worker, rather than starting a new thread.
+
+    This is deliberately not built on an async HTTP library (httpx, aiohttp): that would add a dependency and a second implementation of auth,
+    retries, rate limiting and response caching, all of which are handled by the TNCOClient. The cost is that at most "max_workers" requests
+    are sent at once, however many coroutines are awaiting them. To have more requests in-flight, raise "max_workers" together with the connection 
+    pool size of the transport (TNCOClientBuilder.connection_pool), otherwise workers beyond the pool size open connections which are not kept alive.
+    """
+
+    def __init__(self, address: str = None, auth_type: AuthType = None, kami_address: str = None, transport: TNCOClientTransport = None,
+                    max_workers: int = None, client: TNCOClient = None, token_cache: TokenCache = None,
+                    refresh_ahead: float = None, retry_policy: RetryPolicy = None, rate_limiter: RateLimiter = None,
+                    response_cache: ResponseCache = None):
+        """
+        Args:
+            address (str): address of TNCO (ignored if "client" is set)
+            auth_type (AuthType): authentication for TNCO (ignored if "client" is set)
+            kami_address (str): address of Kami (ignored if "client" is set)
+            transport (TNCOClientTransport): transport used to send requests (ignored if "client" is set)
+            token_cache (TokenCache): cache of access tokens shared with other clients/processes (ignored if "client" is set)
+            refresh_ahead (float): fraction of the access token lifetime after which it is refreshed in the background (ignored if "client" is set)
+            retry_policy (RetryPolicy): policy for retrying failed requests (ignored if "client" is set)
+            rate_limiter (RateLimiter): limits the rate, and concurrency, of requests (ignored if "client" is set)
+            response_cache (ResponseCache): cache of responses from rarely changing endpoints (ignored if "client" is set)
+            max_workers (int): maximum number of requests executed at once. Defaults to the connection pool size of the transport
+            client (TNCOClient): an existing client to execute requests with
+        """
+        if client is None:
+            client = TNCOClient(address, auth_type=auth_type, kami_address=kami_address, transport=transport, token_cache=token_cache, 
+                                    refresh_ahead=refresh_ahead, retry_policy=retry_policy, rate_limiter=rate_limiter, 
+                                    response_cache=response_cache)
+        self.client = client
+        self.max_workers = max_workers if max_workers is not None else self.client.transport.pool_maxsize
+        self._executor = None
+
+    @property
+    def address(self) -> str:
+        return self.client.address
+
+    @property
+    def kami_address(self) -> str:
+        return self.client.kami_address
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='lmctl-async-client')
+        return self._executor
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Execute a (blocking) function of the client on the worker pool and wait for the result
+        """
+        # Tracing context is thread local, so copy it to the worker executing the request
+        ctx_values = dict(trace_ctx.data)
+        def run_in_ctx():
+            with trace_ctx.scope(ctx_values=ctx_values):
+                return func(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), run_in_ctx)
+
+    async def iterate(self, func: Callable, *args, **kwargs) -> AsyncIterator[Any]:
+        """
+        Execute a (blocking) function of the client, returning an iterator, on the worker pool and yield each item as the worker produces it
+        """
+        iterator = await self.run(func, *args, **kwargs)
+        try:
+            while True:
+                item = await self.run(next, iterator, _END_OF_ITERATION)
+                if item is _END_OF_ITERATION:
+                    return
+                yield item
+        finally:
+            # Release anything held by the iterator (e.g. the connection of a streamed response) when the consumer stops early
+            close = getattr(iterator, 'close', None)
+            if close is not None:
+                await self.run(close)
+
+    async def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, etype, value, traceback):
+        await self.close()
+
+    async def get_access_token(self) -> str:
+        return await self.run(self.client.get_access_token)
+
+    async def make_request(self, request: TNCOClientRequest, stream: bool = False) -> requests.Response:
+        if stream:
+            return await self.run(self.client.make_request, request, stream=True)
+        return await self.run(self.client.make_request, request)
+
+    async def make_request_for_json(self, request: TNCOClientRequest, stream: bool = False) -> Dict:
+        if stream:
+            return await self.run(self.client.make_request_for_json, request, stream=True)
+        return await self.run(self.client.make_request_for_json, request)
+
+    def iter_json(self, request: TNCOClientRequest, items_key: str = None) -> AsyncIterator[Any]:
+        return self.iterate(self.client.iter_json, request, items_key=items_key)
+
+    async def ping(self, include_template_engine: bool = False, timeout: float = None, lightweight: bool = False) -> TestResults:
+        return await self.run(self.client.ping, include_template_engine=include_template_engine, timeout=timeout, lightweight=lightweight)
+
+    @property
+    def auth(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self.client.auth, self)
+
+    @property
+    def assemblies(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self.client.assemblies, self)
+
+    @property
+    def behaviour_assembly_confs(self) -> AsyncTNCOAPI:
+        return self.behaviour_assembly_configs
+
+    @property
+    def behaviour_assembly_configs(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self.client.behaviour_assembly_configs, self)
+
+    @property
+    def behaviour_projects(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self.client.behaviour_projects, self)
+
+    @property
+    def behaviour_scenarios(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self.client.behaviour_scenarios, self)
+
+    @property
+    def behaviour_scenario_execs(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self.client.behaviour_scenario_execs, self)
+
+    @property
+    def deployment_locations(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self.client.deployment_locations, self)
+
+    @property
+    def descriptors(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self.client.descriptors, self)
+
+    @property
+    def descriptor_templates(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self.client.descriptor_templates, self)
+
+    @property
+    def lifecycle_drivers(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self.client.lifecycle_drivers, self)
+
+    @property
+    def processes(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self.client.processes, self)
+
+    @property
+    def object_groups(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self.client.object_groups, self)
+
+    @property
+    def permission_types(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self.client.permission_types, self)
+
+    @property
+    def resource_drivers(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self.client.resource_drivers, self)
+
+    @property
+    def resource_packages(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self.client.resource_packages, self)
+
+    @property
+    def resource_managers(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self.client.resource_managers, self)
+
+    @property
+    def shared_inf_keys(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self.client.shared_inf_keys, self)
+
+    @property
+    def vim_drivers(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self.client.vim_drivers, self)
@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from collections import namedtuple
 from lmctl.utils.jwt import decode_jwt
 import logging
 import time
@@ -6,43 +7,132 @@ import os
 
 logger = logging.getLogger(__name__)
 
+# Default fraction of a token's lifetime after which it is refreshed, when refresh-ahead is enabled
+DEFAULT_REFRESH_AHEAD = 0.8
+# Seconds to wait before retrying a failed background refresh (capped at half the remaining lifetime of the token)
+REFRESH_RETRY_INTERVAL = 5
+
+def get_expires_time_from_jwt(token: str) -> datetime:
+    jwt_content = decode_jwt(token)
+    exp = jwt_content.get('exp')
+    if exp is None:
+        raise ValueError('Expected "exp" in token content')
+    return datetime.fromtimestamp(exp)
+
+# Replaced as a whole when a new token is accepted, so readers never see the token of one auth with the expiry of another
+_TokenState = namedtuple('_TokenState', ['access_token', 'time_of_auth', 'time_of_expiry', 'refresh_at'])
+_NO_TOKEN = _TokenState(None, None, None, None)
+
 class AuthTracker:
+    """
+    Tracks the current access token and when it expires.
+
+    With "refresh_ahead" set, the token is due for refresh ("needs_refresh") once that fraction of its lifetime has passed,
+    so it can be replaced in the background while it remains valid for in-flight requests.
+    Without it, a token close to expiry is waited out and then treated as expired.
+    """
+
+    def __init__(self, refresh_ahead: float = None):
+        """
+        Args:
+            refresh_ahead (float): fraction (between 0 and 1) of the token lifetime after which it should be refreshed
+        """
+        if refresh_ahead is not None and not 0 < refresh_ahead < 1:
+            raise ValueError(f'refresh_ahead must be greater than 0 and less than 1 but was {refresh_ahead}')
+        self.refresh_ahead = refresh_ahead
+        self._state = _NO_TOKEN
 
-    def __init__(self):
-        self.current_access_token = None
-        self.time_of_auth = None # Datetime obj of when we're authenticated
-        self._time_of_expiry = None # Datetime obj of when the current token expires
+    @property
+    def current_access_token(self):
+        return self._state.access_token
+
+    @property
+    def time_of_auth(self):
+        # Datetime obj of when we're authenticated
+        return self._state.time_of_auth
+
+    @property
+    def _time_of_expiry(self):
+        # Datetime obj of when the current token expires
+        return self._state.time_of_expiry
 
     @property
     def has_access_expired(self):
-        if self.current_access_token is None:
+        state = self._state
+        if state.access_token is None:
             logger.debug('No current access token, must request one')
             return True
         logger.debug('Checking if CP4NA orchestration access token has expired')
         now = datetime.now()
-        logger.debug(f'Authenticated at {self.time_of_auth.isoformat()}, the time is {now.isoformat()}, token has an expiration timestamp of {self._time_of_expiry.isoformat()}')
-        if now >= self._time_of_expiry:
+        logger.debug(f'Authenticated at {state.time_of_auth.isoformat()}, the time is {now.isoformat()}, token has an expiration timestamp of {state.time_of_expiry.isoformat()}')
+        if now >= state.time_of_expiry:
             logger.debug('Token expired, must request a new one')
             return True
-        # If the token expires within 3/4 of a second, wait and get a new one
-        if now + timedelta(seconds = 0.75) >= self._time_of_expiry:
-            logger.debug('Expires in less than 1 second, must request a new one')
-            time.sleep(0.75)
+        # If the token expires within 3/4 of a second, get a new one
+        if now + timedelta(seconds = 0.75) >= state.time_of_expiry:
+            if self.refresh_ahead is None:
+                # Wait for it to expire, so the auth server does not hand back the same token
+                logger.debug('Expires in less than 1 second, must request a new one')
+                time.sleep(0.75)
+            else:
+                logger.debug('Expires in less than 1 second and was not refreshed ahead of time, must request a new one')
             return True
         return False
-    
+
+    @property
+    def needs_refresh(self):
+        """
+        True when refresh-ahead is enabled and the current (still valid) token has passed the refresh point of its lifetime
+        """
+        state = self._state
+        if state.refresh_at is None:
+            return False
+        return datetime.now() >= state.refresh_at
+
     def accept_auth_response(self, auth_response):
-        self.time_of_auth = datetime.now()
         if 'token' in auth_response:
-            self.current_access_token = auth_response.get('token')
-            self._time_of_expiry = self._get_expires_time_from_jwt(self.current_access_token)
+            access_token = auth_response.get('token')
         else:
-            self.current_access_token = auth_response.get('access_token', auth_response.get('accessToken'))
-            self._time_of_expiry = self._get_expires_time_from_jwt(self.current_access_token)
+            access_token = auth_response.get('access_token', auth_response.get('accessToken'))
+        time_of_auth = datetime.now()
+        time_of_expiry = self._get_expires_time_from_jwt(access_token)
+        previous_expiry = self._state.time_of_expiry
+        if previous_expiry is not None and time_of_expiry <= previous_expiry and time_of_expiry > time_of_auth:
+            # Auth server returned the same (or an older) token, refreshing again before it expires would not help
+            refresh_at = None
+        else:
+            refresh_at = self._calculate_refresh_at(time_of_auth, time_of_expiry)
+        self._state = _TokenState(access_token, time_of_auth, time_of_expiry, refresh_at)
+
+    def expires_after_current(self, token: str) -> bool:
+        """
+        Check if the given token expires later than the current token (always True if there is no current token)
+        """
+        state = self._state
+        if state.access_token is None:
+            return True
+        try:
+            return self._get_expires_time_from_jwt(token) > state.time_of_expiry
+        except ValueError:
+            return False
+
+    def postpone_refresh(self, seconds: float = REFRESH_RETRY_INTERVAL):
+        """
+        Delay the next refresh of the current token (e.g. after a failed attempt), without going past the time it expires
+        """
+        state = self._state
+        if state.refresh_at is None:
+            return
+        now = datetime.now()
+        remaining = (state.time_of_expiry - now).total_seconds()
+        delay = min(seconds, max(remaining / 2, 0))
+        self._state = state._replace(refresh_at=now + timedelta(seconds=delay))
+
+    def _calculate_refresh_at(self, time_of_auth: datetime, time_of_expiry: datetime) -> datetime:
+        if self.refresh_ahead is None:
+            return None
+        lifetime = time_of_expiry - time_of_auth
+        return time_of_auth + (lifetime * self.refresh_ahead)
 
     def _get_expires_time_from_jwt(self, token):
-        jwt_content = decode_jwt(token)
-        exp = jwt_content.get('exp')
-        if exp is None:
-            raise ValueError('Expected "exp" in token content')
-        return datetime.fromtimestamp(exp)
\ No newline at end of file
+        return get_expires_time_from_jwt(token)
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Tuple
 
 
 class AuthType:
@@ -6,3 +6,10 @@ class AuthType:
     def handle(self, client: 'TNCOClient') -> Dict:
         pass
 
+    def token_cache_key_parts(self) -> Tuple:
+        """
+        Values identifying the user/client (and credentials) this auth type obtains tokens for, used to key a TokenCache.
+        Returns None if the tokens should not be cached
+        """
+        return None
+
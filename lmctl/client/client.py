@@ -1,17 +1,27 @@
 from .api import *
+from .api.tnco_api_base import TNCOAPI
 from .exceptions import TNCOClientError, TNCOClientHttpError
 from .auth_type import AuthType
 from .auth_tracker import AuthTracker
-from .error_capture import tnco_error_capture
-from .client_test_result import TestResult, TestResults
+from .client_test_result import TestResults, PingProbeRun
 from .client_request import TNCOClientRequest
-from .utils import convert_dict_to_yaml, convert_dict_to_json
+from .transport import TNCOClientTransport, ConnectionPoolStats
+from .token_cache import TokenCache, token_cache_key
+from .retry_policy import RetryPolicy
+from .rate_limiter import RateLimiter, RateLimitStats
+from .response_cache import ResponseCache
+from .multipart import MultipartStreamEncoder
+from .utils import convert_dict_to_yaml, convert_dict_to_json, read_response_body_as_json, iter_response_body_as_json
 
 from lmctl.utils.trace_ctx import trace_ctx
 
 import requests
 import logging
-from typing import Dict, Any
+import threading
+import functools
+import contextlib
+import time
+from typing import Dict, Any, Callable, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -20,15 +30,44 @@ class TNCOClient:
     Base client for TNCO 
 
     TNCO APIs are grouped by functional attributes.
+
+    Requests are sent through a pooled, keep-alive transport (see TNCOClientTransport) so connections are re-used between calls. 
+    Call close() (or use the client as a context manager) to release the connections when finished.
+
+    Provide a TokenCache (e.g. FileTokenCache) to re-use access tokens obtained by other clients/processes authenticating as the same user.
+
+    Provide a RetryPolicy to send requests again, after a backoff, when they fail with a connection error or a transient (429/5xx) response.
+
+    Provide a RateLimiter to limit the rate of requests (with separate limits for intents) and the number of requests in-flight at once.
+
+    Provide a ResponseCache to re-use responses from endpoints which rarely change (catalog, object groups...), revalidating them with conditional requests.
+
+    Set "refresh_ahead" to replace the access token on a background thread once that fraction of its lifetime has passed, 
+    so requests are not held up re-authenticating when the token expires.
+
+    The client is thread-safe: a single instance may be shared by many worker threads. Authentication is performed by one thread at a time, 
+    the API groups (e.g. client.assemblies) are created once per client and requests from all threads share the transport's connection pool 
+    (size the pool with TNCOClientBuilder.connection_pool to match the number of threads).
     """
 
-    def __init__(self, address: str, auth_type: AuthType = None, kami_address: str = None, use_sessions: bool = False):
+    def __init__(self, address: str, auth_type: AuthType = None, kami_address: str = None, use_sessions: bool = True, transport: TNCOClientTransport = None,
+                    token_cache: TokenCache = None, refresh_ahead: float = None, retry_policy: RetryPolicy = None,
+                    rate_limiter: RateLimiter = None, response_cache: ResponseCache = None):
         self.address = self._parse_address(address)
         self.auth_type = auth_type
         self.kami_address = kami_address
-        self.auth_tracker = AuthTracker() if self.auth_type is not None else None
-        self._session = None
+        self.auth_tracker = AuthTracker(refresh_ahead=refresh_ahead) if self.auth_type is not None else None
+        self._auth_lock = threading.RLock()
+        # Held while a background refresh is in-flight, so only one is started at a time
+        self._refresh_lock = threading.Lock()
+        self._api_groups = {}
+        self._api_groups_lock = threading.Lock()
         self.use_sessions = use_sessions
+        self.transport = transport if transport is not None else TNCOClientTransport()
+        self.token_cache = token_cache
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
 
     def _parse_address(self, address: str) -> str:
         if address is not None:
@@ -37,26 +76,96 @@ class TNCOClient:
         return address
 
     def close(self):
-        if self._session is not None:
-            self._session.close()
-    
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, etype, value, traceback):
+        self.close()
+
     def _curr_session(self):
         if self.use_sessions:
-            if self._session is None:
-                self._session = requests.Session()
-            return self._session
+            return self.transport.session
         else:
             return requests
 
+    @property
+    def pool_stats(self) -> Dict[str, ConnectionPoolStats]:
+        return self.transport.pool_stats()
+
+    @property
+    def rate_limit_stats(self) -> Dict[str, RateLimitStats]:
+        if self.rate_limiter is None:
+            return {}
+        return self.rate_limiter.stats()
+
     def get_access_token(self) -> str:
         if self.auth_tracker is not None:
             if self.auth_tracker.has_access_expired:
-                auth_response = self.auth_type.handle(self)
-                self.auth_tracker.accept_auth_response(auth_response)
+                # Only one thread should authenticate when the token has expired
+                with self._auth_lock:
+                    if self.auth_tracker.has_access_expired:
+                        self._authenticate()
+            elif self.auth_tracker.needs_refresh:
+                self._start_background_refresh()
             return self.auth_tracker.current_access_token
         else:
             return None
 
+    def _start_background_refresh(self):
+        if not self._refresh_lock.acquire(blocking=False):
+            # Already refreshing
+            return
+        try:
+            threading.Thread(target=self._background_refresh, name='lmctl-token-refresh', daemon=True).start()
+        except Exception:
+            self._refresh_lock.release()
+            raise
+
+    def _background_refresh(self):
+        try:
+            with self._auth_lock:
+                if self.auth_tracker.needs_refresh:
+                    logger.debug('Refreshing CP4NA orchestration access token ahead of expiry')
+                    self._authenticate()
+        except Exception as e:
+            logger.warning(f'Failed to refresh CP4NA orchestration access token, the current token will be used until it expires: {e}')
+            self.auth_tracker.postpone_refresh()
+        finally:
+            self._refresh_lock.release()
+
+    def _authenticate(self):
+        cache_key = self._token_cache_key()
+        if cache_key is None:
+            auth_response = self.auth_type.handle(self)
+            self.auth_tracker.accept_auth_response(auth_response)
+            return
+        # Hold the cache lock while authenticating, so other processes wait and re-use our token rather than authenticating too
+        with self.token_cache.lock(cache_key):
+            cached_token = self.token_cache.get(cache_key)
+            # When refreshing ahead of expiry, the cache may still hold the current token
+            if cached_token is not None and self.auth_tracker.expires_after_current(cached_token):
+                self.auth_tracker.accept_auth_response({'token': cached_token})
+            else:
+                auth_response = self.auth_type.handle(self)
+                self.auth_tracker.accept_auth_response(auth_response)
+                self.token_cache.put(cache_key, self.auth_tracker.current_access_token)
+
+    def _token_cache_key(self) -> str:
+        if self.token_cache is None:
+            return None
+        return self._auth_scope_key()
+
+    def _auth_scope_key(self) -> str:
+        # Identifies the user/client requests are made as (None if the auth type cannot identify it)
+        if self.auth_type is None:
+            return token_cache_key(self.address)
+        key_parts = self.auth_type.token_cache_key_parts()
+        if key_parts is None:
+            return None
+        return token_cache_key(self.address, type(self.auth_type).__name__, *key_parts)
+
     def _add_auth_headers(self, headers: Dict) -> Dict:
         if self.auth_tracker is not None:
             access_token = self.get_access_token()
@@ -72,6 +181,9 @@ class TNCOClient:
         return headers
     
     def _convert_body(self, body: Any, headers: Dict[str, Any]):
+        if isinstance(body, (str, bytes)) or hasattr(body, 'read'):
+            # Already serialized (or a file to be streamed)
+            return body
         if headers.get('Content-Type', None) == 'application/json':
             body = convert_dict_to_json(body)
         elif headers.get('Content-Type', None) == 'application/yaml':
@@ -79,7 +191,11 @@ class TNCOClient:
         
         return body
     
-    def make_request(self, request: TNCOClientRequest) -> requests.Response:
+    def make_request(self, request: TNCOClientRequest, stream: bool = False) -> requests.Response:
+        """
+        Send a request. With "stream" set, the request returns once the response headers are received and the body is read from the connection 
+        as it is consumed (e.g. with response.iter_content()). Close the response when done with it, to return the connection to the pool
+        """
         url = request.override_address if request.override_address else self.address
         if request.endpoint is not None:
             url = f'{url}/{request.endpoint}'
@@ -99,61 +215,195 @@ class TNCOClient:
 
         if request.body is not None:
             request_kwargs['data'] = self._convert_body(request.body, request_kwargs['headers'])
+        multipart_files = None
         if request.files is not None and len(request.files) > 0:
-            request_kwargs['files'] = request.files
+            if request.body is None:
+                # Stream the files as they are sent, rather than requests building the whole multipart body in memory (see below)
+                multipart_files = request.files
+            else:
+                request_kwargs['files'] = request.files
+        if request.timeout is not None:
+            request_kwargs['timeout'] = request.timeout
+        if stream:
+            request_kwargs['stream'] = True
 
         # Log before adding sensitive data
         logger.debug(f'CP4NA orchestration request: Method={request.method}, URL={url}, Request Kwargs={request_kwargs}')
 
         if request.additional_auth_handler is not None:
             request_kwargs['auth'] = request.additional_auth_handler        
-        self._supplement_headers(headers=request_kwargs['headers'], inject_current_auth=request.inject_current_auth) 
 
-        try:
-            response = self._curr_session().request(method=request.method, url=url, verify=False, **request_kwargs)
-        except requests.RequestException as e:
-            raise TNCOClientError(str(e)) from e
-        logger.debug(f'CP4NA orchestration request has returned: Method={request.method}, URL={url}, Response={response}')
+        cache_key, cache_entry, cache_ttl = None, None, None
+        if self._is_cacheable(request, stream):
+            cache_ttl = self.response_cache.ttl_for(request.endpoint)
+            scope = self._auth_scope_key()
+            if cache_ttl is not None and scope is not None:
+                cache_key = self.response_cache.key(url, params=request_kwargs.get('params'), accept=request_kwargs['headers'].get('Accept'), scope=scope)
+                cache_entry = self.response_cache.get(cache_key)
+                if cache_entry is not None:
+                    if cache_entry.is_fresh:
+                        logger.debug(f'CP4NA orchestration request served from cache: Method={request.method}, URL={url}')
+                        return cache_entry.to_response()
+                    for header_name, header_value in cache_entry.conditional_headers().items():
+                        request_kwargs['headers'].setdefault(header_name, header_value)
+
+        attempt = 0
+        while True:
+            # Supplement on each attempt, as the access token may have been refreshed
+            self._supplement_headers(headers=request_kwargs['headers'], inject_current_auth=request.inject_current_auth) 
+            if multipart_files is not None:
+                # An encoder is read once, so a new one is needed on each attempt (only in-memory files are retried, see RetryPolicy)
+                multipart_body = MultipartStreamEncoder(multipart_files)
+                request_kwargs['data'] = multipart_body
+                request_kwargs['headers']['Content-Type'] = multipart_body.content_type
+            if self.retry_policy is not None:
+                self.retry_policy.budget.record_request()
+            try:
+                with self._limit_rate(request):
+                    response = self._curr_session().request(method=request.method, url=url, verify=False, **request_kwargs)
+            except requests.RequestException as e:
+                delay = self._get_retry_delay(request, attempt, error=e)
+                if delay is None:
+                    raise TNCOClientError(str(e)) from e
+                logger.warning(f'CP4NA orchestration request failed: Method={request.method}, URL={url}, Error={e}. Retrying in {delay:.2f} seconds (retry {attempt + 1})')
+            else:
+                logger.debug(f'CP4NA orchestration request has returned: Method={request.method}, URL={url}, Response={response}')
+                delay = self._get_retry_delay(request, attempt, response=response)
+                if delay is None:
+                    break
+                logger.warning(f'CP4NA orchestration request returned {response.status_code}: Method={request.method}, URL={url}. Retrying in {delay:.2f} seconds (retry {attempt + 1})')
+                # Release the connection before waiting
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+        if cache_entry is not None and response.status_code == 304:
+            logger.debug(f'CP4NA orchestration request revalidated cached response: Method={request.method}, URL={url}')
+            self.response_cache.revalidated(cache_key, cache_entry, cache_ttl)
+            return cache_entry.to_response()
+        if self.response_cache is not None and request.method.upper() not in ('GET', 'HEAD', 'OPTIONS'):
+            # Changes to a resource make cached responses for it (and the collections it belongs to) out of date
+            self.response_cache.invalidate(url)
         try:
             response.raise_for_status()
         except requests.HTTPError as e:
+            if stream:
+                # Error responses are small, read the body so it is available on the error then release the connection
+                response.content
+                response.close()
             raise TNCOClientHttpError(f'{request.method} request to {url} failed', e) from e
+        if cache_key is not None and response.status_code == 200:
+            self.response_cache.put(cache_key, url, response, cache_ttl)
         return response
 
-    def make_request_for_json(self, request: TNCOClientRequest) -> Dict:
+    def _is_cacheable(self, request: TNCOClientRequest, stream: bool) -> bool:
+        return self.response_cache is not None and not stream and request.method.upper() == 'GET' and request.override_address is None \
+                    and request.inject_current_auth and request.additional_auth_handler is None
+
+    def _limit_rate(self, request: TNCOClientRequest):
+        if self.rate_limiter is None:
+            return contextlib.nullcontext()
+        return self.rate_limiter.limit(request)
+
+    def _get_retry_delay(self, request: TNCOClientRequest, attempt: int, response: requests.Response = None, error: Exception = None) -> float:
+        if self.retry_policy is None:
+            return None
+        if response is not None and response.ok:
+            return None
+        return self.retry_policy.get_retry_delay(request, attempt, response=response, error=error)
+
+    def make_request_for_json(self, request: TNCOClientRequest, stream: bool = False) -> Dict:
+        """
+        Send a request and parse the response body as JSON. 
+        With "stream" set, the body is parsed incrementally as it is read from the connection, instead of reading the raw body into memory before parsing it
+        """
+        if stream:
+            response = self.make_request(request, stream=True)
+            try:
+                return read_response_body_as_json(response, stream=True)
+            finally:
+                response.close()
         response = self.make_request(request)
         try:
             return response.json()
         except ValueError as e:
             raise TNCOClientError(f'Failed to parse response to JSON: {str(e)}') from e
 
-    def ping(self, include_template_engine: bool = False) -> Dict:
-        with tnco_error_capture() as A:
-            self.descriptors.all()
-        with tnco_error_capture() as B:
-            self.deployment_locations.all()
-        with tnco_error_capture() as C:
-            self.behaviour_projects.all()
-        with tnco_error_capture() as D:
-            self.shared_inf_keys.all()
-        tests = []
-        tests.append(TestResult(name='Descriptors', error=A.error))
-        tests.append(TestResult(name='Topology', error=B.error))
-        tests.append(TestResult(name='Behaviour', error=C.error))
-        tests.append(TestResult(name='Resource Manager', error=D.error))
+    def iter_json(self, request: TNCOClientRequest, items_key: str = None) -> Iterator[Any]:
+        """
+        Send a request and yield the items of the JSON array in the response (or of the array under "items_key" when the response is an object), 
+        parsing each one as it is read from the connection. Memory use stays flat regardless of the size of the response. 
+        The request is sent when iteration begins and the connection is released when it ends (or the iterator is closed)
+        """
+        response = self.make_request(request, stream=True)
+        yield from iter_response_body_as_json(response, items_key=items_key)
+
+    def ping(self, include_template_engine: bool = False, timeout: float = None, lightweight: bool = False) -> TestResults:
+        """
+        Test the connection to TNCO by making a request to a few pre-selected APIs. The requests are made concurrently.
+
+        Args:
+            include_template_engine (bool): include a test of the connection to Kami
+            timeout (float): seconds to wait for each test to complete before it is marked as failed
+            lightweight (bool): make cheap requests (HEAD, or GET with limit=1 if HEAD is not supported) instead of retrieving all items from each API
+        Returns:
+            TestResults: the result of each test, including the seconds it took to complete
+        """
+        probes = [
+            ('Descriptors', self.descriptors),
+            ('Topology', self.deployment_locations),
+            ('Behaviour', self.behaviour_projects),
+            ('Resource Manager', self.shared_inf_keys)
+        ]
         if include_template_engine:
-            with tnco_error_capture() as templates:
-                self.descriptor_templates.all()
-            tests.append(TestResult(name='Template Engine', error=templates.error))
+            probes.append(('Template Engine', self.descriptor_templates))
+        # Daemon threads, so a probe that never returns does not hold up the caller past the timeout
+        runs = [PingProbeRun(name, self._ping_probe_func(api, timeout, lightweight)) for name, api in probes]
+        for run in runs:
+            run.start()
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        tests = []
+        for run in runs:
+            run.join(None if deadline is None else max(deadline - time.monotonic(), 0))
+            tests.append(run.to_test_result(timeout))
         return TestResults(tests=tests)
 
+    def _ping_probe_func(self, api: TNCOAPI, timeout: float, lightweight: bool) -> Callable:
+        if lightweight:
+            return functools.partial(self._lightweight_ping_probe, api=api, timeout=timeout)
+        else:
+            return api.all
+
+    def _lightweight_ping_probe(self, api: TNCOAPI, timeout: float = None):
+        override_address = getattr(api, 'override_address', None)
+        request = TNCOClientRequest(method='HEAD', endpoint=api.endpoint, override_address=override_address, timeout=timeout)
+        try:
+            self.make_request(request)
+        except TNCOClientHttpError as e:
+            if e.status_code not in (405, 501):
+                raise
+            logger.debug(f'HEAD request not supported on {api.endpoint}, using GET with limit=1 for ping')
+            request = TNCOClientRequest.build_request_for_json(endpoint=api.endpoint, query_params={'limit': 1})
+            request.override_address = override_address
+            request.timeout = timeout
+            self.make_request(request)
+
+    def _api_group(self, name: str, api_class: type) -> TNCOAPI:
+        api_group = self._api_groups.get(name, None)
+        if api_group is None:
+            with self._api_groups_lock:
+                api_group = self._api_groups.get(name, None)
+                if api_group is None:
+                    api_group = api_class(self)
+                    self._api_groups[name] = api_group
+        return api_group
+
     @property
     def auth(self) -> AuthenticationAPI:
-        return AuthenticationAPI(self)
+        return self._api_group('auth', AuthenticationAPI)
 
     @property
     def assemblies(self) -> AssembliesAPI:
-        return AssembliesAPI(self)
+        return self._api_group('assemblies', AssembliesAPI)
 
     @property
     def behaviour_assembly_confs(self) -> BehaviourAssemblyConfigurationsAPI:
@@ -161,64 +411,64 @@ class TNCOClient:
 
     @property
     def behaviour_assembly_configs(self) -> BehaviourAssemblyConfigurationsAPI:
-        return BehaviourAssemblyConfigurationsAPI(self)
+        return self._api_group('behaviour_assembly_configs', BehaviourAssemblyConfigurationsAPI)
 
     @property
     def behaviour_projects(self) -> BehaviourProjectsAPI:
-        return BehaviourProjectsAPI(self)
+        return self._api_group('behaviour_projects', BehaviourProjectsAPI)
 
     @property
     def behaviour_scenarios(self) -> BehaviourScenariosAPI:
-        return BehaviourScenariosAPI(self)
+        return self._api_group('behaviour_scenarios', BehaviourScenariosAPI)
 
     @property
     def behaviour_scenario_execs(self) -> BehaviourScenarioExecutionsAPI:
-        return BehaviourScenarioExecutionsAPI(self)
+        return self._api_group('behaviour_scenario_execs', BehaviourScenarioExecutionsAPI)
 
     @property
     def deployment_locations(self) -> DeploymentLocationAPI:
-        return DeploymentLocationAPI(self)
+        return self._api_group('deployment_locations', DeploymentLocationAPI)
 
     @property
     def descriptors(self) -> DescriptorsAPI:
-        return DescriptorsAPI(self)
+        return self._api_group('descriptors', DescriptorsAPI)
 
     @property
     def descriptor_templates(self) -> DescriptorTemplatesAPI:
-        return DescriptorTemplatesAPI(self)
+        return self._api_group('descriptor_templates', DescriptorTemplatesAPI)
     
     @property
     def lifecycle_drivers(self) -> LifecycleDriversAPI:
-        return LifecycleDriversAPI(self)
+        return self._api_group('lifecycle_drivers', LifecycleDriversAPI)
 
     @property
     def processes(self) -> ProcessesAPI:
-        return ProcessesAPI(self)
+        return self._api_group('processes', ProcessesAPI)
 
     @property
     def object_groups(self) -> ObjectGroupsAPI:
-        return ObjectGroupsAPI(self)
+        return self._api_group('object_groups', ObjectGroupsAPI)
 
     @property
     def permission_types(self) -> ObjectGroupsAPI:
-        return PermissionTypesAPI(self)
+        return self._api_group('permission_types', PermissionTypesAPI)
 
     @property
     def resource_drivers(self) -> ResourceDriversAPI:
-        return ResourceDriversAPI(self)
+        return self._api_group('resource_drivers', ResourceDriversAPI)
     
     @property
     def resource_packages(self) -> ResourcePackagesAPI:
-        return ResourcePackagesAPI(self)
+        return self._api_group('resource_packages', ResourcePackagesAPI)
     
     @property
     def resource_managers(self) -> ResourceManagersAPI:
-        return ResourceManagersAPI(self)
+        return self._api_group('resource_managers', ResourceManagersAPI)
     
     @property
     def shared_inf_keys(self) -> SharedInfrastructureKeysAPI:
-        return SharedInfrastructureKeysAPI(self)
+        return self._api_group('shared_inf_keys', SharedInfrastructureKeysAPI)
     
     @property
     def vim_drivers(self) -> VIMDriversAPI:
-        return VIMDriversAPI(self)
\ No newline at end of file
+        return self._api_group('vim_drivers', VIMDriversAPI)
\ No newline at end of file
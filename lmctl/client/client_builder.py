@@ -4,7 +4,14 @@ from .pass_auth import UserPassAuth, LegacyUserPassAuth, OktaUserPassAuth
 from .zen_auth import ZenAPIKeyAuth
 from .token_auth import JwtTokenAuth
 from .client import TNCOClient
+from .async_client import AsyncTNCOClient
+from .transport import TNCOClientTransport, DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE
 from .auth_type import AuthType
+from .auth_tracker import DEFAULT_REFRESH_AHEAD
+from .token_cache import TokenCache
+from .retry_policy import RetryPolicy
+from .rate_limiter import RateLimiter
+from .response_cache import ResponseCache
 
 class TNCOClientBuilder:
 
@@ -12,6 +19,12 @@ class TNCOClientBuilder:
         self._address = None
         self._kami_address = None
         self._auth = None
+        self._transport = None
+        self._token_cache = None
+        self._refresh_ahead = None
+        self._retry_policy = None
+        self._rate_limiter = None
+        self._response_cache = None
     
     @property
     def address(self):
@@ -65,5 +78,68 @@ class TNCOClientBuilder:
         self._auth = LegacyUserPassAuth(username=username, password=password, legacy_auth_address=legacy_auth_address)
         return self
     
+    @property
+    def transport(self):
+        return self._transport
+
+    def transport(self, transport: TNCOClientTransport) -> 'TNCOClientBuilder':
+        self._transport = transport
+        return self
+
+    def connection_pool(self, pool_maxsize: int = DEFAULT_POOL_MAXSIZE, pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_block: bool = False, keep_alive: bool = True) -> 'TNCOClientBuilder':
+        self._transport = TNCOClientTransport(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block, keep_alive=keep_alive)
+        return self
+
+    @property
+    def token_cache(self):
+        return self._token_cache
+
+    def token_cache(self, token_cache: TokenCache) -> 'TNCOClientBuilder':
+        self._token_cache = token_cache
+        return self
+
+    @property
+    def refresh_ahead(self):
+        return self._refresh_ahead
+
+    def refresh_ahead(self, refresh_ahead: float = DEFAULT_REFRESH_AHEAD) -> 'TNCOClientBuilder':
+        self._refresh_ahead = refresh_ahead
+        return self
+
+    @property
+    def retry_policy(self):
+        return self._retry_policy
+
+    def retry_policy(self, retry_policy: RetryPolicy = None) -> 'TNCOClientBuilder':
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        return self
+
+    @property
+    def rate_limiter(self):
+        return self._rate_limiter
+
+    def rate_limiter(self, rate_limiter: RateLimiter) -> 'TNCOClientBuilder':
+        self._rate_limiter = rate_limiter
+        return self
+
+    def rate_limit(self, requests_per_second: float = None, burst: int = None, intents_per_second: float = None, intent_burst: int = None, 
+                    max_in_flight: int = None) -> 'TNCOClientBuilder':
+        self._rate_limiter = RateLimiter(requests_per_second=requests_per_second, burst=burst, intents_per_second=intents_per_second, 
+                                            intent_burst=intent_burst, max_in_flight=max_in_flight)
+        return self
+
+    @property
+    def response_cache(self):
+        return self._response_cache
+
+    def response_cache(self, response_cache: ResponseCache = None) -> 'TNCOClientBuilder':
+        self._response_cache = response_cache if response_cache is not None else ResponseCache()
+        return self
+
     def build(self):
-        return TNCOClient(self._address, auth_type=self._auth, kami_address=self._kami_address)
+        return TNCOClient(self._address, auth_type=self._auth, kami_address=self._kami_address, transport=self._transport, token_cache=self._token_cache, 
+                            refresh_ahead=self._refresh_ahead, retry_policy=self._retry_policy, rate_limiter=self._rate_limiter,
+                            response_cache=self._response_cache)
+
+    def build_async(self, max_workers: int = None) -> AsyncTNCOClient:
+        return AsyncTNCOClient(client=self.build(), max_workers=max_workers)
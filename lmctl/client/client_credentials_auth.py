@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Tuple
 from .auth_type import AuthType
 
 class ClientCredentialsAuth(AuthType):
@@ -11,4 +11,5 @@ class ClientCredentialsAuth(AuthType):
     def handle(self, client: 'TNCOClient') -> Dict:
         return client.auth.request_client_access(self.client_id, self.client_secret)
 
-    
\ No newline at end of file
+    def token_cache_key_parts(self) -> Tuple:
+        return ('oauth', self.client_id, self.client_secret)
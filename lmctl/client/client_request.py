@@ -21,6 +21,8 @@ class TNCOClientRequest:
     additional_auth_handler: AuthBase = None
     object_group_id_param: str = None
     object_group_id_body: str = None
+    timeout: float = None
+    retryable: bool = None
 
     def __post_init__(self):
         if self.object_group_id_body is not None:
@@ -77,6 +79,17 @@ class TNCOClientRequest:
         self.inject_current_auth = False
         return self
 
+    def set_timeout(self, timeout: float) -> 'TNCOClientRequest':
+        self.timeout = timeout
+        return self
+
+    def set_retryable(self, retryable: bool = True) -> 'TNCOClientRequest':
+        """
+        Mark the request as safe (or not) to send again on failure, overriding the classification of the client's RetryPolicy 
+        """
+        self.retryable = retryable
+        return self
+
     def add_auth_handler(self, additional_auth_handler: AuthBase) -> 'TNCOClientRequest':
         self.additional_auth_handler = additional_auth_handler
         return self
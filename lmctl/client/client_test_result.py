@@ -1,10 +1,15 @@
-from typing import List
+import threading
+import time
+from typing import List, Callable
+from .exceptions import TNCOClientError
 
 class TestResult:
 
-    def __init__(self, name: str, error: Exception = None):
+    def __init__(self, name: str, error: Exception = None, latency: float = None):
         self.name = name
         self.error = error
+        # Seconds taken to complete the test
+        self.latency = latency
     
     @property
     def passed(self):
@@ -20,4 +25,34 @@ class TestResults:
         for t in self.tests:
             if not t.passed:
                 return False
-        return True
\ No newline at end of file
+        return True
+
+class PingProbeRun(threading.Thread):
+    """
+    Runs a single test on a daemon thread, capturing the error (if any) and the time taken
+    """
+
+    def __init__(self, name: str, probe: Callable):
+        super().__init__(name=f'lmctl-ping-{name}', daemon=True)
+        self.test_name = name
+        self.probe = probe
+        self.error = None
+        self.unexpected_error = None
+        self.latency = None
+
+    def run(self):
+        start = time.monotonic()
+        try:
+            self.probe()
+        except TNCOClientError as e:
+            self.error = e
+        except Exception as e:
+            self.unexpected_error = e
+        self.latency = time.monotonic() - start
+
+    def to_test_result(self, timeout: float = None) -> TestResult:
+        if self.unexpected_error is not None:
+            raise self.unexpected_error
+        if self.latency is None:
+            return TestResult(name=self.test_name, error=TNCOClientError(f'Timed out after {timeout} seconds'), latency=timeout)
+        return TestResult(name=self.test_name, error=self.error, latency=self.latency)
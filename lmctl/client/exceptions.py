@@ -39,4 +39,11 @@ class TNCOClientHttpError(TNCOClientError):
                 body = yaml.safe_load(self.cause.response.text)
             except yaml.YAMLError as e:
                 pass
-        return body
\ No newline at end of file
+        return body
+
+class TNCOProcessWaitTimeoutError(TNCOClientError):
+
+    def __init__(self, msg, pending_ids, finished = None, *args, **kwargs):
+        self.pending_ids = pending_ids
+        self.finished = finished if finished is not None else {}
+        super().__init__(msg, *args, **kwargs)
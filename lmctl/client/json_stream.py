@@ -0,0 +1,203 @@
+import json
+import codecs
+from typing import Iterable, Iterator, Any
+
+# Bytes read from the response at a time
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\n\r'
+# Characters which may follow the part of a number decoded so far, when the number continues in the next chunk
+_NUMBER_CONTINUATION = '.eE+-0123456789'
+
+
+class JsonStreamParser:
+    """
+    Incrementally parses a JSON document from an iterable of byte (or str) chunks, such as `response.iter_content()` of a streamed response.
+
+    Use "iter_items" to yield the items of an array one at a time: only the item being parsed (plus the unread part of the current chunk) is held in memory,
+    so memory use does not grow with the size of the array. Use "parse" to build the whole document without first reading the raw body into memory.
+
+    A parser reads through its chunks once, so only one of "iter_items" or "parse" may be used on each instance.
+    """
+
+    def __init__(self, chunks: Iterable[Any], encoding: str = 'utf-8-sig'):
+        """
+        Args:
+            chunks (Iterable): bytes (or str) making up the JSON document
+            encoding (str): encoding of byte chunks (the default accepts UTF-8 with or without a byte order mark)
+        """
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _read_chunk(self) -> bool:
+        """
+        Append the next chunk to the buffer, discarding the part already parsed. Returns False at the end of the document
+        """
+        if self._eof:
+            return False
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self._eof = True
+            self._buffer = self._buffer[self._pos:] + self._decoder.decode(b'', final=True)
+            self._pos = 0
+            return False
+        if isinstance(chunk, bytes):
+            chunk = self._decoder.decode(chunk)
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """
+        Return the next non-whitespace character (without consuming it), or an empty string at the end of the document
+        """
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._read_chunk():
+                return ''
+
+    def _expect(self, expected: str):
+        char = self._peek()
+        if char != expected:
+            found = f'"{char}"' if char else 'end of document'
+            raise json.JSONDecodeError(f'Expecting "{expected}" but found {found}', self._buffer, self._pos)
+        self._pos += 1
+
+    def _decode_value(self) -> Any:
+        """
+        Decode the next complete value, reading more of the document until it can be decoded
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._read_more():
+                    raise
+                continue
+            if not self._eof and (end == len(self._buffer) or (self._is_number(value) and self._buffer[end] in _NUMBER_CONTINUATION)):
+                # A number (or literal) at the end of the buffer may continue in the next chunk. The decoder also stops a number short of an 
+                # incomplete fraction or exponent (e.g. the "1" of "1." or "1e"), which may be completed by the next chunk
+                if self._read_more():
+                    continue
+            self._pos = end
+            return value
+
+    def _is_number(self, value: Any) -> bool:
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+    def _read_more(self) -> bool:
+        # Read at least as much again as is pending, so a large value is re-tried a logarithmic (not linear) number of times
+        pending = len(self._buffer) - self._pos
+        read_any = False
+        while len(self._buffer) - self._pos < pending * 2 or not read_any:
+            if not self._read_chunk():
+                return read_any
+            read_any = True
+        return True
+
+    def _parse_value(self) -> Any:
+        # Objects are parsed a field at a time and the items of arrays decoded one at a time, so the raw text of the whole document is never held
+        char = self._peek()
+        if char == '{':
+            self._pos += 1
+            obj = {}
+            if self._peek() == '}':
+                self._pos += 1
+                return obj
+            while True:
+                key = self._parse_key()
+                obj[key] = self._parse_value()
+                if self._end_of_container('}'):
+                    return obj
+        if char == '[':
+            return list(self._iter_array())
+        return self._decode_value()
+
+    def _parse_key(self) -> str:
+        if self._peek() != '"':
+            self._expect('"')
+        key = self._decode_value()
+        self._expect(':')
+        return key
+
+    def _end_of_container(self, closing_char: str) -> bool:
+        char = self._peek()
+        if char == ',':
+            self._pos += 1
+            return False
+        self._expect(closing_char)
+        return True
+
+    def _iter_array(self) -> Iterator[Any]:
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self._decode_value()
+            if self._end_of_container(']'):
+                return
+
+    def parse(self) -> Any:
+        """
+        Parse the whole document
+        """
+        value = self._parse_value()
+        self._expect_end()
+        return value
+
+    def iter_items(self, items_key: str = None) -> Iterator[Any]:
+        """
+        Yield the items of the array making up the document, or of the array under "items_key" when the document is an object (e.g. a page of results).
+        Nothing is yielded if the object has no "items_key" or its value is null
+        """
+        if items_key is None:
+            yield from self._iter_array()
+            self._expect_end()
+            return
+        self._expect('{')
+        if self._peek() == '}':
+            return
+        while True:
+            key = self._parse_key()
+            if key == items_key:
+                if self._peek() == 'n':
+                    self._decode_value()
+                    return
+                # Remaining fields of the object are not read
+                yield from self._iter_array()
+                return
+            # Other fields are parsed and discarded
+            self._parse_value()
+            if self._end_of_container('}'):
+                return
+
+    def _expect_end(self):
+        char = self._peek()
+        if char:
+            raise json.JSONDecodeError('Extra data', self._buffer, self._pos)
+
+
+def iter_json_items(chunks: Iterable[Any], items_key: str = None) -> Iterator[Any]:
+    """
+    Yield the items of a JSON array (or of the array under "items_key" of a JSON object) from an iterable of chunks, one at a time
+    """
+    return JsonStreamParser(chunks).iter_items(items_key=items_key)
+
+def parse_json_stream(chunks: Iterable[Any]) -> Any:
+    """
+    Parse a JSON document from an iterable of chunks
+    """
+    return JsonStreamParser(chunks).parse()
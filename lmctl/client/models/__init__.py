@@ -1,4 +1,5 @@
 from .intents import (Intent, ExistingAssemblyIntent, CreateAssemblyIntent, 
                         ChangeAssemblyStateIntent, DeleteAssemblyIntent, HealAssemblyIntent,
                         ScaleAssemblyIntent, UpgradeAssemblyIntent, CreateOrUpgradeAssemblyIntent, AdoptAssemblyIntent,
-                        CancelAssemblyIntent, RetryAssemblyIntent, RollbackAssemblyIntent)
+                        CancelAssemblyIntent, RetryAssemblyIntent, RollbackAssemblyIntent,
+                        IntentResult, IntentBatchResults)
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, List
 from abc import ABC, abstractmethod
 
 class Intent(ABC):
@@ -373,4 +373,37 @@ class AdoptAssemblyIntent(Intent):
             obj['clusters'] = self.clusters
         if self.object_group_id is not None:
             obj['objectGroupId'] = self.object_group_id
-        return obj
\ No newline at end of file
+        return obj
+
+class IntentResult:
+    """
+    Outcome of one intent submitted with AssembliesAPI.intents_batch
+    """
+
+    def __init__(self, index: int, intent_name: str, process_id: str = None, error: Exception = None, latency: float = None):
+        # Position of the intent in the batch
+        self.index = index
+        self.intent_name = intent_name
+        # None for intents which do not return a process ID (retry, rollback and cancel), even when accepted
+        self.process_id = process_id
+        self.error = error
+        # Seconds taken to submit the intent (not including time waiting for a worker or the rate limit)
+        self.latency = latency
+
+    @property
+    def accepted(self) -> bool:
+        return self.error is None
+
+
+class IntentBatchResults:
+
+    def __init__(self, results: List[IntentResult] = None):
+        self.results = results or []
+
+    @property
+    def accepted(self) -> bool:
+        return all(r.accepted for r in self.results)
+
+    @property
+    def failed(self) -> List[IntentResult]:
+        return [r for r in self.results if not r.accepted]
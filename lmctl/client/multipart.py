@@ -0,0 +1,136 @@
+import os
+import uuid
+from typing import Dict, Any, List, Tuple, Optional
+
+# Bytes read from a file at a time, when the caller of "read" does not ask for a size
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def _file_name_of(file_obj: Any) -> Optional[str]:
+    name = getattr(file_obj, 'name', None)
+    if isinstance(name, str) and name[0:1] != '<' and name[-1:] != '>':
+        return os.path.basename(name)
+    return None
+
+
+def _remaining_size_of(file_obj: Any) -> Optional[int]:
+    try:
+        size = os.fstat(file_obj.fileno()).st_size
+        return size - file_obj.tell()
+    except (AttributeError, OSError, ValueError):
+        pass
+    try:
+        position = file_obj.tell()
+        file_obj.seek(0, os.SEEK_END)
+        size = file_obj.tell()
+        file_obj.seek(position)
+        return size - position
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+class MultipartStreamEncoder:
+    """
+    A multipart/form-data body, built from the same "files" accepted by requests, which is read a chunk at a time as it is sent.
+
+    requests builds the whole body of a request with "files" in memory before sending it, so uploading a package would hold all of it in memory.
+    Instead, this encoder reads each file only as the body is read (by the connection sending the request), so only one chunk is held at a time.
+    The length of the body is known up front (from the size of each file), so the request is sent with a Content-Length.
+
+    Each value of "files" may be a file object, str or bytes, or a tuple of (filename, content), (filename, content, content_type) or
+    (filename, content, content_type, headers). Files are read from their current position and are not closed.
+    """
+
+    def __init__(self, files: Dict[str, Any], boundary: str = None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.boundary = boundary if boundary is not None else uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self._segments = self._build_segments(files)
+        self._length = sum(length for _, length in self._segments)
+        self._index = 0
+        self._remaining_in_segment = self._segments[0][1] if len(self._segments) > 0 else 0
+        self._bytes_offset = 0
+
+    @property
+    def content_type(self) -> str:
+        return f'multipart/form-data; boundary={self.boundary}'
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _build_segments(self, files: Dict[str, Any]) -> List[Tuple[Any, int]]:
+        segments = []
+        for field_name, value in files.items():
+            file_name, content, content_type, headers = self._unpack(field_name, value)
+            segments.append(self._as_bytes_segment(self._part_headers(field_name, file_name, content_type, headers)))
+            if isinstance(content, str):
+                content = content.encode('utf-8')
+            if isinstance(content, (bytes, bytearray)):
+                segments.append(self._as_bytes_segment(bytes(content)))
+            else:
+                size = _remaining_size_of(content)
+                if size is None:
+                    # Size cannot be determined without reading it, so it must be held in memory
+                    segments.append(self._as_bytes_segment(content.read()))
+                else:
+                    segments.append((content, size))
+            segments.append(self._as_bytes_segment(b'\r\n'))
+        segments.append(self._as_bytes_segment(f'--{self.boundary}--\r\n'.encode('utf-8')))
+        return segments
+
+    def _as_bytes_segment(self, data: bytes) -> Tuple[bytes, int]:
+        return (data, len(data))
+
+    def _unpack(self, field_name: str, value: Any):
+        if isinstance(value, (tuple, list)):
+            if len(value) == 2:
+                return value[0], value[1], None, None
+            if len(value) == 3:
+                return value[0], value[1], value[2], None
+            return value[0], value[1], value[2], value[3]
+        # As requests, the file name defaults to the name of the file, otherwise the field name
+        file_name = _file_name_of(value) if not isinstance(value, (str, bytes, bytearray)) else None
+        return file_name or field_name, value, None, None
+
+    def _part_headers(self, field_name: str, file_name: Optional[str], content_type: Optional[str], headers: Optional[Dict[str, str]]) -> bytes:
+        disposition = f'form-data; name="{self._quote(field_name)}"'
+        if file_name is not None:
+            disposition += f'; filename="{self._quote(file_name)}"'
+        lines = [f'--{self.boundary}', f'Content-Disposition: {disposition}']
+        if content_type is not None:
+            lines.append(f'Content-Type: {content_type}')
+        if headers is not None:
+            for header_name, header_value in headers.items():
+                lines.append(f'{header_name}: {header_value}')
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('utf-8')
+
+    def _quote(self, value: str) -> str:
+        return value.replace('\\', '\\\\').replace('"', '%22').replace('\r', '%0D').replace('\n', '%0A')
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read up to "size" bytes of the body (one chunk, if size is not given). Returns b'' once the whole body has been read
+        """
+        if size is None or size < 0:
+            size = self.chunk_size
+        output = bytearray()
+        while len(output) < size and self._index < len(self._segments):
+            if self._remaining_in_segment <= 0:
+                self._next_segment()
+                continue
+            segment, _ = self._segments[self._index]
+            wanted = min(size - len(output), self._remaining_in_segment)
+            if isinstance(segment, bytes):
+                data = segment[self._bytes_offset:self._bytes_offset + wanted]
+                self._bytes_offset += len(data)
+            else:
+                data = segment.read(wanted)
+                if not data:
+                    raise IOError('File ended before the expected number of bytes were read (was it modified during the upload?)')
+            output.extend(data)
+            self._remaining_in_segment -= len(data)
+        return bytes(output)
+
+    def _next_segment(self):
+        self._index += 1
+        self._bytes_offset = 0
+        self._remaining_in_segment = self._segments[self._index][1] if self._index < len(self._segments) else 0
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Tuple
 from .auth_type import AuthType
 
 class OktaClientCredentialsAuth(AuthType):
@@ -13,4 +13,5 @@ class OktaClientCredentialsAuth(AuthType):
     def handle(self, client: 'TNCOClient') -> Dict:
         return client.auth.request_okta_client_access(self.client_id, self.client_secret, self.scope, self.auth_server_id, self.okta_server)
 
-    
\ No newline at end of file
+    def token_cache_key_parts(self) -> Tuple:
+        return ('okta', self.okta_server, self.auth_server_id, self.scope, self.client_id, self.client_secret)
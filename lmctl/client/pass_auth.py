@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Tuple
 from .auth_type import AuthType
 
 class UserPassAuth(AuthType):
@@ -15,6 +15,9 @@ class UserPassAuth(AuthType):
                                                 username=self.username,
                                                 password=self.password)
 
+    def token_cache_key_parts(self) -> Tuple:
+        return ('oauth', self.client_id, self.client_secret, self.username, self.password)
+
 class OktaUserPassAuth(AuthType):
 
     def __init__(self, username: str, password: str, client_id: str, client_secret: str, scope: str = None, auth_server_id: str = None, okta_server: str = None):
@@ -34,6 +37,9 @@ class OktaUserPassAuth(AuthType):
                                                 auth_server_id= self.auth_server_id,
                                                 okta_server=self.okta_server)
 
+    def token_cache_key_parts(self) -> Tuple:
+        return ('okta', self.okta_server, self.auth_server_id, self.scope, self.client_id, self.client_secret, self.username, self.password)
+
 class LegacyUserPassAuth(AuthType):
 
     def __init__(self, username: str, password: str, legacy_auth_address: str = None):
@@ -43,3 +49,6 @@ class LegacyUserPassAuth(AuthType):
 
     def handle(self, client: 'TNCOClient') -> Dict:
         return client.auth.legacy_login(username=self.username, password=self.password, legacy_auth_address=self.legacy_auth_address)
+
+    def token_cache_key_parts(self) -> Tuple:
+        return ('legacy', self.legacy_auth_address, self.username, self.password)
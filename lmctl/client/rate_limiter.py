@@ -0,0 +1,142 @@
+import re
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Dict, Iterator
+from .client_request import TNCOClientRequest
+from .retry_policy import INTENT_ENDPOINT_PATTERN
+
+logger = logging.getLogger(__name__)
+
+# Names of the buckets requests are counted against
+INTENT_BUCKET = 'intents'
+REQUEST_BUCKET = 'requests'
+IN_FLIGHT = 'in_flight'
+
+@dataclass
+class RateLimitStats:
+    name: str
+    requests: int = 0
+    waits: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        return self.total_wait / self.requests if self.requests > 0 else 0.0
+
+    def _record(self, waited: float):
+        self.requests += 1
+        if waited > 0:
+            self.waits += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+
+
+class TokenBucket:
+    """
+    Allows "rate" acquisitions per second on average, with bursts of up to "burst" acquisitions.
+
+    Acquiring reserves a token immediately (so waiting threads are served in the order they arrived) then sleeps, outside of the lock, until it is due.
+    """
+
+    def __init__(self, rate: float, burst: int = None):
+        if rate is None or rate <= 0:
+            raise ValueError(f'rate must be greater than 0 but was {rate}')
+        self.rate = rate
+        self.burst = burst if burst is not None and burst > 0 else max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take a token, waiting until one is available. Returns the seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._tokens + (now - self._last_refill) * self.rate, self.burst)
+            self._last_refill = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            wait = -self._tokens / self.rate
+        time.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """
+    Limits the requests a TNCOClient sends, so parallel work does not overload the orchestrator.
+
+    Requests to intent endpoints (api/intent/*) are counted against the "intents_per_second" bucket and all other requests (reads and
+    other changes) against the "requests_per_second" bucket. "max_in_flight" limits the number of requests awaiting a response at once.
+    Any limit left as None is not enforced.
+
+    The time requests spend waiting for each limit is recorded (see "stats").
+    """
+
+    def __init__(self, requests_per_second: float = None, burst: int = None, intents_per_second: float = None, intent_burst: int = None,
+                    max_in_flight: int = None):
+        """
+        Args:
+            requests_per_second (float): average rate of requests, other than intents
+            burst (int): number of requests, other than intents, which may be sent at once before "requests_per_second" applies (defaults to requests_per_second)
+            intents_per_second (float): average rate of intent requests
+            intent_burst (int): number of intents which may be sent at once before "intents_per_second" applies (defaults to intents_per_second)
+            max_in_flight (int): maximum number of requests awaiting a response at once
+        """
+        self._buckets = {}
+        if requests_per_second is not None:
+            self._buckets[REQUEST_BUCKET] = TokenBucket(requests_per_second, burst)
+        if intents_per_second is not None:
+            self._buckets[INTENT_BUCKET] = TokenBucket(intents_per_second, intent_burst)
+        self.max_in_flight = max_in_flight
+        self._in_flight = threading.BoundedSemaphore(max_in_flight) if max_in_flight is not None else None
+        limit_names = list(self._buckets.keys()) + ([IN_FLIGHT] if self._in_flight is not None else [])
+        self._stats = {name: RateLimitStats(name=name) for name in limit_names}
+        self._stats_lock = threading.Lock()
+
+    def bucket_name(self, request: TNCOClientRequest) -> str:
+        if request.endpoint is not None and re.match(INTENT_ENDPOINT_PATTERN, request.endpoint):
+            return INTENT_BUCKET
+        return REQUEST_BUCKET
+
+    @contextmanager
+    def limit(self, request: TNCOClientRequest) -> Iterator[None]:
+        """
+        Wait for the request to be allowed by the rate and in-flight limits, holding an in-flight slot until the context exits
+        """
+        name = self.bucket_name(request)
+        bucket = self._buckets.get(name)
+        if bucket is not None:
+            waited = bucket.acquire()
+            self._record(name, waited)
+            if waited > 0:
+                logger.debug(f'Request to {request.endpoint} waited {waited:.3f} seconds for the {name} rate limit')
+        if self._in_flight is None:
+            yield
+            return
+        if self._in_flight.acquire(blocking=False):
+            self._record(IN_FLIGHT, 0.0)
+        else:
+            start = time.monotonic()
+            self._in_flight.acquire()
+            self._record(IN_FLIGHT, time.monotonic() - start)
+        try:
+            yield
+        finally:
+            self._in_flight.release()
+
+    def _record(self, name: str, waited: float):
+        with self._stats_lock:
+            self._stats[name]._record(waited)
+
+    def stats(self) -> Dict[str, RateLimitStats]:
+        """
+        Returns a snapshot of the wait statistics of each limit, keyed by "requests", "intents" and "in_flight" (only those limits which are enforced)
+        """
+        with self._stats_lock:
+            return {name: replace(stats) for name, stats in self._stats.items()}
@@ -0,0 +1,271 @@
+import os
+import re
+import json
+import time
+import base64
+import hashlib
+import logging
+import tempfile
+import threading
+import requests
+from collections import OrderedDict
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple, Callable, Any
+from urllib.parse import urlsplit, urlencode
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_DIR_ENV_VAR = 'LMCTL_RESPONSE_CACHE_DIR'
+DEFAULT_MAX_ENTRIES = 256
+# Seconds a response is used without revalidating it, by endpoint (regex patterns matched against the relative endpoint of the request).
+# Only responses from endpoints matching one of the patterns are cached
+DEFAULT_TTLS = (
+    (r'^api/catalog/descriptors(/|$)', 60),
+    (r'^api/catalog/descriptorTemplates(/|$)', 60),
+    (r'^api/resource-manager/resource-drivers(/|$)', 300),
+    (r'^api/deploymentLocations(/|$)', 60),
+    (r'^api/v1/object-groups(/|$)', 300),
+)
+# Headers of a cached response which are kept, as they are needed to read the body
+STORED_HEADERS = ('Content-Type', 'Content-Encoding', 'ETag', 'Last-Modified')
+
+def default_response_cache_dir() -> Path:
+    override_dir = os.environ.get(RESPONSE_CACHE_DIR_ENV_VAR, None)
+    if override_dir is not None and len(override_dir.strip()) > 0:
+        return Path(override_dir)
+    return Path.home().joinpath('.lmctl').joinpath('responses')
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    resource: str
+    status_code: int
+    content: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    expires_at: float = 0
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get('ETag')
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get('Last-Modified')
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def can_revalidate(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def to_response(self) -> requests.Response:
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.url = self.url
+        response._content = self.content
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data['content'] = base64.b64encode(self.content).decode('ascii')
+        return data
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'CachedResponse':
+        data = dict(data)
+        data['content'] = base64.b64decode(data['content'])
+        return CachedResponse(**data)
+
+
+def _resource_of(url: str) -> str:
+    # The URL without query parameters or trailing slashes
+    parts = urlsplit(url)
+    return f'{parts.scheme}://{parts.netloc}{parts.path}'.rstrip('/')
+
+
+class ResponseStore:
+    """
+    Second level store for a ResponseCache, holding responses beyond the lifetime of the client (e.g. between lmctl commands)
+    """
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        pass
+
+    def put(self, key: str, entry: CachedResponse):
+        pass
+
+    def delete(self, key: str):
+        pass
+
+    def delete_matching(self, predicate: Callable[[CachedResponse], bool]):
+        pass
+
+
+class FileResponseStore(ResponseStore):
+    """
+    Stores responses in files, in a directory only readable by the current user (defaults to ~/.lmctl/responses)
+    """
+
+    def __init__(self, directory: str = None):
+        self.directory = Path(directory) if directory is not None else default_response_cache_dir()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory.joinpath(f'{key}.json')
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        path = self._entry_path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r') as f:
+                return CachedResponse.from_dict(json.load(f))
+        except (OSError, ValueError, TypeError) as e:
+            logger.debug(f'Ignoring unreadable cached response at {path}: {e}')
+            return None
+
+    def put(self, key: str, entry: CachedResponse):
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        path = self._entry_path(key)
+        # Write to a temporary file then replace, so readers never see a partially written entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f'{key}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry.to_dict(), f)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f'Failed to write response to cache at {path}: {e}')
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def delete(self, key: str):
+        path = self._entry_path(key)
+        if path.exists():
+            path.unlink()
+
+    def delete_matching(self, predicate: Callable[[CachedResponse], bool]):
+        if not self.directory.exists():
+            return
+        for path in self.directory.glob('*.json'):
+            entry = self.get(path.stem)
+            if entry is None or predicate(entry):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+
+class ResponseCache:
+    """
+    Caches responses to GET requests made by a TNCOClient, for endpoints whose resources rarely change (catalog, object groups...).
+
+    Responses are kept in an in-memory LRU (of "max_entries") and, optionally, a ResponseStore shared between clients/processes.
+    Entries are keyed by URL (including query parameters), Accept header and the auth scope (the user/client the request is made as).
+
+    A cached response is re-used without a request for the TTL of its endpoint. After that, it is revalidated with a
+    conditional request (If-None-Match/If-Modified-Since) and re-used if the server responds 304 (Not Modified).
+    Any other request from the client (PUT/POST/DELETE...) to a resource removes the cached responses for that resource, those
+    below it (e.g. api/catalog/descriptors/a for api/catalog/descriptors) and the collections above it.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttls: Sequence[Tuple[str, float]] = DEFAULT_TTLS, store: ResponseStore = None):
+        """
+        Args:
+            max_entries (int): maximum number of responses held in memory
+            ttls (Sequence[Tuple[str, float]]): pairs of endpoint regex pattern and seconds a response from a matching endpoint is used without revalidation.
+                Responses from endpoints not matching any pattern are not cached
+            store (ResponseStore): optional second level store (e.g. FileResponseStore)
+        """
+        self.max_entries = max_entries
+        self.ttls = [(re.compile(pattern), ttl) for pattern, ttl in ttls]
+        self.store = store
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ttl_for(self, endpoint: str) -> Optional[float]:
+        if endpoint is None:
+            return None
+        for pattern, ttl in self.ttls:
+            if pattern.match(endpoint):
+                return ttl
+        return None
+
+    def key(self, url: str, params: Dict[str, Any] = None, accept: str = None, scope: str = None) -> str:
+        if params:
+            url = f'{url}?{urlencode(sorted((k, str(v)) for k, v in params.items()))}'
+        digest = hashlib.sha256()
+        for part in (url, accept, scope):
+            digest.update(str(part).encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self.store is not None:
+            entry = self.store.get(key)
+            if entry is not None:
+                self._put_in_memory(key, entry)
+            return entry
+        return None
+
+    def put(self, key: str, url: str, response: requests.Response, ttl: float):
+        headers = {name: response.headers[name] for name in STORED_HEADERS if name in response.headers}
+        entry = CachedResponse(url=url, resource=_resource_of(url), status_code=response.status_code, content=response.content,
+                                    headers=headers, expires_at=time.time() + ttl)
+        self._put_in_memory(key, entry)
+        if self.store is not None:
+            self.store.put(key, entry)
+
+    def revalidated(self, key: str, entry: CachedResponse, ttl: float):
+        """
+        Mark an entry as fresh again, after the server confirmed it has not been modified
+        """
+        entry.expires_at = time.time() + ttl
+        self._put_in_memory(key, entry)
+        if self.store is not None:
+            self.store.put(key, entry)
+
+    def _put_in_memory(self, key: str, entry: CachedResponse):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, url: str):
+        """
+        Remove cached responses for the resource at the URL, resources below it and collections above it
+        """
+        resource = _resource_of(url)
+        def is_related(entry: CachedResponse) -> bool:
+            return entry.resource == resource or entry.resource.startswith(resource + '/') or resource.startswith(entry.resource + '/')
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if is_related(entry)]:
+                del self._entries[key]
+        if self.store is not None:
+            self.store.delete_matching(is_related)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        if self.store is not None:
+            self.store.delete_matching(lambda entry: True)
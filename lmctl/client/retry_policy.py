@@ -0,0 +1,174 @@
+import re
+import random
+import logging
+import threading
+import requests
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Sequence
+from .client_request import TNCOClientRequest
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_RETRIES = 3
+# Seconds before the first retry, doubled on each further attempt (before jitter is applied)
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_MAX = 30
+# Longest "Retry-After" the client will wait for, before giving up instead
+DEFAULT_MAX_RETRY_AFTER = 120
+# Responses to retry: too many requests and the gateway/unavailable errors returned by an orchestrator under load
+DEFAULT_RETRY_STATUSES = (429, 502, 503, 504)
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+# POST requests which are safe to repeat (requesting an access token)
+DEFAULT_IDEMPOTENT_POST_ENDPOINTS = (r'^oauth/token$', r'^oauth2/.+/v1/token$', r'^(ui/)?api/login$')
+INTENT_ENDPOINT_PATTERN = r'^api/intent/'
+
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of the requests made, so a struggling server is not overwhelmed by retries from many threads.
+
+    Each request deposits "ratio" into the budget (up to "max_balance") and each retry withdraws 1.
+    The budget starts with "min_retries", so a client making few requests can still retry.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, max_balance: float = 100):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.max_balance = max(max_balance, min_retries)
+        self._balance = float(min_retries)
+        self._lock = threading.Lock()
+
+    @property
+    def balance(self) -> float:
+        return self._balance
+
+    def record_request(self):
+        with self._lock:
+            self._balance = min(self._balance + self.ratio, self.max_balance)
+
+    def try_withdraw(self) -> bool:
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Decides if, and when, a failed request should be sent again.
+
+    Connection errors and responses with a status in "retry_statuses" are retried with exponential backoff and full jitter
+    (a random delay between 0 and min(backoff_max, backoff_base * 2^attempt)), or after the delay requested by a "Retry-After" header.
+
+    Only requests which are safe to repeat are retried:
+    - requests with an idempotent method (GET, HEAD, OPTIONS, PUT, DELETE)
+    - POST requests to endpoints matching "idempotent_post_endpoints" (by default, the access token endpoints)
+    - POST requests to intent endpoints, only if "retry_intents" is enabled (a repeated intent may start a second process)
+    - any request marked with TNCOClientRequest.set_retryable(True) (and no request marked with set_retryable(False))
+    Requests with a body streamed from a file are never retried, as the body cannot be sent again (even if marked as retryable).
+
+    Extend this class and override "is_retryable_request" or "get_retry_delay" to customise the policy.
+    """
+
+    def __init__(self, max_retries: int = DEFAULT_MAX_RETRIES, backoff_base: float = DEFAULT_BACKOFF_BASE, backoff_max: float = DEFAULT_BACKOFF_MAX,
+                    retry_statuses: Sequence[int] = DEFAULT_RETRY_STATUSES, max_retry_after: float = DEFAULT_MAX_RETRY_AFTER,
+                    idempotent_post_endpoints: Sequence[str] = DEFAULT_IDEMPOTENT_POST_ENDPOINTS, retry_intents: bool = False,
+                    budget: RetryBudget = None):
+        """
+        Args:
+            max_retries (int): maximum number of times a request is sent again after the first attempt
+            backoff_base (float): seconds before the first retry (before jitter), doubled on each further retry
+            backoff_max (float): maximum seconds between retries (before jitter)
+            retry_statuses (Sequence[int]): HTTP response statuses to retry
+            max_retry_after (float): maximum seconds to wait when a response includes a "Retry-After" header. Longer waits are not retried
+            idempotent_post_endpoints (Sequence[str]): regex patterns of (relative) endpoints of POST requests which may be retried
+            retry_intents (bool): retry POST requests to intent endpoints
+            budget (RetryBudget): limits the number of retries relative to the number of requests. Defaults to a RetryBudget with default settings
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = tuple(retry_statuses)
+        self.max_retry_after = max_retry_after
+        self.idempotent_post_endpoints = [re.compile(pattern) for pattern in idempotent_post_endpoints]
+        self.retry_intents = retry_intents
+        self.budget = budget if budget is not None else RetryBudget()
+
+    def is_retryable_request(self, request: TNCOClientRequest) -> bool:
+        if self._has_streamed_body(request):
+            return False
+        if request.retryable is not None:
+            return request.retryable
+        method = request.method.upper()
+        if method in IDEMPOTENT_METHODS:
+            return True
+        if method == 'POST' and request.endpoint is not None:
+            if re.match(INTENT_ENDPOINT_PATTERN, request.endpoint):
+                return self.retry_intents
+            return any(pattern.match(request.endpoint) for pattern in self.idempotent_post_endpoints)
+        return False
+
+    def _has_streamed_body(self, request: TNCOClientRequest) -> bool:
+        if hasattr(request.body, 'read'):
+            return True
+        if request.files:
+            for file_value in request.files.values():
+                if isinstance(file_value, tuple):
+                    file_value = file_value[1] if len(file_value) > 1 else None
+                if hasattr(file_value, 'read'):
+                    return True
+        return False
+
+    def is_retryable_response(self, response: requests.Response) -> bool:
+        return response.status_code in self.retry_statuses
+
+    def get_retry_delay(self, request: TNCOClientRequest, attempt: int, response: requests.Response = None, error: Exception = None) -> Optional[float]:
+        """
+        Returns the seconds to wait before sending the request again, or None if it should not be retried
+
+        Args:
+            request (TNCOClientRequest): the request which failed
+            attempt (int): number of retries already made for this request (0 after the first attempt)
+            response (requests.Response): the response, if one was received
+            error (Exception): the connection error, if no response was received
+        """
+        if attempt >= self.max_retries:
+            return None
+        if response is not None and not self.is_retryable_response(response):
+            return None
+        if not self.is_retryable_request(request):
+            return None
+        delay = self.backoff(attempt)
+        if response is not None:
+            retry_after = self.parse_retry_after(response)
+            if retry_after is not None:
+                if retry_after > self.max_retry_after:
+                    logger.debug(f'Not retrying {request.method} request to {request.endpoint}, server requested a wait of {retry_after} seconds (max is {self.max_retry_after})')
+                    return None
+                delay = max(delay, retry_after)
+        if not self.budget.try_withdraw():
+            logger.debug(f'Not retrying {request.method} request to {request.endpoint}, retry budget exhausted')
+            return None
+        return delay
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def parse_retry_after(self, response: requests.Response) -> Optional[float]:
+        value = response.headers.get('Retry-After') if response.headers is not None else None
+        if value is None:
+            return None
+        value = str(value).strip()
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
@@ -0,0 +1,151 @@
+import os
+import json
+import hashlib
+import logging
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, Iterator, Any
+from .auth_tracker import get_expires_time_from_jwt
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+logger = logging.getLogger(__name__)
+
+TOKEN_CACHE_DIR_ENV_VAR = 'LMCTL_TOKEN_CACHE_DIR'
+# Cached tokens expiring within this many seconds are not re-used
+DEFAULT_MIN_VALIDITY = 30
+
+def default_token_cache_dir() -> Path:
+    override_dir = os.environ.get(TOKEN_CACHE_DIR_ENV_VAR, None)
+    if override_dir is not None and len(override_dir.strip()) > 0:
+        return Path(override_dir)
+    return Path.home().joinpath('.lmctl').joinpath('tokens')
+
+def token_cache_key(*parts: Any) -> str:
+    """
+    Produce a cache key from the given parts (address, auth mode, user/client, credentials...).
+    The parts are hashed, so secrets included in them are not exposed in the key
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class TokenCache:
+    """
+    Stores access tokens, so they may be re-used by other clients (and processes) authenticating as the same user/client
+    """
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        yield
+
+    def get(self, key: str) -> Optional[str]:
+        pass
+
+    def put(self, key: str, token: str):
+        pass
+
+    def delete(self, key: str):
+        pass
+
+
+class FileTokenCache(TokenCache):
+    """
+    Stores access tokens in files, in a directory only readable by the current user (defaults to ~/.lmctl/tokens).
+
+    Use "lock" to hold an exclusive, cross-process, file lock on a key while checking for a token and authenticating,
+    so parallel processes wait for one of them to authenticate then re-use the token it obtained.
+    Expiry of a cached token is determined from the "exp" of the JWT.
+    """
+
+    def __init__(self, directory: str = None, min_validity: float = DEFAULT_MIN_VALIDITY):
+        """
+        Args:
+            directory (str): directory to store the tokens in. Defaults to the value of LMCTL_TOKEN_CACHE_DIR or ~/.lmctl/tokens
+            min_validity (float): tokens which expire within this number of seconds are treated as missing from the cache
+        """
+        self.directory = Path(directory) if directory is not None else default_token_cache_dir()
+        self.min_validity = min_validity
+
+    def _ensure_directory(self):
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    def _token_path(self, key: str) -> Path:
+        return self.directory.joinpath(f'{key}.json')
+
+    def _lock_path(self, key: str) -> Path:
+        return self.directory.joinpath(f'{key}.lock')
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        self._ensure_directory()
+        with open(self._lock_path(key), 'a+') as lock_file:
+            _lock_file(lock_file)
+            try:
+                yield
+            finally:
+                _unlock_file(lock_file)
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._token_path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r') as f:
+                token = json.load(f).get('token')
+            expires_at = get_expires_time_from_jwt(token)
+        except (OSError, ValueError, AttributeError) as e:
+            logger.debug(f'Ignoring unreadable cached token at {path}: {e}')
+            return None
+        if datetime.now() + timedelta(seconds=self.min_validity) >= expires_at:
+            logger.debug(f'Cached token at {path} has expired (or expires within {self.min_validity} seconds)')
+            return None
+        logger.debug(f'Re-using cached token at {path}, expires at {expires_at.isoformat()}')
+        return token
+
+    def put(self, key: str, token: str):
+        self._ensure_directory()
+        path = self._token_path(key)
+        # Write to a temporary file then replace, so readers never see a partially written token
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f'{key}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'token': token}, f)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f'Failed to write token to cache at {path}: {e}')
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def delete(self, key: str):
+        path = self._token_path(key)
+        if path.exists():
+            path.unlink()
+
+
+def _lock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    elif msvcrt is not None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+def _unlock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    elif msvcrt is not None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,111 @@
+import logging
+import threading
+import requests
+from dataclasses import dataclass
+from typing import Dict
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Number of hosts (main address, Kami, auth servers...) a transport keeps a connection pool for
+DEFAULT_POOL_CONNECTIONS = 10
+# Number of connections kept alive in the pool for each host
+DEFAULT_POOL_MAXSIZE = 10
+
+@dataclass
+class ConnectionPoolStats:
+    host: str
+    connections_opened: int = 0
+    requests: int = 0
+    idle_connections: int = 0
+
+    @property
+    def connections_reused(self) -> int:
+        return max(self.requests - self.connections_opened, 0)
+
+
+class TNCOClientTransport:
+    """
+    Manages the HTTP connections used by a TNCOClient.
+
+    Requests are sent through a single requests.Session, so connections (and their TLS handshakes) are kept alive and re-used between requests.
+    A bounded pool of connections is maintained for each host the client talks to (CP4NA orchestration API, Kami, Zen/Okta/Oauth auth servers).
+
+    The transport may be shared by many threads: the session is created once (under a lock) and the connection pools are thread-safe. 
+    With "pool_block" set, threads wait for a pooled connection to be free rather than opening extra connections beyond "pool_maxsize".
+    """
+
+    def __init__(self, pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE, pool_block: bool = False, keep_alive: bool = True):
+        """
+        Args:
+            pool_connections (int): the number of hosts to cache connection pools for
+            pool_maxsize (int): the maximum number of connections kept in the pool for a single host
+            pool_block (bool): when True, requests wait for a free connection once "pool_maxsize" connections to a host are in use (otherwise extra, un-pooled, connections are opened)
+            keep_alive (bool): when False, connections are closed after each request
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self._session = None
+        self._adapter = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        session = self._session
+        if session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._build_session()
+                session = self._session
+        return session
+
+    def _build_session(self) -> requests.Session:
+        logger.debug(f'Creating HTTP session: pool_connections={self.pool_connections}, pool_maxsize={self.pool_maxsize}, pool_block={self.pool_block}, keep_alive={self.keep_alive}')
+        session = requests.Session()
+        self._adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize, pool_block=self.pool_block)
+        session.mount('https://', self._adapter)
+        session.mount('http://', self._adapter)
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        return self.session.request(method=method, url=url, **kwargs)
+
+    def pool_stats(self) -> Dict[str, ConnectionPoolStats]:
+        """
+        Returns statistics for each host currently holding a connection pool, keyed by "scheme://host:port"
+        """
+        stats = {}
+        adapter = self._adapter
+        if adapter is None:
+            return stats
+        pools = adapter.poolmanager.pools
+        for pool_key in list(pools.keys()):
+            pool = pools.get(pool_key)
+            if pool is None:
+                continue
+            host = f'{pool_key.key_scheme}://{pool_key.key_host}:{pool_key.key_port}'
+            stats[host] = ConnectionPoolStats(
+                host=host,
+                connections_opened=getattr(pool, 'num_connections', 0),
+                requests=getattr(pool, 'num_requests', 0),
+                idle_connections=self._count_idle_connections(pool)
+            )
+        return stats
+
+    def _count_idle_connections(self, pool) -> int:
+        queue = getattr(pool, 'pool', None)
+        if queue is None:
+            return 0
+        # Empty slots in the pool queue are represented by None
+        return len([conn for conn in list(queue.queue) if conn is not None])
+
+    def close(self):
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+                self._adapter = None
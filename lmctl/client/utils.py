@@ -1,8 +1,9 @@
 import yaml
 import json
 import requests
-from typing import Dict
+from typing import Dict, Iterator, Any
 from lmctl.client.exceptions import TNCOClientError
+from lmctl.client.json_stream import JsonStreamParser, DEFAULT_CHUNK_SIZE
 
 def convert_dict_to_yaml(data_dict: Dict):
     return yaml.safe_dump(data_dict)
@@ -22,11 +23,33 @@ def read_response_body_as_yaml(response: requests.Response) -> Dict:
     except yaml.YAMLError as e:
         raise TNCOClientError(f'Failed to parse response as YAML: {str(e)}') from e
 
-def read_response_body_as_json(response: requests.Response, error_class = TNCOClientError) -> Dict:
+def read_response_body_as_json(response: requests.Response, error_class = TNCOClientError, stream: bool = False) -> Dict:
+    """
+    Parse the response body as JSON. With "stream" set, the body is parsed as it is read from a streamed response (see TNCOClient.make_request(stream=True)),
+    rather than reading the full body into memory first
+    """
     try:
+        if stream:
+            return JsonStreamParser(response.iter_content(chunk_size=DEFAULT_CHUNK_SIZE)).parse()
         return response.json()
     except ValueError as e:
         raise error_class(f'Failed to parse response as JSON: {str(e)}') from e
+    except requests.RequestException as e:
+        raise error_class(f'Failed to read response: {str(e)}') from e
+
+def iter_response_body_as_json(response: requests.Response, items_key: str = None, error_class = TNCOClientError) -> Iterator[Any]:
+    """
+    Yield the items of a JSON array response body (or of the array under "items_key" of a JSON object body) as they are read from a streamed response. 
+    The response is closed when iteration ends (or the iterator is discarded)
+    """
+    try:
+        yield from JsonStreamParser(response.iter_content(chunk_size=DEFAULT_CHUNK_SIZE)).iter_items(items_key=items_key)
+    except ValueError as e:
+        raise error_class(f'Failed to parse response as JSON: {str(e)}') from e
+    except requests.RequestException as e:
+        raise error_class(f'Failed to read response: {str(e)}') from e
+    finally:
+        response.close()
 
 def read_response_location_header(response: requests.Response, error_class = TNCOClientError) -> str:
     location_header = response.headers.get('Location', response.headers.get('location', None))
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Tuple
 from .auth_type import AuthType
 
 class ZenAPIKeyAuth(AuthType):
@@ -10,3 +10,6 @@ class ZenAPIKeyAuth(AuthType):
 
     def handle(self, client: 'TNCOClient') -> Dict:
         return client.auth.request_zen_api_key_access(username=self.username, api_key=self.api_key, zen_auth_address=self.zen_auth_address)
+
+    def token_cache_key_parts(self) -> Tuple:
+        return ('zen', self.zen_auth_address, self.username, self.api_key)
@@ -1,10 +1,38 @@
 import yaml
+from lmctl.client import TNCOClient, TNCOClientRequest, TNCOClientError, TNCOClientHttpError
 
 class LmDriver:
 
-    def __init__(self, lm_base, lm_security_ctrl=None):
+    def __init__(self, lm_base, lm_security_ctrl=None, client=None):
+        """
+        Args:
+            lm_base (str): the base URL of the target CP4NA orchestration environment
+            lm_security_ctrl (LmSecurityCtrl): controller used to add access headers to each request (optional)
+            client (TNCOClient): client used to send requests. Share the same client between drivers to re-use connections. If not set, a new client is created for this driver
+        """
         self.lm_base = lm_base
         self.lm_security_ctrl = lm_security_ctrl
+        self.client = client if client is not None else TNCOClient(lm_base)
+
+    def _request(self, method, url, data=None, json=None, headers=None, params=None, files=None):
+        """
+        Sends a request through the TNCOClient of this driver. Unlike the client, an unsuccessful status code does not raise an error, 
+        the response is returned so the driver may inspect the status code.
+
+        Returns:
+            requests.Response: the response to the request
+        """
+        request = TNCOClientRequest(method=method, override_address=url, headers=dict(headers or {}), query_params=dict(params or {}), files=dict(files or {}))
+        if json is not None:
+            request.add_json_body(json)
+        elif data is not None:
+            request.body = data
+        try:
+            return self.client.make_request(request)
+        except TNCOClientHttpError as e:
+            return e.cause.response
+        except TNCOClientError as e:
+            raise LmDriverException(f'Request to {url} failed: {str(e)}') from e
 
     def _configure_access_headers(self, headers=None):
         if headers is None:
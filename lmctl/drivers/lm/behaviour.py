@@ -1,5 +1,4 @@
 import json
-import requests
 from .base import LmDriver, NotFoundException
 
 
@@ -8,8 +7,8 @@ class LmBehaviourDriver(LmDriver):
     Client for the CP4NA orchestration Behaviour APIs
     """
 
-    def __init__(self, lm_base, lm_security_ctrl=None):
-        super().__init__(lm_base, lm_security_ctrl)
+    def __init__(self, lm_base, lm_security_ctrl=None, client=None):
+        super().__init__(lm_base, lm_security_ctrl, client=client)
 
     def __projects_api(self):
         return '{0}/api/behaviour/projects'.format(self.lm_base)
@@ -41,13 +40,19 @@ class LmBehaviourDriver(LmDriver):
     def __scenario_exec_api(self, exec_id):
         return '{0}/api/behaviour/executions/{1}'.format(self.lm_base, exec_id)
 
+    def __scenario_exec_progress_api(self, exec_id):
+        return '{0}/api/behaviour/executions/{1}/progress'.format(self.lm_base, exec_id)
+
+    def __scenario_exec_cancel_api(self, exec_id):
+        return '{0}/api/behaviour/executions/{1}/cancel'.format(self.lm_base, exec_id)
+
     def __scenario_execution_api(self):
         return '{0}/api/behaviour/executions'.format(self.lm_base)
 
     def create_project(self, project):
         url = self.__projects_api()
         headers = self._configure_access_headers()
-        response = requests.post(url, json=project, headers=headers, verify=False)
+        response = self._request('POST', url, json=project, headers=headers)
         if response.status_code == 201:
             return True
         else:
@@ -56,7 +61,7 @@ class LmBehaviourDriver(LmDriver):
     def update_project(self, project):
         url = self.__project_api(project['id'])
         headers = self._configure_access_headers()
-        response = requests.put(url, json=project, headers=headers, verify=False)
+        response = self._request('PUT', url, json=project, headers=headers)
         if response.status_code == 200:
             return True
         elif response.status_code == 404:
@@ -67,7 +72,7 @@ class LmBehaviourDriver(LmDriver):
     def get_project(self, project_id):
         url = self.__project_api(project_id)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._request('GET', url, headers=headers)
         if response.status_code == 200:
             project = response.json()
             return project
@@ -79,7 +84,7 @@ class LmBehaviourDriver(LmDriver):
     def create_assembly_configuration(self, assembly_configuration):
         url = self.__assembly_configurations_api()
         headers = self._configure_access_headers()
-        response = requests.post(url, json=assembly_configuration, headers=headers, verify=False)
+        response = self._request('POST', url, json=assembly_configuration, headers=headers)
         if response.status_code == 201:
             return True
         else:
@@ -88,7 +93,7 @@ class LmBehaviourDriver(LmDriver):
     def update_assembly_configuration(self, assembly_configuration):
         url = self.__assembly_configuration_api(assembly_configuration['id'])
         headers = self._configure_access_headers()
-        response = requests.put(url, json=assembly_configuration, headers=headers, verify=False)
+        response = self._request('PUT', url, json=assembly_configuration, headers=headers)
         if response.status_code == 200:
             return True
         elif response.status_code == 404:
@@ -99,7 +104,7 @@ class LmBehaviourDriver(LmDriver):
     def get_assembly_configuration(self, assembly_configuration_id):
         url = self.__assembly_configuration_api(assembly_configuration_id)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._request('GET', url, headers=headers)
         if response.status_code == 200:
             template = response.json()
             return template
@@ -111,7 +116,7 @@ class LmBehaviourDriver(LmDriver):
     def get_assembly_configurations(self, project_id):
         url = self.__assembly_configurations_in_project_api(project_id)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._request('GET', url, headers=headers)
         if response.status_code == 200:
             templates = response.json()
             return templates
@@ -123,7 +128,7 @@ class LmBehaviourDriver(LmDriver):
     def create_scenario(self, scenario):
         url = self.__scenarios_api()
         headers = self._configure_access_headers()
-        response = requests.post(url, json=scenario, headers=headers, verify=False)
+        response = self._request('POST', url, json=scenario, headers=headers)
         if response.status_code == 201:
             return True
         else:
@@ -132,7 +137,7 @@ class LmBehaviourDriver(LmDriver):
     def update_scenario(self, scenario):
         url = self.__scenario_api(scenario['id'])
         headers = self._configure_access_headers()
-        response = requests.put(url, json=scenario, headers=headers, verify=False)
+        response = self._request('PUT', url, json=scenario, headers=headers)
         if response.status_code == 200:
             return True
         elif response.status_code == 404:
@@ -143,7 +148,7 @@ class LmBehaviourDriver(LmDriver):
     def get_scenario(self, scenario_id):
         url = self.__scenario_api(scenario_id)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._request('GET', url, headers=headers)
         if response.status_code == 200:
             scenario = response.json()
             return scenario
@@ -162,7 +167,7 @@ class LmBehaviourDriver(LmDriver):
     def get_scenarios(self, project_id):
         url = self.__scenarios_in_project_api(project_id)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._request('GET', url, headers=headers)
         if response.status_code == 200:
             scenarios = response.json()
             return scenarios
@@ -178,7 +183,7 @@ class LmBehaviourDriver(LmDriver):
         body = {}
         body['scenarioId'] = '{0}'.format(scenario_id)
 
-        response = requests.post(url, json=body, headers=headers, verify=False)
+        response = self._request('POST', url, json=body, headers=headers)
         if response.status_code == 201:
             return response.headers['location']
         elif response.status_code == 404:
@@ -189,7 +194,7 @@ class LmBehaviourDriver(LmDriver):
     def get_execution(self, exec_id):
         url = self.__scenario_exec_api(exec_id)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._request('GET', url, headers=headers)
         if response.status_code == 200:
             execution = response.json()
             return execution
@@ -198,6 +203,31 @@ class LmBehaviourDriver(LmDriver):
         else:
             self._raise_unexpected_status_exception(response)
 
+    def get_execution_progress(self, exec_id):
+        """
+        Get the progress (status and stage/step statuses) of an execution, which is lighter to retrieve than the full execution
+        """
+        url = self.__scenario_exec_progress_api(exec_id)
+        headers = self._configure_access_headers()
+        response = self._request('GET', url, headers=headers)
+        if response.status_code == 200:
+            return response.json()
+        elif response.status_code == 404:
+            raise NotFoundException('Execution does not exist: {0}'.format(exec_id))
+        else:
+            self._raise_unexpected_status_exception(response)
+
+    def cancel_execution(self, exec_id):
+        url = self.__scenario_exec_cancel_api(exec_id)
+        headers = self._configure_access_headers()
+        response = self._request('POST', url, headers=headers)
+        if response.status_code in [200, 202, 204]:
+            return True
+        elif response.status_code == 404:
+            raise NotFoundException('Execution does not exist: {0}'.format(exec_id))
+        else:
+            self._raise_unexpected_status_exception(response)
+
 
 class DuplicateEntityException(Exception):
     pass
@@ -1,5 +1,4 @@
 import logging
-import requests
 import json
 from .base import LmDriver, NotFoundException
 
@@ -10,8 +9,8 @@ class EtsiPackageMgmtDriver(LmDriver):
     Client for managing packages
     """
 
-    def __init__(self, lm_base, lm_security_ctrl=None):
-        super().__init__(lm_base, lm_security_ctrl)
+    def __init__(self, lm_base, lm_security_ctrl=None, client=None):
+        super().__init__(lm_base, lm_security_ctrl, client=client)
 
     def __packages_api(self):
         return '{0}/api/etsi/vnfpkgm/v2/vnf_packages'.format(self.lm_base)
@@ -42,7 +41,7 @@ class EtsiPackageMgmtDriver(LmDriver):
         url = self.__packages_api_package_content(package_id)
         headers = self.__configure_headers('application/zip')
         with open(resource_pkg_path, 'rb') as resource_pkg:
-            response = requests.put(url, headers=headers, data=resource_pkg, verify=False)
+            response = self._request('PUT', url, headers=headers, data=resource_pkg)
             if response.status_code == 202:
                 return True
             else:
@@ -53,7 +52,7 @@ class EtsiPackageMgmtDriver(LmDriver):
         url = self.__nsd_api_package_content(package_id)
         headers = self.__configure_headers('application/zip')
         with open(resource_pkg_path, 'rb') as resource_pkg:
-            response = requests.put(url, headers=headers, data=resource_pkg, verify=False)
+            response = self._request('PUT', url, headers=headers, data=resource_pkg)
             if response.status_code == 202:
                 return True
             else:
@@ -66,7 +65,7 @@ class EtsiPackageMgmtDriver(LmDriver):
         url = self.__packages_api()
         headers = self.__configure_headers()
         params = self.__build_base_params(object_group_id)
-        response = requests.post(url, headers=headers, json=package_user_data_json, params=params, verify=False)
+        response = self._request('POST', url, headers=headers, json=package_user_data_json, params=params)
         if response.status_code == 201:
             return response.json()
         else:
@@ -78,7 +77,7 @@ class EtsiPackageMgmtDriver(LmDriver):
         url = self.__nsd_api()
         headers = self.__configure_headers()
         params = self.__build_base_params(object_group_id)
-        response = requests.post(url, headers=headers, json=package_user_data_json, params=params, verify=False)
+        response = self._request('POST', url, headers=headers, json=package_user_data_json, params=params)
         if response.status_code == 201:
             return response.json()
         else:
@@ -88,7 +87,7 @@ class EtsiPackageMgmtDriver(LmDriver):
         self.__disable_package(package_id)    
         url = self.__packages_api_by_id_api(package_id)
         headers = self.__configure_headers()
-        response = requests.delete(url, headers=headers, verify=False)
+        response = self._request('DELETE', url, headers=headers)
         if response.status_code == 204:
             return True
         elif response.status_code == 404:
@@ -101,7 +100,7 @@ class EtsiPackageMgmtDriver(LmDriver):
         self.__disable_nsd_package(package_id)    
         url = self.__nsd_api_by_id(package_id)
         headers = self.__configure_headers()
-        response = requests.delete(url, headers=headers, verify=False)
+        response = self._request('DELETE', url, headers=headers)
         if response.status_code == 204:
             return True
         elif response.status_code == 404:
@@ -113,7 +112,7 @@ class EtsiPackageMgmtDriver(LmDriver):
         url = self.__packages_api_by_id_api(package_id)
         headers = self.__configure_headers()
         data='{"operationalState": "DISABLED"}'
-        response = requests.patch(url, data, headers=headers, verify=False)
+        response = self._request('PATCH', url, data=data, headers=headers)
         if response.status_code == 200:
             return True
         elif response.status_code == 404:
@@ -125,7 +124,7 @@ class EtsiPackageMgmtDriver(LmDriver):
         url = self.__nsd_api_by_id(package_id)
         headers = self.__configure_headers()
         data='{"nsdOperationalState": "DISABLED"}'
-        response = requests.patch(url, data, headers=headers, verify=False)
+        response = self._request('PATCH', url, data=data, headers=headers)
         if response.status_code == 200:
             return True
         elif response.status_code == 404:
@@ -136,7 +135,7 @@ class EtsiPackageMgmtDriver(LmDriver):
     def get_package_details(self, package_id):
         url = self.__packages_api_by_id_api(package_id)
         headers = self.__configure_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._request('GET', url, headers=headers)
         if response.status_code == 200:
             return response.json()
         elif response.status_code == 404:
@@ -1,5 +1,4 @@
 import logging
-import requests
 from .base import LmDriver, NotFoundException
 
 logger = logging.getLogger(__name__)
@@ -10,8 +9,8 @@ class LmInfrastructureKeysDriver(LmDriver):
     Client for CP4NA orchestration Infrastructure Key APIs
     """
 
-    def __init__(self, lm_base, lm_security_ctrl=None):
-        super().__init__(lm_base, lm_security_ctrl)
+    def __init__(self, lm_base, lm_security_ctrl=None, client=None):
+        super().__init__(lm_base, lm_security_ctrl, client=client)
 
     def __infrastructure_keys_api(self):
         return '{0}/api/resource-manager/infrastructure-keys/shared'.format(self.lm_base)
@@ -22,7 +21,7 @@ class LmInfrastructureKeysDriver(LmDriver):
     def get_infrastructure_keys(self):
         url = self.__infrastructure_keys_api()
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._request('GET', url, headers=headers)
         if response.status_code == 200:
             infrastructure_keys = response.json()
             return infrastructure_keys
@@ -32,7 +31,7 @@ class LmInfrastructureKeysDriver(LmDriver):
     def get_infrastructure_key_by_name(self, keyname):
         url = self.__infrastructure_key_by_name_api(keyname)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._request('GET', url, headers=headers)
         if response.status_code == 200:
             infrastructure_key = response.json()
             return infrastructure_key
@@ -44,7 +43,7 @@ class LmInfrastructureKeysDriver(LmDriver):
     def add_infrastructure_key(self, infrastructure_key):
         url = self.__infrastructure_keys_api()
         headers = self._configure_access_headers()
-        response = requests.post(url, headers=headers, json=infrastructure_key, verify=False)
+        response = self._request('POST', url, headers=headers, json=infrastructure_key)
         if response.status_code == 201:
             location_header = response.headers['location']
             location_parts = location_header.split('/')
@@ -57,7 +56,7 @@ class LmInfrastructureKeysDriver(LmDriver):
     def delete_infrastructure_key(self, infrastructure_key_name):
         url = self.__infrastructure_key_by_name_api(infrastructure_key_name)
         headers = self._configure_access_headers()
-        response = requests.delete(url, headers=headers, verify=False)
+        response = self._request('DELETE', url, headers=headers)
         if response.status_code == 204:
             return True
         elif response.status_code == 404:
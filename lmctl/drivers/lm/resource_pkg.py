@@ -1,4 +1,3 @@
-import requests
 from .base import LmDriver, NotFoundException
 
 class LmResourcePkgDriver(LmDriver):
@@ -6,8 +5,8 @@ class LmResourcePkgDriver(LmDriver):
     Client for CP4NA orchestration Resource Pkg APIs
     """
 
-    def __init__(self, lm_base, lm_security_ctrl=None):
-        super().__init__(lm_base, lm_security_ctrl)
+    def __init__(self, lm_base, lm_security_ctrl=None, client=None):
+        super().__init__(lm_base, lm_security_ctrl, client=client)
 
     def __packages_api(self):
         return '{0}/api/resource-manager/resource-packages'.format(self.lm_base)
@@ -23,7 +22,7 @@ class LmResourcePkgDriver(LmDriver):
             params['objectGroupId'] = object_group_id
         with open(resource_pkg_path, 'rb') as resource_pkg:
             files = {'file': resource_pkg}
-            response = requests.post(url, headers=headers, files=files, params=params, verify=False)
+            response = self._request('POST', url, headers=headers, files=files, params=params)
             if response.status_code == 201:
                 return True
             else:
@@ -32,7 +31,7 @@ class LmResourcePkgDriver(LmDriver):
     def delete_package(self, resource_type_name):
         url = self.__package_api(resource_type_name)
         headers = self._configure_access_headers()
-        response = requests.delete(url, headers=headers, verify=False)
+        response = self._request('DELETE', url, headers=headers)
         if response.status_code == 404:
             raise NotFoundException('Package does not exist: {0}'.format(resource_type_name))
         elif response.status_code == 204:
@@ -1,5 +1,4 @@
 import logging
-import requests
 from .base import LmDriver, NotFoundException
 
 logger = logging.getLogger(__name__)
@@ -9,8 +8,8 @@ class LmResourceDriverMgmtDriver(LmDriver):
     Client for managing Resource drivers
     """
 
-    def __init__(self, lm_base, lm_security_ctrl=None):
-        super().__init__(lm_base, lm_security_ctrl)
+    def __init__(self, lm_base, lm_security_ctrl=None, client=None):
+        super().__init__(lm_base, lm_security_ctrl, client=client)
 
     def __resource_drivers_api(self):
         return '{0}/api/resource-manager/resource-drivers'.format(self.lm_base)
@@ -24,7 +23,7 @@ class LmResourceDriverMgmtDriver(LmDriver):
     def add_resource_driver(self, resource_driver):
         url = self.__resource_drivers_api()
         headers = self._configure_access_headers()
-        response = requests.post(url, headers=headers, json=resource_driver, verify=False)
+        response = self._request('POST', url, headers=headers, json=resource_driver)
         if response.status_code == 201:
             location_header = response.headers['location']
             location_parts = location_header.split('/')
@@ -37,7 +36,7 @@ class LmResourceDriverMgmtDriver(LmDriver):
     def delete_resource_driver(self, driver_id):
         url = self.__resource_driver_by_id_api(driver_id)
         headers = self._configure_access_headers()
-        response = requests.delete(url, headers=headers, verify=False)
+        response = self._request('DELETE', url, headers=headers)
         if response.status_code == 204:
             return True
         elif response.status_code == 404:
@@ -48,7 +47,7 @@ class LmResourceDriverMgmtDriver(LmDriver):
     def get_resource_driver(self, driver_id):
         url = self.__resource_driver_by_id_api(driver_id)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._request('GET', url, headers=headers)
         if response.status_code == 200:
             return response.json()
         elif response.status_code == 404:
@@ -59,7 +58,7 @@ class LmResourceDriverMgmtDriver(LmDriver):
     def get_resource_driver_by_type(self, driver_type):
         url = self.__resource_drivers_by_type_api(driver_type)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._request('GET', url, headers=headers)
         if response.status_code == 200:
             return response.json()
         elif response.status_code == 404:
@@ -1,11 +1,10 @@
 import datetime
-import requests
 import logging
 import time
 from .base import LmDriver
 # Temporarily use new client to control auth in order to support client_credential authentication
 # Eventually this class and all classes in the drivers section will be replaced by the new client
-from lmctl.client import TNCOClientBuilder, TNCOClient, AuthTracker, ZEN_AUTH_MODE, TOKEN_AUTH_MODE, OAUTH_MODE, \
+from lmctl.client import TNCOClientBuilder, TNCOClient, ZEN_AUTH_MODE, TOKEN_AUTH_MODE, OAUTH_MODE, \
     OKTA_MODE
 
 logger = logging.getLogger(__name__)
@@ -16,8 +15,8 @@ class LmSecurityDriver(LmDriver):
     Client for CP4NA orchestration Security APIs
     """
 
-    def __init__(self, lm_base):
-        super().__init__(lm_base)
+    def __init__(self, lm_base, client=None):
+        super().__init__(lm_base, client=client)
 
     def login(self, username, password):
         url = '{0}/ui/api/login'.format(self.lm_base)
@@ -25,11 +24,11 @@ class LmSecurityDriver(LmDriver):
             'username': username,
             'password': password
         }
-        response = requests.post(url, json=data, verify=False)
+        response = self._request('POST', url, json=data)
         if response.status_code == 404 or response.status_code == 405:
             old_url = '{0}/api/login'.format(self.lm_base)
             logger.info('Failed to access login at {0} with {1} repsonse code...may be an older LM environment, trying {2}'.format(url, response.status_code, old_url))
-            response = requests.post(old_url, json=data, verify=False)
+            response = self._request('POST', old_url, json=data)
         if response.status_code == 200:
             login_result = response.json()
             return login_result
@@ -41,7 +40,7 @@ class LmSecurityCtrl:
     Manages authentication with a target CP4NA orchestration environment 
     """
 
-    def __init__(self, auth_address, username=None, password=None, client_id=None, client_secret=None, token=None, api_key=None, auth_mode=None, scope=None, auth_server_id=None):
+    def __init__(self, auth_address, username=None, password=None, client_id=None, client_secret=None, token=None, api_key=None, auth_mode=None, scope=None, auth_server_id=None, transport=None, token_cache=None):
         """
         Constructs a new instance of controller for a target CP4NA orchestration environment and target user
 
@@ -54,6 +53,8 @@ class LmSecurityCtrl:
             api_key (str): API key used for Zen based auth
             token (str): Token used for authentication
             auth_mode (str): Determines if we're using Zen or Oauth
+            transport (TNCOClientTransport): transport used for authentication requests, share with the drivers to re-use connections (optional)
+            token_cache (TokenCache): cache to re-use access tokens obtained by other sessions/processes authenticating as the same user (optional)
         """
         self.__auth_address = auth_address
         self.__username = username
@@ -63,13 +64,16 @@ class LmSecurityCtrl:
         self.__api_key = api_key
         self.__token = token
         self.__auth_mode = auth_mode
-        self.__auth_tracker = AuthTracker()
         self.__scope = scope
         self.__auth_server_id = auth_server_id
         # Using the new client authentication methods in the "legacy" driver so we only need to maintain one impl
         # Eventually this LmSecurityCtrl will be removed, once we switch all of the "lmctl project" functionality to use the new client
         client_builder = TNCOClientBuilder()
         client_builder.address(self.__auth_address)
+        if transport is not None:
+            client_builder.transport(transport)
+        if token_cache is not None:
+            client_builder.token_cache(token_cache)
         if self.__auth_mode.lower() == ZEN_AUTH_MODE:
             client_builder.zen_api_key_auth(username=self.__username, api_key=self.__api_key, zen_auth_address=self.__auth_address)
         elif self.__auth_mode.lower() == TOKEN_AUTH_MODE:
@@ -113,9 +117,7 @@ class LmSecurityCtrl:
         """
         if self.__need_new_token():
             logger.debug('Requesting new access token')
-            auth_response = self.__client.auth_type.handle(self.__client)
-            self.__auth_tracker.accept_auth_response(auth_response)
-        return self.__auth_tracker.current_access_token
+        return self.__client.get_access_token()
 
     def __need_new_token(self):
         """
@@ -126,7 +128,7 @@ class LmSecurityCtrl:
         Returns:
             bool: True if there is no Access Token for the user or it is believed to be expired based on time of last authentication
         """
-        return self.__auth_tracker.has_access_expired
+        return self.__client.auth_tracker.has_access_expired
 
     def add_access_headers(self, headers=None):
         """
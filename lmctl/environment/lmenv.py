@@ -1,6 +1,7 @@
 import lmctl.drivers.lm as lm_drivers
 import logging
 import os
+import threading
 
 from typing import Union, Optional
 from .common import build_address
@@ -10,7 +11,9 @@ from pydantic import constr, root_validator
 
 from lmctl.utils.jwt import decode_jwt
 from lmctl.utils.dcutils.dc_capture import recordattrs
-from lmctl.client import TNCOClientBuilder, TOKEN_AUTH_MODE, ZEN_AUTH_MODE, OAUTH_MODE, OKTA_MODE
+from lmctl.client import TNCOClient, TNCOClientBuilder, TNCOClientTransport, FileTokenCache, RetryPolicy, RateLimiter, ResponseCache, FileResponseStore, TOKEN_AUTH_MODE, ZEN_AUTH_MODE, OAUTH_MODE, OKTA_MODE
+from lmctl.client.transport import DEFAULT_POOL_MAXSIZE
+from lmctl.client.retry_policy import DEFAULT_MAX_RETRIES
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +60,17 @@ class TNCOEnvironment:
     kami_port: Optional[Union[str,int]] = DEFAULT_KAMI_PORT 
     kami_protocol: Optional[str] = DEFAULT_KAMI_PROTOCOL
 
+    pool_size: Optional[int] = DEFAULT_POOL_MAXSIZE
+    keep_alive: Optional[bool] = True
+    token_cache: Optional[bool] = True
+    retries: Optional[int] = DEFAULT_MAX_RETRIES
+    rate_limit: Optional[float] = None
+    rate_limit_burst: Optional[int] = None
+    intent_rate_limit: Optional[float] = None
+    intent_rate_limit_burst: Optional[int] = None
+    max_in_flight: Optional[int] = None
+    response_cache: Optional[bool] = False
+
     @root_validator(pre=True)
     @classmethod
     def check_security(cls, values):
@@ -202,10 +216,43 @@ class TNCOEnvironment:
                                 scope=self.scope,
                                 auth_server_id=self.auth_server_id
                             )
+    def build_transport(self):
+        return TNCOClientTransport(pool_maxsize=self.pool_size or DEFAULT_POOL_MAXSIZE, keep_alive=self.keep_alive is not False)
+
+    def build_token_cache(self):
+        if self.token_cache is False:
+            return None
+        return FileTokenCache()
+
+    def build_retry_policy(self):
+        if self.retries is None or self.retries <= 0:
+            return None
+        return RetryPolicy(max_retries=self.retries)
+
+    def build_rate_limiter(self):
+        if self.rate_limit is None and self.intent_rate_limit is None and self.max_in_flight is None:
+            return None
+        return RateLimiter(requests_per_second=self.rate_limit, burst=self.rate_limit_burst, intents_per_second=self.intent_rate_limit, 
+                            intent_burst=self.intent_rate_limit_burst, max_in_flight=self.max_in_flight)
+
+    def build_response_cache(self):
+        if self.response_cache is not True:
+            return None
+        return ResponseCache(store=FileResponseStore())
+
     def build_client(self):
         builder = TNCOClientBuilder()
         builder.address(self.address)
         builder.kami_address(self.kami_address)
+        builder.transport(self.build_transport())
+        builder.token_cache(self.build_token_cache())
+        retry_policy = self.build_retry_policy()
+        if retry_policy is not None:
+            builder.retry_policy(retry_policy)
+        builder.rate_limiter(self.build_rate_limiter())
+        response_cache = self.build_response_cache()
+        if response_cache is not None:
+            builder.response_cache(response_cache)
         if self.secure:
             if self.auth_mode == ZEN_AUTH_MODE:
                 builder.zen_api_key_auth(username=self.username, api_key=self.api_key, zen_auth_address=self.auth_address)
@@ -328,7 +375,11 @@ class LmSession:
         self.auth_mode = session_config.auth_mode
         self.scope = session_config.scope
         self.auth_server_id = session_config.auth_server_id
+        self.__client = None
         self.__lm_security_ctrl = None
+        # Drivers are used from worker threads (e.g. parallel push/test), so the shared client and security ctrl are created under a lock 
+        # (re-entrant, as the security ctrl is created with the transport of the client)
+        self.__lazy_init_lock = threading.RLock()
         self.__descriptor_driver = None
         self.__onboard_rm_driver = None
         self.__topology_driver = None
@@ -345,20 +396,43 @@ class LmSession:
     def __get_lm_security_ctrl(self):
         if self.env.secure:
             if not self.__lm_security_ctrl:
-                self.__lm_security_ctrl = lm_drivers.LmSecurityCtrl(self.env.auth_address, 
-                                                                    username=self.username, 
-                                                                    password=self.password,
-                                                                    client_id=self.client_id, 
-                                                                    client_secret=self.client_secret,
-                                                                    api_key=self.api_key,
-                                                                    token=self.token,
-                                                                    auth_mode=self.auth_mode,
-                                                                    scope=self.scope,
-                                                                    auth_server_id=self.auth_server_id
-                                                                )
+                with self.__lazy_init_lock:
+                    if not self.__lm_security_ctrl:
+                        self.__lm_security_ctrl = self.__build_lm_security_ctrl()
             return self.__lm_security_ctrl
         return None
 
+    def __build_lm_security_ctrl(self):
+        return lm_drivers.LmSecurityCtrl(self.env.auth_address, 
+                                            username=self.username, 
+                                            password=self.password,
+                                            client_id=self.client_id, 
+                                            client_secret=self.client_secret,
+                                            api_key=self.api_key,
+                                            token=self.token,
+                                            auth_mode=self.auth_mode,
+                                            scope=self.scope,
+                                            auth_server_id=self.auth_server_id,
+                                            transport=self.client.transport,
+                                            token_cache=self.client.token_cache
+                                        )
+
+    @property
+    def client(self):
+        """
+        Obtain the TNCOClient shared by all drivers of this session, so they re-use the same pooled connections. 
+        Authentication is added to each request by the drivers, so this client has no auth configured
+
+        Returns:
+            TNCOClient: the client used to send requests to this CP4NA orchestration environment
+        """
+        if not self.__client:
+            with self.__lazy_init_lock:
+                if not self.__client:
+                    self.__client = TNCOClient(self.env.api_address, kami_address=self.env.kami_address, transport=self.env.build_transport(), token_cache=self.env.build_token_cache(),
+                                                retry_policy=self.env.build_retry_policy(), rate_limiter=self.env.build_rate_limiter())
+        return self.__client
+
 
     @property
     def descriptor_driver(self):
@@ -369,7 +443,7 @@ class LmSession:
             LmDescriptorDriver: a configured DescriptorDriver for this CP4NA orchestration environment
         """
         if not self.__descriptor_driver:
-            self.__descriptor_driver = lm_drivers.LmDescriptorDriver(self.env.api_address, self.__get_lm_security_ctrl())
+            self.__descriptor_driver = lm_drivers.LmDescriptorDriver(self.env.api_address, self.__get_lm_security_ctrl(), client=self.client)
         return self.__descriptor_driver
 
     @property
@@ -381,7 +455,7 @@ class LmSession:
             LmOnboardRmDriver: a configured LmOnboardRmDriver for this CP4NA orchestration environment
         """
         if not self.__onboard_rm_driver:
-            self.__onboard_rm_driver = lm_drivers.LmOnboardRmDriver(self.env.api_address, self.__get_lm_security_ctrl())
+            self.__onboard_rm_driver = lm_drivers.LmOnboardRmDriver(self.env.api_address, self.__get_lm_security_ctrl(), client=self.client)
         return self.__onboard_rm_driver
 
     @property
@@ -393,7 +467,7 @@ class LmSession:
             LmTopologyDriver: a configured LmTopologyDriver for this CP4NA orchestration environment
         """
         if not self.__topology_driver:
-            self.__topology_driver = lm_drivers.LmTopologyDriver(self.env.api_address, self.__get_lm_security_ctrl())
+            self.__topology_driver = lm_drivers.LmTopologyDriver(self.env.api_address, self.__get_lm_security_ctrl(), client=self.client)
         return self.__topology_driver
 
     @property
@@ -405,7 +479,7 @@ class LmSession:
             LmBehaviourDriver: a configured LmBehaviourDriver for this CP4NA orchestration environment
         """
         if not self.__behaviour_driver:
-            self.__behaviour_driver = lm_drivers.LmBehaviourDriver(self.env.api_address, self.__get_lm_security_ctrl())
+            self.__behaviour_driver = lm_drivers.LmBehaviourDriver(self.env.api_address, self.__get_lm_security_ctrl(), client=self.client)
         return self.__behaviour_driver
 
     @property
@@ -417,7 +491,7 @@ class LmSession:
             LmDeploymentLocationDriver: a configured LmDeploymentLocationDriver for this CP4NA orchestration environment
         """
         if not self.__deployment_location_driver:
-            self.__deployment_location_driver = lm_drivers.LmDeploymentLocationDriver(self.env.api_address, self.__get_lm_security_ctrl())
+            self.__deployment_location_driver = lm_drivers.LmDeploymentLocationDriver(self.env.api_address, self.__get_lm_security_ctrl(), client=self.client)
         return self.__deployment_location_driver
 
     @property
@@ -429,7 +503,7 @@ class LmSession:
             LmResourcePkgDriver: a configured LmResourcePkgDriver for this CP4NA orchestration environment
         """
         if not self.__resource_pkg_driver:
-            self.__resource_pkg_driver = lm_drivers.LmResourcePkgDriver(self.env.api_address, self.__get_lm_security_ctrl())
+            self.__resource_pkg_driver = lm_drivers.LmResourcePkgDriver(self.env.api_address, self.__get_lm_security_ctrl(), client=self.client)
         return self.__resource_pkg_driver
 
     @property
@@ -441,7 +515,7 @@ class LmSession:
             EtsiPackageMgmtDriver: a configured EtsiPackageMgmtDriver for this CP4NA orchestration environment
         """
         if not self.__pkg_mgmt_driver:
-            self.__pkg_mgmt_driver = lm_drivers.EtsiPackageMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl())
+            self.__pkg_mgmt_driver = lm_drivers.EtsiPackageMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl(), client=self.client)
         return self.__pkg_mgmt_driver        
 
     @property
@@ -453,7 +527,7 @@ class LmSession:
             LmResourceDriverMgmtDriver: a configured LmResourceDriverMgmtDriver for this CP4NA orchestration environment
         """
         if not self.__resource_driver_mgmt_driver:
-            self.__resource_driver_mgmt_driver = lm_drivers.LmResourceDriverMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl())
+            self.__resource_driver_mgmt_driver = lm_drivers.LmResourceDriverMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl(), client=self.client)
         return self.__resource_driver_mgmt_driver
 
     @property
@@ -465,7 +539,7 @@ class LmSession:
             LmVimDriverMgmtDriver: a configured LmVimDriverMgmtDriver for this CP4NA orchestration environment
         """
         if not self.__vim_driver_mgmt_driver:
-            self.__vim_driver_mgmt_driver = lm_drivers.LmVimDriverMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl())
+            self.__vim_driver_mgmt_driver = lm_drivers.LmVimDriverMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl(), client=self.client)
         return self.__vim_driver_mgmt_driver
 
     @property
@@ -477,7 +551,7 @@ class LmSession:
             LmLifecycleDriverMgmtDriver: a configured LmLifecycleDriverMgmtDriver for this CP4NA orchestration environment
         """
         if not self.__lifecycle_driver_mgmt_driver:
-            self.__lifecycle_driver_mgmt_driver = lm_drivers.LmLifecycleDriverMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl())
+            self.__lifecycle_driver_mgmt_driver = lm_drivers.LmLifecycleDriverMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl(), client=self.client)
         return self.__lifecycle_driver_mgmt_driver
 
     @property
@@ -489,7 +563,7 @@ class LmSession:
             LmInfrastructureKeysDriver: a configured LmInfrastructureKeysDriver for this CP4NA orchestration environment
         """
         if not self.__infrastructure_keys_driver:
-            self.__infrastructure_keys_driver = lm_drivers.LmInfrastructureKeysDriver(self.env.api_address, self.__get_lm_security_ctrl())
+            self.__infrastructure_keys_driver = lm_drivers.LmInfrastructureKeysDriver(self.env.api_address, self.__get_lm_security_ctrl(), client=self.client)
         return self.__infrastructure_keys_driver
 
     @property
@@ -501,7 +575,7 @@ class LmSession:
             LmDescriptorTemplatesDriver: a configured LmDescriptorTemplatesDriver for this CP4NA orchestration environment
         """
         if not self.__descriptor_template_driver:
-            self.__descriptor_template_driver = lm_drivers.LmDescriptorTemplatesDriver(self.env.kami_address)
+            self.__descriptor_template_driver = lm_drivers.LmDescriptorTemplatesDriver(self.env.kami_address, client=self.client)
         return self.__descriptor_template_driver
 
 LmEnvironment = TNCOEnvironment
\ No newline at end of file
@@ -1,6 +1,6 @@
 import os
+import stat
 import shutil
-import distutils.dir_util
 import string
 import unicodedata
 import logging
@@ -27,9 +27,49 @@ def clean_directory(directory_path):
     os.makedirs(directory_path)
 
 
+def clean_directory_except(directory_path, keep_names):
+    """
+    Remove the contents of a directory, other than the entries named in "keep_names"
+    """
+    if not os.path.exists(directory_path):
+        os.makedirs(directory_path)
+        return
+    for name in os.listdir(directory_path):
+        if name in keep_names:
+            continue
+        path = os.path.join(directory_path, name)
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+
+
 def remove_directory(directory_path):
     if os.path.exists(directory_path):
-        shutil.rmtree(directory_path)
+        shutil.rmtree(directory_path, onerror=_remove_read_only)
+
+
+def _remove_read_only(func, path, exc_info):
+    # Files made read-only (see make_read_only) cannot be removed on some platforms until they are writable again
+    if os.path.exists(path) and not os.access(path, os.W_OK):
+        os.chmod(path, os.stat(path).st_mode | stat.S_IWUSR)
+        func(path)
+    else:
+        raise exc_info[1]
+
+
+def make_read_only(directory_path):
+    """
+    Remove write permission from every file in a directory (at any depth), so they cannot be modified by accident.
+    Directories are left writable, so the tree can still be removed with remove_directory
+    """
+    write_bits = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+    for dir_path, dir_names, file_names in os.walk(directory_path):
+        for file_name in file_names:
+            file_path = os.path.join(dir_path, file_name)
+            if os.path.islink(file_path):
+                continue
+            os.chmod(file_path, os.stat(file_path).st_mode & ~write_bits)
 
 
 def create_directories(*directories):
@@ -42,7 +82,9 @@ def copy_file(src, dest):
 
 
 def copy_tree(src, dest):
-    distutils.dir_util.copy_tree(src, dest, 0)
+    # Merges into an existing destination, without preserving file modes (distutils.dir_util.copy_tree cached the directories it created in a global, 
+    # so failed to re-create a directory removed since, and is not safe to use from many threads)
+    shutil.copytree(src, dest, copy_function=shutil.copyfile, dirs_exist_ok=True)
 
 
 def immediate_sub_directories(parent_directory):
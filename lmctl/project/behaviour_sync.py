@@ -0,0 +1,134 @@
+from concurrent.futures import ThreadPoolExecutor
+import lmctl.project.mutate.behaviour as behaviour_mutations
+
+SYNC_CREATE = 'create'
+SYNC_UPDATE = 'update'
+SYNC_UNCHANGED = 'unchanged'
+# Fields set by CP4NA orchestration, so ignored when deciding if a configuration/scenario has changed
+SERVER_MANAGED_FIELDS = ('id', 'createdAt', 'lastModifiedAt')
+
+CONFIGURATION_TYPE = 'Assembly Configuration'
+SCENARIO_TYPE = 'Scenario'
+
+
+def _index_by_name(elements):
+    index = {}
+    for element in elements:
+        # First of any duplicates is used, matching a search through the list
+        index.setdefault(element['name'], element)
+    return index
+
+
+def _without_server_managed_fields(element):
+    return {key: value for key, value in element.items() if key not in SERVER_MANAGED_FIELDS}
+
+
+class BehaviourSnapshot:
+    """
+    The Assembly Configurations and Scenarios of a behaviour project in CP4NA orchestration, indexed by name
+    """
+
+    def __init__(self, configurations, scenarios):
+        self.configurations_by_name = _index_by_name(configurations)
+        self.scenarios_by_name = _index_by_name(scenarios)
+
+    def add_configurations(self, configurations):
+        for configuration in configurations:
+            self.configurations_by_name.setdefault(configuration['name'], configuration)
+
+
+class BehaviourSyncAction:
+
+    def __init__(self, element_type, element, action, existing=None):
+        self.element_type = element_type
+        self.element = element
+        self.action = action
+        self.existing = existing
+
+    @property
+    def name(self):
+        return self.element['name']
+
+
+class BehaviourSync:
+    """
+    Pushes the Assembly Configurations and Scenarios of a project to CP4NA orchestration.
+
+    The existing configurations and scenarios of the project are read once into indexes by name, from which a plan is made to create, update or leave unchanged
+    each configuration/scenario. Only the creates and updates are sent, up to "max_workers" at once. Configurations are written before scenarios,
+    as scenarios reference configurations by ID (the configurations are read again only if any were created, to learn their new IDs)
+    """
+
+    def __init__(self, behaviour_driver, project_id, journal, max_workers=1):
+        self.behaviour_driver = behaviour_driver
+        self.project_id = project_id
+        self.journal = journal
+        self.max_workers = max(1, max_workers) if max_workers is not None else 1
+
+    def take_snapshot(self):
+        configurations = self.behaviour_driver.get_assembly_configurations(self.project_id)
+        scenarios = self.behaviour_driver.get_scenarios(self.project_id)
+        return BehaviourSnapshot(configurations, scenarios)
+
+    def sync(self, configurations, scenarios):
+        """
+        Push configurations then scenarios (the content of each as read from the package). Returns the actions taken
+        """
+        snapshot = self.take_snapshot()
+        configuration_actions = self.__plan(CONFIGURATION_TYPE, configurations, snapshot.configurations_by_name)
+        self.__execute(configuration_actions)
+        if any(action.action == SYNC_CREATE for action in configuration_actions):
+            snapshot.add_configurations(self.behaviour_driver.get_assembly_configurations(self.project_id))
+        scenario_mutator = behaviour_mutations.ScenarioPushMutator(snapshot.configurations_by_name)
+        scenarios = [scenario_mutator.apply(self.__with_project_id(scenario)) for scenario in scenarios]
+        scenario_actions = self.__plan(SCENARIO_TYPE, scenarios, snapshot.scenarios_by_name)
+        self.__execute(scenario_actions)
+        return configuration_actions + scenario_actions
+
+    def __with_project_id(self, element):
+        element['projectId'] = self.project_id
+        return element
+
+    def __plan(self, element_type, elements, existing_by_name):
+        actions = []
+        for element in elements:
+            element = self.__with_project_id(element)
+            existing = existing_by_name.get(element['name'])
+            if existing is None:
+                self.journal.event('{0} {1} not found, creating'.format(element_type, element['name']))
+                actions.append(BehaviourSyncAction(element_type, element, SYNC_CREATE))
+                continue
+            element['id'] = existing['id']
+            if _without_server_managed_fields(element) == _without_server_managed_fields(existing):
+                self.journal.event('{0} {1} already exists and is unchanged, skipping'.format(element_type, element['name']))
+                actions.append(BehaviourSyncAction(element_type, element, SYNC_UNCHANGED, existing=existing))
+            else:
+                self.journal.event('{0} {1} already exists, updating'.format(element_type, element['name']))
+                actions.append(BehaviourSyncAction(element_type, element, SYNC_UPDATE, existing=existing))
+        return actions
+
+    def __execute(self, actions):
+        writes = [action for action in actions if action.action != SYNC_UNCHANGED]
+        if len(writes) == 0:
+            return
+        if self.max_workers == 1 or len(writes) == 1:
+            for action in writes:
+                self.__write(action)
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(writes)), thread_name_prefix='lmctl-behaviour') as executor:
+            futures = [executor.submit(self.__write, action) for action in writes]
+        # Raise the first error, in the order of the plan, once all writes have ended
+        for future in futures:
+            future.result()
+
+    def __write(self, action):
+        if action.element_type == CONFIGURATION_TYPE:
+            if action.action == SYNC_CREATE:
+                self.behaviour_driver.create_assembly_configuration(action.element)
+            else:
+                self.behaviour_driver.update_assembly_configuration(action.element)
+        else:
+            if action.action == SYNC_CREATE:
+                self.behaviour_driver.create_scenario(action.element)
+            else:
+                self.behaviour_driver.update_scenario(action.element)
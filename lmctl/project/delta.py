@@ -0,0 +1,58 @@
+import json
+import hashlib
+import threading
+import yaml
+
+PUSH_CREATE = 'create'
+PUSH_UPDATE = 'update'
+PUSH_UNCHANGED = 'unchanged'
+
+DESCRIPTOR_TYPE = 'Descriptor'
+DESCRIPTOR_TEMPLATE_TYPE = 'Descriptor Template'
+
+
+def content_hash(yaml_content):
+    """
+    Hash of YAML (or JSON) content, normalized so that formatting, key order and comments do not change the hash
+    """
+    try:
+        parsed = yaml.safe_load(yaml_content)
+        normalized = json.dumps(parsed, sort_keys=True, separators=(',', ':'), default=str)
+    except yaml.YAMLError:
+        # Compare content which cannot be parsed as it is, ignoring surrounding whitespace
+        normalized = yaml_content.strip() if yaml_content is not None else ''
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+def is_unchanged(local_content, remote_content):
+    if remote_content is None:
+        return False
+    return content_hash(local_content) == content_hash(remote_content)
+
+
+class PushSummary:
+    """
+    Counts the objects created, updated and left unchanged by a push, by type of object (Descriptor, Scenario etc.)
+    """
+
+    def __init__(self):
+        self.counts = {}
+        self._lock = threading.Lock()
+
+    def record(self, object_type, action):
+        with self._lock:
+            type_counts = self.counts.setdefault(object_type, {PUSH_CREATE: 0, PUSH_UPDATE: 0, PUSH_UNCHANGED: 0})
+            type_counts[action] = type_counts.get(action, 0) + 1
+
+    def total(self, action):
+        with self._lock:
+            return sum(type_counts.get(action, 0) for type_counts in self.counts.values())
+
+    def report(self, journal):
+        with self._lock:
+            counts = {object_type: dict(type_counts) for object_type, type_counts in self.counts.items()}
+        if len(counts) == 0:
+            journal.event('Nothing pushed')
+            return
+        for object_type, type_counts in counts.items():
+            journal.event('{0}: {1} created, {2} updated, {3} unchanged'.format(object_type, type_counts[PUSH_CREATE], type_counts[PUSH_UPDATE], type_counts[PUSH_UNCHANGED]))
@@ -1,15 +1,17 @@
-import time
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 import lmctl.files as files
 import lmctl.utils.descriptors as descriptors
 import lmctl.drivers.lm.base as lm_drivers
-import lmctl.project.mutate.behaviour as behaviour_mutations
 import lmctl.project.handlers.interface as handlers_api
 import lmctl.project.testing as project_testing
+from lmctl.project.behaviour_sync import BehaviourSync, SYNC_UNCHANGED
+import lmctl.project.delta as push_delta
 from lmctl.project.validation import ValidationResult, ValidationViolation
 
-DEFAULT_POLLING_PERIOD = 2
+# Maximum seconds between checks on the progress of a test execution (checks start more frequently, see ScenarioExecutionTracker)
+DEFAULT_POLLING_PERIOD = project_testing.DEFAULT_MAX_POLL_INTERVAL
 POLLING_PERIOD = DEFAULT_POLLING_PERIOD
 
 def set_polling_period(new_period):
@@ -102,7 +104,7 @@ class AssemblyContentHandler(handlers_api.PkgContentHandler):
 
     def push_content(self, journal, env_sessions, push_options):
         project_id = self.__push_descriptor(journal, env_sessions, push_options)
-        self.__push_descriptor_template(journal, env_sessions)
+        self.__push_descriptor_template(journal, env_sessions, push_options)
         self.__push_service_behaviour(journal, env_sessions, project_id, push_options)
 
     def __push_descriptor(self, journal, env_sessions, push_options):
@@ -114,19 +116,25 @@ class AssemblyContentHandler(handlers_api.PkgContentHandler):
         journal.event('Checking for Descriptor {0} in CP4NA orchestration ({1})'.format(descriptor_name, lm_session.env.address))
         found = True
         try:
-            descriptor_driver.get_descriptor(descriptor_name)
+            existing_descriptor = descriptor_driver.get_descriptor(descriptor_name)
         except lm_drivers.NotFoundException:
             found = False
         if found:
+            if push_options.delta and push_delta.is_unchanged(descriptor_yml_str, existing_descriptor):
+                journal.event('Descriptor {0} already exists and is unchanged, skipping'.format(descriptor_name))
+                push_options.summary.record(push_delta.DESCRIPTOR_TYPE, push_delta.PUSH_UNCHANGED)
+                return descriptor_name
             journal.event('Descriptor {0} already exists, updating'.format(descriptor_name))
             descriptor_driver.update_descriptor(descriptor_name, descriptor_yml_str)
+            push_options.summary.record(push_delta.DESCRIPTOR_TYPE, push_delta.PUSH_UPDATE)
         else:
             journal.event('Not found, creating Descriptor {0}'.format(descriptor_name))
             descriptor_driver.create_descriptor(descriptor_yml_str, object_group_id=push_options.object_group_id)
+            push_options.summary.record(push_delta.DESCRIPTOR_TYPE, push_delta.PUSH_CREATE)
         env_sessions.mark_lm_updated()
         return descriptor_name
 
-    def __push_descriptor_template(self, journal, env_sessions):
+    def __push_descriptor_template(self, journal, env_sessions, push_options):
         lm_session = env_sessions.lm
         descriptor_template_path = self.tree.descriptor_template_file_path
         if os.path.exists(descriptor_template_path):
@@ -136,15 +144,21 @@ class AssemblyContentHandler(handlers_api.PkgContentHandler):
             journal.event('Checking for Descriptor Template {0} in CP4NA orchestration ({1})'.format(descriptor_name, descriptor_template_driver.lm_base))
             found = True
             try:
-                descriptor_template_driver.get_descriptor_template(descriptor_name)
+                existing_template = descriptor_template_driver.get_descriptor_template(descriptor_name)
             except lm_drivers.NotFoundException:
                 found = False
             if found:
+                if push_options.delta and push_delta.is_unchanged(descriptor_yml_str, existing_template):
+                    journal.event('Descriptor Template {0} already exists and is unchanged, skipping'.format(descriptor_name))
+                    push_options.summary.record(push_delta.DESCRIPTOR_TEMPLATE_TYPE, push_delta.PUSH_UNCHANGED)
+                    return
                 journal.event('Descriptor Template {0} already exists, updating'.format(descriptor_name))
                 descriptor_template_driver.update_descriptor_template(descriptor_name, descriptor_yml_str)
+                push_options.summary.record(push_delta.DESCRIPTOR_TEMPLATE_TYPE, push_delta.PUSH_UPDATE)
             else:
                 journal.event('Not found, creating Descriptor Template {0}'.format(descriptor_name))
                 descriptor_template_driver.create_descriptor_template(descriptor_yml_str)
+                push_options.summary.record(push_delta.DESCRIPTOR_TEMPLATE_TYPE, push_delta.PUSH_CREATE)
 
     def __push_service_behaviour(self, journal, env_sessions, project_id, push_options):
         lm_session = env_sessions.lm
@@ -153,68 +167,25 @@ class AssemblyContentHandler(handlers_api.PkgContentHandler):
             journal.event('Skipping Service Behaviour - nothing to push at {0}'.format(behaviour_path))
             return
         journal.stage('Pushing Service Behaviour for {0} at {1}'.format(self.meta.name, behaviour_path))
-        existing_configurations = lm_session.behaviour_driver.get_assembly_configurations(project_id)
-        self.__push_configurations(journal, env_sessions, project_id, existing_configurations)
-        existing_scenarios = lm_session.behaviour_driver.get_scenarios(project_id)
-        all_available_configurations = lm_session.behaviour_driver.get_assembly_configurations(project_id)
-        self.__push_runtime_scenarios(journal, env_sessions, project_id, existing_scenarios, all_available_configurations)
-        self.__push_test_scenarios(journal, env_sessions, project_id, existing_scenarios, all_available_configurations)
-
-    def __push_configurations(self, journal, env_sessions, project_id, existing_configurations):
-        lm_session = env_sessions.lm
-        existing_configurations = lm_session.behaviour_driver.get_assembly_configurations(project_id)
-        configurations_path = self.tree.service_behaviour_configurations_path
-        if os.path.exists(configurations_path):
-            walk_and_find_json(configurations_path, 'Assembly Configuration', self.__push_configuration, journal, env_sessions, project_id, existing_configurations)
-
-    def __push_configuration(self, file_path, configuration, journal, env_sessions, project_id, existing_configurations):
-        lm_session = env_sessions.lm
-        configuration['projectId'] = project_id
-        project_descriptor_name = project_id
-        behaviour_driver = lm_session.behaviour_driver
-        journal.event('Checking for assembly configuration {0} in CP4NA orchestration ({1}) project {2}'.format(configuration['name'], lm_session.env.address, project_id))
-        matching_configuration = self.__find_assembly_configuration_by_name(existing_configurations, configuration['name'])
-        if matching_configuration:
-            journal.event('Assembly Configuration {0} already exists, updating'.format(configuration['name']))
-            configuration['id'] = matching_configuration['id']
-            behaviour_driver.update_assembly_configuration(configuration)
-        else:
-            journal.event('Not found, creating assembly configuration {0}'.format(configuration['name']))
-            behaviour_driver.create_assembly_configuration(configuration)
-        env_sessions.mark_lm_updated()
-
-    def __push_runtime_scenarios(self, journal, env_sessions, project_id, existing_scenarios, available_configurations):
-        runtimes_path = self.tree.service_behaviour_runtime_path
-        if os.path.exists(runtimes_path):
-            walk_and_find_json(runtimes_path, 'Runtime', self.__push_scenario, journal, env_sessions, project_id, existing_scenarios, available_configurations)
-
-    def __push_test_scenarios(self, journal, env_sessions, project_id, existing_scenarios, available_configurations):
-        tests_path = self.tree.service_behaviour_tests_path
-        if os.path.exists(tests_path):
-            walk_and_find_json(tests_path, 'Test', self.__push_scenario, journal, env_sessions, project_id, existing_scenarios, available_configurations)
-
-    def __push_scenario(self, file_path, scenario, journal, env_sessions, project_id, existing_scenarios, available_configurations):
-        lm_session = env_sessions.lm
-        scenario['projectId'] = project_id
-        behaviour_driver = lm_session.behaviour_driver
-        scenario = behaviour_mutations.ScenarioPushMutator(available_configurations).apply(scenario)
-        journal.event('Checking for Scenario {0} in CP4NA orchestration ({1}) project {2}'.format(scenario['name'], lm_session.env.address, project_id))
-        matching_scenario = next((x for x in existing_scenarios if x["name"] == scenario['name']), None)
-        if matching_scenario:
-            journal.event('Scenario {0} already exists, updating'.format(scenario['name']))
-            scenario['id'] = matching_scenario['id']
-            behaviour_driver.update_scenario(scenario)
-        else:
-            journal.event('Not found, creating Scenario {0}'.format(scenario['name']))
-            behaviour_driver.create_scenario(scenario)
-        env_sessions.mark_lm_updated()
-
-    def __find_assembly_configuration_by_name(self, all_available_configurations, assembly_name):
-        return next((x for x in all_available_configurations if x["name"] == assembly_name), None)
-
-    def execute_tests(self, journal, env_sessions, selected_tests):
-        return AssemblyTestManager(self.root_path, self.meta).execute_tests(journal, env_sessions, selected_tests)
-
+        configurations = find_json(self.tree.service_behaviour_configurations_path, 'Assembly Configuration')
+        scenarios = find_json(self.tree.service_behaviour_runtime_path, 'Runtime') + find_json(self.tree.service_behaviour_tests_path, 'Test')
+        journal.event('Checking for Assembly Configurations and Scenarios in CP4NA orchestration ({0}) project {1}'.format(lm_session.env.address, project_id))
+        behaviour_sync = BehaviourSync(lm_session.behaviour_driver, project_id, journal, max_workers=getattr(push_options, 'parallel', 1))
+        actions = behaviour_sync.sync(configurations, scenarios)
+        for action in actions:
+            push_options.summary.record(action.element_type, action.action)
+        if any(action.action != SYNC_UNCHANGED for action in actions):
+            env_sessions.mark_lm_updated()
+
+    def execute_tests(self, journal, env_sessions, selected_tests, execution_options=None):
+        return AssemblyTestManager(self.root_path, self.meta).execute_tests(journal, env_sessions, selected_tests, execution_options=execution_options)
+
+
+def find_json(path, type_name):
+    found = []
+    if os.path.exists(path):
+        walk_and_find_json(path, type_name, lambda file_path, content: found.append(content))
+    return found
 
 def walk_and_find_json(path, type_name, action, *action_args):
     for root, dirs, files in os.walk(path):
@@ -253,18 +224,42 @@ class AssemblyTestManager:
             test_scenarios.extend(test_capture.captives)
         return test_scenarios
 
-    def execute_tests(self, journal, env_sessions, selected_tests):
+    def execute_tests(self, journal, env_sessions, selected_tests, execution_options=None):
+        if execution_options is None:
+            execution_options = project_testing.TestExecutionOptions()
         test_scenarios = self.__filter_scenarios_to_execute(self.get_tests(), selected_tests)
         if len(test_scenarios) == 0:
             journal.event('No matching tests found to execute at {0}'.format(self.tree.service_behaviour_tests_path))
             return project_testing.TestSuiteExecutionReport([])
         lm_session = env_sessions.lm
         project_id = self.__determine_project_id()
-        report_entries = []
-        for test_scenario in test_scenarios:
-            report_entries.append(self.__execute_test(journal, lm_session, project_id, test_scenario))
+        def execute(test_scenario):
+            return self.__execute_test_in_slot(journal, lm_session, project_id, test_scenario, execution_options)
+        if execution_options.parallel <= 1 or len(test_scenarios) == 1:
+            report_entries = [execute(test_scenario) for test_scenario in test_scenarios]
+        else:
+            # Report entries are kept in the order of the scenarios, regardless of the order they finish
+            with ThreadPoolExecutor(max_workers=min(execution_options.parallel, len(test_scenarios)), thread_name_prefix='lmctl-test') as executor:
+                report_entries = list(executor.map(execute, test_scenarios))
         return project_testing.TestSuiteExecutionReport(report_entries)
 
+    def __execute_test_in_slot(self, journal, lm_session, project_id, test_scenario, execution_options):
+        scenario_name = test_scenario['name']
+        if execution_options.stopped:
+            return self.__skip_test(journal, scenario_name)
+        with execution_options.execution_slot():
+            # Another test may have failed while waiting for a slot
+            if execution_options.stopped:
+                return self.__skip_test(journal, scenario_name)
+            report_entry = self.__execute_test(journal, lm_session, project_id, test_scenario, timeout=execution_options.timeout)
+        if report_entry.result == project_testing.TEST_STATUS_FAILED and execution_options.fail_fast:
+            execution_options.stop()
+        return report_entry
+
+    def __skip_test(self, journal, scenario_name):
+        journal.event('Skipping test: {0} (a previous test failed)'.format(scenario_name))
+        return project_testing.TestExecutionReportEntry(scenario_name, project_testing.TEST_STATUS_SKIPPED, 'Skipped as a previous test failed')
+
     def __filter_scenarios_to_execute(self, test_scenarios, selected_test_names):
         scenarios_to_execute = []
         for test_scenario in test_scenarios:
@@ -272,7 +267,7 @@ class AssemblyTestManager:
                 scenarios_to_execute.append(test_scenario)
         return scenarios_to_execute
 
-    def __execute_test(self, journal, lm_session, project_id, test_scenario):
+    def __execute_test(self, journal, lm_session, project_id, test_scenario, timeout=None):
         scenario_name = test_scenario['name']
         journal.event('Executing test: {0}'.format(scenario_name))
         behaviour_driver = lm_session.behaviour_driver
@@ -280,36 +275,68 @@ class AssemblyTestManager:
         execution_location = behaviour_driver.execute_scenario(remote_scenario['id'])
         location_parts = execution_location.split('/')
         execution_id = location_parts[len(location_parts) - 1]
-        finished = False
-        report_entries = []
-        current_step = 0
-        while not finished:
-            execution = behaviour_driver.get_execution(execution_id)
-            finished = self.__is_exec_finished(execution)
-            if finished:
-                journal.event('Test {0} completed with result: {1}'.format(scenario_name, execution['status']))
-                if execution['status'] == 'FAIL':
-                    journal.error_event('Execution failed with reason: {0}'.format(execution['error']))
-                exec_report = self.__build_execution_report(scenario_name, execution)
-                return exec_report
+        progress_reporter = TestProgressReporter(journal, scenario_name)
+        tracker = project_testing.ScenarioExecutionTracker(behaviour_driver, max_poll_interval=POLLING_PERIOD)
+        try:
+            execution = tracker.wait_for(execution_id, progress_listener=progress_reporter.report, timeout=timeout)
+        except project_testing.ScenarioExecutionTimeoutError as e:
+            journal.error_event('Test {0} timed out after {1} seconds, cancelling execution {2}'.format(scenario_name, timeout, execution_id))
+            self.__cancel_execution(journal, behaviour_driver, execution_id)
+            return project_testing.TestExecutionReportEntry(scenario_name, project_testing.TEST_STATUS_FAILED, '{0} failed: {1}'.format(scenario_name, str(e)))
+        journal.event('Test {0} completed with result: {1}'.format(scenario_name, execution['status']))
+        if execution['status'] == 'FAIL':
+            journal.error_event('Execution failed with reason: {0}'.format(execution['error']))
+        return self.__build_execution_report(scenario_name, execution)
+
+    def __cancel_execution(self, journal, behaviour_driver, execution_id):
+        try:
+            behaviour_driver.cancel_execution(execution_id)
+        except lm_drivers.LmDriverException as e:
+            journal.error_event('Failed to cancel execution {0}: {1}'.format(execution_id, str(e)))
+
+    def __build_execution_report(self, scenario_name, execution):
+        status = execution['status']
+        detail = None
+        if status == 'PASS':
+            result = project_testing.TEST_STATUS_PASSED
+        else:
+            result = project_testing.TEST_STATUS_FAILED
+            detail = '{0} failed:'.format(scenario_name)
+            if 'error' in execution:
+                detail += ' {0}'.format(execution['error'])
             else:
-                stage_results = execution['stageReports']
-                total_steps = self.__calc_total_steps(stage_results)
-                prev_step = current_step
-                current_step = self.__calc_current_step(stage_results)
-                steps_difference = current_step - prev_step
-                if steps_difference > 1:
-                    for i in range(prev_step+1, current_step):
-                        step_str = 'step {0}/{1}'.format(i, total_steps)
-                        journal.event('Test \'{0}\' in progress: {1}'.format(scenario_name, step_str))
-                step_str = 'step {0}/{1}'.format(current_step, total_steps) if current_step > 0 else 'pending...'
-                journal.event('Test \'{0}\' in progress: {1}'.format(scenario_name, step_str))
-                time.sleep(POLLING_PERIOD)
+                detail += ' no reason given'
+        entry = project_testing.TestExecutionReportEntry(scenario_name, result, detail)
+        return entry
+
+
+class TestProgressReporter:
+    """
+    Adds an event to the journal for each step an execution has moved through since the last report
+    """
+
+    def __init__(self, journal, scenario_name):
+        self.journal = journal
+        self.scenario_name = scenario_name
+        self.current_step = 0
+
+    def report(self, progress):
+        stage_results = progress.get('stageReports') or []
+        total_steps = self.__calc_total_steps(stage_results)
+        prev_step = self.current_step
+        self.current_step = self.__calc_current_step(stage_results)
+        steps_difference = self.current_step - prev_step
+        if steps_difference > 1:
+            for i in range(prev_step+1, self.current_step):
+                step_str = 'step {0}/{1}'.format(i, total_steps)
+                self.journal.event('Test \'{0}\' in progress: {1}'.format(self.scenario_name, step_str))
+        step_str = 'step {0}/{1}'.format(self.current_step, total_steps) if self.current_step > 0 else 'pending...'
+        self.journal.event('Test \'{0}\' in progress: {1}'.format(self.scenario_name, step_str))
 
     def __calc_current_step(self, stage_results):
         current_step = 0
         for stage_result in stage_results:
-            steps = stage_result['steps']
+            steps = stage_result.get('steps') or []
             for step in steps:
                 current_step += 1
                 if step['status'] == 'IN_PROGRESS':
@@ -319,32 +346,11 @@ class AssemblyTestManager:
     def __calc_total_steps(self, stage_results):
         total = 0
         for stage_result in stage_results:
-            steps = stage_result['steps']
+            steps = stage_result.get('steps') or []
             for step in steps:
                 total += 1
         return total
 
-    def __is_exec_finished(self, execution):
-        finished_results = ['PASS', 'ABORTED', 'FAIL']
-        if execution['status'] in finished_results:
-            return True
-        return False
-
-    def __build_execution_report(self, scenario_name, execution):
-        status = execution['status']
-        detail = None
-        if status == 'PASS':
-            result = project_testing.TEST_STATUS_PASSED
-        else:
-            result = project_testing.TEST_STATUS_FAILED
-            detail = '{0} failed:'.format(scenario_name)
-            if 'error' in execution:
-                detail += ' {0}'.format(execution['error'])
-            else:
-                detail += ' no reason given'
-        entry = project_testing.TestExecutionReportEntry(scenario_name, result, detail)
-        return entry
-
 
 class TestCapture:
 
@@ -3,6 +3,7 @@ import os
 import shutil
 from lmctl.project.source.config import RootProjectConfig
 import lmctl.project.types as project_types
+from lmctl.project.delta import PushSummary
 from datetime import datetime, timezone
 
 PACKAGING_PARAM = 'packaging'
@@ -391,8 +392,14 @@ class ContentValidationOptions:
         self.allow_autocorrect = allow_autocorrect
 
 class ContentPushOptions:
-    def __init__(self, object_group_id=None):
+    def __init__(self, object_group_id=None, parallel=1, delta=False, summary=None):
         self.object_group_id = object_group_id
+        # Maximum number of writes (e.g. behaviour scenarios) sent at once
+        self.parallel = parallel
+        # Skip writing objects whose content matches that already in the environment
+        self.delta = delta
+        # Counts of the objects created/updated/unchanged (shared by the handlers of all content in a package)
+        self.summary = summary if summary is not None else PushSummary()
 
 ############################
 # Content Handlers
@@ -413,7 +420,7 @@ class PkgContentHandler(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def execute_tests(self, journal, env_sessions, selected_tests):
+    def execute_tests(self, journal, env_sessions, selected_tests, execution_options=None):
         pass
 
 
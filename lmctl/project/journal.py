@@ -1,3 +1,4 @@
+import threading
 import lmctl.journal as journal
 
 
@@ -8,24 +9,54 @@ class ProjectJournal:
         if journal_consumer is not None:
             self.journal.register_consumer(journal_consumer)
         self.journal.open_chapter('Start')
+        # Events may be added by parallel workers (e.g. tests executed at once)
+        self._lock = threading.Lock()
+
+    def _add_entry(self, entry):
+        with self._lock:
+            self.journal.add_entry(entry)
 
     def subproject(self, sub_project_name):
-        self.journal.add_entry(SubprojectEvent(sub_project_name))
+        self._add_entry(SubprojectEvent(sub_project_name))
 
     def subproject_end(self, sub_project_name):
-        self.journal.add_entry(SubprojectEndEvent(sub_project_name))
+        self._add_entry(SubprojectEndEvent(sub_project_name))
 
     def section(self, title):
-        self.journal.add_entry(SectionEvent(title))
+        self._add_entry(SectionEvent(title))
 
     def stage(self, title):
-        self.journal.add_entry(StageEvent(title))
+        self._add_entry(StageEvent(title))
 
     def event(self, message):
-        self.journal.add_entry(Event(message))
+        self._add_entry(Event(message))
 
     def error_event(self, message):
-        self.journal.add_entry(Event(message, journal.EntryType.ERROR))
+        self._add_entry(Event(message, journal.EntryType.ERROR))
+
+
+class BufferedProjectJournal(ProjectJournal):
+    """
+    Holds events instead of passing them to a consumer, so the events of work done in parallel (e.g. testing a subproject) 
+    can be added to another journal as one block, rather than interleaved with the events of other work
+    """
+
+    def __init__(self):
+        self.entries = []
+        self._lock = threading.Lock()
+
+    def _add_entry(self, entry):
+        with self._lock:
+            self.entries.append(entry)
+
+    def replay(self, target_journal):
+        """
+        Add the held events to another ProjectJournal
+        """
+        with self._lock:
+            entries = list(self.entries)
+        for entry in entries:
+            target_journal._add_entry(entry)
 
 
 class ProjectEvent(journal.Entry):
@@ -4,11 +4,14 @@ import tarfile
 import zipfile
 import tempfile
 import shutil
+import copy
+from concurrent.futures import ThreadPoolExecutor
 import lmctl.utils.descriptors as descriptor_utils
 import lmctl.files as files
 import lmctl.journal as journal
 import lmctl.project.journal as project_journal
 import lmctl.project.package.meta as pkg_metas
+from lmctl.project.package.reader import PkgReader, PkgReadError
 import lmctl.project.processes.push as push_exec
 import lmctl.project.processes.etsi_push as etsi_push_exec
 import lmctl.project.processes.pkg_validation as pkg_validation_exec
@@ -63,18 +66,28 @@ class ValidateOptions(Options):
 
 class PushOptions(ValidateOptions):
 
-    def __init__(self, object_group_id: str = None):
+    def __init__(self, object_group_id: str = None, parallel: int = 1, delta: bool = False):
         super().__init__()
         self.object_group_id = object_group_id
+        # Maximum number of subprojects to push at once
+        self.parallel = parallel
+        # Skip descriptors, templates and behaviour which are unchanged in the target environment
+        self.delta = delta
 
 class TestOptions(Options):
 
-    def __init__(self, tests: List[str] = None):
+    def __init__(self, tests: List[str] = None, parallel: int = 1, fail_fast: bool = False, test_timeout: float = None):
         super().__init__()
         if tests is not None:
             self.selected_tests = tests
         else:
             self.selected_tests = ['*']
+        # Maximum number of tests to execute at once
+        self.parallel = parallel
+        # Skip remaining tests once one has failed
+        self.fail_fast = fail_fast
+        # Seconds to wait for each test to finish, before it is failed
+        self.test_timeout = test_timeout
 
 
 class PkgContentBase():
@@ -111,6 +124,21 @@ class SubPkgContent(PkgContentBase):
         tree = ExpandedPkgTree(root_path)
         super().__init__(tree, meta)
 
+class EnvironmentPushResult:
+    """
+    Outcome of pushing a package to one of several environments (see Pkg.push_to_environments)
+    """
+
+    def __init__(self, environment, journal, error=None):
+        self.environment = environment
+        # Events of the push to this environment only
+        self.journal = journal
+        self.error = error
+
+    @property
+    def failed(self):
+        return self.error is not None
+
 class PkgInspectionReport:
 
     def __init__(self, pkg_name, pkg_version, includes):
@@ -120,6 +148,17 @@ class PkgInspectionReport:
             includes = []
         self.includes = includes
 
+    @staticmethod
+    def for_meta(pkg_meta):
+        return PkgInspectionReport(pkg_meta.full_name, pkg_meta.version, PkgInspectionReport.__includes_of(pkg_meta))
+
+    @staticmethod
+    def __includes_of(meta_entry):
+        includes = [PkgIncludeEntry(meta_entry)]
+        for subpkg in meta_entry.subpkgs:
+            includes.extend(PkgInspectionReport.__includes_of(subpkg))
+        return includes
+
     def to_dict(self):
         tpl = {}
         tpl['name'] = self.name
@@ -161,13 +200,44 @@ class Pkg:
         self.path = path
 
     def inspect(self):
+        return PkgInspectionReport.for_meta(self.read_meta())
+
+    def reader(self):
+        """
+        Open a PkgReader, to read single files of the package without extracting it
+        """
+        try:
+            return PkgReader(self.path)
+        except PkgReadError as e:
+            raise InvalidPackageError(str(e)) from e
+
+    def read_meta(self):
+        """
+        Read the meta file of the package directly from the archive.
+        Packages with a deprecated structure (no lmpkg.yml, instead an lmproject.yml and/or content.tgz) are extracted to a temporary directory to read it
+        """
+        meta = self.__read_meta_from_archive()
+        if meta is not None:
+            return meta
         tempdir = tempfile.mkdtemp()
         try:
-            pkg_content = self.open(tempdir)
-            return pkg_content.inspect()
+            return self.open(tempdir).meta
         finally:
-            if os.path.exists(tempdir):
-                shutil.rmtree(tempdir)
+            files.remove_directory(tempdir)
+
+    def __read_meta_from_archive(self):
+        """
+        Returns the meta of the package, or None if it can only be found by extracting the package (deprecated structure)
+        """
+        with self.reader() as reader:
+            meta_file_name = ExpandedPkgTree.PKG_META_FILE_YML
+            if not reader.has(meta_file_name):
+                return None
+            try:
+                config_dict = yaml.safe_load(reader.read_text(meta_file_name))
+            except PkgReadError as e:
+                raise InvalidPackageError(str(e)) from e
+        return self.__parse_meta(config_dict)
 
     def extract(self, target_directory):
         if tarfile.is_tarfile(self.path):
@@ -211,12 +281,15 @@ class Pkg:
         if os.path.exists(deprecated_pkg_meta_file_path) and not os.path.exists(meta_file_path):
             with open(deprecated_pkg_meta_file_path, 'rt') as f:
                 old_meta_dict = yaml.safe_load(f.read())
-            version = self.__attempt_to_determine_version()
+            version = self.__attempt_to_determine_version(pkg_tree)
             pkg_metas.PkgMetaRewriter(deprecated_pkg_meta_file_path, meta_file_path, old_meta_dict, version).rewrite()
         if not os.path.exists(meta_file_path):
             raise InvalidPackageError('Could not find meta file at path: {0}'.format(meta_file_path))
         with open(meta_file_path, 'rt') as f:
             config_dict = yaml.safe_load(f.read())
+        return self.__parse_meta(config_dict)
+
+    def __parse_meta(self, config_dict):
         if not config_dict:
             config_dict = {}
         try:
@@ -224,9 +297,10 @@ class Pkg:
         except pkg_metas.PkgMetaError as e:
             raise InvalidPackageError(str(e)) from e
 
-    def __attempt_to_determine_version(self):
+    def __attempt_to_determine_version(self, pkg_tree):
         try:
-            potential_descriptor = os.path.join(self.path, 'Descriptor', 'assembly.yml')
+            # Read from the extracted package (the package itself is an archive, so never contains this path)
+            potential_descriptor = pkg_tree.resolve_relative_path('Descriptor', 'assembly.yml')
             if os.path.exists(potential_descriptor):
                 descriptor = descriptor_utils.DescriptorParser().read_from_file(potential_descriptor)
                 return descriptor.get_version()
@@ -240,20 +314,108 @@ class Pkg:
         return pkg_meta.is_etsi_content()
 
     def push(self, env_sessions, options):
+        """
+        Push the package to an environment. Returns the extracted PkgContent, or None for an ETSI package,
+        which is onboarded by uploading the package file itself, so is never extracted
+        """
         journal = self.__init_journal(options.journal_consumer)
         journal.section('Processing Package')
         journal.event('Processing {0}'.format(self.path))
 
+        pkg_meta = self.__read_meta_from_archive()
+        if pkg_meta is not None and self.__is_etsi_pkg(pkg_meta):
+            self.__push_etsi(pkg_meta, options, journal, env_sessions)
+            return None
+
         push_workspace = self.__create_push_workspace()
         files.clean_directory(push_workspace)
         pkg_content = self.open(push_workspace)
 
         if self.__is_etsi_pkg(pkg_content.meta):
-            etsi_push_exec.EtsiPushProcess(self, pkg_content.meta, options, journal, env_sessions, push_workspace).execute()
+            self.__push_etsi(pkg_content.meta, options, journal, env_sessions)
         else:
             pkg_content.push(env_sessions, options)
         return pkg_content
 
+    def __push_etsi(self, pkg_meta, options, journal, env_sessions):
+        try:
+            etsi_push_exec.EtsiPushProcess(self, pkg_meta, options, journal, env_sessions).execute()
+        except etsi_push_exec.EtsiPushProcessError as e:
+            raise PushError(str(e)) from e
+
+    def push_to_environments(self, env_sessions_by_name, options, max_workers=None, pkg_content=None, object_group_id_by_name=None):
+        """
+        Push the package to several environments at once. "env_sessions_by_name" maps the name of each environment to its EnvironmentSessions.
+
+        The package is extracted (unless an already opened "pkg_content" is given) and validated once, then the workspace is made read-only
+        and shared by concurrent pushes to each environment (up to "max_workers" at once, all by default). ETSI packages are onboarded
+        from the archive itself, so are never extracted.
+        The events of each push are held until all have ended, then added to the journal one environment at a time.
+        A failure in one environment does not stop the pushes to the others, so an EnvironmentPushResult is returned for each environment, in the given order.
+
+        Object groups are specific to an environment, so "object_group_id_by_name" may give the object group to use in each environment (instead of options.object_group_id)
+        """
+        journal = self.__init_journal(options.journal_consumer)
+        journal.section('Processing Package')
+        journal.event('Processing {0}'.format(self.path))
+
+        pkg_meta = pkg_content.meta if pkg_content is not None else self.__read_meta_from_archive()
+        if pkg_meta is None:
+            # Deprecated structure, the package must be extracted to read the meta
+            push_workspace = self.__create_push_workspace()
+            files.clean_directory(push_workspace)
+            try:
+                pkg_content = self.open(push_workspace)
+            except:
+                files.remove_directory(push_workspace)
+                raise
+            pkg_meta = pkg_content.meta
+        else:
+            push_workspace = None
+        is_etsi = self.__is_etsi_pkg(pkg_meta)
+        if pkg_content is None and not is_etsi:
+            push_workspace = self.__create_push_workspace()
+            files.clean_directory(push_workspace)
+        try:
+            if pkg_content is None and not is_etsi:
+                pkg_content = self.open(push_workspace)
+            environment_names = list(env_sessions_by_name.keys())
+            if not is_etsi and len(environment_names) > 0:
+                # Validation (and autocorrection) depends only on the content, so is done once for all environments
+                validate_result = pkg_content.validate(env_sessions_by_name[environment_names[0]], options)
+                if validate_result.has_errors():
+                    raise PushValidationError(validate_result)
+            if pkg_content is not None:
+                files.make_read_only(pkg_content.tree.root_path)
+            results = [EnvironmentPushResult(name, project_journal.BufferedProjectJournal()) for name in environment_names]
+
+            def push_to_environment(result):
+                env_sessions = env_sessions_by_name[result.environment]
+                environment_options = copy.copy(options)
+                if object_group_id_by_name is not None and result.environment in object_group_id_by_name:
+                    environment_options.object_group_id = object_group_id_by_name[result.environment]
+                try:
+                    if is_etsi:
+                        etsi_push_exec.EtsiPushProcess(self, pkg_meta, environment_options, result.journal, env_sessions).execute()
+                    else:
+                        pkg_content.push_validated(env_sessions, environment_options, journal=result.journal)
+                except Exception as e:
+                    result.error = e
+
+            if len(results) > 0:
+                workers = max_workers if max_workers is not None else len(results)
+                with ThreadPoolExecutor(max_workers=max(1, min(workers, len(results))), thread_name_prefix='lmctl-pkg-push') as executor:
+                    list(executor.map(push_to_environment, results))
+            for result in results:
+                journal.section('Push to {0}'.format(result.environment))
+                result.journal.replay(journal)
+                if result.failed:
+                    journal.error_event('Push to {0} failed: {1}'.format(result.environment, str(result.error)))
+            return results
+        finally:
+            if push_workspace is not None:
+                files.remove_directory(push_workspace)
+
     def __create_push_workspace(self):
         tempdir = tempfile.mkdtemp()
         return tempdir
@@ -277,15 +439,7 @@ class PkgContent(PkgContentBase):
         return project_journal.ProjectJournal(journal_consumer)
 
     def inspect(self):
-        includes = self.__inspect_meta(self.meta)
-        return PkgInspectionReport(self.meta.full_name, self.meta.version, includes)
-
-    def __inspect_meta(self, meta_entry):
-        includes = []
-        includes.append(PkgIncludeEntry(meta_entry))
-        for subpkg in meta_entry.subpkgs:
-            includes.extend(self.__inspect_meta(subpkg))
-        return includes
+        return PkgInspectionReport.for_meta(self.meta)
 
     def validate(self, env_sessions, options):
         journal = self.__init_journal(options.journal_consumer)
@@ -305,6 +459,17 @@ class PkgContent(PkgContentBase):
         validate_result = self.__do_validate(env_sessions, options, journal)
         if validate_result.has_errors():
             raise PushValidationError(validate_result)
+        self.__do_push_validated(env_sessions, options, journal)
+
+    def push_validated(self, env_sessions, options, journal=None):
+        """
+        Push content which has already been validated (e.g. once, before pushing it to several environments)
+        """
+        if journal is None:
+            journal = self.__init_journal(options.journal_consumer)
+        self.__do_push_validated(env_sessions, options, journal)
+
+    def __do_push_validated(self, env_sessions, options, journal):
         try:
             push_exec.PushProcess(self, options, journal, env_sessions).execute()
         except push_exec.PushProcessError as e:
@@ -0,0 +1,113 @@
+import tarfile
+import zipfile
+import fnmatch
+
+class PkgReadError(Exception):
+    pass
+
+def _normalise_member_name(name):
+    name = name.replace('\\', '/')
+    while name.startswith('./'):
+        name = name[2:]
+    return name.lstrip('/')
+
+
+class PkgReader:
+    """
+    Reads single files of a package (tgz or csar) directly from the archive, without extracting it.
+
+    An index of the members of the archive is built as they are found. A csar (zip) has a central directory, so the index is complete on open and any
+    member is read without decompressing the others. A tgz can only be read from the start, so the index is built lazily: looking for a member
+    reads through the archive only as far as that member (lmpkg.yml is added to the start of packages built by lmctl for this reason).
+
+    Use as a context manager, or call close() when finished:
+
+        with PkgReader(path) as reader:
+            meta_str = reader.read_text('lmpkg.yml')
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._tar = None
+        self._zip = None
+        self._index = {}
+        self._fully_indexed = False
+        self.__open()
+
+    def __open(self):
+        if tarfile.is_tarfile(self.path):
+            self._tar = tarfile.open(self.path, mode='r:gz')
+        elif zipfile.is_zipfile(self.path):
+            self._zip = zipfile.ZipFile(self.path, mode='r')
+            for info in self._zip.infolist():
+                if not info.is_dir():
+                    self._index.setdefault(_normalise_member_name(info.filename), info)
+            self._fully_indexed = True
+        else:
+            raise PkgReadError('Could not determine if pkg {0} was a tgz or csar'.format(self.path))
+
+    def close(self):
+        if self._tar is not None:
+            self._tar.close()
+            self._tar = None
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, etype, value, traceback):
+        self.close()
+
+    def __index_next_member(self):
+        member = self._tar.next()
+        if member is None:
+            self._fully_indexed = True
+            return None
+        if member.isfile():
+            self._index.setdefault(_normalise_member_name(member.name), member)
+        return member
+
+    def __find_member(self, name):
+        name = _normalise_member_name(name)
+        member = self._index.get(name)
+        while member is None and not self._fully_indexed:
+            self.__index_next_member()
+            member = self._index.get(name)
+        return member
+
+    def __index_all(self):
+        while not self._fully_indexed:
+            self.__index_next_member()
+
+    def names(self):
+        """
+        Names of all files in the package (relative to the root of the package, using "/" as separator)
+        """
+        self.__index_all()
+        return list(self._index.keys())
+
+    def has(self, name):
+        return self.__find_member(name) is not None
+
+    def find(self, pattern):
+        """
+        Names of the files matching a glob pattern (e.g. "Definitions/*.yaml"), in the order found in the archive
+        """
+        return [name for name in self.names() if fnmatch.fnmatchcase(name, pattern)]
+
+    def read(self, name):
+        member = self.__find_member(name)
+        if member is None:
+            raise PkgReadError('Could not find {0} in pkg {1}'.format(name, self.path))
+        if self._zip is not None:
+            return self._zip.read(member)
+        member_file = self._tar.extractfile(member)
+        if member_file is None:
+            raise PkgReadError('Could not read {0} in pkg {1}'.format(name, self.path))
+        with member_file:
+            return member_file.read()
+
+    def read_text(self, name, encoding='utf-8'):
+        return self.read(name).decode(encoding)
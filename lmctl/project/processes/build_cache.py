@@ -0,0 +1,171 @@
+import os
+import json
+import hashlib
+import logging
+import lmctl.files as files
+from .common import LIFECYCLE_WORKSPACE
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE_NAME = 'build-manifest.json'
+MANIFEST_VERSION = 1
+# Directories never treated as inputs of a build
+IGNORED_DIRECTORIES = (LIFECYCLE_WORKSPACE, '.git')
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _lmctl_version():
+    pkg_info_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'pkg_info.json')
+    try:
+        with open(pkg_info_path, 'r') as f:
+            return json.load(f).get('version')
+    except (OSError, ValueError):
+        return None
+
+
+class BuildCache:
+    """
+    Records the inputs of each project/subproject built, so an incremental build can reuse the staged and compiled output
+    of those whose inputs have not changed since the last build.
+
+    The inputs of a project are its own source files (excluding the directories of its subprojects, which are separate entries),
+    the configuration of the root project (which the references resolved when staging descriptors are built from) and the version of lmctl.
+    Each source file is recorded with its size, modification time and content hash, so unmodified files are not read again to work out the hash.
+
+    The manifest is removed before staging begins and only written once compilation has completed, so output left by a failed build is never reused.
+    A BuildCache which is not "incremental" reuses nothing, so every project is rebuilt
+    """
+
+    def __init__(self, project, incremental=False):
+        self.project = project
+        self.incremental = incremental
+        self.manifest_path = os.path.join(project.tree.root_path, LIFECYCLE_WORKSPACE, MANIFEST_FILE_NAME)
+        self.__config_hash = None
+        self.__previous = {}
+        self.__current = {}
+        self.__reusable = set()
+
+    def prepare(self, journal):
+        """
+        Work out the inputs of each project and which have not changed since the last build
+        """
+        previous_manifest = self.__read_manifest()
+        self.__remove_manifest()
+        if not self.incremental:
+            return
+        journal.section('Check Build Cache')
+        config_hash = self.__hash_config()
+        previous_projects = {}
+        if previous_manifest is not None and previous_manifest.get('version') == MANIFEST_VERSION and previous_manifest.get('lmctl') == _lmctl_version() \
+                and previous_manifest.get('config') == config_hash:
+            previous_projects = previous_manifest.get('projects', {})
+        self.__config_hash = config_hash
+        self.__previous = previous_projects
+        self.__record_project(self.project)
+        journal.event('Incremental build: {0} of {1} projects unchanged since the last build'.format(len(self.__reusable), len(self.__current)))
+
+    def key(self, project):
+        return os.path.relpath(project.tree.root_path, self.project.tree.root_path).replace(os.sep, '/')
+
+    def is_reusable(self, project):
+        """
+        True if the output of the last build of this project can be used, as none of its inputs have changed
+        """
+        return self.incremental and self.key(project) in self.__reusable
+
+    def invalidate(self, project):
+        """
+        Mark the output of the last build of this project as not reusable (e.g. because some of it has been removed)
+        """
+        self.__reusable.discard(self.key(project))
+
+    def clean_output(self, project, output_path, contains_dir_name):
+        """
+        Prepare the directory the output of a project is written to. On an incremental build, the output of its subprojects (in "contains_dir_name")
+        is kept, as it may be reused, apart from that of any subproject no longer in the project
+        """
+        if not self.incremental:
+            files.clean_directory(output_path)
+            return
+        files.clean_directory_except(output_path, [contains_dir_name])
+        contains_path = os.path.join(output_path, contains_dir_name)
+        if os.path.exists(contains_path):
+            subproject_directories = [subproject.config.directory for subproject in project.subprojects]
+            for name in os.listdir(contains_path):
+                if name not in subproject_directories:
+                    files.remove_directory(os.path.join(contains_path, name))
+
+    def save(self):
+        """
+        Record the inputs of this build, so the next incremental build may reuse its output
+        """
+        if not self.incremental:
+            return
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'lmctl': _lmctl_version(),
+            'config': self.__config_hash,
+            'projects': self.__current
+        }
+        os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    def __read_manifest(self):
+        if not os.path.exists(self.manifest_path):
+            return None
+        try:
+            with open(self.manifest_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug('Ignoring unreadable build manifest at {0}: {1}'.format(self.manifest_path, e))
+            return None
+
+    def __remove_manifest(self):
+        if os.path.exists(self.manifest_path):
+            os.remove(self.manifest_path)
+
+    def __hash_config(self):
+        config_str = json.dumps(self.project.config.to_dict(), sort_keys=True, default=str)
+        return hashlib.sha256(config_str.encode('utf-8')).hexdigest()
+
+    def __record_project(self, project):
+        key = self.key(project)
+        previous_entry = self.__previous.get(key, {})
+        previous_files = previous_entry.get('files', {})
+        file_entries = {}
+        excluded_paths = [os.path.abspath(subproject.tree.root_path) for subproject in project.subprojects]
+        for relative_path, full_path in self.__source_files(project.tree.root_path, excluded_paths):
+            file_entries[relative_path] = self.__file_entry(full_path, previous_files.get(relative_path))
+        digest = hashlib.sha256()
+        for relative_path in sorted(file_entries.keys()):
+            digest.update(relative_path.encode('utf-8'))
+            digest.update(b'\0')
+            digest.update(file_entries[relative_path]['sha256'].encode('utf-8'))
+            digest.update(b'\0')
+        inputs_hash = digest.hexdigest()
+        self.__current[key] = {'inputs': inputs_hash, 'files': file_entries}
+        if previous_entry.get('inputs') == inputs_hash:
+            self.__reusable.add(key)
+        for subproject in project.subprojects:
+            self.__record_project(subproject)
+
+    def __source_files(self, root_path, excluded_paths):
+        for dir_path, dir_names, file_names in os.walk(root_path):
+            dir_names[:] = sorted(name for name in dir_names
+                                    if not (dir_path == root_path and name in IGNORED_DIRECTORIES) and os.path.abspath(os.path.join(dir_path, name)) not in excluded_paths)
+            for file_name in sorted(file_names):
+                full_path = os.path.join(dir_path, file_name)
+                yield os.path.relpath(full_path, root_path).replace(os.sep, '/'), full_path
+
+    def __file_entry(self, full_path, previous_entry):
+        stat = os.stat(full_path)
+        if previous_entry is not None and previous_entry.get('size') == stat.st_size and previous_entry.get('mtime') == stat.st_mtime_ns:
+            return previous_entry
+        digest = hashlib.sha256()
+        with open(full_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return {'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'sha256': digest.hexdigest()}
@@ -1,3 +1,90 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from lmctl.project.journal import BufferedProjectJournal
 
+LIFECYCLE_WORKSPACE = '_lmctl'
 
-LIFECYCLE_WORKSPACE = '_lmctl'
\ No newline at end of file
+
+class SubprojectWork:
+    """
+    Work to be done for a subproject. "work" is called with the journal to record events on and returns the SubprojectWork for the subprojects of this subproject
+    """
+
+    def __init__(self, name, work):
+        self.name = name
+        self.work = work
+        self.journal = BufferedProjectJournal()
+        self.children = []
+        self.started = False
+        self.error = None
+
+
+class ParallelSubprojectWorker:
+    """
+    Executes the work for a tree of subprojects on a pool of "jobs" threads. The work for a subproject completes before
+    the work for its own subprojects starts (e.g. a subproject is staged into a directory prepared by its parent), whilst siblings are worked at once.
+    Once any work has failed, no further work is started and the first error (in the order of the subprojects) is raised.
+
+    The events of each subproject are held until all work has ended, then added to the journal in the order
+    they would be had the subprojects been worked one at a time
+    """
+
+    def __init__(self, jobs, journal):
+        self.jobs = jobs
+        self.journal = journal
+        # Set by the first work to fail, so work already queued on the pool is not started
+        self.failed = threading.Event()
+
+    def execute(self, subproject_works):
+        try:
+            self.__execute(subproject_works)
+        finally:
+            for subproject_work in subproject_works:
+                self.__replay(subproject_work)
+        error = self.__first_error(subproject_works)
+        if error is not None:
+            raise error
+
+    def __execute(self, subproject_works):
+        with ThreadPoolExecutor(max_workers=self.jobs, thread_name_prefix='lmctl-build') as executor:
+            running = {executor.submit(self.__do_work, subproject_work): subproject_work for subproject_work in subproject_works}
+            while len(running) > 0:
+                done, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+                for future in done:
+                    subproject_work = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        subproject_work.error = error
+                        continue
+                    subproject_work.children = future.result() or []
+                    if not self.failed.is_set():
+                        for child in subproject_work.children:
+                            running[executor.submit(self.__do_work, child)] = child
+
+    def __do_work(self, subproject_work):
+        if self.failed.is_set():
+            return None
+        subproject_work.started = True
+        try:
+            return subproject_work.work(subproject_work.journal)
+        except Exception:
+            self.failed.set()
+            raise
+
+    def __replay(self, subproject_work):
+        if not subproject_work.started:
+            return
+        self.journal.subproject(subproject_work.name)
+        subproject_work.journal.replay(self.journal)
+        for child in subproject_work.children:
+            self.__replay(child)
+        self.journal.subproject_end(subproject_work.name)
+
+    def __first_error(self, subproject_works):
+        for subproject_work in subproject_works:
+            if subproject_work.error is not None:
+                return subproject_work.error
+            error = self.__first_error(subproject_work.children)
+            if error is not None:
+                return error
+        return None
@@ -1,19 +1,22 @@
 import os
+import functools
 import lmctl.files as files
 import lmctl.project.handlers.interface as handlers_api
 from lmctl.project.package.core import ExpandedPkgTree
-from .common import LIFECYCLE_WORKSPACE
+from .common import LIFECYCLE_WORKSPACE, SubprojectWork, ParallelSubprojectWorker
+from .build_cache import BuildCache
 
 class CompileProcessError(Exception):
     pass
 
 class CompileProcess:
 
-    def __init__(self, project, options, staging_tree, journal):
+    def __init__(self, project, options, staging_tree, journal, build_cache=None):
         self.project = project
         self.options = options
         self.journal = journal
         self.staging_tree = staging_tree
+        self.build_cache = build_cache if build_cache is not None else BuildCache(project)
 
     def __create_content_tree(self):
         compile_workspace = os.path.join(self.project.tree.root_path, LIFECYCLE_WORKSPACE, 'compile')
@@ -21,26 +24,39 @@ class CompileProcess:
 
     def execute(self):
         content_tree = self.__create_content_tree()
-        CompileWorker(self.project, self.options, self.staging_tree, content_tree, self.journal).work()
+        CompileWorker(self.project, self.options, self.staging_tree, content_tree, self.journal, build_cache=self.build_cache).work()
         return content_tree
 
 
 class CompileWorker:
 
-    def __init__(self, project, options, staging_tree, content_tree, journal):
+    def __init__(self, project, options, staging_tree, content_tree, journal, build_cache=None):
         self.project = project
         self.options = options
         self.journal = journal
         self.staging_tree = staging_tree
         self.content_tree = content_tree
+        self.build_cache = build_cache if build_cache is not None else BuildCache(project)
 
     def work(self):
+        self.compile()
+        self.__compile_child_projects()
+
+    def compile(self):
+        if self.__reuse_compiled_sources():
+            return
         self.__prepare_compile_directories()
         self.__compile_sources()
-        self.__compile_child_projects()
+
+    def __reuse_compiled_sources(self):
+        if not self.build_cache.is_reusable(self.project) or not os.path.exists(self.content_tree.root_path):
+            return False
+        self.journal.section('Compile Package')
+        self.journal.event('Sources unchanged since the last build, reusing compiled content at {0}'.format(self.content_tree.root_path))
+        return True
 
     def __prepare_compile_directories(self):
-        files.clean_directory(self.content_tree.root_path)
+        self.build_cache.clean_output(self.project, self.content_tree.root_path, ExpandedPkgTree.CONTAINS_DIR)
 
     def __compile_sources(self):
         self.journal.section('Compile Package')
@@ -61,13 +77,27 @@ class CompileWorker:
         subprojects = self.project.subprojects
         if len(subprojects) == 0:
             return
+        jobs = getattr(self.options, 'jobs', 1)
+        if jobs is not None and jobs > 1:
+            ParallelSubprojectWorker(jobs, self.journal).execute(self.subproject_works())
+            return
         for subproject in subprojects:
             self.journal.subproject(subproject.config.name)
             child_staging_tree = self.staging_tree.gen_subproject_staging_tree(subproject.config.directory)
             child_content_tree = self.content_tree.gen_child_content_tree(subproject.config.directory)
-            CompileWorker(subproject, self.options, child_staging_tree, child_content_tree, self.journal).work()
+            CompileWorker(subproject, self.options, child_staging_tree, child_content_tree, self.journal, build_cache=self.build_cache).work()
             self.journal.subproject_end(subproject.config.name)
 
+    def subproject_works(self):
+        return [SubprojectWork(subproject.config.name, functools.partial(self.__compile_subproject, subproject)) for subproject in self.project.subprojects]
+
+    def __compile_subproject(self, subproject, journal):
+        child_staging_tree = self.staging_tree.gen_subproject_staging_tree(subproject.config.directory)
+        child_content_tree = self.content_tree.gen_child_content_tree(subproject.config.directory)
+        child_worker = CompileWorker(subproject, self.options, child_staging_tree, child_content_tree, journal, build_cache=self.build_cache)
+        child_worker.compile()
+        return child_worker.subproject_works()
+
 class SourceCompiler:
 
     def __init__(self, journal, source_config, compile_path):
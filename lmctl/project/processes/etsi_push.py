@@ -3,19 +3,37 @@ import lmctl.project.handlers.etsi_ns as etsi_ns_handler_api
 import lmctl.project.handlers.etsi_vnf as etsi_vnf_handler_api
 import lmctl.utils.descriptors as descriptors
 import lmctl.drivers.lm.base as lm_drivers
+from lmctl.project.package.reader import PkgReadError
+
+# Location of the descriptor within each type of ETSI package
+ETSI_NS_DESCRIPTOR_MEMBER = '/'.join([etsi_ns_handler_api.EtsiNsPkgContentTree.DEFINITIONS_DIR, etsi_ns_handler_api.EtsiNsPkgContentTree.DESCRIPTOR_FILE_YML])
+ETSI_VNF_DESCRIPTOR_MEMBER = '/'.join([etsi_vnf_handler_api.EtsiVnfPkgContentTree.DEFINITIONS_DIR, etsi_vnf_handler_api.EtsiVnfPkgContentTree.LM_DIRECTORY,
+                                        etsi_vnf_handler_api.EtsiVnfPkgContentTree.RESOURCE_YAML_FILE])
 
 class EtsiPushProcessError(Exception):
     pass
 
 class EtsiPushProcess:
+    """
+    Onboards an ETSI package. Only the descriptor is needed (to find the name of the package), which is read directly from the package archive,
+    so the package does not need to be extracted ("push_workspace" is no longer used and kept for compatibility)
+    """
 
-    def __init__(self, pkg, pkg_meta, options, journal, env_sessions, push_workspace):
+    def __init__(self, pkg, pkg_meta, options, journal, env_sessions, push_workspace=None):
         self.pkg = pkg
         self.pkg_meta = pkg_meta
         self.options = options
         self.journal = journal
         self.env_sessions = env_sessions
-        self.push_workspace = push_workspace        
+        self.push_workspace = push_workspace
+
+    def __read_descriptor_name(self, descriptor_member_name):
+        with self.pkg.reader() as reader:
+            try:
+                descriptor_yml_str = reader.read_text(descriptor_member_name)
+            except PkgReadError as e:
+                raise EtsiPushProcessError(str(e)) from e
+        return descriptors.DescriptorParser().read_from_str(descriptor_yml_str).get_name()
 
     def execute(self):
         self.journal.event('Pushing ETSI Package Content')
@@ -23,9 +41,7 @@ class EtsiPushProcess:
         pkg_driver = lm_session.pkg_mgmt_driver
         if (self.pkg_meta.is_etsi_ns_content()):
             # Need to get the descriptor to determin the full ID (descriptor_name) as namein the pkg_meta is not full
-            descriptor_path = etsi_ns_handler_api.EtsiNsPkgContentTree(self.push_workspace).descriptor_definitions_file_path
-            descriptor, descriptor_yml_str = descriptors.DescriptorParser().read_from_file_with_raw(descriptor_path)
-            descriptor_name = descriptor.get_name()            
+            descriptor_name = self.__read_descriptor_name(ETSI_NS_DESCRIPTOR_MEMBER)
             self.journal.event('Removing any existing ETSI_NS assembly package named {0} (version: {1}) from TNC-O: {2} ({3})'
                 .format(descriptor_name, self.pkg_meta.version, lm_session.env.name, lm_session.env.address))
             try:
@@ -34,9 +50,7 @@ class EtsiPushProcess:
                 self.journal.event('No package named {0} found'.format(descriptor_name))            
             pkg_driver.onboard_nsd_package(descriptor_name, self.pkg.path, object_group_id=self.options.object_group_id)
         elif (self.pkg_meta.is_etsi_vnf_content()):
-            descriptor_path = etsi_vnf_handler_api.EtsiVnfPkgContentTree(self.push_workspace).definitions_descriptor_file_path
-            descriptor, descriptor_yml_str = descriptors.DescriptorParser().read_from_file_with_raw(descriptor_path)
-            descriptor_name = descriptor.get_name()
+            descriptor_name = self.__read_descriptor_name(ETSI_VNF_DESCRIPTOR_MEMBER)
             self.journal.event('Removing any existing ETSI_NS assembly package named {0} (version: {1}) from TNC-O: {2} ({3})'
                 .format(descriptor_name, self.pkg_meta.version, lm_session.env.name, lm_session.env.address))
             try:
@@ -53,13 +53,17 @@ class PkgProcess:
         else:
             with tarfile.open(pkg_path, mode='w:gz') as pkg_tar:
                 self.__build_package(pkg_tar.add, pkg_tree, compiled_content_path, pkg_meta_file_path)
-        self.__clear_compile_directory()
+        if not getattr(self.options, 'incremental', False):
+            # Compiled content is kept on an incremental build, to be reused by the next
+            self.__clear_compile_directory()
         try:
             return pkgs.Pkg(pkg_path)
         except pkgs.InvalidPackageError as e:
             raise PkgProcessError(str(e)) from e
 
     def __build_package(self, add_method, pkg_tree, compiled_content_path, pkg_meta_file_path):
+        # Meta file first, so it can be read from the start of a tgz without reading through the rest of the package (see PkgReader)
+        add_method(pkg_meta_file_path, arcname=pkg_tree.pkg_meta_file_name)
         rootlen = len(compiled_content_path) + 1
         for root, dirs, filelist in os.walk(compiled_content_path):
             for file_name in filelist:
@@ -70,7 +74,6 @@ class PkgProcess:
                     # For big files let people know. TODO: make this more generic, so we can report long running tasks as events
                     self.journal.event('Processing large file {0} ({1:.2f} mb), this may take some time...'.format(os.path.basename(full_path), (file_size/1000000)))
                 add_method(full_path, arcname=arcname)
-        add_method(pkg_meta_file_path, arcname=pkg_tree.pkg_meta_file_name)
 
     def __clear_compile_directory(self):
         files.remove_directory(self.content_tree.root_path)
@@ -1,4 +1,8 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import lmctl.project.handlers.interface as handlers_api
+from lmctl.project.delta import PushSummary
+from lmctl.project.journal import BufferedProjectJournal
 
 class PushProcessError(Exception):
     pass
@@ -12,24 +16,35 @@ class PushProcess:
         self.env_sessions = env_sessions
 
     def execute(self):
-        return PushWorker(self.pkg_content, self.options, self.journal, self.env_sessions).work()
+        summary = PushSummary()
+        result = PushWorker(self.pkg_content, self.options, self.journal, self.env_sessions, summary=summary).work()
+        if getattr(self.options, 'delta', False):
+            self.journal.section('Push Summary')
+            summary.report(self.journal)
+        return result
 
 class PushWorker:
 
-    def __init__(self, pkg_content, options, journal, env_sessions):
+    def __init__(self, pkg_content, options, journal, env_sessions, summary=None):
         self.pkg_content = pkg_content
         self.journal = journal
         self.options = options
         self.env_sessions = env_sessions
+        self.summary = summary if summary is not None else PushSummary()
 
     def work(self):
-        self.__push_child_content()
-        self.__push_content()
+        parallel = getattr(self.options, 'parallel', 1)
+        if parallel is not None and parallel > 1 and len(self.pkg_content.subcontents) > 0:
+            SubcontentPushScheduler(self.pkg_content, self.options, self.journal, self.env_sessions, parallel, summary=self.summary).push()
+        else:
+            self.__push_child_content()
+        self.push_content()
 
     def __build_push_options(self):
-        return handlers_api.ContentPushOptions(object_group_id=self.options.object_group_id)
+        return handlers_api.ContentPushOptions(object_group_id=self.options.object_group_id, parallel=getattr(self.options, 'parallel', 1),
+                                                    delta=getattr(self.options, 'delta', False), summary=self.summary)
 
-    def __push_content(self):
+    def push_content(self):
         self.journal.section('Push Content')
         try:
             self.pkg_content.handler.push_content(self.journal, self.env_sessions, self.__build_push_options())
@@ -40,6 +55,112 @@ class PushWorker:
         subcontents = self.pkg_content.subcontents
         for subcontent in subcontents:
             self.journal.subproject(subcontent.meta.name)
-            PushWorker(subcontent, self.options, self.journal, self.env_sessions).work()
+            PushWorker(subcontent, self.options, self.journal, self.env_sessions, summary=self.summary).work()
             self.journal.subproject_end(subcontent.meta.name)
 
+
+class SubcontentPushTask:
+
+    def __init__(self, content, parent=None):
+        self.content = content
+        self.parent = parent
+        self.children = []
+        self.pending_children = 0
+        self.journal = BufferedProjectJournal()
+        self.started = False
+        self.error = None
+
+    @property
+    def name(self):
+        return self.content.meta.name
+
+    def was_attempted(self):
+        return self.started or any(child.was_attempted() for child in self.children)
+
+
+class SubcontentPushScheduler:
+    """
+    Pushes all subcontents (at any depth) of a package, up to "max_workers" at a time.
+
+    The subcontents form a tree: siblings have no ordering between them, so are pushed at once,
+    but a subcontent is only pushed once all of its own subcontents have been pushed successfully.
+    Once any push has failed, no further subcontents are started (those already started are allowed to finish) and the first error is raised.
+
+    The events of each subcontent are held until all pushes have ended, then added to the journal in the order
+    they would be had the subcontents been pushed one at a time
+    """
+
+    def __init__(self, pkg_content, options, journal, env_sessions, max_workers, summary=None):
+        self.pkg_content = pkg_content
+        self.options = options
+        self.journal = journal
+        self.env_sessions = env_sessions
+        self.max_workers = max_workers
+        self.summary = summary if summary is not None else PushSummary()
+        # Set by the first push to fail, so pushes already queued on the pool are not started
+        self.failed = threading.Event()
+
+    def push(self):
+        top_level_tasks = [self.__build_task(subcontent) for subcontent in self.pkg_content.subcontents]
+        all_tasks = []
+        for task in top_level_tasks:
+            self.__collect_tasks(task, all_tasks)
+        try:
+            self.__execute(all_tasks)
+        finally:
+            for task in top_level_tasks:
+                self.__replay(task)
+        for task in all_tasks:
+            if task.error is not None:
+                raise task.error
+
+    def __build_task(self, content, parent=None):
+        task = SubcontentPushTask(content, parent=parent)
+        task.children = [self.__build_task(subcontent, parent=task) for subcontent in content.subcontents]
+        task.pending_children = len(task.children)
+        return task
+
+    def __collect_tasks(self, task, all_tasks):
+        # Children before their parent, in the order a serial push would complete them
+        for child in task.children:
+            self.__collect_tasks(child, all_tasks)
+        all_tasks.append(task)
+
+    def __execute(self, all_tasks):
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='lmctl-push') as executor:
+            running = {}
+            for task in all_tasks:
+                if task.pending_children == 0:
+                    running[executor.submit(self.__push_task, task)] = task
+            while len(running) > 0:
+                done, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        task.error = error
+                        continue
+                    parent = task.parent
+                    if parent is not None:
+                        parent.pending_children -= 1
+                        if parent.pending_children == 0 and not self.failed.is_set():
+                            running[executor.submit(self.__push_task, parent)] = parent
+
+    def __push_task(self, task):
+        if self.failed.is_set():
+            return
+        task.started = True
+        try:
+            PushWorker(task.content, self.options, task.journal, self.env_sessions, summary=self.summary).push_content()
+        except Exception:
+            self.failed.set()
+            raise
+
+    def __replay(self, task):
+        if not task.was_attempted():
+            return
+        self.journal.subproject(task.name)
+        for child in task.children:
+            self.__replay(child)
+        task.journal.replay(self.journal)
+        self.journal.subproject_end(task.name)
@@ -1,10 +1,12 @@
 import os
+import functools
 import lmctl.files as files
 import lmctl.utils.descriptors as descriptor_utils
 import lmctl.project.mutate.descriptor as descriptor_mutations
 import lmctl.project.source.config_references as refs
 import lmctl.project.handlers.interface as handlers_api
-from .common import LIFECYCLE_WORKSPACE
+from .common import LIFECYCLE_WORKSPACE, SubprojectWork, ParallelSubprojectWorker
+from .build_cache import BuildCache
 from lmctl.project.source.config import RootProjectConfig
 
 class StagingTree(files.Tree):
@@ -31,11 +33,12 @@ class StageProcessError(Exception):
 
 class StageProcess:
 
-    def __init__(self, project, options, journal):
+    def __init__(self, project, options, journal, build_cache=None):
         self.project = project
         self.options = options
         self.journal = journal
         self.references = refs.ConfigReferences(self.project.config)
+        self.build_cache = build_cache if build_cache is not None else BuildCache(project)
 
     def __create_staging_tree(self):
         staging_workspace = os.path.join(self.project.tree.root_path, LIFECYCLE_WORKSPACE, 'staging')
@@ -43,25 +46,41 @@ class StageProcess:
 
     def execute(self):
         staging_tree = self.__create_staging_tree()
-        StageWorker(self.project, self.options, staging_tree, self.journal, self.references).work()
+        StageWorker(self.project, self.options, staging_tree, self.journal, self.references, build_cache=self.build_cache).work()
         return staging_tree
 
 class StageWorker:
 
-    def __init__(self, project, options, staging_tree, journal, references):
+    def __init__(self, project, options, staging_tree, journal, references, build_cache=None):
         self.project = project
         self.options = options
         self.journal = journal
         self.staging_tree = staging_tree
         self.references = references
+        self.build_cache = build_cache if build_cache is not None else BuildCache(project)
 
     def work(self):
+        self.stage()
+        self.__stage_child_projects()
+
+    def stage(self):
+        if self.__reuse_staged_sources():
+            return
         self.__prepare_stage_directories()
         self.__stage_sources()
-        self.__stage_child_projects()
+
+    def __reuse_staged_sources(self):
+        if not self.build_cache.is_reusable(self.project):
+            return False
+        if not os.path.exists(self.staging_tree.root_path):
+            self.build_cache.invalidate(self.project)
+            return False
+        self.journal.section('Stage Sources')
+        self.journal.event('Sources unchanged since the last build, reusing staged sources at {0}'.format(self.staging_tree.root_path))
+        return True
 
     def __prepare_stage_directories(self):
-        files.clean_directory(self.staging_tree.root_path)
+        self.build_cache.clean_output(self.project, self.staging_tree.root_path, StagingTree.CONTAINS_DIR)
 
     def __stage_sources(self):
         self.journal.section('Stage Sources')
@@ -83,12 +102,25 @@ class StageWorker:
         subprojects = self.project.subprojects
         if len(subprojects) == 0:
             return
+        jobs = getattr(self.options, 'jobs', 1)
+        if jobs is not None and jobs > 1:
+            ParallelSubprojectWorker(jobs, self.journal).execute(self.subproject_works())
+            return
         for subproject in subprojects:
             self.journal.subproject(subproject.config.name)
             child_staging_tree = self.staging_tree.gen_subproject_staging_tree(subproject.config.directory)
-            StageWorker(subproject, self.options, child_staging_tree, self.journal, self.references).work()
+            StageWorker(subproject, self.options, child_staging_tree, self.journal, self.references, build_cache=self.build_cache).work()
             self.journal.subproject_end(subproject.config.name)
 
+    def subproject_works(self):
+        return [SubprojectWork(subproject.config.name, functools.partial(self.__stage_subproject, subproject)) for subproject in self.project.subprojects]
+
+    def __stage_subproject(self, subproject, journal):
+        child_staging_tree = self.staging_tree.gen_subproject_staging_tree(subproject.config.directory)
+        child_worker = StageWorker(subproject, self.options, child_staging_tree, journal, self.references, build_cache=self.build_cache)
+        child_worker.stage()
+        return child_worker.subproject_works()
+
 class SourceStager:
 
     def __init__(self, journal, source_config, staging_path, references):
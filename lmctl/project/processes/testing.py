@@ -1,5 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
 import lmctl.project.handlers.interface as handlers_api
 import lmctl.project.testing as project_testing
+from lmctl.project.journal import BufferedProjectJournal
 
 class TestProcessError(Exception):
     pass
@@ -13,15 +15,21 @@ class TestProcess:
         self.env_sessions = env_sessions
 
     def execute(self):
-        return TestWorker(self.pkg_content, self.options, self.journal, self.env_sessions).work()
+        execution_options = project_testing.TestExecutionOptions(
+            parallel=getattr(self.options, 'parallel', 1), 
+            fail_fast=getattr(self.options, 'fail_fast', False), 
+            timeout=getattr(self.options, 'test_timeout', None)
+        )
+        return TestWorker(self.pkg_content, self.options, self.journal, self.env_sessions, execution_options=execution_options).work()
 
 class TestWorker:
 
-    def __init__(self, pkg_content, options, journal, env_sessions):
+    def __init__(self, pkg_content, options, journal, env_sessions, execution_options=None):
         self.pkg_content = pkg_content
         self.journal = journal
         self.options = options
         self.env_sessions = env_sessions
+        self.execution_options = execution_options if execution_options is not None else project_testing.TestExecutionOptions()
 
     def work(self):
         child_test_reports = self.__test_child_content()
@@ -34,17 +42,32 @@ class TestWorker:
     def __test_content(self):
         self.journal.section('Execute Tests')
         try:
-            test_report = self.pkg_content.handler.execute_tests(self.journal, self.env_sessions, self.__filter_selected_tests())
+            test_report = self.pkg_content.handler.execute_tests(self.journal, self.env_sessions, self.__filter_selected_tests(), execution_options=self.execution_options)
             return test_report
         except handlers_api.ContentHandlerError as e:
             raise TestProcessError(str(e)) from e
 
     def __test_child_content(self):
-        child_reports = []
         subcontents = self.pkg_content.subcontents
-        for subcontent in subcontents:
-            self.journal.subproject(subcontent.meta.name)
-            test_report = TestWorker(subcontent, self.options, self.journal, self.env_sessions).work()
-            child_reports.append(test_report)
-            self.journal.subproject_end(subcontent.meta.name)
+        if self.execution_options.parallel <= 1 or len(subcontents) <= 1:
+            child_reports = []
+            for subcontent in subcontents:
+                self.journal.subproject(subcontent.meta.name)
+                test_report = TestWorker(subcontent, self.options, self.journal, self.env_sessions, execution_options=self.execution_options).work()
+                child_reports.append(test_report)
+                self.journal.subproject_end(subcontent.meta.name)
+            return child_reports
+        # Subcontents are tested at once. The events of each are held until it has finished, so they are not interleaved with the events of the others
+        child_reports = []
+        with ThreadPoolExecutor(max_workers=min(self.execution_options.parallel, len(subcontents)), thread_name_prefix='lmctl-test') as executor:
+            for test_report, child_journal in executor.map(self.__test_child_in_parallel, subcontents):
+                child_journal.replay(self.journal)
+                child_reports.append(test_report)
         return child_reports
+
+    def __test_child_in_parallel(self, subcontent):
+        child_journal = BufferedProjectJournal()
+        child_journal.subproject(subcontent.meta.name)
+        test_report = TestWorker(subcontent, self.options, child_journal, self.env_sessions, execution_options=self.execution_options).work()
+        child_journal.subproject_end(subcontent.meta.name)
+        return test_report, child_journal
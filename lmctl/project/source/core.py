@@ -7,6 +7,7 @@ import lmctl.project.journal as project_journal
 import lmctl.project.processes.validation as validation_exec
 import lmctl.project.processes.staging as stage_exec
 import lmctl.project.processes.compile as compile_exec
+import lmctl.project.processes.build_cache as build_cache_exec
 import lmctl.project.processes.pull as pull_exec
 import lmctl.project.processes.package as package_exec
 import lmctl.project.processes.listelement as list_exec
@@ -60,8 +61,12 @@ class ValidateOptions(Options):
 
 class BuildOptions(ValidateOptions):
 
-    def __init__(self):
+    def __init__(self, jobs: int = 1, incremental: bool = False):
         super().__init__()
+        # Maximum number of subprojects to stage/compile at once
+        self.jobs = jobs
+        # Reuse the output of the last build for projects whose sources have not changed since
+        self.incremental = incremental
 
 
 class PullOptions(Options):
@@ -174,8 +179,11 @@ class Project(ProjectBase):
         if validate_result.has_errors():
             raise BuildValidationError(validate_result)
         try:
-            staging_tree = stage_exec.StageProcess(self, options, journal).execute()
-            content_tree = compile_exec.CompileProcess(self, options, staging_tree, journal).execute()
+            build_cache = build_cache_exec.BuildCache(self, incremental=options.incremental)
+            build_cache.prepare(journal)
+            staging_tree = stage_exec.StageProcess(self, options, journal, build_cache=build_cache).execute()
+            content_tree = compile_exec.CompileProcess(self, options, staging_tree, journal, build_cache=build_cache).execute()
+            build_cache.save()
             final_pkg = package_exec.PkgProcess(self, options, content_tree, journal).execute()
         except (stage_exec.StageProcessError, compile_exec.CompileProcessError, package_exec.PkgProcessError) as e:
             raise BuildError(str(e)) from e
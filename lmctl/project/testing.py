@@ -1,7 +1,18 @@
+import time
+import threading
+from contextlib import contextmanager
+
 TEST_STATUS_PASSED = 'PASSED'
 TEST_STATUS_FAILED = 'FAILED'
 TEST_STATUS_SKIPPED = 'SKIPPED'
 
+EXECUTION_FINISHED_STATUSES = ['PASS', 'ABORTED', 'FAIL']
+# Seconds between checks on the progress of a scenario execution. Checks start at the minimum interval, so short tests finish promptly,
+# and back off (by POLL_BACKOFF_FACTOR) up to the maximum while the progress is unchanged
+DEFAULT_MIN_POLL_INTERVAL = 0.25
+DEFAULT_MAX_POLL_INTERVAL = 10
+POLL_BACKOFF_FACTOR = 1.5
+
 class PkgTestReport:
 
     def __init__(self, name, full_name, suite_report, sub_reports):
@@ -83,4 +94,90 @@ class TestExecutionReportEntry:
     def __init__(self, test_name, result, detail=None):
         self.test_name = test_name
         self.result = result
-        self.detail = detail
\ No newline at end of file
+        self.detail = detail
+
+
+class ScenarioExecutionTimeoutError(Exception):
+    pass
+
+
+class TestExecutionOptions:
+    """
+    Controls how the tests of a package (and its subcontents) are executed. One instance is shared by all of the contents of the package, 
+    so "parallel" limits the number of scenarios executing at once across all of them
+    """
+
+    def __init__(self, parallel=1, fail_fast=False, timeout=None):
+        """
+        Args:
+            parallel (int): maximum number of test scenarios to execute at once
+            fail_fast (bool): skip tests not yet started once any test has failed
+            timeout (float): seconds to wait for each test to finish before it is failed (and its execution cancelled)
+        """
+        self.parallel = max(1, parallel) if parallel is not None else 1
+        self.fail_fast = fail_fast
+        self.timeout = timeout
+        self.__slots = threading.Semaphore(self.parallel)
+        self.__stopped = threading.Event()
+
+    @property
+    def stopped(self):
+        return self.__stopped.is_set()
+
+    def stop(self):
+        self.__stopped.set()
+
+    @contextmanager
+    def execution_slot(self):
+        """
+        Wait until fewer than "parallel" tests are executing, holding a place until the context exits
+        """
+        with self.__slots:
+            yield
+
+
+class ScenarioExecutionTracker:
+    """
+    Waits for a behaviour scenario execution to finish, using the lightweight progress of the execution rather than retrieving it in full on each check.
+    The full execution (with all stage reports) is retrieved once, when it has finished
+    """
+
+    def __init__(self, behaviour_driver, min_poll_interval=DEFAULT_MIN_POLL_INTERVAL, max_poll_interval=DEFAULT_MAX_POLL_INTERVAL):
+        self.behaviour_driver = behaviour_driver
+        self.max_poll_interval = max_poll_interval
+        self.min_poll_interval = min(min_poll_interval, max_poll_interval)
+
+    def wait_for(self, execution_id, progress_listener=None, timeout=None):
+        """
+        Wait for the execution to finish, returning the full execution. 
+        "progress_listener" is called with the current progress each time the status or the steps of the execution change.
+        Raises ScenarioExecutionTimeoutError if the execution has not finished after "timeout" seconds
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        interval = self.min_poll_interval
+        last_seen = None
+        while True:
+            progress = self.behaviour_driver.get_execution_progress(execution_id)
+            if progress.get('status') in EXECUTION_FINISHED_STATUSES:
+                return self.behaviour_driver.get_execution(execution_id)
+            current = (progress.get('status'), self.__step_statuses(progress))
+            if current != last_seen:
+                last_seen = current
+                interval = self.min_poll_interval
+                if progress_listener is not None:
+                    progress_listener(progress)
+            else:
+                interval = min(interval * POLL_BACKOFF_FACTOR, self.max_poll_interval)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise ScenarioExecutionTimeoutError('Execution {0} did not finish within {1} seconds'.format(execution_id, timeout))
+                interval = min(interval, remaining)
+            time.sleep(interval)
+
+    def __step_statuses(self, progress):
+        statuses = []
+        for stage_report in progress.get('stageReports') or []:
+            for step in stage_report.get('steps') or []:
+                statuses.append(step.get('status'))
+        return tuple(statuses)
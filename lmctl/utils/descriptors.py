@@ -1,5 +1,6 @@
 import ruamel.yaml as ryaml
 import os
+import threading
 from collections import OrderedDict
 
 ASSEMBLY_DESCRIPTOR_TYPE = 'assembly'
@@ -7,8 +8,16 @@ RESOURCE_DESCRIPTOR_TYPE = 'resource'
 ASSEMBLY_TEMPLATE_DESCRIPTOR_TYPE = 'assembly-template'
 TYPE_DESCRIPTOR_TYPE = 'type'
 
-yaml = ryaml.YAML()
-yaml.default_flow_style = False
+_yaml_local = threading.local()
+
+def _yaml():
+    # A YAML instance holds the state of the document it is loading/dumping, so each thread uses its own (subprojects may be built or pushed at once)
+    yaml = getattr(_yaml_local, 'yaml', None)
+    if yaml is None:
+        yaml = ryaml.YAML()
+        yaml.default_flow_style = False
+        _yaml_local.yaml = yaml
+    return yaml
 
 class DescriptorParsingError(Exception):
     pass
@@ -35,7 +44,7 @@ class DescriptorParser:
 
     def __convert_str_to_dict(self, descriptor_yml_str):
         try:
-            yml_dict = yaml.load(descriptor_yml_str)
+            yml_dict = _yaml().load(descriptor_yml_str)
         except ryaml.YAMLError as e:
             raise DescriptorParsingError(str(e)) from e
         return yml_dict
@@ -50,12 +59,12 @@ class DescriptorParser:
     def write_to_file(self, descriptor, descriptor_path):
         descriptor.sort()
         with open(descriptor_path, 'w') as descriptor_file:
-            yaml.dump(descriptor.raw, descriptor_file)
+            _yaml().dump(descriptor.raw, descriptor_file)
 
     def write_to_str(self, descriptor):
         descriptor.sort()
         stringio = ryaml.compat.StringIO()
-        yaml.dump(descriptor.raw, stringio)
+        _yaml().dump(descriptor.raw, stringio)
         return stringio.getvalue()
 
 
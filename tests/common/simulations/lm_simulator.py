@@ -388,6 +388,18 @@ class SimulatedLm:
         execution = self.__get(self.scenario_executions, execution_id)
         return execution
 
+    def get_execution_progress(self, execution_id):
+        self.mock.get_execution_progress(execution_id)
+        execution = self.__get(self.scenario_executions, execution_id)
+        stage_reports = []
+        for stage_report in execution.get('stageReports', []):
+            stage_reports.append({
+                'name': stage_report.get('name'),
+                'status': stage_report.get('status'),
+                'steps': [{'status': step.get('status')} for step in stage_report.get('steps', [])]
+            })
+        return {'id': execution['id'], 'status': execution['status'], 'stageReports': stage_reports}
+
     def __convert_stages_to_reports(self, scenario):
         stage_reports = []
         if 'stages' in scenario:
@@ -566,6 +578,7 @@ class SimulatedLmSession(LmSession):
         self.__behaviour_driver.get_scenarios.side_effect = self.__behaviour_driver_sim.get_scenarios
         self.__behaviour_driver.execute_scenario.side_effect = self.__behaviour_driver_sim.execute_scenario
         self.__behaviour_driver.get_execution.side_effect = self.__behaviour_driver_sim.get_execution
+        self.__behaviour_driver.get_execution_progress.side_effect = self.__behaviour_driver_sim.get_execution_progress
         self.__resource_pkg_driver.onboard_package.side_effect = self.__resource_pkg_driver_sim.onboard_package
         self.__resource_pkg_driver.delete_package.side_effect = self.__resource_pkg_driver_sim.delete_package
         self.__onboard_rm_driver.update_rm.side_effect = self.__onboard_rm_driver_sim.update_rm
@@ -917,6 +930,14 @@ class SimBehaviourDriver:
         except Exception as e:
             raise lm_drivers.LmDriverException('Error: {0}'.format(str(e))) from e
 
+    def get_execution_progress(self, exec_id):
+        try:
+            return self.sim_lm.get_execution_progress(exec_id)
+        except NotFoundError as e:
+            raise lm_drivers.NotFoundException('No execution with id {0}'.format(exec_id))
+        except Exception as e:
+            raise lm_drivers.LmDriverException('Error: {0}'.format(str(e))) from e
+
 class SimResourcePkgDriver:
 
     def __init__(self, sim_lm):
@@ -0,0 +1,60 @@
+import tests.unit.cli.commands.command_testing as command_testing
+from unittest.mock import patch
+from lmctl.cli.controller import clear_global_controller
+from lmctl.cli.commands.actions import create, update, delete
+from lmctl.config import Config
+from lmctl.environment import EnvironmentGroup, TNCOEnvironment
+import lmctl.cli.commands.assemblies
+
+class TestAssemblyCommands(command_testing.CommandTestCase):
+
+    def setUp(self):
+        super().setUp()
+        clear_global_controller()
+
+        self.tnco_env_client_patcher = patch('lmctl.environment.lmenv.TNCOClientBuilder')
+        self.mock_tnco_client_builder_class = self.tnco_env_client_patcher.start()
+        self.addCleanup(self.tnco_env_client_patcher.stop)
+        self.mock_tnco_client = self.mock_tnco_client_builder_class.return_value.build.return_value
+
+        self.global_config_patcher = patch('lmctl.cli.controller.get_config_with_path')
+        self.mock_get_global_config = self.global_config_patcher.start()
+        self.addCleanup(self.global_config_patcher.stop)
+        self.mock_get_global_config.return_value = (Config(
+            active_environment='default',
+            environments={
+                'default': EnvironmentGroup(name='default', tnco=TNCOEnvironment(address='https://mock.example.com'))
+            }
+        ), 'config.yaml')
+
+    def test_create_assembly(self):
+        self.mock_tnco_client.assemblies.intent_create.return_value = '123'
+        result = self.runner.invoke(create, ['assembly', '--set', 'assemblyName=A', '--set', 'descriptorName=assembly::a::1.0'])
+        self.assert_no_errors(result)
+        self.assert_output(result, 'Accepted - Process: 123')
+        self.mock_tnco_client.processes.iter_wait_for.assert_not_called()
+
+    def test_create_assembly_and_wait(self):
+        self.mock_tnco_client.assemblies.intent_create.return_value = '123'
+        self.mock_tnco_client.processes.iter_wait_for.return_value = iter([{'id': '123', 'status': 'Completed'}])
+        result = self.runner.invoke(create, ['assembly', '--set', 'assemblyName=A', '--wait'])
+        self.assert_no_errors(result)
+        self.assert_output(result, 'Accepted - Process: 123\nProcess 123: Completed')
+        self.mock_tnco_client.processes.iter_wait_for.assert_called_once_with(['123'], timeout=None)
+
+    def test_update_assembly_and_wait(self):
+        self.mock_tnco_client.assemblies.intent_upgrade.return_value = '123'
+        self.mock_tnco_client.processes.iter_wait_for.return_value = iter([{'id': '123', 'status': 'Completed'}])
+        result = self.runner.invoke(update, ['assembly', 'A', '--set', 'descriptorName=assembly::a::2.0', '--wait', '--wait-timeout', '30'])
+        self.assert_no_errors(result)
+        self.assert_output(result, 'Accepted - Process: 123\nProcess 123: Completed')
+        self.mock_tnco_client.processes.iter_wait_for.assert_called_once_with(['123'], timeout=30)
+
+    def test_delete_assembly_and_wait_for_failed_process(self):
+        self.mock_tnco_client.assemblies.intent_delete.return_value = '123'
+        self.mock_tnco_client.processes.iter_wait_for.return_value = iter([{'id': '123', 'status': 'Failed'}])
+        result = self.runner.invoke(delete, ['assembly', 'A', '--wait'])
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn('Accepted - Process: 123', result.output)
+        self.assertIn('Process 123: Failed', result.output)
+        self.mock_tnco_client.assemblies.intent_delete.assert_called_once_with({'assemblyName': 'A'})
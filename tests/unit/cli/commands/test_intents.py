@@ -0,0 +1,154 @@
+import tests.unit.cli.commands.command_testing as command_testing
+import os
+import yaml
+import shutil
+import tempfile
+from unittest.mock import patch
+from lmctl.cli.controller import clear_global_controller
+from lmctl.cli.commands.actions import create
+from lmctl.client import TNCOClientError, TNCOProcessWaitTimeoutError
+from lmctl.client.models import IntentResult, IntentBatchResults
+from lmctl.config import Config
+from lmctl.environment import EnvironmentGroup, TNCOEnvironment
+import lmctl.cli.commands.intents
+
+class TestIntentCommands(command_testing.CommandTestCase):
+
+    def setUp(self):
+        super().setUp()
+        clear_global_controller()
+
+        self.tnco_env_client_patcher = patch('lmctl.environment.lmenv.TNCOClientBuilder')
+        self.mock_tnco_client_builder_class = self.tnco_env_client_patcher.start()
+        self.addCleanup(self.tnco_env_client_patcher.stop)
+        self.mock_tnco_client = self.mock_tnco_client_builder_class.return_value.build.return_value
+
+        self.global_config_patcher = patch('lmctl.cli.controller.get_config_with_path')
+        self.mock_get_global_config = self.global_config_patcher.start()
+        self.addCleanup(self.global_config_patcher.stop)
+        self.mock_get_global_config.return_value = (Config(
+            active_environment='default',
+            environments={
+                'default': EnvironmentGroup(name='default', tnco=TNCOEnvironment(address='https://mock.example.com'))
+            }
+        ), 'config.yaml')
+
+        self.tmp_dir = tempfile.mkdtemp(prefix='lmctl-test')
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+
+    def _write_file(self, content) -> str:
+        path = os.path.join(self.tmp_dir, 'intents.yaml')
+        with open(path, 'w') as f:
+            yaml.safe_dump(content, f)
+        return path
+
+    def test_create_intent(self):
+        self.mock_tnco_client.assemblies.intent.return_value = '123'
+        path = self._write_file({'intentType': 'healAssembly', 'assemblyName': 'A'})
+        result = self.runner.invoke(create, ['intent', '-f', path])
+        self.assert_no_errors(result)
+        self.assert_output(result, 'Accepted - Process: 123')
+        self.mock_tnco_client.assemblies.intent.assert_called_once_with('healAssembly', {'assemblyName': 'A'}, object_group_id=None)
+
+    def test_create_many_intents_in_parallel(self):
+        self.mock_tnco_client.assemblies.intents_batch.return_value = IntentBatchResults([
+            IntentResult(0, 'healAssembly', process_id='123', latency=0.5),
+            IntentResult(1, 'changeAssemblyState', process_id='456', latency=0.25)
+        ])
+        path = self._write_file([
+            {'intentType': 'healAssembly', 'assemblyName': 'A'},
+            {'intentType': 'changeAssemblyState', 'assemblyName': 'B'}
+        ])
+        result = self.runner.invoke(create, ['intent', '-f', path, '--parallel', '5', '--set', 'intendedState=Inactive'])
+        self.assert_no_errors(result)
+        expected_output = '[0] healAssembly: Accepted - Process: 123 (0.50s)'
+        expected_output += '\n[1] changeAssemblyState: Accepted - Process: 456 (0.25s)'
+        self.assert_output(result, expected_output)
+        self.mock_tnco_client.assemblies.intents_batch.assert_called_once_with([
+            ('healAssembly', {'assemblyName': 'A', 'intendedState': 'Inactive'}),
+            ('changeAssemblyState', {'assemblyName': 'B', 'intendedState': 'Inactive'})
+        ], max_workers=5, object_group_id=None)
+
+    def test_create_many_intents_with_failures(self):
+        self.mock_tnco_client.assemblies.intents_batch.return_value = IntentBatchResults([
+            IntentResult(0, 'healAssembly', process_id='123', latency=0.5),
+            IntentResult(1, 'healAssembly', error=TNCOClientError('Mock error'), latency=0.1)
+        ])
+        path = self._write_file({'items': [
+            {'intentType': 'healAssembly', 'assemblyName': 'A'},
+            {'intentType': 'healAssembly', 'assemblyName': 'B'}
+        ]})
+        result = self.runner.invoke(create, ['intent', '-f', path])
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn('[1] healAssembly: Failed - Mock error', result.output)
+        self.assertIn('1 of 2 intents failed', result.output)
+        self.assertEqual(self.mock_tnco_client.assemblies.intents_batch.call_args[1]['max_workers'], 1)
+
+    def test_create_many_intents_requires_intent_type(self):
+        path = self._write_file([{'intentType': 'healAssembly', 'assemblyName': 'A'}, {'assemblyName': 'B'}])
+        result = self.runner.invoke(create, ['intent', '-f', path])
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn('Must include "intentType" in intent 1', result.output)
+        self.mock_tnco_client.assemblies.intents_batch.assert_not_called()
+
+    def test_create_intent_and_wait(self):
+        self.mock_tnco_client.assemblies.intent.return_value = '123'
+        self.mock_tnco_client.processes.iter_wait_for.return_value = iter([{'id': '123', 'status': 'Completed'}])
+        path = self._write_file({'intentType': 'healAssembly', 'assemblyName': 'A'})
+        result = self.runner.invoke(create, ['intent', '-f', path, '--wait', '--wait-timeout', '60'])
+        self.assert_no_errors(result)
+        self.assert_output(result, 'Accepted - Process: 123\nProcess 123: Completed')
+        self.mock_tnco_client.processes.iter_wait_for.assert_called_once_with(['123'], timeout=60)
+
+    def test_create_intent_without_process_id_and_wait(self):
+        self.mock_tnco_client.assemblies.intent.return_value = None
+        path = self._write_file({'intentType': 'retry', 'processId': '789'})
+        result = self.runner.invoke(create, ['intent', '-f', path, '--wait'])
+        self.assert_no_errors(result)
+        self.assert_output(result, 'Accepted - retry request\nCannot wait on retry intent as it does not return a process ID')
+        self.mock_tnco_client.processes.iter_wait_for.assert_not_called()
+
+    def test_create_intent_and_wait_for_failed_process(self):
+        self.mock_tnco_client.assemblies.intent.return_value = '123'
+        self.mock_tnco_client.processes.iter_wait_for.return_value = iter([{'id': '123', 'status': 'Failed'}])
+        path = self._write_file({'intentType': 'healAssembly', 'assemblyName': 'A'})
+        result = self.runner.invoke(create, ['intent', '-f', path, '--wait'])
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn('Process 123: Failed', result.output)
+        self.assertIn('1 of 1 processes did not complete', result.output)
+
+    def test_create_intent_and_wait_timeout(self):
+        self.mock_tnco_client.assemblies.intent.return_value = '123'
+        self.mock_tnco_client.processes.iter_wait_for.side_effect = TNCOProcessWaitTimeoutError('Timed out after 5 seconds waiting for processes: 123', pending_ids=['123'])
+        path = self._write_file({'intentType': 'healAssembly', 'assemblyName': 'A'})
+        result = self.runner.invoke(create, ['intent', '-f', path, '--wait', '--wait-timeout', '5'])
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn('Error: Timed out after 5 seconds waiting for processes: 123', result.output)
+
+    def test_create_many_intents_and_wait_for_accepted(self):
+        self.mock_tnco_client.assemblies.intents_batch.return_value = IntentBatchResults([
+            IntentResult(0, 'healAssembly', process_id='123', latency=0.5),
+            IntentResult(1, 'healAssembly', error=TNCOClientError('Mock error'), latency=0.1),
+            IntentResult(2, 'healAssembly', process_id='456', latency=0.5)
+        ])
+        self.mock_tnco_client.processes.iter_wait_for.return_value = iter([{'id': '456', 'status': 'Completed'}, {'id': '123', 'status': 'Completed'}])
+        path = self._write_file([{'intentType': 'healAssembly', 'assemblyName': name} for name in ('A', 'B', 'C')])
+        result = self.runner.invoke(create, ['intent', '-f', path, '--wait'])
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn('1 of 3 intents failed', result.output)
+        self.assertIn('Process 456: Completed\nProcess 123: Completed', result.output)
+        self.mock_tnco_client.processes.iter_wait_for.assert_called_once_with(['123', '456'], timeout=None)
+
+    def test_create_many_intents_and_wait_skips_intents_without_process_id(self):
+        self.mock_tnco_client.assemblies.intents_batch.return_value = IntentBatchResults([
+            IntentResult(0, 'healAssembly', process_id='123', latency=0.5),
+            IntentResult(1, 'retry', latency=0.1)
+        ])
+        self.mock_tnco_client.processes.iter_wait_for.return_value = iter([{'id': '123', 'status': 'Completed'}])
+        path = self._write_file([{'intentType': 'healAssembly', 'assemblyName': 'A'}, {'intentType': 'retry', 'processId': '789'}])
+        result = self.runner.invoke(create, ['intent', '-f', path, '--wait'])
+        self.assert_no_errors(result)
+        self.assertIn('[1] retry: Accepted (0.10s)', result.output)
+        self.assertNotIn('None', result.output)
+        self.assertIn('Cannot wait on 1 accepted intent(s) which do not return a process ID: [1] retry', result.output)
+        self.mock_tnco_client.processes.iter_wait_for.assert_called_once_with(['123'], timeout=None)
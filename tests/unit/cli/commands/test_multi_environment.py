@@ -0,0 +1,113 @@
+import tests.unit.cli.commands.command_testing as command_testing
+import json
+from unittest.mock import patch, MagicMock
+from lmctl.cli.controller import clear_global_controller
+from lmctl.cli.commands.actions import get, ping
+from lmctl.client import TNCOClientError
+from lmctl.client.client_test_result import TestResult as PingTestResult, TestResults as PingTestResults
+import lmctl.cli.commands.descriptors
+import lmctl.cli.commands.env
+from lmctl.config import Config
+from lmctl.environment import EnvironmentGroup, TNCOEnvironment
+
+class TestMultiEnvironmentCommands(command_testing.CommandTestCase):
+
+    def setUp(self):
+        super().setUp()
+        clear_global_controller()
+
+        self.tnco_env_client_patcher = patch('lmctl.environment.lmenv.TNCOClientBuilder')
+        self.mock_tnco_client_builder_class = self.tnco_env_client_patcher.start()
+        self.addCleanup(self.tnco_env_client_patcher.stop)
+        self.mock_tnco_client_builder = self.mock_tnco_client_builder_class.return_value
+        self.mock_tnco_clients = {}
+        def build_client():
+            address = self.mock_tnco_client_builder.address.call_args[0][0]
+            client = MagicMock()
+            client.descriptors.all.return_value = [{'name': 'assembly::A::1.0'}]
+            self.mock_tnco_clients[address] = client
+            return client
+        self.mock_tnco_client_builder.build.side_effect = build_client
+
+        self.global_config_patcher = patch('lmctl.cli.controller.get_config_with_path')
+        self.mock_get_global_config = self.global_config_patcher.start()
+        self.addCleanup(self.global_config_patcher.stop)
+        self.mock_get_global_config.return_value = (Config(
+            active_environment='dev',
+            environments={
+                'dev': EnvironmentGroup(name='dev', tnco=TNCOEnvironment(address='https://dev.example.com')),
+                'test': EnvironmentGroup(name='test', tnco=TNCOEnvironment(address='https://test.example.com')),
+                'local': EnvironmentGroup(name='local')
+            }
+        ), 'config.yaml')
+
+    def _client(self, env_name: str) -> MagicMock:
+        return self.mock_tnco_clients[f'https://{env_name}.example.com']
+
+    def test_get_single_environment_output_unchanged(self):
+        result = self.runner.invoke(get, ['descriptor', '-e', 'test', '-o', 'json'])
+        self.assert_no_errors(result)
+        self.assertEqual(json.loads(result.output), {'items': [{'name': 'assembly::A::1.0'}]})
+        self.assertEqual(list(self.mock_tnco_clients.keys()), ['https://test.example.com'])
+        self._client('test').descriptors.all.assert_called_once_with(object_group_id=None)
+
+    def test_get_multiple_environments(self):
+        self.mock_tnco_client_builder.build.side_effect = None
+        mock_client = self.mock_tnco_client_builder.build.return_value
+        mock_client.descriptors.all.return_value = [{'name': 'assembly::A::1.0'}]
+        result = self.runner.invoke(get, ['descriptor', '-e', 'dev', '-e', 'test', '-o', 'json'])
+        self.assert_no_errors(result)
+        self.assertEqual(json.loads(result.output), {'items': [
+            {'environment': 'dev', 'name': 'assembly::A::1.0'},
+            {'environment': 'test', 'name': 'assembly::A::1.0'}
+        ]})
+        self.assertEqual(mock_client.descriptors.all.call_count, 2)
+
+    def test_get_multiple_environments_as_table(self):
+        self.mock_tnco_client_builder.build.side_effect = None
+        mock_client = self.mock_tnco_client_builder.build.return_value
+        mock_client.descriptors.get.return_value = {'name': 'assembly::A::1.0', 'description': 'A'}
+        result = self.runner.invoke(get, ['descriptor', 'assembly::A::1.0', '-e', 'dev', '-e', 'test'])
+        self.assert_no_errors(result)
+        expected_output = '| Environment   | Name             | Description   |'
+        expected_output += '\n|---------------+------------------+---------------|'
+        expected_output += '\n| dev           | assembly::A::1.0 | A             |'
+        expected_output += '\n| test          | assembly::A::1.0 | A             |'
+        self.assert_output(result, expected_output)
+
+    def test_get_all_environments_skips_those_without_tnco(self):
+        result = self.runner.invoke(get, ['descriptor', '--all-envs', '-o', 'json'])
+        self.assert_no_errors(result)
+        self.assertEqual(sorted(self.mock_tnco_clients.keys()), ['https://dev.example.com', 'https://test.example.com'])
+
+    def test_get_multiple_environments_with_failure(self):
+        self.mock_tnco_client_builder.build.side_effect = None
+        mock_client = self.mock_tnco_client_builder.build.return_value
+        mock_client.descriptors.all.side_effect = [[{'name': 'assembly::A::1.0'}], TNCOClientError('Mock error')]
+        result = self.runner.invoke(get, ['descriptor', '-e', 'dev', '-e', 'test', '-o', 'json'])
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn('Mock error', result.output)
+
+    def test_ping_multiple_environments(self):
+        with patch('lmctl.cli.commands.env.CLIController.get_tnco_client') as get_tnco_client:
+            get_tnco_client.return_value.ping.return_value = PingTestResults(tests=[PingTestResult(name='Descriptors', latency=0.1)])
+            result = self.runner.invoke(ping, ['env', 'dev', 'test'])
+        self.assert_no_errors(result)
+        expected_output = 'Pinging CP4NA orchestration: dev (https://dev.example.com), test (https://test.example.com)'
+        expected_output += '\n| Environment   | Test Name   | Result   |   Latency (s) | Error   |'
+        expected_output += '\n|---------------+-------------+----------+---------------+---------|'
+        expected_output += '\n| dev           | Descriptors | OK       |           0.1 |         |'
+        expected_output += '\n| test          | Descriptors | OK       |           0.1 |         |'
+        expected_output += '\nCP4NA orchestration tests passed! ✅'
+        self.assert_output(result, expected_output)
+
+    def test_ping_all_environments_reports_failures(self):
+        with patch('lmctl.cli.commands.env.CLIController.get_tnco_client') as get_tnco_client:
+            get_tnco_client.return_value.ping.side_effect = [
+                PingTestResults(tests=[PingTestResult(name='Descriptors')]),
+                PingTestResults(tests=[PingTestResult(name='Descriptors', error='Mock error')])
+            ]
+            result = self.runner.invoke(ping, ['env', '--all-envs'])
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn('No CP4NA orchestration configured on local (skipping)', result.output)
+        self.assertIn('CP4NA orchestration tests failed on: test ❌', result.output)
@@ -1,4 +1,5 @@
 import tests.unit.cli.commands.command_testing as command_testing
+import json
 import tempfile
 import os
 import shutil
@@ -75,4 +76,11 @@ class TestProcessCommands(command_testing.CommandTestCase):
         self.assert_no_errors(result)
         expected_output = 'Accepted - Rollback request for process: 8475f402-cb6f-4ef1-a379-77c7e20cdf72'
         self.assert_output(result, expected_output)
-        self.mock_tnco_client.assemblies.intent_rollback.assert_called_once_with({'processId': '8475f402-cb6f-4ef1-a379-77c7e20cdf72'})
\ No newline at end of file
+        self.mock_tnco_client.assemblies.intent_rollback.assert_called_once_with({'processId': '8475f402-cb6f-4ef1-a379-77c7e20cdf72'})
+
+    def test_get_processes_streams_response(self):
+        self.mock_tnco_client.processes.iter_query.return_value = iter([{'id': '1'}, {'id': '2'}])
+        result = self.runner.invoke(process_cmds.get, ['process', '--assembly-id', 'abc', '--limit', '500', '-o', 'json'])
+        self.assert_no_errors(result)
+        self.assertEqual(json.loads(result.output), {'items': [{'id': '1'}, {'id': '2'}]})
+        self.mock_tnco_client.processes.iter_query.assert_called_once_with(object_group_id=None, assemblyId='abc', limit=500)
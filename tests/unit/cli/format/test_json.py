@@ -28,6 +28,15 @@ class TestJsonFormat(unittest.TestCase):
         output = JsonFormat().convert_list(test_list)
         self.assertEqual(output, TEST_JSON_LIST)
     
+    def test_convert_stream(self):
+        test_list = ['abc', 123, {'someObject': {'data': 'some data'}}]
+        output = '\n'.join(JsonFormat().convert_stream(iter(test_list)))
+        self.assertEqual(output, TEST_JSON_LIST)
+
+    def test_convert_stream_empty(self):
+        output = '\n'.join(JsonFormat().convert_stream(iter([])))
+        self.assertEqual(output, JsonFormat().convert_list([]))
+
     def test_convert_element(self):
         element = {'someObject': {'data': 'some data'}}
         output = JsonFormat().convert_element(element)
@@ -42,6 +42,29 @@ class TestTableFormat(unittest.TestCase):
         output = TableFormat(table=DummyTable).convert_list(test_list)
         self.assertEqual(output, EXPECTED_LIST)
     
+    def test_convert_stream(self):
+        test_list = [
+            {'name': 'A', 'status': 'Good'},
+            {'name': 'B', 'status': 'Bad'},
+            {'name': 'C', 'status': 'Excellent'},
+            {'name': 'D'}
+        ]
+        output = '\n'.join(TableFormat(table=DummyTable).convert_stream(iter(test_list)))
+        self.assertEqual(output, EXPECTED_LIST)
+
+    def test_convert_stream_in_batches(self):
+        table_format = TableFormat(table=DummyTable)
+        table_format.stream_batch_size = 2
+        test_list = [
+            {'name': 'A', 'status': 'Good'},
+            {'name': 'B', 'status': 'Bad'},
+            {'name': 'C', 'status': 'Excellent'}
+        ]
+        chunks = list(table_format.convert_stream(iter(test_list)))
+        self.assertEqual(len(chunks), 2)
+        self.assertTrue(chunks[0].startswith('| Name'))
+        self.assertEqual(chunks[1], '| C | OK |')
+
     def test_convert_element(self):
         element = {'name': 'A', 'status': 'Good'}
         output = TableFormat(table=DummyTable).convert_element(element)
@@ -21,6 +21,11 @@ class TestYamlFormat(unittest.TestCase):
         output = YamlFormat().convert_list(test_list)
         self.assertEqual(output, TEST_YAML_LIST)
     
+    def test_convert_stream(self):
+        test_list = ['abc', 123, {'someObject': {'data': 'some data'}}]
+        output = '\n'.join(YamlFormat().convert_stream(iter(test_list)))
+        self.assertEqual(output + '\n', TEST_YAML_LIST)
+
     def test_convert_element(self):
         element = {'someObject': {'data': 'some data'}}
         output = YamlFormat().convert_element(element)
@@ -1,5 +1,7 @@
 import unittest
 import json
+import time
+import threading
 from unittest.mock import patch, MagicMock
 from lmctl.client.api import AssembliesAPI
 from lmctl.client.models import (CreateAssemblyIntent, UpgradeAssemblyIntent, ChangeAssemblyStateIntent, 
@@ -7,6 +9,7 @@ from lmctl.client.models import (CreateAssemblyIntent, UpgradeAssemblyIntent, Ch
                                     AdoptAssemblyIntent, CreateOrUpgradeAssemblyIntent, CancelAssemblyIntent,
                                     RetryAssemblyIntent, RollbackAssemblyIntent)
 from lmctl.client.client_request import TNCOClientRequest
+from lmctl.client.exceptions import TNCOClientError
 
 class TestAssembliesAPI(unittest.TestCase):
 
@@ -78,6 +81,62 @@ class TestAssembliesAPI(unittest.TestCase):
         self.assertEqual(response, '123')
         self.mock_client.make_request.assert_called_with(TNCOClientRequest(method='POST', endpoint='api/intent/createAssembly', headers={'Content-Type': 'application/json'}, body=intent))
     
+    def test_intent_retryable(self):
+        mock_response = MagicMock(headers={'Location': '/api/processes/123'})
+        self.mock_client.make_request.return_value = mock_response
+        intent = {'descriptorName': 'assembly::Test::1.0', 'assemblyName': 'Test', 'intendedState': 'Active'}
+        response = self.assemblies.intent('createAssembly', intent, retryable=True)
+        self.assertEqual(response, '123')
+        self.mock_client.make_request.assert_called_with(TNCOClientRequest(method='POST', endpoint='api/intent/createAssembly', headers={'Content-Type': 'application/json'}, body=intent, retryable=True))
+
+    def test_intents_batch(self):
+        def make_request(request):
+            if request.body['assemblyName'] == 'B':
+                raise TNCOClientError('Mock error')
+            return MagicMock(headers={'Location': f'/api/processes/{request.body["assemblyName"]}'})
+        self.mock_client.make_request.side_effect = make_request
+        results = self.assemblies.intents_batch([
+            ('healAssembly', {'assemblyName': 'A'}),
+            ('healAssembly', {'assemblyName': 'B'}),
+            ('changeAssemblyState', {'assemblyName': 'C', 'intendedState': 'Inactive'}, 'og-1')
+        ], max_workers=2, object_group_id='og-default')
+        self.assertFalse(results.accepted)
+        self.assertEqual([(r.index, r.intent_name, r.process_id) for r in results.results], [(0, 'healAssembly', 'A'), (1, 'healAssembly', None), (2, 'changeAssemblyState', 'C')])
+        self.assertEqual(str(results.results[1].error), 'Mock error')
+        self.assertEqual([r.index for r in results.failed], [1])
+        for result in results.results:
+            self.assertGreaterEqual(result.latency, 0)
+        requests_made = {call[0][0].body['assemblyName']: call[0][0] for call in self.mock_client.make_request.call_args_list}
+        self.assertEqual(requests_made['A'].object_group_id_body, 'og-default')
+        self.assertEqual(requests_made['C'].object_group_id_body, 'og-1')
+        self.assertEqual(requests_made['C'].endpoint, 'api/intent/changeAssemblyState')
+
+    def test_intents_batch_bounded_by_max_workers(self):
+        lock = threading.Lock()
+        in_flight = {'current': 0, 'max': 0}
+        def make_request(request):
+            with lock:
+                in_flight['current'] += 1
+                in_flight['max'] = max(in_flight['max'], in_flight['current'])
+            time.sleep(0.02)
+            with lock:
+                in_flight['current'] -= 1
+            return MagicMock(headers={'Location': '/api/processes/123'})
+        self.mock_client.make_request.side_effect = make_request
+        results = self.assemblies.intents_batch([('healAssembly', {'assemblyName': str(i)}) for i in range(9)], max_workers=3)
+        self.assertTrue(results.accepted)
+        self.assertEqual(len(results.results), 9)
+        self.assertEqual(in_flight['max'], 3)
+
+    def test_intents_batch_retry_accepted_without_process_id(self):
+        self.mock_client.make_request.return_value = MagicMock(headers={})
+        results = self.assemblies.intents_batch([('retry', {'processId': '123'})])
+        self.assertTrue(results.accepted)
+        self.assertIsNone(results.results[0].process_id)
+
+    def test_intents_batch_empty(self):
+        self.assertEqual(self.assemblies.intents_batch([]).results, [])
+
     def test_intent_create(self):
         mock_response = MagicMock(headers={'Location': '/api/processes/123'})
         self.mock_client.make_request.return_value = mock_response
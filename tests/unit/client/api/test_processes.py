@@ -1,7 +1,9 @@
 import unittest
+import json
 from unittest.mock import patch, MagicMock
 from lmctl.client.api import ProcessesAPI
 from lmctl.client.client_request import TNCOClientRequest
+from lmctl.client.exceptions import TNCOProcessWaitTimeoutError
 
 class TestProcessesAPI(unittest.TestCase):
 
@@ -23,6 +25,19 @@ class TestProcessesAPI(unittest.TestCase):
         self.assertEqual(response, mock_response)
         self.mock_client.make_request.assert_called_with(TNCOClientRequest.build_request_for_json(method='GET', endpoint='api/processes/123', query_params={'shallow': True}))
 
+    def test_get_with_stream(self):
+        self.mock_client.make_request.return_value.iter_content.return_value = iter([b'{"id": "123", ', b'"childProcesses": []}'])
+        response = self.processes.get('123', shallow=False, stream=True)
+        self.assertEqual(response, {'id': '123', 'childProcesses': []})
+        self.mock_client.make_request.assert_called_with(TNCOClientRequest.build_request_for_json(method='GET', endpoint='api/processes/123', query_params={'shallow': False}), stream=True)
+        self.mock_client.make_request.return_value.close.assert_called_once()
+
+    def test_stream_request_without_response_handler_is_sent_once(self):
+        request = TNCOClientRequest(method='DELETE', endpoint='api/processes/123')
+        self.assertIsNone(self.processes._exec_request(request, stream=True))
+        self.mock_client.make_request.assert_called_once_with(request, stream=True)
+        self.mock_client.make_request.return_value.close.assert_called_once()
+
     def test_query(self):
         mock_response = [{'id': '123'}, {'id': '456'}]
         self.mock_client.make_request.return_value.json.return_value = mock_response
@@ -36,3 +51,129 @@ class TestProcessesAPI(unittest.TestCase):
         response = self.processes.query(object_group_id='123-456', assemblyName='Abc', intentTypes='healAssembly')
         self.assertEqual(response, mock_response)
         self.mock_client.make_request.assert_called_with(TNCOClientRequest.build_request_for_json(method='GET', endpoint='api/processes', query_params={'assemblyName': 'Abc', 'intentTypes': 'healAssembly'}, object_group_id='123-456'))
+
+    def test_iter_query_streams_one_response(self):
+        self.mock_client.make_request.return_value.iter_content.return_value = iter([b'[{"id": "1"}, {"i', b'd": "2"}, {"id": "3"}]'])
+        result = self.processes.iter_query(assemblyName='Abc')
+        self.mock_client.make_request.assert_not_called()
+        self.assertEqual([p['id'] for p in result], ['1', '2', '3'])
+        self.mock_client.make_request.assert_called_once_with(TNCOClientRequest.build_request_for_json(method='GET', endpoint='api/processes', query_params={'assemblyName': 'Abc'}), stream=True)
+        self.mock_client.make_request.return_value.close.assert_called_once()
+
+    def test_iter_query_yields_processes_as_they_are_read(self):
+        self.mock_client.make_request.return_value.iter_content.return_value = iter([b'[{"id": "1"},', b' {"id": "2"}]'])
+        result = self.processes.iter_query()
+        self.assertEqual(next(result)['id'], '1')
+        self.mock_client.make_request.return_value.close.assert_not_called()
+
+    def test_iter_query_sends_limit_to_server(self):
+        self.mock_client.make_request.return_value.iter_content.return_value = iter([b'[{"id": "1"}, {"id": "2"}, {"id": "3"}]'])
+        result = list(self.processes.iter_query(object_group_id='123-456', limit=500))
+        self.assertEqual(len(result), 3)
+        self.mock_client.make_request.assert_called_once_with(TNCOClientRequest.build_request_for_json(method='GET', endpoint='api/processes', query_params={'limit': 500}, object_group_id='123-456'), stream=True)
+
+    def _mock_process_responses(self, get_statuses, query_results=None, assembly_ids=None):
+        # Responds to GETs of a process with the next of its statuses and to queries with the next of query_results
+        get_statuses = {process_id: list(statuses) for process_id, statuses in get_statuses.items()}
+        query_results = list(query_results) if query_results is not None else []
+        assembly_ids = assembly_ids if assembly_ids is not None else {}
+        def make_request(request, stream=False):
+            response = MagicMock()
+            if request.endpoint == 'api/processes':
+                response.iter_content.return_value = iter([json.dumps(query_results.pop(0)).encode('utf-8')])
+            else:
+                process_id = request.endpoint.split('/')[-1]
+                statuses = get_statuses[process_id]
+                status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+                response.json.return_value = {'id': process_id, 'status': status, 'assemblyId': assembly_ids.get(process_id, 'A1'), 'startTime': f'2021-01-01T00:00:0{process_id}Z'}
+            return response
+        self.mock_client.make_request.side_effect = make_request
+
+    @patch('lmctl.client.api.processes.time.sleep')
+    def test_wait_for_single_process(self, mock_sleep):
+        self._mock_process_responses({'1': ['In Progress', 'In Progress', 'Completed']})
+        process = self.processes.wait_for('1')
+        self.assertEqual(process['status'], 'Completed')
+        self.assertEqual(self.mock_client.make_request.call_count, 3)
+        self.mock_client.make_request.assert_called_with(TNCOClientRequest.build_request_for_json(method='GET', endpoint='api/processes/1', query_params={'shallow': True}))
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch('lmctl.client.api.processes.time.sleep')
+    def test_wait_for_backs_off_while_status_unchanged(self, mock_sleep):
+        self._mock_process_responses({'1': ['Pending', 'In Progress', 'In Progress', 'In Progress', 'In Progress', 'Completed']})
+        self.processes.wait_for('1', poll_interval=1, max_poll_interval=2)
+        delays = [c[0][0] for c in mock_sleep.call_args_list]
+        # Status changed on the first two checks, then was unchanged
+        self.assertEqual(delays, [1, 1, 1.5, 2, 2])
+
+    @patch('lmctl.client.api.processes.time.sleep')
+    def test_wait_for_many_processes_queries_by_assembly(self, mock_sleep):
+        self._mock_process_responses({'1': ['In Progress'], '2': ['In Progress', 'Completed'], '3': ['In Progress']}, query_results=[
+            [{'id': '1', 'status': 'Completed', 'assemblyId': 'A1'}, {'id': '2', 'status': 'In Progress', 'assemblyId': 'A1'}, {'id': '3', 'status': 'Failed', 'assemblyId': 'A1'}, {'id': '9', 'status': 'Completed'}],
+        ])
+        processes = self.processes.wait_for(['3', '1', '2'])
+        self.assertEqual([(p['id'], p['status']) for p in processes], [('3', 'Failed'), ('1', 'Completed'), ('2', 'Completed')])
+        # 3 GETs to find the Assembly of each process, one query for all 3 then a GET for the only remaining process
+        self.assertEqual(self.mock_client.make_request.call_count, 5)
+        requests = [c[0][0] for c in self.mock_client.make_request.call_args_list]
+        self.assertEqual(requests[3], TNCOClientRequest.build_request_for_json(method='GET', endpoint='api/processes', query_params={'assemblyId': 'A1', 'startDateTime': '2021-01-01T00:00:01Z'}))
+        self.assertEqual(requests[4], TNCOClientRequest.build_request_for_json(method='GET', endpoint='api/processes/2', query_params={'shallow': True}))
+
+    @patch('lmctl.client.api.processes.time.sleep')
+    def test_wait_for_processes_of_different_assemblies_queries_by_start_time(self, mock_sleep):
+        self._mock_process_responses({'1': ['In Progress'], '2': ['In Progress'], '3': ['In Progress']}, assembly_ids={'1': 'A1', '2': 'A2', '3': 'A3'}, query_results=[
+            [{'id': '1', 'status': 'Completed', 'assemblyId': 'A1', 'startTime': '2021-01-01T00:00:01Z'}, {'id': '2', 'status': 'In Progress', 'assemblyId': 'A2', 'startTime': '2021-01-01T00:00:02Z'}, {'id': '3', 'status': 'In Progress', 'assemblyId': 'A3', 'startTime': '2021-01-01T00:00:03Z'}],
+            [{'id': '2', 'status': 'Completed', 'assemblyId': 'A2', 'startTime': '2021-01-01T00:00:02Z'}, {'id': '3', 'status': 'Failed', 'assemblyId': 'A3', 'startTime': '2021-01-01T00:00:03Z'}, {'id': '8', 'status': 'Completed', 'assemblyId': 'A8', 'startTime': '2021-01-01T00:00:08Z'}],
+        ])
+        processes = self.processes.wait_for(['1', '2', '3'])
+        self.assertEqual([p['status'] for p in processes], ['Completed', 'Completed', 'Failed'])
+        # 3 GETs to find each process, then one query per poll
+        self.assertEqual(self.mock_client.make_request.call_count, 5)
+        requests = [c[0][0] for c in self.mock_client.make_request.call_args_list]
+        self.assertEqual(requests[3], TNCOClientRequest.build_request_for_json(method='GET', endpoint='api/processes', query_params={'startDateTime': '2021-01-01T00:00:01Z'}))
+        # Earliest start time of the processes still pending
+        self.assertEqual(requests[4], TNCOClientRequest.build_request_for_json(method='GET', endpoint='api/processes', query_params={'startDateTime': '2021-01-01T00:00:02Z'}))
+
+    @patch('lmctl.client.api.processes.time.sleep')
+    def test_wait_for_gets_process_missing_from_query(self, mock_sleep):
+        self._mock_process_responses({'1': ['In Progress', 'Completed'], '2': ['In Progress']}, query_results=[
+            [{'id': '2', 'status': 'Completed', 'assemblyId': 'A1'}],
+        ])
+        processes = self.processes.wait_for(['1', '2'])
+        self.assertEqual([p['status'] for p in processes], ['Completed', 'Completed'])
+        self.mock_client.make_request.assert_called_with(TNCOClientRequest.build_request_for_json(method='GET', endpoint='api/processes/1', query_params={'shallow': True}))
+
+    @patch('lmctl.client.api.processes.time.sleep')
+    def test_iter_wait_for_yields_processes_as_they_finish(self, mock_sleep):
+        self._mock_process_responses({'1': ['In Progress', 'In Progress', 'Completed'], '2': ['Cancelled']}, query_results=[])
+        processes = self.processes.iter_wait_for(['1', '2'])
+        first = next(processes)
+        self.assertEqual(first['id'], '2')
+        self.assertEqual(mock_sleep.call_count, 0)
+        self.assertEqual([p['id'] for p in processes], ['1'])
+
+    def test_wait_for_rejects_missing_process_id(self):
+        for process_ids in ([None], ['123', ''], None):
+            with self.assertRaises(ValueError):
+                self.processes.wait_for(process_ids)
+        self.mock_client.make_request.assert_not_called()
+
+    @patch('lmctl.client.api.processes.time.sleep')
+    def test_wait_for_custom_statuses(self, mock_sleep):
+        self._mock_process_responses({'1': ['Pending', 'In Progress', 'Completed']})
+        process = self.processes.wait_for('1', statuses=['in progress'])
+        self.assertEqual(process['status'], 'In Progress')
+
+    @patch('lmctl.client.api.processes.time.monotonic')
+    @patch('lmctl.client.api.processes.time.sleep')
+    def test_wait_for_timeout(self, mock_sleep, mock_monotonic):
+        mock_monotonic.side_effect = [0, 2, 4, 6]
+        self._mock_process_responses({'1': ['Completed'], '2': ['In Progress']}, query_results=[
+            [{'id': '2', 'status': 'In Progress', 'assemblyId': 'A1'}],
+        ])
+        with self.assertRaises(TNCOProcessWaitTimeoutError) as context:
+            self.processes.wait_for(['1', '2'], timeout=5)
+        self.assertEqual(context.exception.pending_ids, ['2'])
+        self.assertEqual(list(context.exception.finished.keys()), ['1'])
+        # Last wait cut short to the remaining time
+        self.assertEqual(mock_sleep.call_args_list[-1][0][0], 1)
@@ -0,0 +1,113 @@
+import unittest
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+from lmctl.client import AsyncTNCOClient, TNCOClient, TNCOClientRequest, TNCOClientError, client_builder
+from lmctl.utils.trace_ctx import trace_ctx
+
+class TestAsyncTNCOClient(unittest.TestCase):
+
+    def _build_client(self):
+        client = MagicMock(spec=TNCOClient)
+        client.transport = MagicMock(pool_maxsize=10)
+        return client
+
+    def test_api_methods_are_coroutines(self):
+        client = self._build_client()
+        client.assemblies.get.return_value = {'id': '123'}
+        async_client = AsyncTNCOClient(client=client)
+        async def run():
+            async with async_client:
+                return await async_client.assemblies.get('123')
+        result = asyncio.run(run())
+        self.assertEqual(result, {'id': '123'})
+        client.assemblies.get.assert_called_once_with('123')
+        client.close.assert_called_once()
+
+    def test_non_request_methods_are_not_coroutines(self):
+        client = TNCOClient('https://test.example.com')
+        async_client = AsyncTNCOClient(client=client)
+        self.assertEqual(async_client.assemblies.intent_endpoint('createAssembly'), 'api/intent/createAssembly')
+
+    def test_make_request(self):
+        client = self._build_client()
+        request = TNCOClientRequest(method='GET', endpoint='api/test')
+        async_client = AsyncTNCOClient(client=client)
+        result = asyncio.run(async_client.make_request_for_json(request))
+        client.make_request_for_json.assert_called_once_with(request)
+        self.assertEqual(result, client.make_request_for_json.return_value)
+
+    def test_errors_raised_to_caller(self):
+        client = self._build_client()
+        client.processes.get.side_effect = TNCOClientError('Mock error')
+        async_client = AsyncTNCOClient(client=client)
+        with self.assertRaises(TNCOClientError) as context:
+            asyncio.run(async_client.processes.get('123'))
+        self.assertEqual(str(context.exception), 'Mock error')
+
+    def test_iterator_methods_are_async_generators(self):
+        client = self._build_client()
+        client.processes.iter_query.return_value = iter([{'id': '1'}, {'id': '2'}])
+        async_client = AsyncTNCOClient(client=client)
+        async def run():
+            return [process async for process in async_client.processes.iter_query(assemblyId='123')]
+        result = asyncio.run(run())
+        self.assertEqual(result, [{'id': '1'}, {'id': '2'}])
+        client.processes.iter_query.assert_called_once_with(assemblyId='123')
+
+    def test_iterator_closed_when_consumer_stops_early(self):
+        client = self._build_client()
+        closed_on = []
+        def iter_query(**kwargs):
+            try:
+                yield {'id': '1'}
+                yield {'id': '2'}
+            finally:
+                closed_on.append(threading.current_thread().name)
+        client.processes.iter_query.side_effect = iter_query
+        async_client = AsyncTNCOClient(client=client)
+        async def run():
+            processes = async_client.processes.iter_query()
+            async for process in processes:
+                break
+            await processes.aclose()
+            return process
+        self.assertEqual(asyncio.run(run()), {'id': '1'})
+        self.assertEqual(len(closed_on), 1)
+        self.assertTrue(closed_on[0].startswith('lmctl-async-client'))
+
+    def test_concurrent_requests_bounded_by_max_workers(self):
+        client = self._build_client()
+        lock = threading.Lock()
+        in_flight = {'current': 0, 'max': 0}
+        def get(id):
+            with lock:
+                in_flight['current'] += 1
+                in_flight['max'] = max(in_flight['max'], in_flight['current'])
+            time.sleep(0.05)
+            with lock:
+                in_flight['current'] -= 1
+            return {'id': id}
+        client.processes.get.side_effect = get
+        async_client = AsyncTNCOClient(client=client, max_workers=3)
+        async def run():
+            return await asyncio.gather(*[async_client.processes.get(str(i)) for i in range(9)])
+        results = asyncio.run(run())
+        self.assertEqual([r['id'] for r in results], [str(i) for i in range(9)])
+        self.assertEqual(in_flight['max'], 3)
+
+    def test_trace_ctx_copied_to_worker(self):
+        client = self._build_client()
+        client.processes.get.side_effect = lambda id: trace_ctx.get_transaction_id()
+        async_client = AsyncTNCOClient(client=client)
+        async def run():
+            with trace_ctx.scope(transaction_id='123456789'):
+                return await async_client.processes.get('123')
+        self.assertEqual(asyncio.run(run()), '123456789')
+
+    def test_builder_build_async(self):
+        async_client = client_builder().address('https://test.example.com').connection_pool(pool_maxsize=4).build_async()
+        self.assertIsInstance(async_client, AsyncTNCOClient)
+        self.assertEqual(async_client.address, 'https://test.example.com')
+        self.assertEqual(async_client.max_workers, 4)
@@ -35,4 +35,43 @@ class TestAuthTracker(unittest.TestCase):
         # Expires in 10 minutes
         auth_response = {'token': build_a_token(expires_in=600)}
         tracker.accept_auth_response(auth_response)
-        self.assertFalse(tracker.has_access_expired)
\ No newline at end of file
+        self.assertFalse(tracker.has_access_expired)
+    def test_needs_refresh_false_without_refresh_ahead(self):
+        tracker = AuthTracker()
+        tracker.accept_auth_response({'token': build_a_token(expires_in=1)})
+        self.assertFalse(tracker.needs_refresh)
+
+    def test_needs_refresh_after_fraction_of_lifetime(self):
+        # "exp" is truncated to the second, so the lifetime is between 4 and 5 seconds (refresh due after 0.4 to 0.5 seconds)
+        tracker = AuthTracker(refresh_ahead=0.1)
+        tracker.accept_auth_response({'token': build_a_token(expires_in=5)})
+        self.assertFalse(tracker.needs_refresh)
+        time.sleep(0.6)
+        self.assertTrue(tracker.needs_refresh)
+        self.assertFalse(tracker.has_access_expired)
+
+    def test_needs_refresh_false_when_same_token_returned(self):
+        tracker = AuthTracker(refresh_ahead=0.5)
+        token = build_a_token(expires_in=2)
+        tracker.accept_auth_response({'token': token})
+        tracker.accept_auth_response({'token': token})
+        self.assertFalse(tracker.needs_refresh)
+
+    def test_has_access_expired_does_not_wait_with_refresh_ahead(self):
+        tracker = AuthTracker(refresh_ahead=0.5)
+        tracker.accept_auth_response({'token': build_a_token(expires_in=0.5)})
+        start = time.monotonic()
+        self.assertTrue(tracker.has_access_expired)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_postpone_refresh(self):
+        tracker = AuthTracker(refresh_ahead=0.1)
+        tracker.accept_auth_response({'token': build_a_token(expires_in=600)})
+        tracker._state = tracker._state._replace(refresh_at=tracker.time_of_auth)
+        self.assertTrue(tracker.needs_refresh)
+        tracker.postpone_refresh(seconds=60)
+        self.assertFalse(tracker.needs_refresh)
+
+    def test_invalid_refresh_ahead(self):
+        with self.assertRaises(ValueError):
+            AuthTracker(refresh_ahead=1.5)
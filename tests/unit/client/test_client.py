@@ -2,8 +2,10 @@ import unittest
 import requests
 import json
 import jwt
+import time
+import threading
 from unittest.mock import patch, MagicMock, Mock
-from lmctl.client import TNCOClient, TNCOClientError, TNCOClientRequest
+from lmctl.client import TNCOClient, TNCOClientError, TNCOClientHttpError, TNCOClientRequest, RetryPolicy
 from datetime import datetime, timedelta
 
 class TestTNCOClient(unittest.TestCase):
@@ -57,6 +59,79 @@ class TestTNCOClient(unittest.TestCase):
             client.make_request_for_json(TNCOClientRequest(method='GET', endpoint='api/test'))
         self.assertEqual(str(context.exception), 'Failed to parse response to JSON: Mock error')
 
+    @patch('lmctl.client.client.requests.Session')
+    def test_make_request_for_json_with_stream(self, requests_session_builder):
+        mock_session = self._get_requests_session(requests_session_builder)
+        mock_session.request.return_value.iter_content.return_value = iter([b'{"id": "1", "chil', b'dren": [{"id": "2"}]}'])
+        client = TNCOClient('https://test.example.com', use_sessions=True)
+        response = client.make_request_for_json(TNCOClientRequest(method='GET', endpoint='api/test'), stream=True)
+        self.assertEqual(response, {'id': '1', 'children': [{'id': '2'}]})
+        mock_session.request.assert_called_with(method='GET', url='https://test.example.com/api/test', headers={}, verify=False, stream=True)
+        mock_session.request.return_value.json.assert_not_called()
+        mock_session.request.return_value.close.assert_called()
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_iter_json(self, requests_session_builder):
+        mock_session = self._get_requests_session(requests_session_builder)
+        mock_session.request.return_value.iter_content.return_value = iter([b'{"items": [{"id": "1"}, ', b'{"id": "2"}]}'])
+        client = TNCOClient('https://test.example.com', use_sessions=True)
+        iterator = client.iter_json(TNCOClientRequest(method='GET', endpoint='api/test'), items_key='items')
+        mock_session.request.assert_not_called()
+        self.assertEqual(list(iterator), [{'id': '1'}, {'id': '2'}])
+        mock_session.request.assert_called_with(method='GET', url='https://test.example.com/api/test', headers={}, verify=False, stream=True)
+        mock_session.request.return_value.close.assert_called_once()
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_iter_json_fails_when_cannot_parse(self, requests_session_builder):
+        mock_session = self._get_requests_session(requests_session_builder)
+        mock_session.request.return_value.iter_content.return_value = iter([b'[{"id": "1"}, {"id"'])
+        client = TNCOClient('https://test.example.com', use_sessions=True)
+        iterator = client.iter_json(TNCOClientRequest(method='GET', endpoint='api/test'))
+        self.assertEqual(next(iterator), {'id': '1'})
+        with self.assertRaises(TNCOClientError) as context:
+            next(iterator)
+        self.assertTrue(str(context.exception).startswith('Failed to parse response as JSON'))
+        mock_session.request.return_value.close.assert_called_once()
+
+    @patch('lmctl.client.client.time.sleep')
+    @patch('lmctl.client.client.requests.Session')
+    def test_make_request_retries_transient_errors(self, requests_session_builder, mock_sleep):
+        mock_session = self._get_requests_session(requests_session_builder)
+        unavailable_response = MagicMock(status_code=503, ok=False, headers={'Retry-After': '2'})
+        ok_response = MagicMock(status_code=200, ok=True)
+        mock_session.request.side_effect = [requests.ConnectionError('Mock error'), unavailable_response, ok_response]
+        client = TNCOClient('https://test.example.com', use_sessions=True, retry_policy=RetryPolicy())
+        response = client.make_request(TNCOClientRequest(method='GET', endpoint='api/test'))
+        self.assertEqual(response, ok_response)
+        self.assertEqual(mock_session.request.call_count, 3)
+        unavailable_response.close.assert_called_once()
+        self.assertEqual(mock_sleep.call_count, 2)
+        self.assertEqual(mock_sleep.call_args_list[1][0][0], 2)
+
+    @patch('lmctl.client.client.time.sleep')
+    @patch('lmctl.client.client.requests.Session')
+    def test_make_request_does_not_retry_intents(self, requests_session_builder, mock_sleep):
+        mock_session = self._get_requests_session(requests_session_builder)
+        mock_session.request.side_effect = requests.ConnectionError('Mock error')
+        client = TNCOClient('https://test.example.com', use_sessions=True, retry_policy=RetryPolicy())
+        with self.assertRaises(TNCOClientError) as context:
+            client.make_request(TNCOClientRequest(method='POST', endpoint='api/intent/createAssembly'))
+        self.assertEqual(str(context.exception), 'Mock error')
+        self.assertEqual(mock_session.request.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    @patch('lmctl.client.client.time.sleep')
+    @patch('lmctl.client.client.requests.Session')
+    def test_make_request_raises_after_max_retries(self, requests_session_builder, mock_sleep):
+        mock_session = self._get_requests_session(requests_session_builder)
+        unavailable_response = MagicMock(status_code=503, ok=False, headers={})
+        unavailable_response.raise_for_status.side_effect = requests.HTTPError('Mock error', response=unavailable_response)
+        mock_session.request.return_value = unavailable_response
+        client = TNCOClient('https://test.example.com', use_sessions=True, retry_policy=RetryPolicy(max_retries=2))
+        with self.assertRaises(TNCOClientHttpError):
+            client.make_request(TNCOClientRequest(method='DELETE', endpoint='api/test'))
+        self.assertEqual(mock_session.request.call_count, 3)
+
     @patch('lmctl.client.client.requests.Session')
     def test_make_request_with_body(self, requests_session_builder):
         client = TNCOClient('https://test.example.com', use_sessions=True)
@@ -64,6 +139,13 @@ class TestTNCOClient(unittest.TestCase):
         mock_session = self._get_requests_session(requests_session_builder)
         mock_session.request.assert_called_with(method='POST', url='https://test.example.com/api/test', data=json.dumps({'id': 'test'}), headers={}, verify=False)
 
+    @patch('lmctl.client.client.requests.Session')
+    def test_make_request_with_serialized_body_is_not_converted(self, requests_session_builder):
+        client = TNCOClient('https://test.example.com', use_sessions=True)
+        client.make_request(TNCOClientRequest(method='POST', endpoint='api/test', body='name: test', headers={'Content-Type': 'application/yaml'}))
+        mock_session = self._get_requests_session(requests_session_builder)
+        mock_session.request.assert_called_with(method='POST', url='https://test.example.com/api/test', data='name: test', headers={'Content-Type': 'application/yaml'}, verify=False)
+
     @patch('lmctl.client.client.requests.Session')
     def test_make_request_with_headers(self, requests_session_builder):
         client = TNCOClient('https://test.example.com', use_sessions=True)
@@ -292,4 +374,142 @@ class TestTNCOClient(unittest.TestCase):
         self.assertEqual(result.tests[3].name, 'Resource Manager')
         self.assertTrue(result.tests[3].passed)
         self.assertIsNone(result.tests[3].error)
-        
\ No newline at end of file
+        
+    @patch('lmctl.client.client.SharedInfrastructureKeysAPI')
+    @patch('lmctl.client.client.BehaviourProjectsAPI')
+    @patch('lmctl.client.client.DescriptorsAPI')
+    @patch('lmctl.client.client.DeploymentLocationAPI')
+    def test_ping_runs_tests_concurrently(self, mock_dl_api, mock_descriptors_api, mock_projects_api, mock_keys_api):
+        def slow_all():
+            time.sleep(0.2)
+            return []
+        for mock_api in [mock_dl_api, mock_descriptors_api, mock_projects_api, mock_keys_api]:
+            mock_api.return_value.all.side_effect = slow_all
+        client = TNCOClient('https://test.example.com', use_sessions=True)
+        start = time.monotonic()
+        result = client.ping()
+        duration = time.monotonic() - start
+        self.assertTrue(result.passed)
+        self.assertLess(duration, 0.6)
+        for test in result.tests:
+            self.assertGreaterEqual(test.latency, 0.2)
+
+    @patch('lmctl.client.client.SharedInfrastructureKeysAPI')
+    @patch('lmctl.client.client.BehaviourProjectsAPI')
+    @patch('lmctl.client.client.DescriptorsAPI')
+    @patch('lmctl.client.client.DeploymentLocationAPI')
+    def test_ping_with_timeout(self, mock_dl_api, mock_descriptors_api, mock_projects_api, mock_keys_api):
+        mock_dl_api.return_value.all.return_value = []
+        mock_descriptors_api.return_value.all.return_value = []
+        mock_projects_api.return_value.all.side_effect = lambda: time.sleep(1)
+        mock_keys_api.return_value.all.return_value = []
+        client = TNCOClient('https://test.example.com', use_sessions=True)
+        result = client.ping(timeout=0.1)
+        self.assertFalse(result.passed)
+        self.assertTrue(result.tests[0].passed)
+        self.assertEqual(result.tests[2].name, 'Behaviour')
+        self.assertFalse(result.tests[2].passed)
+        self.assertEqual(str(result.tests[2].error), 'Timed out after 0.1 seconds')
+        self.assertEqual(result.tests[2].latency, 0.1)
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_ping_lightweight(self, requests_session_builder):
+        client = TNCOClient('https://test.example.com', kami_address='https://kami.example.com', use_sessions=True)
+        result = client.ping(include_template_engine=True, lightweight=True, timeout=5)
+        self.assertTrue(result.passed)
+        mock_session = self._get_requests_session(requests_session_builder)
+        self.assertEqual(mock_session.request.call_count, 5)
+        mock_session.request.assert_any_call(method='HEAD', url='https://test.example.com/api/catalog/descriptors', headers={}, timeout=5, verify=False)
+        mock_session.request.assert_any_call(method='HEAD', url='https://test.example.com/api/deploymentLocations', headers={}, timeout=5, verify=False)
+        mock_session.request.assert_any_call(method='HEAD', url='https://test.example.com/api/behaviour/projects', headers={}, timeout=5, verify=False)
+        mock_session.request.assert_any_call(method='HEAD', url='https://test.example.com/api/resource-manager/infrastructure-keys/shared', headers={}, timeout=5, verify=False)
+        mock_session.request.assert_any_call(method='HEAD', url='https://kami.example.com/api/catalog/descriptorTemplates', headers={}, timeout=5, verify=False)
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_ping_lightweight_falls_back_to_limited_get(self, requests_session_builder):
+        mock_session = self._get_requests_session(requests_session_builder)
+        def request(method, url, **kwargs):
+            response = MagicMock(status_code=200)
+            if method == 'HEAD':
+                response.raise_for_status.side_effect = requests.HTTPError('Method not allowed', response=MagicMock(status_code=405, headers={}))
+            return response
+        mock_session.request.side_effect = request
+        client = TNCOClient('https://test.example.com', use_sessions=True)
+        result = client.ping(lightweight=True)
+        self.assertTrue(result.passed)
+        mock_session.request.assert_any_call(method='GET', url='https://test.example.com/api/catalog/descriptors', params={'limit': 1}, headers={'Accept': 'application/json'}, verify=False)
+
+    def test_get_access_token_refreshes_ahead_in_background(self):
+        first_token = self._build_a_token(expires_in=600)
+        second_token = self._build_a_token(expires_in=1200)
+        refreshing = threading.Event()
+        def handle(client):
+            if mock_auth.handle.call_count == 1:
+                return {'token': first_token}
+            refreshing.wait(1)
+            return {'token': second_token}
+        mock_auth = MagicMock()
+        mock_auth.handle.side_effect = handle
+        client = TNCOClient('https://test.example.com', auth_type=mock_auth, refresh_ahead=0.5)
+        self.assertEqual(client.get_access_token(), first_token)
+        # Move the refresh point of the current token into the past
+        client.auth_tracker._state = client.auth_tracker._state._replace(refresh_at=datetime.now())
+        # Requests continue to use the current token while the refresh is in-flight, with only one refresh started
+        for _ in range(5):
+            self.assertEqual(client.get_access_token(), first_token)
+        refreshing.set()
+        deadline = time.monotonic() + 2
+        while client.get_access_token() != second_token and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(client.get_access_token(), second_token)
+        self.assertEqual(mock_auth.handle.call_count, 2)
+
+    def test_get_access_token_keeps_current_token_when_refresh_fails(self):
+        token = self._build_a_token(expires_in=600)
+        mock_auth = MagicMock()
+        mock_auth.handle.side_effect = [{'token': token}, TNCOClientError('Mock error')]
+        client = TNCOClient('https://test.example.com', auth_type=mock_auth, refresh_ahead=0.5)
+        client.get_access_token()
+        client.auth_tracker._state = client.auth_tracker._state._replace(refresh_at=datetime.now())
+        self.assertEqual(client.get_access_token(), token)
+        deadline = time.monotonic() + 2
+        while client._refresh_lock.locked() or mock_auth.handle.call_count < 2:
+            if time.monotonic() > deadline:
+                self.fail('Background refresh did not complete')
+            time.sleep(0.01)
+        self.assertFalse(client.auth_tracker.needs_refresh)
+        self.assertEqual(client.get_access_token(), token)
+
+    def test_api_groups_are_created_once_per_client(self):
+        client = TNCOClient('https://test.example.com')
+        self.assertIs(client.assemblies, client.assemblies)
+        self.assertIs(client.behaviour_assembly_confs, client.behaviour_assembly_configs)
+        self.assertIs(client.vim_drivers, client.vim_drivers)
+        self.assertIsNot(client.assemblies, TNCOClient('https://test.example.com').assemblies)
+
+    def test_api_groups_shared_between_threads(self):
+        client = TNCOClient('https://test.example.com')
+        groups = []
+        threads = [threading.Thread(target=lambda: groups.append(client.processes)) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(set(id(g) for g in groups)), 1)
+
+    def test_get_access_token_authenticates_once_for_concurrent_threads(self):
+        token = self._build_a_token(expires_in=600)
+        mock_auth = MagicMock()
+        def handle(client):
+            time.sleep(0.05)
+            return {'token': token}
+        mock_auth.handle.side_effect = handle
+        client = TNCOClient('https://test.example.com', auth_type=mock_auth)
+        tokens = []
+        threads = [threading.Thread(target=lambda: tokens.append(client.get_access_token())) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(tokens, [token] * 10)
+        mock_auth.handle.assert_called_once()
@@ -0,0 +1,81 @@
+import unittest
+import json
+from lmctl.client.json_stream import JsonStreamParser, iter_json_items, parse_json_stream
+
+def chunked(text: str, size: int):
+    data = text.encode('utf-8')
+    return [data[i:i+size] for i in range(0, len(data), size)]
+
+class TestJsonStreamParser(unittest.TestCase):
+
+    def test_iter_items_of_array(self):
+        doc = json.dumps([{'id': i, 'name': f'process-{i}', 'values': [1.5, None, True]} for i in range(50)])
+        for size in (1, 3, 7, 1024):
+            items = list(iter_json_items(chunked(doc, size)))
+            self.assertEqual(items, json.loads(doc))
+
+    def test_iter_items_numbers_split_between_chunks(self):
+        self.assertEqual(list(iter_json_items([b'[12', b'34, 5', b'6.7', b'8e2]'])), [1234, 56.78e2])
+
+    def test_floats_and_exponents_split_at_every_offset(self):
+        doc = '{"a": [1.5, -0.25e-3, 2E+10, 7e5, 3.0e0], "b": 12.75, "c": [0.5]}'
+        data = doc.encode('utf-8')
+        for offset in range(1, len(data)):
+            chunks = [data[:offset], data[offset:]]
+            self.assertEqual(parse_json_stream(chunks), json.loads(doc), f'split at offset {offset}')
+            self.assertEqual(list(iter_json_items(chunks, items_key='a')), json.loads(doc)['a'], f'split at offset {offset}')
+
+    def test_iter_items_multibyte_characters_split_between_chunks(self):
+        doc = json.dumps(['café ✅'], ensure_ascii=False)
+        self.assertEqual(list(iter_json_items(chunked(doc, 1))), ['café ✅'])
+
+    def test_iter_items_of_empty_array(self):
+        self.assertEqual(list(iter_json_items([b' [ ] '])), [])
+
+    def test_iter_items_under_key(self):
+        doc = json.dumps({'total': 2, 'meta': {'links': [1, 2]}, 'items': [{'id': '1'}, {'id': '2'}], 'last': True})
+        self.assertEqual(list(iter_json_items(chunked(doc, 5), items_key='items')), [{'id': '1'}, {'id': '2'}])
+
+    def test_iter_items_under_missing_or_null_key(self):
+        self.assertEqual(list(iter_json_items([b'{"total": 0}'], items_key='items')), [])
+        self.assertEqual(list(iter_json_items([b'{"items": null}'], items_key='items')), [])
+
+    def test_iter_items_reads_lazily(self):
+        read = []
+        def chunks():
+            for chunk in [b'[{"id": 1}', b', {"id": 2}', b']']:
+                read.append(chunk)
+                yield chunk
+        iterator = iter_json_items(chunks())
+        self.assertEqual(next(iterator), {'id': 1})
+        self.assertEqual(len(read), 2)
+
+    def test_iter_items_buffer_does_not_grow_with_array(self):
+        parser = JsonStreamParser(chunked(json.dumps([{'id': i} for i in range(10000)]), 64))
+        max_buffer = 0
+        for item in parser.iter_items():
+            max_buffer = max(max_buffer, len(parser._buffer))
+        self.assertLess(max_buffer, 256)
+
+    def test_iter_items_fails_on_invalid_json(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_items([b'[{"id": 1}, {"id": ]']))
+        with self.assertRaises(ValueError):
+            list(iter_json_items([b'[1, 2']))
+        with self.assertRaises(ValueError):
+            list(iter_json_items([b'{"id": 1}']))
+
+    def test_parse(self):
+        doc = json.dumps({'id': '1', 'children': [{'id': '2', 'tasks': [{'name': 'a'}]}], 'empty': {}, 'none': None, 'count': 10})
+        for size in (1, 4, 1024):
+            self.assertEqual(parse_json_stream(chunked(doc, size)), json.loads(doc))
+
+    def test_parse_scalar(self):
+        self.assertEqual(parse_json_stream([b'12', b'3']), 123)
+
+    def test_parse_with_byte_order_mark(self):
+        self.assertEqual(parse_json_stream([b'\xef\xbb\xbf{"a": 1}']), {'a': 1})
+
+    def test_parse_fails_on_extra_data(self):
+        with self.assertRaises(ValueError):
+            parse_json_stream([b'{"a": 1} {"b": 2}'])
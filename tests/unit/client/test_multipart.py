@@ -0,0 +1,140 @@
+import unittest
+import threading
+import tempfile
+import shutil
+import os
+import io
+from email.parser import BytesParser
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from lmctl.client import TNCOClient, TNCOClientRequest, RetryPolicy
+from lmctl.client.multipart import MultipartStreamEncoder
+
+def parse_multipart(content_type, body):
+    message = BytesParser().parsebytes(b'Content-Type: ' + content_type.encode('utf-8') + b'\r\n\r\n' + body)
+    return {part.get_param('name', header='content-disposition'): part for part in message.get_payload()}
+
+class RecordingHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Give up on a request body which never arrives, rather than hanging the test
+    timeout = 5
+    received = []
+    # Number of requests to reject with 503 before accepting
+    unavailable_count = 0
+
+    def do_POST(self):
+        length = int(self.headers['Content-Length'])
+        RecordingHandler.received.append((self.headers['Content-Type'], self.headers.get('Transfer-Encoding'), self.rfile.read(length)))
+        if RecordingHandler.unavailable_count > 0:
+            RecordingHandler.unavailable_count -= 1
+            self.send_response(503)
+        else:
+            self.send_response(201)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_PUT(self):
+        self.do_POST()
+
+    def log_message(self, format, *args):
+        pass
+
+class TestMultipartStreamEncoder(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.tmp_dir, 'pkg.zip')
+        self.file_content = os.urandom(200 * 1024)
+        with open(self.file_path, 'wb') as f:
+            f.write(self.file_content)
+
+    def tearDown(self):
+        if os.path.exists(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+
+    def _read_all(self, encoder, size=-1):
+        body = b''
+        while True:
+            chunk = encoder.read(size)
+            if not chunk:
+                return body
+            body += chunk
+
+    def test_encodes_file(self):
+        with open(self.file_path, 'rb') as f:
+            encoder = MultipartStreamEncoder({'file': f})
+            body = self._read_all(encoder)
+        self.assertEqual(len(body), len(encoder))
+        parts = parse_multipart(encoder.content_type, body)
+        self.assertEqual(parts['file'].get_filename(), 'pkg.zip')
+        self.assertEqual(parts['file'].get_payload(decode=True), self.file_content)
+
+    def test_reads_file_a_chunk_at_a_time(self):
+        with open(self.file_path, 'rb') as f:
+            encoder = MultipartStreamEncoder({'file': f}, chunk_size=8192)
+            first_chunk = encoder.read()
+            self.assertEqual(len(first_chunk), 8192)
+            # Only the chunks read so far have been read from the file
+            self.assertLessEqual(f.tell(), 8192)
+            body = first_chunk + self._read_all(encoder, size=1000)
+        self.assertEqual(len(body), len(encoder))
+
+    def test_encodes_tuples_and_bytes(self):
+        encoder = MultipartStreamEncoder({
+            'file': ('custom.zip', io.BytesIO(b'zip content'), 'application/zip'),
+            'meta': b'some bytes'
+        })
+        body = self._read_all(encoder)
+        self.assertEqual(len(body), len(encoder))
+        parts = parse_multipart(encoder.content_type, body)
+        self.assertEqual(parts['file'].get_filename(), 'custom.zip')
+        self.assertEqual(parts['file'].get_content_type(), 'application/zip')
+        self.assertEqual(parts['file'].get_payload(decode=True), b'zip content')
+        # As requests, the field name is used when there is no file name
+        self.assertEqual(parts['meta'].get_filename(), 'meta')
+        self.assertEqual(parts['meta'].get_payload(decode=True), b'some bytes')
+
+    def test_file_shorter_than_expected(self):
+        f = io.BytesIO(b'content')
+        encoder = MultipartStreamEncoder({'file': f})
+        f.truncate(3)
+        with self.assertRaises(IOError):
+            self._read_all(encoder)
+
+    def _start_server(self):
+        RecordingHandler.received = []
+        RecordingHandler.unavailable_count = 0
+        server = ThreadingHTTPServer(('127.0.0.1', 0), RecordingHandler)
+        server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+        server_thread.start()
+        return server
+
+    def test_client_streams_files(self):
+        server = self._start_server()
+        try:
+            with TNCOClient(f'http://127.0.0.1:{server.server_port}') as client:
+                with open(self.file_path, 'rb') as f:
+                    client.make_request(TNCOClientRequest(method='POST', endpoint='api/resource-manager/resource-packages', files={'file': f}))
+        finally:
+            server.shutdown()
+            server.server_close()
+        content_type, transfer_encoding, body = RecordingHandler.received[0]
+        self.assertTrue(content_type.startswith('multipart/form-data; boundary='))
+        self.assertIsNone(transfer_encoding)
+        parts = parse_multipart(content_type, body)
+        self.assertEqual(parts['file'].get_filename(), 'pkg.zip')
+        self.assertEqual(parts['file'].get_payload(decode=True), self.file_content)
+
+    def test_client_sends_full_body_on_retry(self):
+        server = self._start_server()
+        RecordingHandler.unavailable_count = 1
+        content = b'A' * 100000
+        try:
+            with TNCOClient(f'http://127.0.0.1:{server.server_port}', retry_policy=RetryPolicy(backoff_base=0, backoff_max=0)) as client:
+                response = client.make_request(TNCOClientRequest(method='PUT', endpoint='api/resource-manager/resource-packages/pkg', files={'file': ('pkg.zip', content)}, timeout=10))
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(RecordingHandler.received), 2)
+        for content_type, _, body in RecordingHandler.received:
+            self.assertEqual(parse_multipart(content_type, body)['file'].get_payload(decode=True), content)
@@ -0,0 +1,85 @@
+import unittest
+import time
+import threading
+from unittest.mock import patch, MagicMock
+from lmctl.client import TNCOClient, TNCOClientRequest, RateLimiter
+from lmctl.client.rate_limiter import TokenBucket
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_burst_acquired_without_waiting(self):
+        bucket = TokenBucket(rate=1, burst=3)
+        self.assertEqual([bucket.acquire() for i in range(3)], [0, 0, 0])
+
+    @patch('lmctl.client.rate_limiter.time.sleep')
+    def test_waits_for_tokens_beyond_burst(self, mock_sleep):
+        bucket = TokenBucket(rate=10, burst=1)
+        bucket.acquire()
+        waited = bucket.acquire()
+        self.assertAlmostEqual(waited, 0.1, places=2)
+        waited = bucket.acquire()
+        # Reserved behind the previous waiter
+        self.assertAlmostEqual(waited, 0.2, places=2)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    def test_rate_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    @patch('lmctl.client.rate_limiter.time.sleep')
+    def test_intents_use_separate_bucket(self, mock_sleep):
+        limiter = RateLimiter(requests_per_second=100, burst=100, intents_per_second=1, intent_burst=1)
+        for i in range(2):
+            with limiter.limit(TNCOClientRequest(method='POST', endpoint='api/intent/createAssembly')):
+                pass
+        for i in range(5):
+            with limiter.limit(TNCOClientRequest(method='GET', endpoint='api/topology/assemblies')):
+                pass
+        stats = limiter.stats()
+        self.assertEqual(stats['intents'].requests, 2)
+        self.assertEqual(stats['intents'].waits, 1)
+        self.assertAlmostEqual(stats['intents'].total_wait, 1, places=1)
+        self.assertEqual(stats['requests'].requests, 5)
+        self.assertEqual(stats['requests'].waits, 0)
+        self.assertNotIn('in_flight', stats)
+
+    def test_max_in_flight(self):
+        limiter = RateLimiter(max_in_flight=2)
+        lock = threading.Lock()
+        in_flight = {'current': 0, 'max': 0}
+        def send():
+            with limiter.limit(TNCOClientRequest(method='GET', endpoint='api/test')):
+                with lock:
+                    in_flight['current'] += 1
+                    in_flight['max'] = max(in_flight['max'], in_flight['current'])
+                time.sleep(0.05)
+                with lock:
+                    in_flight['current'] -= 1
+        threads = [threading.Thread(target=send) for i in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(in_flight['max'], 2)
+        stats = limiter.stats()['in_flight']
+        self.assertEqual(stats.requests, 6)
+        self.assertGreater(stats.waits, 0)
+        self.assertGreater(stats.max_wait, 0)
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_client_enforces_limits(self, requests_session_builder):
+        limiter = MagicMock()
+        client = TNCOClient('https://test.example.com', rate_limiter=limiter)
+        request = TNCOClientRequest(method='GET', endpoint='api/test')
+        client.make_request(request)
+        limiter.limit.assert_called_once_with(request)
+        limiter.limit.return_value.__enter__.assert_called_once()
+        limiter.limit.return_value.__exit__.assert_called_once()
+
+    def test_client_rate_limit_stats(self):
+        self.assertEqual(TNCOClient('https://test.example.com').rate_limit_stats, {})
+        client = TNCOClient('https://test.example.com', rate_limiter=RateLimiter(requests_per_second=5))
+        self.assertEqual(list(client.rate_limit_stats.keys()), ['requests'])
@@ -0,0 +1,136 @@
+import unittest
+import json
+import time
+import shutil
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from unittest.mock import MagicMock
+from lmctl.client import TNCOClient, TNCOClientRequest, ResponseCache, FileResponseStore
+
+class CatalogHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    etag = '"v1"'
+    requests_received = []
+
+    def _send(self, status: int, body: bytes = b'', headers: dict = None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.requests_received.append(('GET', self.path, self.headers.get('If-None-Match')))
+        if self.headers.get('If-None-Match') == self.etag:
+            self._send(304, headers={'ETag': self.etag})
+            return
+        body = json.dumps({'path': self.path, 'etag': self.etag}).encode('utf-8')
+        self._send(200, body, headers={'Content-Type': 'application/json', 'ETag': self.etag})
+
+    def do_PUT(self):
+        self.requests_received.append((self.command, self.path, None))
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self._send(200)
+
+    do_DELETE = do_PUT
+
+    def log_message(self, format, *args):
+        pass
+
+def get_descriptor(name: str = 'assembly::A::1.0') -> TNCOClientRequest:
+    return TNCOClientRequest.build_request_for_json(endpoint=f'api/catalog/descriptors/{name}')
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        CatalogHandler.requests_received = []
+        CatalogHandler.etag = '"v1"'
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), CatalogHandler)
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+        self.address = f'http://127.0.0.1:{self.server.server_port}'
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_fresh_response_served_from_cache(self):
+        client = TNCOClient(self.address, response_cache=ResponseCache())
+        first = client.make_request_for_json(get_descriptor())
+        second = client.make_request_for_json(get_descriptor())
+        self.assertEqual(first, second)
+        self.assertEqual(len(CatalogHandler.requests_received), 1)
+
+    def test_uncached_endpoints(self):
+        client = TNCOClient(self.address, response_cache=ResponseCache())
+        for i in range(2):
+            client.make_request_for_json(TNCOClientRequest.build_request_for_json(endpoint='api/processes/123'))
+        self.assertEqual(len(CatalogHandler.requests_received), 2)
+
+    def test_query_params_and_accept_are_part_of_key(self):
+        client = TNCOClient(self.address, response_cache=ResponseCache())
+        client.make_request(TNCOClientRequest.build_request_for_json(endpoint='api/catalog/descriptors', query_params={'a': '1'}))
+        client.make_request(TNCOClientRequest.build_request_for_json(endpoint='api/catalog/descriptors', query_params={'a': '2'}))
+        client.make_request(TNCOClientRequest(method='GET', endpoint='api/catalog/descriptors', query_params={'a': '2'}, headers={'Accept': 'application/yaml'}))
+        self.assertEqual(len(CatalogHandler.requests_received), 3)
+
+    def test_expired_response_revalidated(self):
+        client = TNCOClient(self.address, response_cache=ResponseCache(ttls=[(r'^api/catalog/', 0)]))
+        first = client.make_request_for_json(get_descriptor())
+        second = client.make_request_for_json(get_descriptor())
+        self.assertEqual(first, second)
+        self.assertEqual(CatalogHandler.requests_received[1], ('GET', '/api/catalog/descriptors/assembly::A::1.0', '"v1"'))
+        CatalogHandler.etag = '"v2"'
+        third = client.make_request_for_json(get_descriptor())
+        self.assertEqual(third['etag'], '"v2"')
+
+    def test_write_invalidates_resource_and_collection(self):
+        client = TNCOClient(self.address, response_cache=ResponseCache())
+        client.make_request(get_descriptor())
+        client.make_request(TNCOClientRequest.build_request_for_json(endpoint='api/catalog/descriptors'))
+        client.make_request(get_descriptor('assembly::B::1.0'))
+        client.make_request(TNCOClientRequest(method='PUT', endpoint='api/catalog/descriptors/assembly::A::1.0', body='{}'))
+        CatalogHandler.requests_received = []
+        client.make_request(get_descriptor())
+        client.make_request(TNCOClientRequest.build_request_for_json(endpoint='api/catalog/descriptors'))
+        client.make_request(get_descriptor('assembly::B::1.0'))
+        self.assertEqual([path for method, path, etag in CatalogHandler.requests_received], ['/api/catalog/descriptors/assembly::A::1.0', '/api/catalog/descriptors'])
+
+    def test_auth_scope_is_part_of_key(self):
+        cache = ResponseCache()
+        def build_auth(client_id):
+            auth = MagicMock()
+            auth.token_cache_key_parts.return_value = ('oauth', client_id, 'secret')
+            return auth
+        client_a = TNCOClient(self.address, auth_type=build_auth('a'), response_cache=cache)
+        client_a.get_access_token = MagicMock(return_value='123')
+        client_b = TNCOClient(self.address, auth_type=build_auth('b'), response_cache=cache)
+        client_b.get_access_token = MagicMock(return_value='456')
+        client_a.make_request(get_descriptor())
+        client_b.make_request(get_descriptor())
+        client_a.make_request(get_descriptor())
+        self.assertEqual(len(CatalogHandler.requests_received), 2)
+
+    def test_file_store_shared_between_clients(self):
+        store = FileResponseStore(directory=self.tmp_dir)
+        TNCOClient(self.address, response_cache=ResponseCache(store=store)).make_request_for_json(get_descriptor())
+        response = TNCOClient(self.address, response_cache=ResponseCache(store=store)).make_request_for_json(get_descriptor())
+        self.assertEqual(response['path'], '/api/catalog/descriptors/assembly::A::1.0')
+        self.assertEqual(len(CatalogHandler.requests_received), 1)
+        TNCOClient(self.address, response_cache=ResponseCache(store=store)).make_request(TNCOClientRequest(method='DELETE', endpoint='api/catalog/descriptors/assembly::A::1.0'))
+        self.assertEqual(list(store.directory.glob('*.json')), [])
+
+    def test_lru_evicts_least_recently_used(self):
+        cache = ResponseCache(max_entries=2)
+        response = MagicMock(status_code=200, content=b'{}', headers={})
+        cache.put('a', 'https://test/api/a', response, ttl=60)
+        cache.put('b', 'https://test/api/b', response, ttl=60)
+        cache.get('a')
+        cache.put('c', 'https://test/api/c', response, ttl=60)
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('c'))
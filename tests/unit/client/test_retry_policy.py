@@ -0,0 +1,93 @@
+import unittest
+import io
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock
+from lmctl.client import TNCOClientRequest, RetryPolicy, RetryBudget
+
+def mock_response(status_code: int, headers: dict = None):
+    return MagicMock(status_code=status_code, headers=headers or {})
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_idempotent_methods_are_retryable(self):
+        policy = RetryPolicy()
+        for method in ['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'get']:
+            self.assertTrue(policy.is_retryable_request(TNCOClientRequest(method=method, endpoint='api/test')), msg=method)
+        self.assertFalse(policy.is_retryable_request(TNCOClientRequest(method='POST', endpoint='api/catalog/descriptors')))
+        self.assertFalse(policy.is_retryable_request(TNCOClientRequest(method='PATCH', endpoint='api/test')))
+
+    def test_token_requests_are_retryable(self):
+        policy = RetryPolicy()
+        self.assertTrue(policy.is_retryable_request(TNCOClientRequest(method='POST', endpoint='oauth/token')))
+        self.assertTrue(policy.is_retryable_request(TNCOClientRequest(method='POST', endpoint='ui/api/login')))
+
+    def test_intents_retryable_only_when_enabled(self):
+        request = TNCOClientRequest(method='POST', endpoint='api/intent/createAssembly')
+        self.assertFalse(RetryPolicy().is_retryable_request(request))
+        self.assertTrue(RetryPolicy(retry_intents=True).is_retryable_request(request))
+
+    def test_request_marked_retryable_overrides_classification(self):
+        policy = RetryPolicy()
+        self.assertTrue(policy.is_retryable_request(TNCOClientRequest(method='POST', endpoint='api/intent/createAssembly').set_retryable()))
+        self.assertFalse(policy.is_retryable_request(TNCOClientRequest(method='GET', endpoint='api/test').set_retryable(False)))
+
+    def test_streamed_body_not_retryable(self):
+        policy = RetryPolicy()
+        self.assertFalse(policy.is_retryable_request(TNCOClientRequest(method='PUT', endpoint='api/test', body=io.BytesIO(b'data')).set_retryable()))
+        self.assertFalse(policy.is_retryable_request(TNCOClientRequest(method='PUT', endpoint='api/test', files={'file': ('pkg.zip', io.BytesIO(b'data'))})))
+
+    def test_get_retry_delay_on_transient_status(self):
+        policy = RetryPolicy(backoff_base=1, backoff_max=5)
+        request = TNCOClientRequest(method='GET', endpoint='api/test')
+        for attempt in range(3):
+            delay = policy.get_retry_delay(request, attempt, response=mock_response(503))
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(5, 2 ** attempt))
+        self.assertIsNone(policy.get_retry_delay(request, 3, response=mock_response(503)))
+        self.assertIsNone(policy.get_retry_delay(request, 0, response=mock_response(500)))
+        self.assertIsNone(policy.get_retry_delay(request, 0, response=mock_response(404)))
+
+    def test_get_retry_delay_on_connection_error(self):
+        policy = RetryPolicy()
+        self.assertIsNotNone(policy.get_retry_delay(TNCOClientRequest(method='GET', endpoint='api/test'), 0, error=ConnectionError()))
+        self.assertIsNone(policy.get_retry_delay(TNCOClientRequest(method='POST', endpoint='api/intent/createAssembly'), 0, error=ConnectionError()))
+
+    def test_get_retry_delay_honours_retry_after_seconds(self):
+        policy = RetryPolicy(backoff_base=0.001)
+        request = TNCOClientRequest(method='GET', endpoint='api/test')
+        self.assertEqual(policy.get_retry_delay(request, 0, response=mock_response(429, {'Retry-After': '7'})), 7)
+
+    def test_get_retry_delay_honours_retry_after_date(self):
+        policy = RetryPolicy(backoff_base=0.001)
+        request = TNCOClientRequest(method='GET', endpoint='api/test')
+        retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+        delay = policy.get_retry_delay(request, 0, response=mock_response(503, {'Retry-After': retry_at}))
+        self.assertGreater(delay, 25)
+        self.assertLessEqual(delay, 30)
+
+    def test_get_retry_delay_gives_up_when_retry_after_too_long(self):
+        policy = RetryPolicy(max_retry_after=60)
+        request = TNCOClientRequest(method='GET', endpoint='api/test')
+        self.assertIsNone(policy.get_retry_delay(request, 0, response=mock_response(503, {'Retry-After': '120'})))
+
+    def test_get_retry_delay_limited_by_budget(self):
+        policy = RetryPolicy(budget=RetryBudget(ratio=0.5, min_retries=1))
+        request = TNCOClientRequest(method='GET', endpoint='api/test')
+        self.assertIsNotNone(policy.get_retry_delay(request, 0, response=mock_response(503)))
+        self.assertIsNone(policy.get_retry_delay(request, 0, response=mock_response(503)))
+        policy.budget.record_request()
+        policy.budget.record_request()
+        self.assertIsNotNone(policy.get_retry_delay(request, 0, response=mock_response(503)))
+
+
+class TestRetryBudget(unittest.TestCase):
+
+    def test_balance_capped(self):
+        budget = RetryBudget(ratio=1, min_retries=2, max_balance=3)
+        for i in range(10):
+            budget.record_request()
+        self.assertEqual(budget.balance, 3)
+        for i in range(3):
+            self.assertTrue(budget.try_withdraw())
+        self.assertFalse(budget.try_withdraw())
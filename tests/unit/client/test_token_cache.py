@@ -0,0 +1,100 @@
+import unittest
+import tempfile
+import shutil
+import os
+import threading
+import time
+from lmctl.client import TNCOClient, FileTokenCache
+from lmctl.client.token_cache import token_cache_key
+from .token_helper import build_a_token, FakeTNCOAuth
+
+class CountingAuth(FakeTNCOAuth):
+
+    def __init__(self, token=None, delay=0):
+        super().__init__(token=token)
+        self.calls = 0
+        self.delay = delay
+
+    def handle(self, *args, **kwargs):
+        self.calls += 1
+        time.sleep(self.delay)
+        return super().handle(*args, **kwargs)
+
+    def token_cache_key_parts(self):
+        return ('fake', 'user')
+
+class TestFileTokenCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp(prefix='lmctl-test')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_put_and_get(self):
+        cache = FileTokenCache(directory=self.tmp_dir)
+        token = build_a_token(expires_in=600)
+        cache.put('abc', token)
+        self.assertEqual(cache.get('abc'), token)
+        self.assertEqual(FileTokenCache(directory=self.tmp_dir).get('abc'), token)
+
+    def test_token_file_only_readable_by_user(self):
+        cache = FileTokenCache(directory=self.tmp_dir)
+        cache.put('abc', build_a_token(expires_in=600))
+        self.assertEqual(os.stat(os.path.join(self.tmp_dir, 'abc.json')).st_mode & 0o777, 0o600)
+
+    def test_get_missing(self):
+        cache = FileTokenCache(directory=self.tmp_dir)
+        self.assertIsNone(cache.get('abc'))
+
+    def test_get_ignores_tokens_close_to_expiry(self):
+        cache = FileTokenCache(directory=self.tmp_dir, min_validity=30)
+        cache.put('abc', build_a_token(expires_in=10))
+        self.assertIsNone(cache.get('abc'))
+
+    def test_get_ignores_unreadable_token(self):
+        cache = FileTokenCache(directory=self.tmp_dir)
+        with open(os.path.join(self.tmp_dir, 'abc.json'), 'w') as f:
+            f.write('not-json')
+        self.assertIsNone(cache.get('abc'))
+
+    def test_delete(self):
+        cache = FileTokenCache(directory=self.tmp_dir)
+        cache.put('abc', build_a_token(expires_in=600))
+        cache.delete('abc')
+        self.assertIsNone(cache.get('abc'))
+
+    def test_key_does_not_expose_secrets(self):
+        key = token_cache_key('https://test', 'ClientCredentialsAuth', 'oauth', 'client', 'secret')
+        self.assertNotIn('secret', key)
+        self.assertNotEqual(key, token_cache_key('https://test', 'ClientCredentialsAuth', 'oauth', 'client', 'other-secret'))
+
+    def test_clients_reuse_cached_token(self):
+        auth = CountingAuth(token=build_a_token(expires_in=600))
+        first_client = TNCOClient('https://test', auth_type=auth, token_cache=FileTokenCache(directory=self.tmp_dir))
+        second_client = TNCOClient('https://test', auth_type=auth, token_cache=FileTokenCache(directory=self.tmp_dir))
+        self.assertEqual(first_client.get_access_token(), auth.token)
+        self.assertEqual(second_client.get_access_token(), auth.token)
+        self.assertEqual(auth.calls, 1)
+
+    def test_clients_for_other_addresses_do_not_share_token(self):
+        auth = CountingAuth(token=build_a_token(expires_in=600))
+        TNCOClient('https://test', auth_type=auth, token_cache=FileTokenCache(directory=self.tmp_dir)).get_access_token()
+        TNCOClient('https://other', auth_type=auth, token_cache=FileTokenCache(directory=self.tmp_dir)).get_access_token()
+        self.assertEqual(auth.calls, 2)
+
+    def test_parallel_clients_authenticate_once(self):
+        auth = CountingAuth(token=build_a_token(expires_in=600), delay=0.1)
+        clients = [TNCOClient('https://test', auth_type=auth, token_cache=FileTokenCache(directory=self.tmp_dir)) for _ in range(5)]
+        threads = [threading.Thread(target=c.get_access_token) for c in clients]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(auth.calls, 1)
+
+    def test_auth_without_key_parts_is_not_cached(self):
+        auth = FakeTNCOAuth()
+        client = TNCOClient('https://test', auth_type=auth, token_cache=FileTokenCache(directory=self.tmp_dir))
+        client.get_access_token()
+        self.assertEqual([f for f in os.listdir(self.tmp_dir) if f.endswith('.json')], [])
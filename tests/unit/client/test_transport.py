@@ -0,0 +1,106 @@
+import unittest
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from unittest.mock import patch, MagicMock
+from lmctl.client import TNCOClient, TNCOClientRequest, TNCOClientTransport, client_builder
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = b'{}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class TestTNCOClientTransport(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+        self.address = f'http://127.0.0.1:{self.server.server_port}'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_connections_are_reused(self):
+        transport = TNCOClientTransport()
+        with TNCOClient(self.address, transport=transport) as client:
+            for _ in range(3):
+                client.make_request(TNCOClientRequest(method='GET', endpoint='api/test'))
+            stats = client.pool_stats
+        self.assertEqual(len(stats), 1)
+        host_stats = stats[f'http://127.0.0.1:{self.server.server_port}']
+        self.assertEqual(host_stats.connections_opened, 1)
+        self.assertEqual(host_stats.requests, 3)
+        self.assertEqual(host_stats.connections_reused, 2)
+        self.assertEqual(host_stats.idle_connections, 1)
+
+    def test_pool_stats_empty_before_first_request(self):
+        transport = TNCOClientTransport()
+        self.assertEqual(transport.pool_stats(), {})
+
+    def test_close_releases_pools(self):
+        transport = TNCOClientTransport()
+        transport.request('GET', f'{self.address}/api/test')
+        self.assertEqual(len(transport.pool_stats()), 1)
+        transport.close()
+        self.assertEqual(transport.pool_stats(), {})
+
+    @patch('lmctl.client.transport.requests.Session')
+    def test_keep_alive_disabled_closes_connections(self, requests_session_builder):
+        transport = TNCOClientTransport(keep_alive=False)
+        session = transport.session
+        self.assertEqual(session, requests_session_builder.return_value)
+        session.headers.__setitem__.assert_called_once_with('Connection', 'close')
+
+    @patch('lmctl.client.transport.HTTPAdapter')
+    @patch('lmctl.client.transport.requests.Session')
+    def test_session_mounts_bounded_adapter(self, requests_session_builder, adapter_init):
+        transport = TNCOClientTransport(pool_connections=3, pool_maxsize=5, pool_block=True)
+        session = transport.session
+        adapter_init.assert_called_once_with(pool_connections=3, pool_maxsize=5, pool_block=True)
+        session.mount.assert_any_call('https://', adapter_init.return_value)
+        session.mount.assert_any_call('http://', adapter_init.return_value)
+
+    @patch('lmctl.client.transport.requests.Session')
+    def test_session_created_once_for_concurrent_threads(self, requests_session_builder):
+        def build_session():
+            time.sleep(0.05)
+            return MagicMock()
+        requests_session_builder.side_effect = build_session
+        transport = TNCOClientTransport()
+        sessions = []
+        threads = [threading.Thread(target=lambda: sessions.append(transport.session)) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        requests_session_builder.assert_called_once()
+        self.assertEqual(len(set(id(s) for s in sessions)), 1)
+
+    def test_requests_from_threads_share_pool(self):
+        transport = TNCOClientTransport(pool_maxsize=2, pool_block=True)
+        with TNCOClient(self.address, transport=transport) as client:
+            threads = [threading.Thread(target=client.make_request, args=(TNCOClientRequest(method='GET', endpoint='api/test'),)) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            stats = client.pool_stats
+        host_stats = stats[f'http://127.0.0.1:{self.server.server_port}']
+        self.assertEqual(host_stats.requests, 8)
+        self.assertLessEqual(host_stats.connections_opened, 2)
+
+    def test_builder_configures_connection_pool(self):
+        client = client_builder().address(self.address).connection_pool(pool_maxsize=4, keep_alive=False).build()
+        self.assertEqual(client.transport.pool_maxsize, 4)
+        self.assertFalse(client.transport.keep_alive)
@@ -0,0 +1,56 @@
+import unittest
+import requests
+from unittest.mock import MagicMock
+from lmctl.client import TNCOClient, TNCOClientError, TNCOClientHttpError
+from lmctl.drivers.lm import LmDescriptorDriver, LmDriverException, NotFoundException
+
+class TestLmDriver(unittest.TestCase):
+
+    def _build_client(self):
+        client = MagicMock(spec=TNCOClient)
+        return client
+
+    def test_request_sent_through_client(self):
+        client = self._build_client()
+        client.make_request.return_value = MagicMock(status_code=201)
+        security_ctrl = MagicMock()
+        security_ctrl.add_access_headers.side_effect = lambda headers: {**headers, 'Authorization': 'Bearer 123'}
+        driver = LmDescriptorDriver('https://test:80', security_ctrl, client=client)
+        driver.create_descriptor('name: assembly::test::1.0', object_group_id='abc')
+        request = client.make_request.call_args[0][0]
+        self.assertEqual(request.method, 'POST')
+        self.assertEqual(request.override_address, 'https://test:80/api/catalog/descriptors')
+        self.assertEqual(request.headers, {'Content-Type': 'application/yaml', 'Authorization': 'Bearer 123'})
+        self.assertEqual(request.query_params, {'objectGroupId': 'abc'})
+        self.assertEqual(request.body, 'name: assembly::test::1.0')
+
+    def test_json_body(self):
+        client = self._build_client()
+        client.make_request.return_value = MagicMock(status_code=200)
+        driver = LmDescriptorDriver('https://test:80', client=client)
+        driver._request('PUT', 'https://test:80/api/test', json={'name': 'test'})
+        request = client.make_request.call_args[0][0]
+        self.assertEqual(request.body, {'name': 'test'})
+        self.assertEqual(request.headers, {'Content-Type': 'application/json'})
+
+    def test_http_error_status_handled_by_driver(self):
+        client = self._build_client()
+        response = MagicMock(status_code=404, headers={})
+        client.make_request.side_effect = TNCOClientHttpError('Mock error', requests.HTTPError('Not found', response=response))
+        driver = LmDescriptorDriver('https://test:80', client=client)
+        with self.assertRaises(NotFoundException) as context:
+            driver.get_descriptor('assembly::test::1.0')
+        self.assertEqual(str(context.exception), 'No descriptor with name assembly::test::1.0')
+
+    def test_connection_error_raises_driver_exception(self):
+        client = self._build_client()
+        client.make_request.side_effect = TNCOClientError('Mock connection error')
+        driver = LmDescriptorDriver('https://test:80', client=client)
+        with self.assertRaises(LmDriverException) as context:
+            driver.get_descriptor('assembly::test::1.0')
+        self.assertEqual(str(context.exception), 'Request to https://test:80/api/catalog/descriptors/assembly::test::1.0 failed: Mock connection error')
+
+    def test_creates_client_when_not_provided(self):
+        driver = LmDescriptorDriver('https://test:80')
+        self.assertIsInstance(driver.client, TNCOClient)
+        self.assertEqual(driver.client.address, 'https://test:80')
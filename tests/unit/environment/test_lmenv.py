@@ -1,9 +1,11 @@
 import unittest
 import unittest.mock as mock
 import os
+import time
+import threading
 from pydantic import ValidationError
 from lmctl.environment import TNCOEnvironment, LmSessionConfig, LmSession, ALLOW_ALL_SCHEMES_ENV_VAR
-from lmctl.client import TNCOClient, LegacyUserPassAuth, UserPassAuth, ClientCredentialsAuth, JwtTokenAuth, ZenAPIKeyAuth, OktaUserPassAuth
+from lmctl.client import TNCOClient, LegacyUserPassAuth, UserPassAuth, ClientCredentialsAuth, JwtTokenAuth, ZenAPIKeyAuth, OktaUserPassAuth, FileTokenCache, RetryPolicy, RateLimiter, ResponseCache, FileResponseStore
 
 class TestTNCOEnvironment(unittest.TestCase):
     maxDiff = None
@@ -223,6 +225,62 @@ class TestTNCOEnvironment(unittest.TestCase):
         self.assertEqual(client.address, 'https://test:80/gateway')
         self.assertEqual(client.kami_address, 'http://test:31289')
 
+    def test_build_client_configures_connection_pool(self):
+        config = TNCOEnvironment(address='https://testing', pool_size=25, keep_alive=False)
+        client = config.build_client()
+        self.assertEqual(client.transport.pool_maxsize, 25)
+        self.assertFalse(client.transport.keep_alive)
+
+    def test_build_client_default_connection_pool(self):
+        config = TNCOEnvironment(address='https://testing')
+        client = config.build_client()
+        self.assertEqual(client.transport.pool_maxsize, 10)
+        self.assertTrue(client.transport.keep_alive)
+
+    def test_build_client_uses_token_cache_by_default(self):
+        config = TNCOEnvironment(address='https://testing')
+        client = config.build_client()
+        self.assertIsInstance(client.token_cache, FileTokenCache)
+
+    def test_build_client_token_cache_disabled(self):
+        config = TNCOEnvironment(address='https://testing', token_cache=False)
+        client = config.build_client()
+        self.assertIsNone(client.token_cache)
+
+    def test_build_client_uses_retry_policy_by_default(self):
+        config = TNCOEnvironment(address='https://testing')
+        client = config.build_client()
+        self.assertIsInstance(client.retry_policy, RetryPolicy)
+        self.assertEqual(client.retry_policy.max_retries, 3)
+
+    def test_build_client_retries_disabled(self):
+        config = TNCOEnvironment(address='https://testing', retries=0)
+        client = config.build_client()
+        self.assertIsNone(client.retry_policy)
+
+    def test_build_client_without_rate_limits(self):
+        config = TNCOEnvironment(address='https://testing')
+        client = config.build_client()
+        self.assertIsNone(client.rate_limiter)
+
+    def test_build_client_with_rate_limits(self):
+        config = TNCOEnvironment(address='https://testing', rate_limit=20, intent_rate_limit=2, intent_rate_limit_burst=4, max_in_flight=5)
+        client = config.build_client()
+        self.assertIsInstance(client.rate_limiter, RateLimiter)
+        self.assertEqual(client.rate_limiter.max_in_flight, 5)
+        self.assertEqual(list(client.rate_limit_stats.keys()), ['requests', 'intents', 'in_flight'])
+
+    def test_build_client_without_response_cache_by_default(self):
+        config = TNCOEnvironment(address='https://testing')
+        client = config.build_client()
+        self.assertIsNone(client.response_cache)
+
+    def test_build_client_with_response_cache(self):
+        config = TNCOEnvironment(address='https://testing', response_cache=True)
+        client = config.build_client()
+        self.assertIsInstance(client.response_cache, ResponseCache)
+        self.assertIsInstance(client.response_cache.store, FileResponseStore)
+
     def test_build_client_legacy_auth(self):
         config = TNCOEnvironment(
                          address='https://testing',
@@ -462,11 +520,42 @@ class TestLmSession(unittest.TestCase):
         mock_client_builder.client_credentials_auth.assert_not_called()
         mock_client_builder.zen_api_key_auth.assert_called_once_with(username='user', api_key='123', zen_auth_address='https://zen:81')
 
+    def test_drivers_share_client(self):
+        session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', pool_size=5), None, auth_mode='oauth'))
+        self.assertEqual(session.client.address, 'https://test:80')
+        self.assertEqual(session.client.transport.pool_maxsize, 5)
+        self.assertIs(session.descriptor_driver.client, session.client)
+        self.assertIs(session.behaviour_driver.client, session.client)
+        self.assertIs(session.descriptor_template_driver.client, session.client)
+
+    @mock.patch('lmctl.environment.lmenv.TNCOClient')
+    @mock.patch('lmctl.environment.lmenv.lm_drivers.LmSecurityCtrl')
+    def test_client_and_security_ctrl_created_once_for_concurrent_threads(self, mock_security_ctrl_init, mock_client_init):
+        def slow_init(*args, **kwargs):
+            # Widen the window in which a second thread could also create one
+            time.sleep(0.05)
+            return mock.MagicMock()
+        mock_client_init.side_effect = slow_init
+        mock_security_ctrl_init.side_effect = slow_init
+        session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', secure=True, username='user', password='secret', auth_host='auth'), 'user', password='secret', auth_mode='oauth'))
+        threads = [threading.Thread(target=lambda: session.descriptor_driver) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(mock_client_init.call_count, 1)
+        self.assertEqual(mock_security_ctrl_init.call_count, 1)
+
+    def test_shared_client_has_no_response_cache(self):
+        # Driver requests carry their own auth, so cannot be cached safely by the client
+        session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', response_cache=True), None, auth_mode='oauth'))
+        self.assertIsNone(session.client.response_cache)
+
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmDescriptorDriver')
     def test_descriptor_driver(self, descriptor_driver_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https'), None, auth_mode='oauth'))
         driver = session.descriptor_driver
-        descriptor_driver_init.assert_called_once_with('https://test:80', None)
+        descriptor_driver_init.assert_called_once_with('https://test:80', None, client=session.client)
         self.assertEqual(driver, descriptor_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmSecurityCtrl')
@@ -474,15 +563,15 @@ class TestLmSession(unittest.TestCase):
     def test_descriptor_driver_with_security(self, descriptor_driver_init, mock_security_ctrl_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', secure=True, username='user', auth_host='auth', auth_port=81, auth_protocol='https'), 'user', 'secret', auth_mode='oauth'))
         driver = session.descriptor_driver
-        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None)
-        descriptor_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value)
+        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None, transport=session.client.transport, token_cache=session.client.token_cache)
+        descriptor_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value, client=session.client)
         self.assertEqual(driver, descriptor_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmOnboardRmDriver')
     def test_onboard_rm_driver(self, onboard_rm_driver_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https'), None))
         driver = session.onboard_rm_driver
-        onboard_rm_driver_init.assert_called_once_with('https://test:80', None)
+        onboard_rm_driver_init.assert_called_once_with('https://test:80', None, client=session.client)
         self.assertEqual(driver, onboard_rm_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmSecurityCtrl')
@@ -490,15 +579,15 @@ class TestLmSession(unittest.TestCase):
     def test_onboard_rm_driver_with_security(self, onboard_rm_driver_init, mock_security_ctrl_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', secure=True, username='user', auth_host='auth', auth_port=81, auth_protocol='https'), 'user', 'secret', auth_mode='oauth'))
         driver = session.onboard_rm_driver
-        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None)
-        onboard_rm_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value)
+        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None, transport=session.client.transport, token_cache=session.client.token_cache)
+        onboard_rm_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value, client=session.client)
         self.assertEqual(driver, onboard_rm_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmTopologyDriver')
     def test_topology_driver(self, topology_driver_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https'), None))
         driver = session.topology_driver
-        topology_driver_init.assert_called_once_with('https://test:80', None)
+        topology_driver_init.assert_called_once_with('https://test:80', None, client=session.client)
         self.assertEqual(driver, topology_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmSecurityCtrl')
@@ -506,15 +595,15 @@ class TestLmSession(unittest.TestCase):
     def test_topology_driver_with_security(self, topology_driver_init, mock_security_ctrl_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', secure=True, username='user', auth_host='auth', auth_port=81, auth_protocol='https'), 'user', 'secret', auth_mode='oauth'))
         driver = session.topology_driver
-        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None)
-        topology_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value)
+        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None, transport=session.client.transport, token_cache=session.client.token_cache)
+        topology_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value, client=session.client)
         self.assertEqual(driver, topology_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmBehaviourDriver')
     def test_behaviour_driver(self, behaviour_driver_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https'), None))
         driver = session.behaviour_driver
-        behaviour_driver_init.assert_called_once_with('https://test:80', None)
+        behaviour_driver_init.assert_called_once_with('https://test:80', None, client=session.client)
         self.assertEqual(driver, behaviour_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmSecurityCtrl')
@@ -522,15 +611,15 @@ class TestLmSession(unittest.TestCase):
     def test_behaviour_driver_with_security(self, behaviour_driver_init, mock_security_ctrl_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', secure=True, username='user', auth_host='auth', auth_port=81, auth_protocol='https'), 'user', 'secret', auth_mode='oauth'))
         driver = session.behaviour_driver
-        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None)
-        behaviour_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value)
+        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None, transport=session.client.transport, token_cache=session.client.token_cache)
+        behaviour_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value, client=session.client)
         self.assertEqual(driver, behaviour_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmDeploymentLocationDriver')
     def test_deployment_location_driver(self, deployment_location_driver_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https'), None))
         driver = session.deployment_location_driver
-        deployment_location_driver_init.assert_called_once_with('https://test:80', None)
+        deployment_location_driver_init.assert_called_once_with('https://test:80', None, client=session.client)
         self.assertEqual(driver, deployment_location_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmSecurityCtrl')
@@ -538,15 +627,15 @@ class TestLmSession(unittest.TestCase):
     def test_deployment_location_driver_with_security(self, deployment_location_driver_init, mock_security_ctrl_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', secure=True, username='user', auth_host='auth', auth_port=81, auth_protocol='https'), 'user', 'secret', auth_mode='oauth'))
         driver = session.deployment_location_driver
-        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None)
-        deployment_location_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value)
+        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None, transport=session.client.transport, token_cache=session.client.token_cache)
+        deployment_location_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value, client=session.client)
         self.assertEqual(driver, deployment_location_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmInfrastructureKeysDriver')
     def test_infrastructure_keys_driver(self, infrastructure_keys_driver_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https'), None))
         driver = session.infrastructure_keys_driver
-        infrastructure_keys_driver_init.assert_called_once_with('https://test:80', None)
+        infrastructure_keys_driver_init.assert_called_once_with('https://test:80', None, client=session.client)
         self.assertEqual(driver, infrastructure_keys_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmSecurityCtrl')
@@ -554,6 +643,6 @@ class TestLmSession(unittest.TestCase):
     def test_infrastructure_keys_driver_with_security(self, infrastructure_keys_driver_init, mock_security_ctrl_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', secure=True, username='user', auth_host='auth', auth_port=81, auth_protocol='https'), 'user', 'secret', auth_mode='oauth'))
         driver = session.infrastructure_keys_driver
-        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None)
-        infrastructure_keys_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value)
+        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None, transport=session.client.transport, token_cache=session.client.token_cache)
+        infrastructure_keys_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value, client=session.client)
         self.assertEqual(driver, infrastructure_keys_driver_init.return_value)
@@ -3,8 +3,10 @@ import tempfile
 import tarfile
 import shutil
 import os
+import zipfile
+from unittest.mock import patch, MagicMock
 from tests.common.project_testing import ProjectSimTestCase, PKG_META_YML_FILE, PKG_DEPRECATED_CONTENT_DIR, ASSEMBLY_DESCRIPTOR_DIR
-from lmctl.project.package.core import Pkg, PkgContent
+from lmctl.project.package.core import Pkg, PkgContent, PushOptions
 
 class TestPkg(ProjectSimTestCase):
 
@@ -91,4 +93,41 @@ class TestPkg(ProjectSimTestCase):
         self.assertEqual(second_include.name, 'sub_basic-contains_basic')
         self.assertEqual(second_include.descriptor_name, 'resource::sub_basic-contains_basic::1.0')
         self.assertEqual(second_include.resource_manager, 'brent')
-        
+
+    def test_inspect_does_not_extract_pkg(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_basic()
+        pkg = Pkg(pkg_sim.path)
+        with patch.object(Pkg, 'extract') as mock_extract:
+            inspection_report = pkg.inspect()
+        mock_extract.assert_not_called()
+        self.assertEqual(inspection_report.name, 'basic')
+
+    def test_read_meta(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_contains_brent_basic()
+        pkg = Pkg(pkg_sim.path)
+        meta = pkg.read_meta()
+        self.assertEqual(meta.name, 'contains_basic')
+        self.assertEqual(len(meta.subpkgs), 1)
+
+    def test_read_meta_of_pkg_with_deprecated_meta_file(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_old_style()
+        pkg = Pkg(pkg_sim.path)
+        meta = pkg.read_meta()
+        self.assertEqual(meta.name, 'old_style')
+
+    def test_push_etsi_ns_pkg_does_not_extract_pkg(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        pkg_path = os.path.join(tmp_dir, 'etsi_basic.zip')
+        with zipfile.ZipFile(pkg_path, 'w') as pkg_zip:
+            pkg_zip.writestr('lmpkg.yml', 'schema: 2.0\nname: etsi_basic\nversion: 1.0\ntype: ETSI_NS\n')
+            pkg_zip.writestr('Definitions/assembly.yml', 'name: assembly::etsi_basic::1.0\n')
+        env_sessions = MagicMock()
+        pkg = Pkg(pkg_path)
+        with patch.object(Pkg, 'extract') as mock_extract:
+            pkg_content = pkg.push(env_sessions, PushOptions())
+        mock_extract.assert_not_called()
+        self.assertIsNone(pkg_content)
+        pkg_driver = env_sessions.lm.pkg_mgmt_driver
+        pkg_driver.delete_nsd_package.assert_called_once_with('assembly::etsi_basic::1.0')
+        pkg_driver.onboard_nsd_package.assert_called_once_with('assembly::etsi_basic::1.0', pkg_path, object_group_id=None)
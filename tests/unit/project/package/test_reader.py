@@ -0,0 +1,90 @@
+import unittest
+import tempfile
+import tarfile
+import zipfile
+import shutil
+import os
+from lmctl.project.package.reader import PkgReader, PkgReadError
+
+class TestPkgReader(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.content_dir = os.path.join(self.tmp_dir, 'content')
+        self.__write('lmpkg.yml', 'name: basic\n')
+        self.__write(os.path.join('Definitions', 'assembly.yaml'), 'name: assembly::basic::1.0\n')
+        self.__write(os.path.join('Definitions', 'other.yaml'), 'name: other\n')
+        self.__write(os.path.join('Files', 'image.qcow2'), 'not really an image')
+
+    def tearDown(self):
+        if os.path.exists(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+
+    def __write(self, relative_path, content):
+        path = os.path.join(self.content_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+
+    def __members(self):
+        return ['lmpkg.yml', 'Definitions/assembly.yaml', 'Definitions/other.yaml', 'Files/image.qcow2']
+
+    def _build_tgz(self, arcname_prefix=''):
+        path = os.path.join(self.tmp_dir, 'pkg.tgz')
+        with tarfile.open(path, mode='w:gz') as tar:
+            for member in self.__members():
+                tar.add(os.path.join(self.content_dir, member), arcname=arcname_prefix + member)
+        return path
+
+    def _build_csar(self):
+        path = os.path.join(self.tmp_dir, 'pkg.csar')
+        with zipfile.ZipFile(path, mode='w') as csar:
+            for member in self.__members():
+                csar.write(os.path.join(self.content_dir, member), arcname=member)
+        return path
+
+    def test_read_text_from_tgz(self):
+        with PkgReader(self._build_tgz()) as reader:
+            self.assertEqual(reader.read_text('lmpkg.yml'), 'name: basic\n')
+            self.assertEqual(reader.read_text('Definitions/assembly.yaml'), 'name: assembly::basic::1.0\n')
+
+    def test_read_text_from_csar(self):
+        with PkgReader(self._build_csar()) as reader:
+            self.assertEqual(reader.read_text('lmpkg.yml'), 'name: basic\n')
+            self.assertEqual(reader.read_text('Definitions/assembly.yaml'), 'name: assembly::basic::1.0\n')
+
+    def test_read_ignores_leading_dot_directory(self):
+        with PkgReader(self._build_tgz(arcname_prefix='./')) as reader:
+            self.assertTrue(reader.has('lmpkg.yml'))
+            self.assertEqual(reader.read_text('Definitions/other.yaml'), 'name: other\n')
+
+    def test_read_earlier_member_after_later(self):
+        with PkgReader(self._build_tgz()) as reader:
+            self.assertEqual(reader.read_text('Files/image.qcow2'), 'not really an image')
+            self.assertEqual(reader.read_text('lmpkg.yml'), 'name: basic\n')
+
+    def test_tgz_indexed_only_as_far_as_member_read(self):
+        with PkgReader(self._build_tgz()) as reader:
+            reader.read_text('lmpkg.yml')
+            self.assertFalse(reader._fully_indexed)
+            self.assertNotIn('Files/image.qcow2', reader._index)
+
+    def test_names_and_find(self):
+        for path in [self._build_tgz(), self._build_csar()]:
+            with PkgReader(path) as reader:
+                self.assertEqual(reader.names(), self.__members())
+                self.assertEqual(reader.find('Definitions/*.yaml'), ['Definitions/assembly.yaml', 'Definitions/other.yaml'])
+
+    def test_has_and_read_missing_member(self):
+        with PkgReader(self._build_tgz()) as reader:
+            self.assertFalse(reader.has('Descriptor/assembly.yml'))
+            with self.assertRaises(PkgReadError) as context:
+                reader.read('Descriptor/assembly.yml')
+            self.assertIn('Could not find Descriptor/assembly.yml', str(context.exception))
+
+    def test_not_a_package(self):
+        path = os.path.join(self.tmp_dir, 'pkg.txt')
+        with open(path, 'w') as f:
+            f.write('Not a package')
+        with self.assertRaises(PkgReadError):
+            PkgReader(path)
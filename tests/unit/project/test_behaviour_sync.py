@@ -0,0 +1,71 @@
+import unittest
+import threading
+from unittest.mock import MagicMock
+from lmctl.project.behaviour_sync import BehaviourSync, SYNC_CREATE, SYNC_UPDATE, SYNC_UNCHANGED
+from lmctl.project.journal import BufferedProjectJournal
+from lmctl.drivers.lm.base import LmDriverException
+
+
+def scenario(name, configuration_ref=None, **fields):
+    actors = []
+    if configuration_ref is not None:
+        actors.append({'instanceName': 'A', 'provided': False, 'assemblyConfigurationRef': configuration_ref})
+    return dict({'name': name, 'stages': [], 'assemblyActors': actors}, **fields)
+
+
+class TestBehaviourSync(unittest.TestCase):
+
+    def setUp(self):
+        self.driver = MagicMock()
+        self.driver.get_assembly_configurations.return_value = []
+        self.driver.get_scenarios.return_value = []
+        self.journal = BufferedProjectJournal()
+
+    def test_sync_takes_one_snapshot_when_nothing_created(self):
+        self.driver.get_assembly_configurations.return_value = [
+            {'id': 'c1', 'name': 'configA', 'projectId': 'proj', 'properties': {'a': '1'}, 'createdAt': 'x', 'lastModifiedAt': 'y'}
+        ]
+        self.driver.get_scenarios.return_value = [{'id': 's1', 'name': 'scenarioA', 'projectId': 'proj'}]
+        actions = BehaviourSync(self.driver, 'proj', self.journal).sync(
+            [{'name': 'configA', 'properties': {'a': '1'}, 'createdAt': 'other'}], 
+            [scenario('scenarioA', configuration_ref='configA')]
+        )
+        self.assertEqual([(a.name, a.action) for a in actions], [('configA', SYNC_UNCHANGED), ('scenarioA', SYNC_UPDATE)])
+        self.driver.get_assembly_configurations.assert_called_once_with('proj')
+        self.driver.get_scenarios.assert_called_once_with('proj')
+        self.driver.update_assembly_configuration.assert_not_called()
+        self.driver.create_assembly_configuration.assert_not_called()
+        self.driver.update_scenario.assert_called_once_with({
+            'id': 's1', 'name': 'scenarioA', 'projectId': 'proj', 'stages': [],
+            'assemblyActors': [{'instanceName': 'A', 'provided': False, 'assemblyConfigurationId': 'c1'}]
+        })
+
+    def test_sync_reads_configurations_again_after_creating_any(self):
+        self.driver.get_assembly_configurations.side_effect = [
+            [],
+            [{'id': 'new1', 'name': 'configA', 'projectId': 'proj'}]
+        ]
+        actions = BehaviourSync(self.driver, 'proj', self.journal).sync([{'name': 'configA'}], [scenario('scenarioA', configuration_ref='configA')])
+        self.assertEqual([(a.name, a.action) for a in actions], [('configA', SYNC_CREATE), ('scenarioA', SYNC_CREATE)])
+        self.assertEqual(self.driver.get_assembly_configurations.call_count, 2)
+        self.driver.create_assembly_configuration.assert_called_once_with({'name': 'configA', 'projectId': 'proj'})
+        created_scenario = self.driver.create_scenario.call_args[0][0]
+        self.assertEqual(created_scenario['assemblyActors'][0]['assemblyConfigurationId'], 'new1')
+
+    def test_sync_sends_writes_at_once(self):
+        # Each write waits for all others to start, so the sync only completes if they are sent at once
+        barrier = threading.Barrier(3, timeout=5)
+        self.driver.create_scenario.side_effect = lambda s: barrier.wait()
+        actions = BehaviourSync(self.driver, 'proj', self.journal, max_workers=3).sync([], [scenario('a'), scenario('b'), scenario('c')])
+        self.assertEqual([a.action for a in actions], [SYNC_CREATE, SYNC_CREATE, SYNC_CREATE])
+        self.assertEqual(self.driver.create_scenario.call_count, 3)
+
+    def test_sync_raises_first_error_after_all_writes(self):
+        def create_scenario(s):
+            if s['name'] in ('b', 'c'):
+                raise LmDriverException('Failed {0}'.format(s['name']))
+        self.driver.create_scenario.side_effect = create_scenario
+        with self.assertRaises(LmDriverException) as context:
+            BehaviourSync(self.driver, 'proj', self.journal, max_workers=2).sync([], [scenario('a'), scenario('b'), scenario('c'), scenario('d')])
+        self.assertEqual(str(context.exception), 'Failed b')
+        self.assertEqual(self.driver.create_scenario.call_count, 4)
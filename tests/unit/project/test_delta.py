@@ -0,0 +1,46 @@
+import unittest
+from unittest.mock import MagicMock, call
+import lmctl.project.delta as push_delta
+
+
+class TestContentHash(unittest.TestCase):
+
+    def test_ignores_formatting_key_order_and_comments(self):
+        local = 'name: assembly::basic::1.0\ndescription: basic\nproperties:\n  a:\n    type: string\n'
+        remote = '# Generated\ndescription: "basic"\nproperties: {a: {type: string}}\nname: assembly::basic::1.0\n'
+        self.assertEqual(push_delta.content_hash(local), push_delta.content_hash(remote))
+
+    def test_changed_content_has_different_hash(self):
+        self.assertNotEqual(push_delta.content_hash('name: a\ndescription: old\n'), push_delta.content_hash('name: a\ndescription: new\n'))
+
+    def test_unparsable_content_compared_as_text(self):
+        self.assertEqual(push_delta.content_hash('a: [b\n'), push_delta.content_hash('  a: [b'))
+        self.assertNotEqual(push_delta.content_hash('a: [b\n'), push_delta.content_hash('a: [c\n'))
+
+    def test_is_unchanged(self):
+        self.assertTrue(push_delta.is_unchanged('name: a\n', 'name: "a"'))
+        self.assertFalse(push_delta.is_unchanged('name: a\n', 'name: b\n'))
+        self.assertFalse(push_delta.is_unchanged('name: a\n', None))
+
+
+class TestPushSummary(unittest.TestCase):
+
+    def test_report(self):
+        summary = push_delta.PushSummary()
+        summary.record(push_delta.DESCRIPTOR_TYPE, push_delta.PUSH_UNCHANGED)
+        summary.record(push_delta.DESCRIPTOR_TYPE, push_delta.PUSH_UPDATE)
+        summary.record('Scenario', push_delta.PUSH_CREATE)
+        summary.record('Scenario', push_delta.PUSH_CREATE)
+        self.assertEqual(summary.total(push_delta.PUSH_CREATE), 2)
+        self.assertEqual(summary.total(push_delta.PUSH_UNCHANGED), 1)
+        journal = MagicMock()
+        summary.report(journal)
+        journal.event.assert_has_calls([
+            call('Descriptor: 0 created, 1 updated, 1 unchanged'),
+            call('Scenario: 2 created, 0 updated, 0 unchanged')
+        ])
+
+    def test_report_nothing_pushed(self):
+        journal = MagicMock()
+        push_delta.PushSummary().report(journal)
+        journal.event.assert_called_once_with('Nothing pushed')
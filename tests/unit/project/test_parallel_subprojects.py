@@ -0,0 +1,33 @@
+import unittest
+from lmctl.project.journal import BufferedProjectJournal
+from lmctl.project.processes.common import SubprojectWork, ParallelSubprojectWorker
+
+
+class TestParallelSubprojectWorker(unittest.TestCase):
+
+    def work(self, name, worked, error=None, children=None):
+        def do_work(journal):
+            journal.event(f'Worked {name}')
+            if error is not None:
+                raise ValueError(error)
+            worked.append(name)
+            return children
+        return SubprojectWork(name, do_work)
+
+    def test_execute_works_children_after_parent(self):
+        worked = []
+        child = self.work('child', worked)
+        parent = self.work('parent', worked, children=[child])
+        ParallelSubprojectWorker(2, BufferedProjectJournal()).execute([parent, self.work('sibling', worked)])
+        self.assertEqual(sorted(worked), ['child', 'parent', 'sibling'])
+        self.assertLess(worked.index('parent'), worked.index('child'))
+
+    def test_execute_does_not_start_queued_work_after_failure(self):
+        worked = []
+        subproject_works = [self.work('sub_0', worked, error='Mock error')] + [self.work(f'sub_{i}', worked) for i in range(1, 10)]
+        journal = BufferedProjectJournal()
+        with self.assertRaises(ValueError) as context:
+            ParallelSubprojectWorker(1, journal).execute(subproject_works)
+        self.assertEqual(str(context.exception), 'Mock error')
+        self.assertEqual(worked, [])
+        self.assertFalse(any(subproject_work.started for subproject_work in subproject_works[1:]))
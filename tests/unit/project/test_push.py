@@ -0,0 +1,120 @@
+import unittest
+import threading
+import time
+from unittest.mock import MagicMock
+from lmctl.project.journal import BufferedProjectJournal, SubprojectEvent, SubprojectEndEvent, SectionEvent
+from lmctl.project.package.core import PushOptions
+from lmctl.project.handlers.interface import ContentHandlerError
+from lmctl.project.processes.push import PushProcess, PushProcessError
+
+
+class FakeHandler:
+
+    def __init__(self, name, pushed, on_push=None, error=None):
+        self.name = name
+        self.pushed = pushed
+        self.on_push = on_push
+        self.error = error
+
+    def push_content(self, journal, env_sessions, push_options):
+        if self.on_push is not None:
+            self.on_push()
+        journal.event(f'Pushed {self.name}')
+        if self.error is not None:
+            raise ContentHandlerError(self.error)
+        self.pushed.append(self.name)
+
+
+def fake_content(name, pushed, subcontents=None, on_push=None, error=None):
+    content = MagicMock()
+    content.meta.name = name
+    content.subcontents = subcontents or []
+    content.handler = FakeHandler(name, pushed, on_push=on_push, error=error)
+    return content
+
+
+def readable_entries(journal):
+    readable = []
+    for entry in journal.entries:
+        if isinstance(entry, SubprojectEvent):
+            readable.append(f'> {entry.to_readable()}')
+        elif isinstance(entry, SubprojectEndEvent):
+            readable.append(f'< {entry.to_readable()}')
+        elif isinstance(entry, SectionEvent):
+            readable.append(f'# {entry.to_readable()}')
+        else:
+            readable.append(entry.to_readable())
+    return readable
+
+
+class TestPushProcess(unittest.TestCase):
+
+    def build_tree(self, pushed, **kwargs):
+        nested = fake_content('nested', pushed, **kwargs.get('nested', {}))
+        sub_a = fake_content('sub_a', pushed, subcontents=[nested], **kwargs.get('sub_a', {}))
+        sub_b = fake_content('sub_b', pushed, **kwargs.get('sub_b', {}))
+        return fake_content('root', pushed, subcontents=[sub_a, sub_b])
+
+    def push(self, pkg_content, parallel):
+        journal = BufferedProjectJournal()
+        PushProcess(pkg_content, PushOptions(parallel=parallel), journal, MagicMock()).execute()
+        return journal
+
+    def test_parallel_push_pushes_siblings_at_once(self):
+        pushed = []
+        # Each sibling waits for the other to start, so the push only completes if they run at once
+        barrier = threading.Barrier(2, timeout=5)
+        pkg_content = self.build_tree(pushed, nested={'on_push': barrier.wait}, sub_b={'on_push': barrier.wait})
+        self.push(pkg_content, parallel=2)
+        self.assertEqual(len(pushed), 4)
+        self.assertEqual(pushed[-1], 'root')
+        self.assertLess(pushed.index('nested'), pushed.index('sub_a'))
+
+    def test_parallel_push_journal_matches_serial_push(self):
+        serial_journal = self.push(self.build_tree([]), parallel=1)
+        parallel_journal = self.push(self.build_tree([]), parallel=3)
+        self.assertEqual(readable_entries(parallel_journal), readable_entries(serial_journal))
+        self.assertEqual(readable_entries(parallel_journal), [
+            '> sub_a', '> nested', '# Push Content', 'Pushed nested', '< nested', '# Push Content', 'Pushed sub_a', '< sub_a',
+            '> sub_b', '# Push Content', 'Pushed sub_b', '< sub_b',
+            '# Push Content', 'Pushed root'
+        ])
+
+    def test_parallel_push_does_not_push_parent_of_failed_subcontent(self):
+        pushed = []
+        pkg_content = self.build_tree(pushed, nested={'error': 'Mock error'})
+        with self.assertRaises(PushProcessError) as context:
+            self.push(pkg_content, parallel=2)
+        self.assertEqual(str(context.exception), 'Mock error')
+        self.assertNotIn('sub_a', pushed)
+        self.assertNotIn('root', pushed)
+
+    def test_parallel_push_journal_includes_attempted_subcontents_on_failure(self):
+        pkg_content = self.build_tree([], nested={'error': 'Mock error'})
+        journal = BufferedProjectJournal()
+        with self.assertRaises(PushProcessError):
+            PushProcess(pkg_content, PushOptions(parallel=2), journal, MagicMock()).execute()
+        entries = readable_entries(journal)
+        self.assertEqual(entries[:5], ['> sub_a', '> nested', '# Push Content', 'Pushed nested', '< nested'])
+        self.assertNotIn('Pushed sub_a', entries)
+        self.assertNotIn('Pushed root', entries)
+
+    def test_parallel_push_does_not_start_queued_subcontents_after_failure(self):
+        pushed = []
+        first_failed = threading.Event()
+        def fail():
+            first_failed.set()
+        def wait_for_failure():
+            # Keeps the other worker busy until the failure has been recorded, leaving the remaining leaves queued
+            first_failed.wait(timeout=5)
+            time.sleep(0.1)
+        leaves = [fake_content('leaf_0', pushed, on_push=fail, error='Mock error'), fake_content('leaf_1', pushed, on_push=wait_for_failure)]
+        leaves += [fake_content(f'leaf_{i}', pushed) for i in range(2, 20)]
+        pkg_content = fake_content('root', pushed, subcontents=leaves)
+        journal = BufferedProjectJournal()
+        with self.assertRaises(PushProcessError):
+            PushProcess(pkg_content, PushOptions(parallel=2), journal, MagicMock()).execute()
+        # leaf_1 may have started before the failure, no others are
+        self.assertEqual([name for name in pushed if name != 'leaf_1'], [])
+        entries = readable_entries(journal)
+        self.assertNotIn('> leaf_2', entries)
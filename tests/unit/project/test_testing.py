@@ -0,0 +1,116 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import threading
+import time
+from lmctl.project.testing import ScenarioExecutionTracker, ScenarioExecutionTimeoutError, TestExecutionOptions
+
+
+def progress(status, *step_statuses):
+    return {'id': 'exec1', 'status': status, 'stageReports': [{'name': 'Stage', 'steps': [{'status': s} for s in step_statuses]}]}
+
+
+class TestScenarioExecutionTracker(unittest.TestCase):
+
+    def setUp(self):
+        self.behaviour_driver = MagicMock()
+        self.behaviour_driver.get_execution.return_value = {'id': 'exec1', 'status': 'PASS', 'stageReports': []}
+
+    @patch('lmctl.project.testing.time.sleep')
+    def test_wait_for_returns_full_execution_once_finished(self, mock_sleep):
+        self.behaviour_driver.get_execution_progress.side_effect = [progress('PENDING'), progress('IN_PROGRESS', 'IN_PROGRESS'), progress('PASS', 'PASS')]
+        tracker = ScenarioExecutionTracker(self.behaviour_driver)
+        execution = tracker.wait_for('exec1')
+        self.assertEqual(execution, {'id': 'exec1', 'status': 'PASS', 'stageReports': []})
+        self.assertEqual(self.behaviour_driver.get_execution_progress.call_count, 3)
+        self.behaviour_driver.get_execution.assert_called_once_with('exec1')
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch('lmctl.project.testing.time.sleep')
+    def test_wait_for_finished_execution_does_not_wait(self, mock_sleep):
+        self.behaviour_driver.get_execution_progress.return_value = progress('FAIL', 'FAIL')
+        ScenarioExecutionTracker(self.behaviour_driver).wait_for('exec1')
+        mock_sleep.assert_not_called()
+
+    @patch('lmctl.project.testing.time.sleep')
+    def test_wait_for_backs_off_while_progress_unchanged(self, mock_sleep):
+        self.behaviour_driver.get_execution_progress.side_effect = [
+            progress('IN_PROGRESS', 'IN_PROGRESS', 'PENDING'),
+            progress('IN_PROGRESS', 'IN_PROGRESS', 'PENDING'),
+            progress('IN_PROGRESS', 'IN_PROGRESS', 'PENDING'),
+            progress('IN_PROGRESS', 'IN_PROGRESS', 'PENDING'),
+            progress('IN_PROGRESS', 'PASS', 'IN_PROGRESS'),
+            progress('PASS', 'PASS', 'PASS')
+        ]
+        tracker = ScenarioExecutionTracker(self.behaviour_driver, min_poll_interval=1, max_poll_interval=2)
+        tracker.wait_for('exec1')
+        delays = [c[0][0] for c in mock_sleep.call_args_list]
+        self.assertEqual(delays, [1, 1.5, 2, 2, 1])
+
+    @patch('lmctl.project.testing.time.sleep')
+    def test_wait_for_notifies_listener_on_change(self, mock_sleep):
+        progresses = [
+            progress('PENDING', 'PENDING'),
+            progress('PENDING', 'PENDING'),
+            progress('IN_PROGRESS', 'IN_PROGRESS'),
+            progress('IN_PROGRESS', 'IN_PROGRESS'),
+            progress('PASS', 'PASS')
+        ]
+        self.behaviour_driver.get_execution_progress.side_effect = progresses
+        listener = MagicMock()
+        ScenarioExecutionTracker(self.behaviour_driver).wait_for('exec1', progress_listener=listener)
+        self.assertEqual([c[0][0] for c in listener.call_args_list], [progresses[0], progresses[2]])
+
+    @patch('lmctl.project.testing.time.sleep')
+    def test_min_poll_interval_limited_to_max(self, mock_sleep):
+        self.behaviour_driver.get_execution_progress.side_effect = [progress('PENDING'), progress('PASS')]
+        tracker = ScenarioExecutionTracker(self.behaviour_driver, min_poll_interval=1, max_poll_interval=0.1)
+        tracker.wait_for('exec1')
+        mock_sleep.assert_called_once_with(0.1)
+
+    @patch('lmctl.project.testing.time.monotonic')
+    @patch('lmctl.project.testing.time.sleep')
+    def test_wait_for_timeout(self, mock_sleep, mock_monotonic):
+        mock_monotonic.side_effect = [0, 4, 6]
+        self.behaviour_driver.get_execution_progress.return_value = progress('IN_PROGRESS', 'IN_PROGRESS')
+        tracker = ScenarioExecutionTracker(self.behaviour_driver, min_poll_interval=2, max_poll_interval=2)
+        with self.assertRaises(ScenarioExecutionTimeoutError) as context:
+            tracker.wait_for('exec1', timeout=5)
+        self.assertEqual(str(context.exception), 'Execution exec1 did not finish within 5 seconds')
+        # Wait cut short to the remaining time
+        self.assertEqual([c[0][0] for c in mock_sleep.call_args_list], [1])
+        self.behaviour_driver.get_execution.assert_not_called()
+
+
+class TestTestExecutionOptions(unittest.TestCase):
+
+    def test_defaults(self):
+        options = TestExecutionOptions()
+        self.assertEqual(options.parallel, 1)
+        self.assertFalse(options.fail_fast)
+        self.assertIsNone(options.timeout)
+        self.assertFalse(options.stopped)
+
+    def test_stop(self):
+        options = TestExecutionOptions(fail_fast=True)
+        options.stop()
+        self.assertTrue(options.stopped)
+
+    def test_execution_slot_limits_concurrent_executions(self):
+        options = TestExecutionOptions(parallel=2)
+        lock = threading.Lock()
+        active = []
+        max_active = []
+        def execute():
+            with options.execution_slot():
+                with lock:
+                    active.append(1)
+                    max_active.append(len(active))
+                time.sleep(0.05)
+                with lock:
+                    active.pop()
+        threads = [threading.Thread(target=execute) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(max(max_active), 2)
@@ -1,5 +1,9 @@
 import unittest
 import os
+import tarfile
+import tempfile
+import shutil
+import lmctl.journal as journal
 import tests.common.simulations.project_lab as project_lab
 import lmctl.project.package.core as pkgs
 from tests.common.project_testing import (ProjectSimTestCase, PROJECT_VNFCS_DIR, PROJECT_CONTAINS_DIR,
@@ -605,6 +609,17 @@ UNRESOLVABLE_CONFIGURATION_NOT_FOUND = """\
   "descriptorName": "$lmctl:/contains:/subZ:/descriptor_name"
 }"""
 
+class RecordingConsumer(journal.Consumer):
+
+  def __init__(self):
+    self.events = []
+
+  def is_interested(self, entry):
+    return True
+
+  def consume(self, entry):
+    self.events.append((type(entry).__name__, entry.to_readable()))
+
 class TestBuildReferences(ProjectSimTestCase):
 
   def test_descriptor_references(self):
@@ -625,6 +640,32 @@ class TestBuildReferences(ProjectSimTestCase):
         pkg_tester.assert_has_descriptor_file(os.path.join(subA_path, PROJECT_CONTAINS_DIR, 'subAB', ASSEMBLY_DESCRIPTOR_DIR, ASSEMBLY_DESCRIPTOR_YML_FILE), WITH_REFERENCE_SUBAB_DESCRIPTOR_YAML)
         pkg_tester.assert_has_descriptor_file(os.path.join(PROJECT_CONTAINS_DIR, 'subB', 'subB-with_descriptor_references.yml'), WITH_REFERENCE_SUBB_DESCRIPTOR_YAML)
 
+  def test_descriptor_references_with_jobs_matches_serial_build(self):
+    project_sim = self.simlab.simulate_assembly_with_descriptor_references()
+    project = Project(project_sim.path)
+    serial_contents, serial_events = self._build_and_read(project, BuildOptions())
+    parallel_contents, parallel_events = self._build_and_read(project, BuildOptions(jobs=4))
+    self.assertEqual(parallel_contents, serial_contents)
+    self.assertEqual(parallel_events, serial_events)
+
+  def _build_and_read(self, project, build_options):
+    consumer = RecordingConsumer()
+    build_options.journal_consumer = consumer
+    result = project.build(build_options)
+    extract_dir = tempfile.mkdtemp()
+    try:
+      with tarfile.open(result.pkg.path, mode='r:gz') as pkg_tar:
+        pkg_tar.extractall(extract_dir)
+      contents = {}
+      for root, dirs, file_names in os.walk(extract_dir):
+        for file_name in file_names:
+          file_path = os.path.join(root, file_name)
+          with open(file_path, 'rb') as f:
+            contents[os.path.relpath(file_path, extract_dir)] = f.read()
+      return contents, consumer.events
+    finally:
+      shutil.rmtree(extract_dir)
+
   def test_behaviour_references(self):
     project_sim = self.simlab.simulate_assembly_with_behaviour_references()
     project = Project(project_sim.path)
@@ -662,4 +703,75 @@ class TestBuildReferences(ProjectSimTestCase):
       pkg_tester.assert_has_descriptor_file(os.path.join(ASSEMBLY_DESCRIPTOR_DIR, ASSEMBLY_DESCRIPTOR_YML_FILE), UNRESOLVABLE_DESCRIPTOR)
       pkg_tester.assert_has_file(os.path.join(ASSEMBLY_BEHAVIOUR_DIR, ASSEMBLY_CONFIGURATIONS_DIR, 'bad_path.json'), UNRESOLVABLE_CONFIGURATION_BAD_PATH)
       pkg_tester.assert_has_file(os.path.join(ASSEMBLY_BEHAVIOUR_DIR, ASSEMBLY_CONFIGURATIONS_DIR, 'not_found.json'), UNRESOLVABLE_CONFIGURATION_NOT_FOUND)
-      
\ No newline at end of file
+      
+
+
+class TestIncrementalBuild(ProjectSimTestCase):
+
+  def _build(self, project_path, incremental=True):
+    consumer = RecordingConsumer()
+    build_options = BuildOptions(incremental=incremental)
+    build_options.journal_consumer = consumer
+    result = Project(project_path).build(build_options)
+    reused = [event for entry_type, event in consumer.events if event.startswith('Sources unchanged since the last build, reusing staged sources')]
+    return result, reused
+
+  def _manifest_path(self, project_path):
+    return os.path.join(project_path, '_lmctl', 'build-manifest.json')
+
+  def test_first_incremental_build_reuses_nothing(self):
+    project_sim = self.simlab.simulate_assembly_with_descriptor_references()
+    result, reused = self._build(project_sim.path)
+    self.assertEqual(reused, [])
+    self.assertTrue(os.path.exists(self._manifest_path(project_sim.path)))
+    with self.assert_package(result.pkg) as pkg_tester:
+      pkg_tester.assert_has_descriptor_file(os.path.join(PROJECT_CONTAINS_DIR, 'subB', 'subB-with_descriptor_references.yml'), WITH_REFERENCE_SUBB_DESCRIPTOR_YAML)
+
+  def test_unchanged_build_reuses_all_projects(self):
+    project_sim = self.simlab.simulate_assembly_with_descriptor_references()
+    self._build(project_sim.path)
+    result, reused = self._build(project_sim.path)
+    self.assertEqual(len(reused), 5)
+    with self.assert_package(result.pkg) as pkg_tester:
+      pkg_tester.assert_has_descriptor_file(os.path.join(ASSEMBLY_DESCRIPTOR_DIR, ASSEMBLY_DESCRIPTOR_YML_FILE), WITH_REFERENCE_ROOT_DESCRIPTOR_YAML)
+      subA_path = os.path.join(PROJECT_CONTAINS_DIR, 'subA')
+      pkg_tester.assert_has_descriptor_file(os.path.join(subA_path, PROJECT_CONTAINS_DIR, 'subAA', ASSEMBLY_DESCRIPTOR_DIR, ASSEMBLY_DESCRIPTOR_YML_FILE), WITH_REFERENCE_SUBAA_DESCRIPTOR_YAML)
+      pkg_tester.assert_has_descriptor_file(os.path.join(PROJECT_CONTAINS_DIR, 'subB', 'subB-with_descriptor_references.yml'), WITH_REFERENCE_SUBB_DESCRIPTOR_YAML)
+
+  def test_only_changed_subproject_is_rebuilt(self):
+    project_sim = self.simlab.simulate_assembly_with_descriptor_references()
+    self._build(project_sim.path)
+    subAA_path = os.path.join(PROJECT_CONTAINS_DIR, 'subA', PROJECT_CONTAINS_DIR, 'subAA')
+    subAA_descriptor_path = os.path.join(project_sim.path, subAA_path, ASSEMBLY_DESCRIPTOR_DIR, ASSEMBLY_DESCRIPTOR_YML_FILE)
+    with open(subAA_descriptor_path, 'r') as f:
+      subAA_descriptor = f.read()
+    with open(subAA_descriptor_path, 'w') as f:
+      f.write(subAA_descriptor.replace('description: subAA', 'description: subAA updated'))
+    result, reused = self._build(project_sim.path)
+    self.assertEqual(len(reused), 4)
+    self.assertFalse(any(event.endswith(subAA_path) for event in reused))
+    with self.assert_package(result.pkg) as pkg_tester:
+      pkg_tester.assert_has_descriptor_file(os.path.join(PROJECT_CONTAINS_DIR, 'subB', 'subB-with_descriptor_references.yml'), WITH_REFERENCE_SUBB_DESCRIPTOR_YAML)
+    with tarfile.open(result.pkg.path, mode='r:gz') as pkg_tar:
+      subAA_descriptor = pkg_tar.extractfile(os.path.join(subAA_path, ASSEMBLY_DESCRIPTOR_DIR, ASSEMBLY_DESCRIPTOR_YML_FILE)).read().decode('utf-8')
+    self.assertIn('description: subAA updated', subAA_descriptor)
+
+  def test_project_config_change_rebuilds_all_projects(self):
+    project_sim = self.simlab.simulate_assembly_with_descriptor_references()
+    self._build(project_sim.path)
+    project_file_path = os.path.join(project_sim.path, 'lmproject.yml')
+    with open(project_file_path, 'r') as f:
+      project_file = f.read()
+    with open(project_file_path, 'w') as f:
+      f.write(project_file.replace('version: \'1.0\'', 'version: \'1.1\'').replace('version: 1.0', 'version: 1.1'))
+    result, reused = self._build(project_sim.path)
+    self.assertEqual(reused, [])
+
+  def test_build_without_incremental_removes_manifest(self):
+    project_sim = self.simlab.simulate_assembly_with_descriptor_references()
+    self._build(project_sim.path)
+    self._build(project_sim.path, incremental=False)
+    self.assertFalse(os.path.exists(self._manifest_path(project_sim.path)))
+    result, reused = self._build(project_sim.path)
+    self.assertEqual(reused, [])
+
@@ -4,13 +4,25 @@ import os
 import tests.common.simulations.project_lab as project_lab
 from tests.common.project_testing import (ProjectSimTestCase, PROJECT_CONTAINS_DIR)
 from lmctl.project.sessions import EnvironmentSessions
-from lmctl.project.package.core import Pkg, PkgContent, PushOptions
+from lmctl.project.package.core import Pkg, PkgContent, PushOptions, EnvironmentPushResult
 from lmctl.project.handlers.assembly.assembly_src import TEMPLATE_CONTENT
+import lmctl.journal as journal
 
 WITH_TEMPLATE_ASSEMBLY_TEMPLATE_DESCRIPTOR_YAML = "name: assembly-template::with_template::1.0"
 WITH_TEMPLATE_ASSEMBLY_TEMPLATE_DESCRIPTOR_YAML += "\n"
 WITH_TEMPLATE_ASSEMBLY_TEMPLATE_DESCRIPTOR_YAML += TEMPLATE_CONTENT
 
+class RecordingConsumer(journal.Consumer):
+
+    def __init__(self):
+        self.events = []
+
+    def is_interested(self, entry):
+        return True
+
+    def consume(self, entry):
+        self.events.append(entry.to_readable())
+
 class TestPushAssemblyPkgs(ProjectSimTestCase):
 
     def test_push_creates_descriptor(self):
@@ -301,6 +313,77 @@ class TestPushAssemblyPkgs(ProjectSimTestCase):
             })
         ])
 
+    def test_push_skips_unchanged_behaviour(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_with_behaviour() 
+        pkg = Pkg(pkg_sim.path)
+        lm_sim = self.simlab.simulate_lm()
+        lm_session = lm_sim.as_mocked_session()
+        env_sessions = EnvironmentSessions(lm_session)
+        pkg.push(env_sessions, PushOptions())
+        lm_session.behaviour_driver.reset_mock()
+        pkg.push(env_sessions, PushOptions())
+        lm_session.behaviour_driver.get_assembly_configurations.assert_called_once_with('assembly::with_behaviour::1.0')
+        lm_session.behaviour_driver.get_scenarios.assert_called_once_with('assembly::with_behaviour::1.0')
+        lm_session.behaviour_driver.create_assembly_configuration.assert_not_called()
+        lm_session.behaviour_driver.update_assembly_configuration.assert_not_called()
+        lm_session.behaviour_driver.create_scenario.assert_not_called()
+        lm_session.behaviour_driver.update_scenario.assert_not_called()
+
+    def test_push_delta_skips_unchanged_descriptor(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_basic()
+        pkg = Pkg(pkg_sim.path)
+        lm_sim = self.simlab.simulate_lm()
+        # Same content, different formatting
+        lm_sim.add_descriptor('description: basic_assembly\nname: "assembly::basic::1.0"\n')
+        lm_session = lm_sim.as_mocked_session()
+        env_sessions = EnvironmentSessions(lm_session)
+        push_options = PushOptions(delta=True)
+        consumer = RecordingConsumer()
+        push_options.journal_consumer = consumer
+        pkg.push(env_sessions, push_options)
+        lm_session.descriptor_driver.get_descriptor.assert_called_once_with('assembly::basic::1.0')
+        lm_session.descriptor_driver.create_descriptor.assert_not_called()
+        lm_session.descriptor_driver.update_descriptor.assert_not_called()
+        self.assertTrue(any('Descriptor: 0 created, 0 updated, 1 unchanged' in event for event in consumer.events))
+
+    def test_push_delta_updates_changed_descriptor(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_basic()
+        pkg = Pkg(pkg_sim.path)
+        lm_sim = self.simlab.simulate_lm()
+        lm_sim.add_descriptor('name: assembly::basic::1.0\ndescription: pre-update basic_assembly\n')
+        lm_session = lm_sim.as_mocked_session()
+        env_sessions = EnvironmentSessions(lm_session)
+        push_options = PushOptions(delta=True)
+        consumer = RecordingConsumer()
+        push_options.journal_consumer = consumer
+        pkg.push(env_sessions, push_options)
+        lm_session.descriptor_driver.update_descriptor.assert_called_once_with('assembly::basic::1.0', 'name: assembly::basic::1.0\ndescription: basic_assembly\n')
+        self.assertTrue(any('Descriptor: 0 created, 1 updated, 0 unchanged' in event for event in consumer.events))
+
+    def test_push_delta_skips_unchanged_descriptor_template(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_with_template()
+        pkg = Pkg(pkg_sim.path)
+        lm_sim = self.simlab.simulate_lm()
+        lm_session = lm_sim.as_mocked_session()
+        env_sessions = EnvironmentSessions(lm_session)
+        pkg.push(env_sessions, PushOptions(delta=True))
+        lm_session.descriptor_template_driver.reset_mock()
+        lm_session.descriptor_driver.reset_mock()
+        pkg.push(env_sessions, PushOptions(delta=True))
+        lm_session.descriptor_template_driver.create_descriptor_template.assert_not_called()
+        lm_session.descriptor_template_driver.update_descriptor_template.assert_not_called()
+        lm_session.descriptor_driver.update_descriptor.assert_not_called()
+
+    def test_push_without_delta_updates_unchanged_descriptor(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_basic()
+        pkg = Pkg(pkg_sim.path)
+        lm_sim = self.simlab.simulate_lm()
+        lm_sim.add_descriptor('name: assembly::basic::1.0\ndescription: basic_assembly\n')
+        lm_session = lm_sim.as_mocked_session()
+        env_sessions = EnvironmentSessions(lm_session)
+        pkg.push(env_sessions, PushOptions())
+        lm_session.descriptor_driver.update_descriptor.assert_called_once_with('assembly::basic::1.0', 'name: assembly::basic::1.0\ndescription: basic_assembly\n')
+
     def test_push_with_object_group_id(self):
         pkg_sim = self.simlab.simulate_pkg_assembly_basic()
         pkg = Pkg(pkg_sim.path)
@@ -330,6 +413,19 @@ class TestPushAssemblyPkgsSubcontent(ProjectSimTestCase):
             call('name: assembly::sub_basic-contains_basic::1.0\ndescription: descriptor\n', object_group_id=None),
             call('name: assembly::contains_basic::1.0\ndescription: basic_assembly\n', object_group_id=None)])
 
+    def test_push_in_parallel_pushes_subcontent_before_parent(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_contains_assembly_basic()
+        pkg = Pkg(pkg_sim.path)
+        push_options = PushOptions(parallel=4)
+        lm_sim = self.simlab.simulate_lm()
+        lm_session = lm_sim.as_mocked_session()
+        env_sessions = EnvironmentSessions(lm_session)
+        result = pkg.push(env_sessions, push_options)
+        self.assertIsInstance(result, PkgContent)
+        lm_session.descriptor_driver.create_descriptor.assert_has_calls([
+            call('name: assembly::sub_basic-contains_basic::1.0\ndescription: descriptor\n', object_group_id=None),
+            call('name: assembly::contains_basic::1.0\ndescription: basic_assembly\n', object_group_id=None)])
+
     def test_push_updates_descriptors_if_exists(self):
         pkg_sim = self.simlab.simulate_pkg_assembly_contains_assembly_basic()
         pkg = Pkg(pkg_sim.path)
@@ -537,6 +633,54 @@ class TestPushAssemblyPkgsSubcontent(ProjectSimTestCase):
         ])
 
 
+class TestPushToEnvironments(ProjectSimTestCase):
+
+    def _sessions(self):
+        lm_sim = self.simlab.simulate_lm()
+        lm_session = lm_sim.as_mocked_session()
+        return lm_session, EnvironmentSessions(lm_session)
+
+    def test_push_to_environments(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_basic()
+        pkg = Pkg(pkg_sim.path)
+        dev_session, dev_env_sessions = self._sessions()
+        test_session, test_env_sessions = self._sessions()
+        consumer = RecordingConsumer()
+        push_options = PushOptions()
+        push_options.journal_consumer = consumer
+        results = pkg.push_to_environments({'dev': dev_env_sessions, 'test': test_env_sessions}, push_options)
+        self.assertEqual([r.environment for r in results], ['dev', 'test'])
+        for result in results:
+            self.assertIsInstance(result, EnvironmentPushResult)
+            self.assertFalse(result.failed)
+        for lm_session in [dev_session, test_session]:
+            lm_session.descriptor_driver.create_descriptor.assert_called_once_with('name: assembly::basic::1.0\ndescription: basic_assembly\n', object_group_id=None)
+        # Validated once, then events of each environment in a block
+        self.assertEqual(consumer.events.count('Validate Content'), 1)
+        self.assertLess(consumer.events.index('Push to dev'), consumer.events.index('Push to test'))
+
+    def test_push_to_environments_continues_after_failure_in_one_environment(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_basic()
+        pkg = Pkg(pkg_sim.path)
+        dev_session, dev_env_sessions = self._sessions()
+        dev_session.descriptor_driver.create_descriptor.side_effect = ValueError('Mocked error')
+        test_session, test_env_sessions = self._sessions()
+        results = pkg.push_to_environments({'dev': dev_env_sessions, 'test': test_env_sessions}, PushOptions())
+        self.assertTrue(results[0].failed)
+        self.assertEqual(str(results[0].error), 'Mocked error')
+        self.assertFalse(results[1].failed)
+        test_session.descriptor_driver.create_descriptor.assert_called_once()
+
+    def test_push_to_environments_with_object_group_per_environment(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_basic()
+        pkg = Pkg(pkg_sim.path)
+        dev_session, dev_env_sessions = self._sessions()
+        test_session, test_env_sessions = self._sessions()
+        pkg.push_to_environments({'dev': dev_env_sessions, 'test': test_env_sessions}, PushOptions(), object_group_id_by_name={'dev': 'dev-group', 'test': 'test-group'})
+        dev_session.descriptor_driver.create_descriptor.assert_called_once_with('name: assembly::basic::1.0\ndescription: basic_assembly\n', object_group_id='dev-group')
+        test_session.descriptor_driver.create_descriptor.assert_called_once_with('name: assembly::basic::1.0\ndescription: basic_assembly\n', object_group_id='test-group')
+
+
 class TestPushOldStyle(ProjectSimTestCase):
 
     def test_push(self):
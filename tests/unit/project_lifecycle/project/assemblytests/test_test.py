@@ -4,7 +4,7 @@ import tests.common.simulations.project_lab as project_lab
 from tests.common.project_testing import (ProjectSimTestCase, PROJECT_CONTAINS_DIR)
 from lmctl.project.sessions import EnvironmentSessions
 from lmctl.project.package.core import Pkg, PkgContent, TestOptions, PushOptions
-from lmctl.project.testing import PkgTestReport, TestSuiteExecutionReport, TEST_STATUS_PASSED, TEST_STATUS_FAILED
+from lmctl.project.testing import PkgTestReport, TestSuiteExecutionReport, TEST_STATUS_PASSED, TEST_STATUS_FAILED, TEST_STATUS_SKIPPED
 import lmctl.project.handlers.assembly.assembly_content as assembly_content
 
 
@@ -54,6 +54,9 @@ class TestTestAssemblyPkgs(ProjectSimTestCase):
         scenario_executions = lm_sim.get_executions_on_scenario(expected_scenario['id'])
         self.assertEqual(len(scenario_executions), 1)
         lm_session.behaviour_driver.get_execution.assert_called_with(scenario_executions[0]['id'])
+        # Progress is checked until the execution finishes, then the full execution is retrieved once
+        lm_session.behaviour_driver.get_execution_progress.assert_called_with(scenario_executions[0]['id'])
+        lm_session.behaviour_driver.get_execution.assert_called_once()
 
     def test_runs_multi_tests(self):
         pkg_sim = self.simlab.simulate_pkg_assembly_with_behaviour_multi_tests() 
@@ -123,6 +126,54 @@ class TestTestAssemblyPkgs(ProjectSimTestCase):
         self.assertIsNone(test3_entry.detail)
 
 
+    def test_runs_tests_in_parallel(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_with_behaviour_multi_tests() 
+        pkg = Pkg(pkg_sim.path)
+        lm_sim = self.simlab.simulate_lm()
+        lm_sim.execution_listener.add_step_failure_trigger('assembly::with_behaviour_multi_tests::1.0', 'test2', 1, 0, 'Mocked Error')
+        lm_session = lm_sim.as_mocked_session()
+        env_sessions = EnvironmentSessions(lm_session)
+        pkg_content = pkg.push(env_sessions, PushOptions())
+        serial_result = pkg_content.test(env_sessions, TestOptions())
+        parallel_result = pkg_content.test(env_sessions, TestOptions(parallel=3))
+        # Same entries, in the same order, as executing one at a time
+        self.assertEqual([(e.test_name, e.result, e.detail) for e in parallel_result.suite_report.entries], 
+                            [(e.test_name, e.result, e.detail) for e in serial_result.suite_report.entries])
+        self.assertEqual(parallel_result.suite_report.failed_count(), 1)
+        self.assertEqual(parallel_result.suite_report.passed_count(), 2)
+
+    def test_fail_fast_skips_remaining_tests(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_with_behaviour_multi_tests() 
+        pkg = Pkg(pkg_sim.path)
+        lm_sim = self.simlab.simulate_lm()
+        lm_sim.execution_listener.add_step_failure_trigger('assembly::with_behaviour_multi_tests::1.0', 'test2', 1, 0, 'Mocked Error')
+        lm_session = lm_sim.as_mocked_session()
+        env_sessions = EnvironmentSessions(lm_session)
+        result = pkg.push(env_sessions, PushOptions()).test(env_sessions, TestOptions(fail_fast=True))
+        entries = result.suite_report.entries
+        self.assertEqual(len(entries), 3)
+        failed_idx = next(i for i, e in enumerate(entries) if e.test_name == 'test2')
+        self.assertEqual(entries[failed_idx].result, TEST_STATUS_FAILED)
+        for entry in entries[:failed_idx]:
+            self.assertEqual(entry.result, TEST_STATUS_PASSED)
+        for entry in entries[failed_idx+1:]:
+            self.assertEqual(entry.result, TEST_STATUS_SKIPPED)
+        self.assertEqual(lm_session.behaviour_driver.execute_scenario.call_count, failed_idx + 1)
+
+    def test_fails_test_after_timeout(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_with_behaviour() 
+        pkg = Pkg(pkg_sim.path)
+        lm_sim = self.simlab.simulate_lm()
+        lm_session = lm_sim.as_mocked_session()
+        env_sessions = EnvironmentSessions(lm_session)
+        result = pkg.push(env_sessions, PushOptions()).test(env_sessions, TestOptions(test_timeout=0.01))
+        entry = result.suite_report.entries[0]
+        self.assertEqual(entry.result, TEST_STATUS_FAILED)
+        self.assertIn('did not finish within 0.01 seconds', entry.detail)
+        execution_id = lm_session.behaviour_driver.get_execution_progress.call_args[0][0]
+        lm_session.behaviour_driver.cancel_execution.assert_called_once_with(execution_id)
+        lm_session.behaviour_driver.get_execution.assert_not_called()
+
 class TestTestAssemblyPkgsSubcontent(ProjectSimTestCase):
 
     def setUp(self):
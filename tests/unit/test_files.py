@@ -3,8 +3,9 @@ import tempfile
 import os
 import shutil
 import tarfile
+import stat
 
-from lmctl.files import safely_extract_tar
+from lmctl.files import safely_extract_tar, make_read_only, remove_directory
 
 class TestFileUtils(unittest.TestCase):
 
@@ -60,4 +61,20 @@ class TestFileUtils(unittest.TestCase):
                 safely_extract_tar(tar, self.tmp_dir)
         
         expected_path_in_error = '..' + self.tmp_dir + os.sep + file_name
-        self.assertEqual(str(ctx.exception), f'TAR contains a file which attempts to traverse to a path outside of the target extraction path: {expected_path_in_error}')
\ No newline at end of file
+        self.assertEqual(str(ctx.exception), f'TAR contains a file which attempts to traverse to a path outside of the target extraction path: {expected_path_in_error}')
+
+    def test_make_read_only_removes_write_permission_from_files(self):
+        directory = os.path.join(self.tmp_dir, 'workspace')
+        os.makedirs(os.path.join(directory, 'DirB'))
+        file_A = os.path.join(directory, 'fileA.txt')
+        file_B = os.path.join(directory, 'DirB', 'fileB.txt')
+        for path in [file_A, file_B]:
+            with open(path, 'w') as f:
+                f.write('Test')
+        make_read_only(directory)
+        for path in [file_A, file_B]:
+            self.assertEqual(os.stat(path).st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH), 0)
+            self.assertTrue(os.stat(path).st_mode & stat.S_IRUSR)
+        self.assertTrue(os.stat(os.path.join(directory, 'DirB')).st_mode & stat.S_IWUSR)
+        remove_directory(directory)
+        self.assertFalse(os.path.exists(directory))